@@ -837,6 +837,7 @@ def drift_search_streaming(
         reduce_system_prompt=reduce_prompt,
         response_type=response_type,
         callbacks=callbacks,
+        community_level=community_level,
     )
     return search_engine.stream_search(query=query)
 
@@ -0,0 +1,52 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A module containing the process-wide LLM cache counters."""
+
+import threading
+from dataclasses import dataclass, field
+
+
+@dataclass
+class CacheStats:
+    """Hit, miss and coalesce counters of the LLM response cache."""
+
+    memory_hits: int = 0
+    """Requests answered by the in-process memory tier."""
+    persistent_hits: int = 0
+    """Requests answered by the persistent pipeline cache."""
+    misses: int = 0
+    """Requests that had to call the model."""
+    coalesced: int = 0
+    """Requests that waited on an identical in-flight request instead of calling the model."""
+
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    def increment(self, counter: str) -> None:
+        """Increment the given counter."""
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def reset(self) -> None:
+        """Reset all counters to zero."""
+        with self._lock:
+            self.memory_hits = 0
+            self.persistent_hits = 0
+            self.misses = 0
+            self.coalesced = 0
+
+    def to_dict(self) -> dict[str, int]:
+        """Return the counters as a dictionary."""
+        with self._lock:
+            return {
+                "memory_hits": self.memory_hits,
+                "persistent_hits": self.persistent_hits,
+                "misses": self.misses,
+                "coalesced": self.coalesced,
+            }
+
+
+cache_stats = CacheStats()
+"""The counters shared by every cached model in the process."""
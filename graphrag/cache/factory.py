@@ -5,11 +5,13 @@
 
 from __future__ import annotations
 
+from pathlib import Path
 from typing import TYPE_CHECKING, ClassVar
 
 from graphrag.cache.json_pipeline_cache import JsonPipelineCache
 from graphrag.cache.memory_pipeline_cache import InMemoryCache
 from graphrag.cache.noop_pipeline_cache import NoopPipelineCache
+from graphrag.cache.sharded_pipeline_cache import ShardedPipelineCache
 from graphrag.config.enums import CacheType
 from graphrag.storage.blob_pipeline_storage import BlobPipelineStorage
 from graphrag.storage.cosmosdb_pipeline_storage import CosmosDBPipelineStorage
@@ -97,6 +99,25 @@ def create_cosmosdb_cache(**kwargs) -> PipelineCache:
     return JsonPipelineCache(storage)
 
 
+def create_sharded_cache(
+    root_dir: str,
+    base_dir: str,
+    shards: int = 16,
+    compression: str = "zlib",
+    max_size_mb: int | None = None,
+    max_age_days: float | None = None,
+    **_kwargs,
+) -> PipelineCache:
+    """Create a sharded on-disk cache implementation."""
+    return ShardedPipelineCache(
+        Path(root_dir) / base_dir,
+        shards=shards,
+        compression=compression,
+        max_size_bytes=max_size_mb * 1024 * 1024 if max_size_mb else None,
+        max_age_seconds=max_age_days * 24 * 3600 if max_age_days else None,
+    )
+
+
 def create_noop_cache(**_kwargs) -> PipelineCache:
     """Create a no-op cache implementation."""
     return NoopPipelineCache()
@@ -113,3 +134,4 @@ CacheFactory.register(CacheType.memory.value, create_memory_cache)
 CacheFactory.register(CacheType.file.value, create_file_cache)
 CacheFactory.register(CacheType.blob.value, create_blob_cache)
 CacheFactory.register(CacheType.cosmosdb.value, create_cosmosdb_cache)
+CacheFactory.register(CacheType.sharded.value, create_sharded_cache)
@@ -0,0 +1,347 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A module containing 'ShardedPipelineCache' model."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any
+
+from graphrag.cache.pipeline_cache import PipelineCache
+
+logger = logging.getLogger(__name__)
+
+_CODEC_NONE = 0
+_CODEC_ZLIB = 1
+_CODEC_ZSTD = 2
+_CODECS = {"none": _CODEC_NONE, "zlib": _CODEC_ZLIB, "zstd": _CODEC_ZSTD}
+
+# fraction of the size limit kept after an eviction pass, so that eviction
+# does not run again on the very next write
+_EVICTION_TARGET = 0.9
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    digest BLOB PRIMARY KEY,
+    namespace TEXT NOT NULL,
+    codec INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    created REAL NOT NULL,
+    accessed REAL NOT NULL,
+    value BLOB NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed);
+CREATE INDEX IF NOT EXISTS entries_namespace ON entries (namespace);
+"""
+
+
+def _zstd() -> Any:
+    try:
+        import zstandard  # type: ignore
+    except ImportError as e:
+        msg = "The zstd cache compression requires the 'zstandard' package."
+        raise ValueError(msg) from e
+    return zstandard
+
+
+class _Shard:
+    """A single SQLite database holding a slice of the cache key space."""
+
+    def __init__(self, path: Path):
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(
+            path, check_same_thread=False, isolation_level=None
+        )
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(_SCHEMA)
+        self.size = self.connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM entries"
+        ).fetchone()[0]
+
+
+class _ShardSet:
+    """The shards and settings shared by a cache and all of its children."""
+
+    def __init__(
+        self,
+        root: Path,
+        shards: int,
+        compression: str,
+        max_size_bytes: int | None,
+        max_age_seconds: float | None,
+    ):
+        if compression not in _CODECS:
+            msg = f"Unknown cache compression: {compression}. Expected one of {list(_CODECS)}."
+            raise ValueError(msg)
+        if shards < 1:
+            msg = "The sharded cache needs at least one shard."
+            raise ValueError(msg)
+        self.codec = _CODECS[compression]
+        if self.codec == _CODEC_ZSTD:
+            _zstd()
+        # zstd (de)compressors are not thread safe, each worker thread gets its own
+        self._zstd = threading.local()
+        root.mkdir(parents=True, exist_ok=True)
+        self.shards = [_Shard(root / f"shard-{i:03d}.sqlite") for i in range(shards)]
+        self.max_shard_size = (
+            max_size_bytes // shards if max_size_bytes is not None else None
+        )
+        self.max_age_seconds = max_age_seconds
+
+    def shard(self, digest: bytes) -> _Shard:
+        return self.shards[int.from_bytes(digest[:4], "big") % len(self.shards)]
+
+    def compress(self, data: bytes) -> bytes:
+        if self.codec == _CODEC_ZLIB:
+            return zlib.compress(data)
+        if self.codec == _CODEC_ZSTD:
+            if not hasattr(self._zstd, "compressor"):
+                self._zstd.compressor = _zstd().ZstdCompressor()
+            return self._zstd.compressor.compress(data)
+        return data
+
+    def decompress(self, codec: int, data: bytes) -> bytes:
+        if codec == _CODEC_ZLIB:
+            return zlib.decompress(data)
+        if codec == _CODEC_ZSTD:
+            # entries keep their codec, so a cache reconfigured away from zstd can still read them
+            if not hasattr(self._zstd, "decompressor"):
+                self._zstd.decompressor = _zstd().ZstdDecompressor()
+            return self._zstd.decompressor.decompress(data)
+        return data
+
+    def expired_before(self) -> float | None:
+        if self.max_age_seconds is None:
+            return None
+        return time.time() - self.max_age_seconds
+
+    def evict(self, shard: _Shard) -> None:
+        """Drop expired entries, then least recently used ones until the shard fits its size limit."""
+        expired_before = self.expired_before()
+        if expired_before is not None:
+            shard.connection.execute(
+                "DELETE FROM entries WHERE created < ?", (expired_before,)
+            )
+        if self.max_shard_size is not None:
+            excess = shard.size - int(self.max_shard_size * _EVICTION_TARGET)
+            if shard.size > self.max_shard_size and excess > 0:
+                shard.connection.execute(
+                    """
+                    DELETE FROM entries WHERE digest IN (
+                        SELECT digest FROM (
+                            SELECT digest, size,
+                                SUM(size) OVER (ORDER BY accessed, digest) AS running
+                            FROM entries
+                        ) WHERE running - size < ?
+                    )
+                    """,
+                    (excess,),
+                )
+        shard.size = shard.connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM entries"
+        ).fetchone()[0]
+
+
+class ShardedPipelineCache(PipelineCache):
+    """On-disk cache packing entries into sharded SQLite databases.
+
+    Keys are content-addressed with SHA-256 and spread over a fixed number of
+    shard files, so a large run produces a handful of files instead of one
+    file per entry. Values are stored compressed, and the cache can be bounded
+    by total size (least recently used entries are evicted first) and by
+    entry age. Database access and compression run on worker threads, so
+    cache lookups do not block the event loop.
+    """
+
+    _shards: _ShardSet
+    _namespace: str
+
+    def __init__(
+        self,
+        root: str | Path,
+        shards: int = 16,
+        compression: str = "zlib",
+        max_size_bytes: int | None = None,
+        max_age_seconds: float | None = None,
+        *,
+        _shard_set: _ShardSet | None = None,
+        _namespace: str = "",
+    ):
+        """Init method definition."""
+        self._shards = _shard_set or _ShardSet(
+            Path(root), shards, compression, max_size_bytes, max_age_seconds
+        )
+        self._root = Path(root)
+        self._namespace = _namespace
+
+    def _digest(self, key: str) -> bytes:
+        # namespace and key are encoded as separate fields, so that neither can
+        # absorb a separator from the other
+        return hashlib.sha256(json.dumps([self._namespace, key]).encode()).digest()
+
+    async def get(self, key: str) -> Any:
+        """Get method definition."""
+        return await asyncio.to_thread(self._get, key)
+
+    def _get(self, key: str) -> Any:
+        digest = self._digest(key)
+        shard = self._shards.shard(digest)
+        with shard.lock:
+            row = shard.connection.execute(
+                "SELECT codec, created, value FROM entries WHERE digest = ?",
+                (digest,),
+            ).fetchone()
+            if row is None:
+                return None
+            codec, created, value = row
+            expired_before = self._shards.expired_before()
+            if expired_before is not None and created < expired_before:
+                self._delete(shard, digest)
+                return None
+            shard.connection.execute(
+                "UPDATE entries SET accessed = ? WHERE digest = ?",
+                (time.time(), digest),
+            )
+        try:
+            data = json.loads(self._shards.decompress(codec, value))
+        except (zlib.error, UnicodeDecodeError, json.decoder.JSONDecodeError):
+            logger.warning("Dropping unreadable cache entry for key %s", key)
+            with shard.lock:
+                self._delete(shard, digest)
+            return None
+        return data.get("result")
+
+    async def set(self, key: str, value: Any, debug_data: dict | None = None) -> None:
+        """Set method definition."""
+        if value is None:
+            return
+        await asyncio.to_thread(self._set, key, value, debug_data)
+
+    def _set(self, key: str, value: Any, debug_data: dict | None) -> None:
+        data = {"result": value, **(debug_data or {})}
+        payload = self._shards.compress(
+            json.dumps(data, ensure_ascii=False).encode("utf-8")
+        )
+        digest = self._digest(key)
+        shard = self._shards.shard(digest)
+        now = time.time()
+        with shard.lock:
+            previous = shard.connection.execute(
+                "SELECT size FROM entries WHERE digest = ?", (digest,)
+            ).fetchone()
+            shard.connection.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    digest,
+                    self._namespace,
+                    self._shards.codec,
+                    len(payload),
+                    now,
+                    now,
+                    payload,
+                ),
+            )
+            shard.size += len(payload) - (previous[0] if previous else 0)
+            max_shard_size = self._shards.max_shard_size
+            if max_shard_size is not None and shard.size > max_shard_size:
+                self._shards.evict(shard)
+
+    async def has(self, key: str) -> bool:
+        """Has method definition."""
+        return await asyncio.to_thread(self._has, key)
+
+    def _has(self, key: str) -> bool:
+        digest = self._digest(key)
+        shard = self._shards.shard(digest)
+        with shard.lock:
+            row = shard.connection.execute(
+                "SELECT created FROM entries WHERE digest = ?", (digest,)
+            ).fetchone()
+        if row is None:
+            return False
+        expired_before = self._shards.expired_before()
+        return expired_before is None or row[0] >= expired_before
+
+    async def delete(self, key: str) -> None:
+        """Delete method definition."""
+        await asyncio.to_thread(self._delete_key, key)
+
+    def _delete_key(self, key: str) -> None:
+        digest = self._digest(key)
+        shard = self._shards.shard(digest)
+        with shard.lock:
+            self._delete(shard, digest)
+
+    async def clear(self) -> None:
+        """Clear method definition."""
+        await asyncio.to_thread(self._clear)
+
+    def _clear(self) -> None:
+        for shard in self._shards.shards:
+            with shard.lock:
+                if self._namespace:
+                    shard.connection.execute(
+                        "DELETE FROM entries WHERE namespace LIKE ? ESCAPE '\\'",
+                        (_like_prefix(self._namespace),),
+                    )
+                else:
+                    shard.connection.execute("DELETE FROM entries")
+                shard.size = shard.connection.execute(
+                    "SELECT COALESCE(SUM(size), 0) FROM entries"
+                ).fetchone()[0]
+
+    def child(self, name: str) -> ShardedPipelineCache:
+        """Child method definition."""
+        return ShardedPipelineCache(
+            self._root,
+            _shard_set=self._shards,
+            _namespace=f"{self._namespace}{name}/",
+        )
+
+    async def evict(self) -> None:
+        """Drop expired entries and enforce the size limit on every shard."""
+        await asyncio.to_thread(self._evict)
+
+    def _evict(self) -> None:
+        for shard in self._shards.shards:
+            with shard.lock:
+                self._shards.evict(shard)
+
+    async def compact(self) -> None:
+        """Evict, then rewrite the shard files to reclaim the space of deleted entries."""
+        await asyncio.to_thread(self._compact)
+
+    def _compact(self) -> None:
+        self._evict()
+        for shard in self._shards.shards:
+            with shard.lock:
+                shard.connection.execute("VACUUM")
+
+    def close(self) -> None:
+        """Close the shard databases."""
+        for shard in self._shards.shards:
+            with shard.lock:
+                shard.connection.close()
+
+    def _delete(self, shard: _Shard, digest: bytes) -> None:
+        row = shard.connection.execute(
+            "DELETE FROM entries WHERE digest = ? RETURNING size", (digest,)
+        ).fetchone()
+        if row is not None:
+            shard.size -= row[0]
+
+
+def _like_prefix(namespace: str) -> str:
+    """Build a LIKE pattern matching every namespace nested under the given one."""
+    escaped = namespace.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"{escaped}%"
@@ -0,0 +1,63 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A module containing the coalescing of identical in-flight computations."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[T]):
+    """Run at most one computation per key at a time, sharing its result with concurrent callers.
+
+    Callers that ask for a key that is already being computed on the same event
+    loop wait for that computation instead of starting their own. Failures are
+    not shared: when the computation fails or is cancelled, each waiter runs
+    the computation itself.
+    """
+
+    def __init__(self):
+        self._in_flight: dict[str, asyncio.Future[T]] = {}
+
+    async def run(
+        self,
+        key: str,
+        create: Callable[[], Awaitable[T]],
+        on_coalesced: Callable[[], None] | None = None,
+    ) -> T:
+        """Compute the value of a key, or wait for the identical computation already in flight.
+
+        `on_coalesced` is called when this caller waits on another computation.
+        """
+        loop = asyncio.get_running_loop()
+        pending = self._in_flight.get(key)
+        if pending is not None and pending.get_loop() is loop:
+            if on_coalesced is not None:
+                on_coalesced()
+            # waiting does not cancel the shared computation if this caller is cancelled
+            await asyncio.wait([pending])
+            if not pending.cancelled() and pending.exception() is None:
+                return pending.result()
+            # the shared computation failed, run our own
+
+        future: asyncio.Future[T] = loop.create_future()
+        # mark the outcome as retrieved, so that a failure nobody waited on is not reported
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._in_flight[key] = future
+        try:
+            value = await create()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(value)
+        finally:
+            if self._in_flight.get(key) is future:
+                del self._in_flight[key]
+        return value
@@ -543,3 +543,87 @@ def _query_cli(
             )
         case _:
             raise ValueError(INVALID_METHOD_ERROR)
+
+
+@app.command("serve")
+def _serve_cli(
+    config: Path | None = typer.Option(
+        None,
+        "--config",
+        "-c",
+        help="The configuration to use.",
+        exists=True,
+        file_okay=True,
+        readable=True,
+        autocompletion=CONFIG_AUTOCOMPLETE,
+    ),
+    data: Path | None = typer.Option(
+        None,
+        "--data",
+        "-d",
+        help="Index output directory (contains the parquet files).",
+        exists=True,
+        dir_okay=True,
+        readable=True,
+        resolve_path=True,
+        autocompletion=ROOT_AUTOCOMPLETE,
+    ),
+    root: Path = typer.Option(
+        Path(),
+        "--root",
+        "-r",
+        help="The project root directory.",
+        exists=True,
+        dir_okay=True,
+        writable=True,
+        resolve_path=True,
+        autocompletion=ROOT_AUTOCOMPLETE,
+    ),
+    host: str = typer.Option(
+        "127.0.0.1",
+        "--host",
+        help="The address to serve the HTTP API on.",
+    ),
+    port: int = typer.Option(
+        8000,
+        "--port",
+        "-p",
+        help="The port to serve the HTTP API on.",
+    ),
+    socket: Path | None = typer.Option(
+        None,
+        "--socket",
+        help="Serve the HTTP API on this Unix socket instead of a TCP port.",
+        resolve_path=True,
+    ),
+    reload_interval: float = typer.Option(
+        5.0,
+        "--reload-interval",
+        help="Seconds between checks of the index output for changes to reload.",
+    ),
+    cache_size: int = typer.Option(
+        4096,
+        "--cache-size",
+        help="Number of query embeddings, entity searches and map responses kept in memory, 0 to disable caching.",
+    ),
+    verbose: bool = typer.Option(
+        False,
+        "--verbose",
+        "-v",
+        help="Run the query server with verbose logging.",
+    ),
+) -> None:
+    """Serve queries from a knowledge graph index kept in memory."""
+    from graphrag.cli.serve import run_query_server
+
+    run_query_server(
+        config_filepath=config,
+        data_dir=data,
+        root_dir=root,
+        host=host,
+        port=port,
+        socket_path=socket,
+        reload_interval=reload_interval,
+        cache_size=cache_size,
+        verbose=verbose,
+    )
@@ -12,6 +12,7 @@ import graphrag.api as api
 from graphrag.callbacks.noop_query_callbacks import NoopQueryCallbacks
 from graphrag.config.load_config import load_config
 from graphrag.config.models.graph_rag_config import GraphRagConfig
+from graphrag.query.indexer_adapters import QUERY_TABLE_COLUMNS
 from graphrag.utils.api import create_storage_from_config
 from graphrag.utils.storage import load_table_from_storage, storage_has_table
 
@@ -517,7 +518,11 @@ def _resolve_output_files(
     dataframe_dict["multi-index"] = False
     storage_obj = create_storage_from_config(config.output)
     for name in output_list:
-        df_value = asyncio.run(load_table_from_storage(name=name, storage=storage_obj))
+        df_value = asyncio.run(
+            load_table_from_storage(
+                name=name, storage=storage_obj, columns=QUERY_TABLE_COLUMNS.get(name)
+            )
+        )
         dataframe_dict[name] = df_value
 
     # for optional output files, set the dict entry to None instead of erroring out if it does not exist
@@ -526,7 +531,11 @@ def _resolve_output_files(
             file_exists = asyncio.run(storage_has_table(optional_file, storage_obj))
             if file_exists:
                 df_value = asyncio.run(
-                    load_table_from_storage(name=optional_file, storage=storage_obj)
+                    load_table_from_storage(
+                        name=optional_file,
+                        storage=storage_obj,
+                        columns=QUERY_TABLE_COLUMNS.get(optional_file),
+                    )
                 )
                 dataframe_dict[optional_file] = df_value
             else:
@@ -0,0 +1,46 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""CLI implementation of the serve subcommand."""
+
+import asyncio
+import contextlib
+from pathlib import Path
+
+from graphrag.config.load_config import load_config
+from graphrag.logger.standard_logging import init_loggers
+from graphrag.query.server.http_server import serve
+from graphrag.query.server.query_service import QueryService
+
+
+def run_query_server(
+    config_filepath: Path | None,
+    data_dir: Path | None,
+    root_dir: Path,
+    host: str,
+    port: int,
+    socket_path: Path | None,
+    reload_interval: float,
+    cache_size: int,
+    verbose: bool,
+):
+    """Serve queries against an index that is loaded once and reloaded when it changes."""
+    root = root_dir.resolve()
+    cli_overrides = {}
+    if data_dir:
+        cli_overrides["output.base_dir"] = str(data_dir)
+    config = load_config(root, config_filepath, cli_overrides)
+    init_loggers(config=config, verbose=verbose, filename="query.log")
+
+    service = QueryService(
+        config, reload_interval=reload_interval, cache_size=cache_size
+    )
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(
+            serve(
+                service,
+                host=host,
+                port=port,
+                socket_path=str(socket_path) if socket_path else None,
+            )
+        )
@@ -30,6 +30,9 @@ from graphrag.language_model.providers.litellm.services.rate_limiter.rate_limite
 from graphrag.language_model.providers.litellm.services.rate_limiter.static_rate_limiter import (
     StaticRateLimiter,
 )
+from graphrag.language_model.providers.litellm.services.rate_limiter.token_bucket_rate_limiter import (
+    TokenBucketRateLimiter,
+)
 from graphrag.language_model.providers.litellm.services.retry.exponential_retry import (
     ExponentialRetry,
 )
@@ -69,6 +72,7 @@ DEFAULT_RETRY_SERVICES: dict[str, Callable[..., Retry]] = {
 
 DEFAULT_RATE_LIMITER_SERVICES: dict[str, Callable[..., RateLimiter]] = {
     "static": StaticRateLimiter,
+    "token_bucket": TokenBucketRateLimiter,
 }
 
 
@@ -93,6 +97,10 @@ class CacheDefaults:
     container_name: None = None
     storage_account_blob_url: None = None
     cosmosdb_account_url: None = None
+    shards: int = 16
+    compression: str = "zlib"
+    max_size_mb: None = None
+    max_age_days: None = None
 
 
 @dataclass
@@ -106,6 +114,7 @@ class ChunksDefaults:
     encoding_model: str = "cl100k_base"
     prepend_metadata: bool = False
     chunk_size_includes_metadata: bool = False
+    async_mode: AsyncType | None = None
 
 
 @dataclass
@@ -144,6 +153,7 @@ class DriftSearchDefaults:
     primer_folds: int = 5
     primer_llm_max_tokens: int = 12_000
     n_depth: int = 3
+    follow_up_similarity_threshold: None = None
     local_search_text_unit_prop: float = 0.9
     local_search_community_prop: float = 0.1
     local_search_top_k_mapped_entities: int = 10
@@ -261,12 +271,15 @@ class GlobalSearchDefaults:
     data_max_tokens: int = 12_000
     map_max_length: int = 1000
     reduce_max_length: int = 2000
+    map_early_stop_score: None = None
     dynamic_search_threshold: int = 1
     dynamic_search_keep_parent: bool = False
     dynamic_search_num_repeats: int = 1
     dynamic_search_use_summary: bool = False
     dynamic_search_max_level: int = 2
+    dynamic_search_min_similarity: None = None
     chat_model_id: str = DEFAULT_CHAT_MODEL_ID
+    embedding_model_id: str = DEFAULT_EMBEDDING_MODEL_ID
 
 
 @dataclass
@@ -300,6 +313,7 @@ class InputDefaults:
     text_column: str = "text"
     title_column: None = None
     metadata: None = None
+    concurrency: int = 32
 
 
 @dataclass
@@ -329,6 +343,7 @@ class LanguageModelDefaults:
     tokens_per_minute: None = None
     requests_per_minute: None = None
     rate_limit_strategy: str | None = "static"
+    rate_limit_coordinator: str | None = None
     retry_strategy: str = "exponential_backoff"
     max_retries: int = 10
     max_retry_wait: float = 10.0
@@ -430,6 +445,8 @@ class VectorStoreDefaults:
     audience: None = None
     database_name: None = None
     schema: None = None
+    ivf_lists: int = 0
+    ivf_probes: int = 8
 
 
 @dataclass
@@ -21,6 +21,8 @@ class CacheType(str, Enum):
     """The blob cache configuration type."""
     cosmosdb = "cosmosdb"
     """The cosmosdb cache configuration type"""
+    sharded = "sharded"
+    """The sharded on-disk (SQLite) cache configuration type."""
 
     def __repr__(self):
         """Get a string representation."""
@@ -65,6 +67,7 @@ class VectorStoreType(str, Enum):
     LanceDB = "lancedb"
     AzureAISearch = "azure_ai_search"
     CosmosDB = "cosmosdb"
+    Memmap = "memmap"
 
 
 class ReportingType(str, Enum):
@@ -114,6 +117,7 @@ class AsyncType(str, Enum):
 
     AsyncIO = "asyncio"
     Threaded = "threaded"
+    Process = "process"
 
 
 class ChunkStrategyType(str, Enum):
@@ -36,3 +36,19 @@ class CacheConfig(BaseModel):
         description="The cosmosdb account url to use.",
         default=graphrag_config_defaults.cache.cosmosdb_account_url,
     )
+    shards: int = Field(
+        description="The number of shard files to use (sharded cache only).",
+        default=graphrag_config_defaults.cache.shards,
+    )
+    compression: str = Field(
+        description="The compression to apply to entries: zlib, zstd or none (sharded cache only).",
+        default=graphrag_config_defaults.cache.compression,
+    )
+    max_size_mb: int | None = Field(
+        description="The size limit of the cache in megabytes; least recently used entries are evicted beyond it (sharded cache only).",
+        default=graphrag_config_defaults.cache.max_size_mb,
+    )
+    max_age_days: float | None = Field(
+        description="The age after which entries expire (sharded cache only).",
+        default=graphrag_config_defaults.cache.max_age_days,
+    )
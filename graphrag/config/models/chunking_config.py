@@ -6,7 +6,7 @@
 from pydantic import BaseModel, Field
 
 from graphrag.config.defaults import graphrag_config_defaults
-from graphrag.config.enums import ChunkStrategyType
+from graphrag.config.enums import AsyncType, ChunkStrategyType
 
 
 class ChunkingConfig(BaseModel):
@@ -40,3 +40,7 @@ class ChunkingConfig(BaseModel):
         description="Count metadata in max tokens.",
         default=graphrag_config_defaults.chunks.chunk_size_includes_metadata,
     )
+    async_mode: AsyncType | None = Field(
+        description="Set to process to chunk documents on a pool of worker processes.",
+        default=graphrag_config_defaults.chunks.async_mode,
+    )
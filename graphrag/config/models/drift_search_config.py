@@ -72,6 +72,11 @@ class DRIFTSearchConfig(BaseModel):
         default=graphrag_config_defaults.drift_search.n_depth,
     )
 
+    follow_up_similarity_threshold: float | None = Field(
+        description="The embedding similarity above which a follow-up query is merged into an earlier one instead of being searched. Disabled when unset.",
+        default=graphrag_config_defaults.drift_search.follow_up_similarity_threshold,
+    )
+
     local_search_text_unit_prop: float = Field(
         description="The proportion of search dedicated to text units.",
         default=graphrag_config_defaults.drift_search.local_search_text_unit_prop,
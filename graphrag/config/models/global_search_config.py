@@ -23,6 +23,10 @@ class GlobalSearchConfig(BaseModel):
         description="The model ID to use for global search.",
         default=graphrag_config_defaults.global_search.chat_model_id,
     )
+    embedding_model_id: str = Field(
+        description="The model ID to use for text embeddings when pruning dynamic community selection.",
+        default=graphrag_config_defaults.global_search.embedding_model_id,
+    )
     knowledge_prompt: str | None = Field(
         description="The global search general prompt to use.",
         default=graphrag_config_defaults.global_search.knowledge_prompt,
@@ -43,6 +47,10 @@ class GlobalSearchConfig(BaseModel):
         description="The reduce llm maximum response length in words.",
         default=graphrag_config_defaults.global_search.reduce_max_length,
     )
+    map_early_stop_score: int | None = Field(
+        description="Stop the map step once the reduce context is full of key points scoring at least this much. Disabled when unset.",
+        default=graphrag_config_defaults.global_search.map_early_stop_score,
+    )
 
     # configurations for dynamic community selection
     dynamic_search_threshold: int = Field(
@@ -65,3 +73,7 @@ class GlobalSearchConfig(BaseModel):
         description="The maximum level of community hierarchy to consider if none of the processed communities are relevant",
         default=graphrag_config_defaults.global_search.dynamic_search_max_level,
     )
+    dynamic_search_min_similarity: float | None = Field(
+        description="The minimum embedding similarity between the query and a community report summary to rate the community. Less similar communities and their subtrees are pruned without being rated. Disabled when unset.",
+        default=graphrag_config_defaults.global_search.dynamic_search_min_similarity,
+    )
@@ -341,9 +341,9 @@ class GraphRagConfig(BaseModel):
     def _validate_vector_store_db_uri(self) -> None:
         """Validate the vector store configuration."""
         for store in self.vector_store.values():
-            if store.type == VectorStoreType.LanceDB:
+            if store.type in (VectorStoreType.LanceDB, VectorStoreType.Memmap):
                 if not store.db_uri or store.db_uri.strip == "":
-                    msg = "Vector store URI is required for LanceDB. Please rerun `graphrag init` and set the vector store configuration."
+                    msg = f"Vector store URI is required for {store.type}. Please rerun `graphrag init` and set the vector store configuration."
                     raise ValueError(msg)
                 store.db_uri = str((Path(self.root_dir) / store.db_uri).resolve())
 
@@ -48,3 +48,7 @@ class InputConfig(BaseModel):
         description="The document attribute columns to use.",
         default=graphrag_config_defaults.input.metadata,
     )
+    concurrency: int = Field(
+        description="The number of input files to read at once.",
+        default=graphrag_config_defaults.input.concurrency,
+    )
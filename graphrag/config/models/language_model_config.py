@@ -303,6 +303,10 @@ class LanguageModelConfig(BaseModel):
         description="The rate limit strategy to use for the LLM service.",
         default=language_model_defaults.rate_limit_strategy,
     )
+    rate_limit_coordinator: str | None = Field(
+        description="Path of a file through which processes share the token_bucket rate limit budget of this model.",
+        default=language_model_defaults.rate_limit_coordinator,
+    )
 
     retry_strategy: str = Field(
         description="The retry strategy to use for the LLM service.",
@@ -3,9 +3,11 @@
 
 """Parameterization settings for the default configuration."""
 
+from pathlib import Path
+
 from pydantic import BaseModel, Field, model_validator
 
-from graphrag.config.defaults import vector_store_defaults
+from graphrag.config.defaults import DEFAULT_OUTPUT_BASE_DIR, vector_store_defaults
 from graphrag.config.embeddings import all_embeddings
 from graphrag.config.enums import VectorStoreType
 from graphrag.config.models.vector_store_schema_config import VectorStoreSchemaConfig
@@ -31,10 +33,16 @@ class VectorStoreConfig(BaseModel):
         ):
             self.db_uri = vector_store_defaults.db_uri
 
-        if self.type != VectorStoreType.LanceDB.value and (
-            self.db_uri is not None and self.db_uri.strip() != ""
+        if self.type == VectorStoreType.Memmap.value and (
+            self.db_uri is None or self.db_uri.strip() == ""
         ):
-            msg = "vector_store.db_uri is only used when vector_store.type == lancedb. Please rerun `graphrag init` and select the correct vector store type."
+            self.db_uri = str(Path(DEFAULT_OUTPUT_BASE_DIR) / "vectors")
+
+        if self.type not in (
+            VectorStoreType.LanceDB.value,
+            VectorStoreType.Memmap.value,
+        ) and (self.db_uri is not None and self.db_uri.strip() != ""):
+            msg = "vector_store.db_uri is only used when vector_store.type == lancedb or vector_store.type == memmap. Please rerun `graphrag init` and select the correct vector store type."
             raise ValueError(msg)
 
     url: str | None = Field(
@@ -56,7 +64,7 @@ class VectorStoreConfig(BaseModel):
             msg = "vector_store.url is required when vector_store.type == cosmos_db. Please rerun `graphrag init` and select the correct vector store type."
             raise ValueError(msg)
 
-        if self.type == VectorStoreType.LanceDB and (
+        if self.type in (VectorStoreType.LanceDB, VectorStoreType.Memmap) and (
             self.url is not None and self.url.strip() != ""
         ):
             msg = "vector_store.url is only used when vector_store.type == azure_ai_search or vector_store.type == cosmos_db. Please rerun `graphrag init` and select the correct vector store type."
@@ -87,6 +95,16 @@ class VectorStoreConfig(BaseModel):
         default=vector_store_defaults.overwrite,
     )
 
+    ivf_lists: int = Field(
+        description="The number of IVF lists to build when type == memmap. 0 disables the IVF index.",
+        default=vector_store_defaults.ivf_lists,
+    )
+
+    ivf_probes: int = Field(
+        description="The number of IVF lists searched per query when type == memmap.",
+        default=vector_store_defaults.ivf_probes,
+    )
+
     embeddings_schema: dict[str, VectorStoreSchemaConfig] = {}
 
     def _validate_embeddings_schema(self) -> None:
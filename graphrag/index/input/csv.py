@@ -9,7 +9,7 @@ from io import BytesIO
 import pandas as pd
 
 from graphrag.config.models.input_config import InputConfig
-from graphrag.index.input.util import load_files, process_data_columns
+from graphrag.index.input.util import FileLoader, load_files, process_data_columns
 from graphrag.storage.pipeline_storage import PipelineStorage
 
 logger = logging.getLogger(__name__)
@@ -21,23 +21,24 @@ async def load_csv(
 ) -> pd.DataFrame:
     """Load csv inputs from a directory."""
     logger.info("Loading csv files from %s", config.storage.base_dir)
+    return await load_files(csv_file_loader(config, storage), config, storage)
+
+
+def csv_file_loader(config: InputConfig, storage: PipelineStorage) -> FileLoader:
+    """Create a loader reading a csv file into one document per row."""
 
     async def load_file(path: str, group: dict | None) -> pd.DataFrame:
         if group is None:
             group = {}
         buffer = BytesIO(await storage.get(path, as_bytes=True))
         data = pd.read_csv(buffer, encoding=config.encoding)
-        additional_keys = group.keys()
-        if len(additional_keys) > 0:
-            data[[*additional_keys]] = data.apply(
-                lambda _row: pd.Series([group[key] for key in additional_keys]), axis=1
-            )
+        for key, value in group.items():
+            data[key] = value
 
         data = process_data_columns(data, config, path)
 
-        creation_date = await storage.get_creation_date(path)
-        data["creation_date"] = data.apply(lambda _: creation_date, axis=1)
+        data["creation_date"] = await storage.get_creation_date(path)
 
         return data
 
-    return await load_files(load_file, config, storage)
+    return load_file
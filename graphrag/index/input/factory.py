@@ -4,16 +4,17 @@
 """A module containing create_input method definition."""
 
 import logging
-from collections.abc import Awaitable, Callable
+from collections.abc import AsyncIterator, Awaitable, Callable
 from typing import cast
 
 import pandas as pd
 
 from graphrag.config.enums import InputFileType
 from graphrag.config.models.input_config import InputConfig
-from graphrag.index.input.csv import load_csv
-from graphrag.index.input.json import load_json
-from graphrag.index.input.text import load_text
+from graphrag.index.input.csv import csv_file_loader, load_csv
+from graphrag.index.input.json import json_file_loader, load_json
+from graphrag.index.input.text import load_text, text_file_loader
+from graphrag.index.input.util import FILE_BATCH_SIZE, FileLoader, stream_files
 from graphrag.storage.pipeline_storage import PipelineStorage
 
 logger = logging.getLogger(__name__)
@@ -22,6 +23,11 @@ loaders: dict[str, Callable[..., Awaitable[pd.DataFrame]]] = {
     InputFileType.csv: load_csv,
     InputFileType.json: load_json,
 }
+file_loaders: dict[str, Callable[[InputConfig, PipelineStorage], FileLoader]] = {
+    InputFileType.text: text_file_loader,
+    InputFileType.csv: csv_file_loader,
+    InputFileType.json: json_file_loader,
+}
 
 
 async def create_input(
@@ -35,22 +41,44 @@ async def create_input(
         logger.info("Loading Input %s", config.file_type)
         loader = loaders[config.file_type]
         result = await loader(config, storage)
-        # Convert metadata columns to strings and collapse them into a JSON object
-        if config.metadata:
-            if all(col in result.columns for col in config.metadata):
-                # Collapse the metadata columns into a single JSON object column
-                result["metadata"] = result[config.metadata].apply(
-                    lambda row: row.to_dict(), axis=1
-                )
-            else:
-                value_error_msg = (
-                    "One or more metadata columns not found in the DataFrame."
-                )
-                raise ValueError(value_error_msg)
-
-            result[config.metadata] = result[config.metadata].astype(str)
-
-        return cast("pd.DataFrame", result)
+        return cast("pd.DataFrame", process_metadata_columns(result, config))
 
     msg = f"Unknown input type {config.file_type}"
     raise ValueError(msg)
+
+
+async def stream_input(
+    config: InputConfig,
+    storage: PipelineStorage,
+    batch_size: int = FILE_BATCH_SIZE,
+) -> AsyncIterator[pd.DataFrame]:
+    """Instantiate input data for a pipeline as a stream of batches, each with the documents of `batch_size` files."""
+    logger.info("loading input from root_dir=%s", config.storage.base_dir)
+
+    if config.file_type not in file_loaders:
+        msg = f"Unknown input type {config.file_type}"
+        raise ValueError(msg)
+
+    logger.info("Streaming Input %s", config.file_type)
+    loader = file_loaders[config.file_type](config, storage)
+    async for batch in stream_files(loader, config, storage, batch_size):
+        yield process_metadata_columns(batch, config)
+
+
+def process_metadata_columns(
+    documents: pd.DataFrame, config: InputConfig
+) -> pd.DataFrame:
+    """Convert metadata columns to strings and collapse them into a JSON object."""
+    if config.metadata:
+        if all(col in documents.columns for col in config.metadata):
+            # Collapse the metadata columns into a single JSON object column
+            documents["metadata"] = documents[config.metadata].apply(
+                lambda row: row.to_dict(), axis=1
+            )
+        else:
+            value_error_msg = "One or more metadata columns not found in the DataFrame."
+            raise ValueError(value_error_msg)
+
+        documents[config.metadata] = documents[config.metadata].astype(str)
+
+    return documents
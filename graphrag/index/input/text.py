@@ -9,7 +9,7 @@ from pathlib import Path
 import pandas as pd
 
 from graphrag.config.models.input_config import InputConfig
-from graphrag.index.input.util import load_files
+from graphrag.index.input.util import FileLoader, load_files
 from graphrag.index.utils.hashing import gen_sha512_hash
 from graphrag.storage.pipeline_storage import PipelineStorage
 
@@ -21,6 +21,11 @@ async def load_text(
     storage: PipelineStorage,
 ) -> pd.DataFrame:
     """Load text inputs from a directory."""
+    return await load_files(text_file_loader(config, storage), config, storage)
+
+
+def text_file_loader(config: InputConfig, storage: PipelineStorage) -> FileLoader:
+    """Create a loader reading a text file into a single document."""
 
     async def load_file(path: str, group: dict | None = None) -> pd.DataFrame:
         if group is None:
@@ -32,4 +37,4 @@ async def load_text(
         new_item["creation_date"] = await storage.get_creation_date(path)
         return pd.DataFrame([new_item])
 
-    return await load_files(load_file, config, storage)
+    return load_file
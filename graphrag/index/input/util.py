@@ -3,25 +3,54 @@
 
 """Shared column processing for structured input files."""
 
+import asyncio
 import logging
 import re
-from typing import Any
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from itertools import islice
 
 import pandas as pd
 
 from graphrag.config.models.input_config import InputConfig
-from graphrag.index.utils.hashing import gen_sha512_hash
+from graphrag.index.utils.hashing import gen_sha512_hashes
 from graphrag.storage.pipeline_storage import PipelineStorage
 
 logger = logging.getLogger(__name__)
 
+FileLoader = Callable[[str, dict | None], Awaitable[pd.DataFrame]]
+"""Load a file found in storage, with the groups its path matched, into a DataFrame."""
+
+FILE_BATCH_SIZE = 1_000
+"""The number of files whose rows are combined into each streamed batch."""
+
 
 async def load_files(
-    loader: Any,
+    loader: FileLoader,
     config: InputConfig,
     storage: PipelineStorage,
 ) -> pd.DataFrame:
     """Load files from storage and apply a loader function."""
+    result = pd.concat([batch async for batch in stream_files(loader, config, storage)])
+    total_files_log = (
+        f"Total number of unfiltered {config.file_type} rows: {len(result)}"
+    )
+    logger.info(total_files_log)
+    return result
+
+
+async def stream_files(
+    loader: FileLoader,
+    config: InputConfig,
+    storage: PipelineStorage,
+    batch_size: int = FILE_BATCH_SIZE,
+) -> AsyncIterator[pd.DataFrame]:
+    """Load files from storage and apply a loader function, yielding the rows of every `batch_size` files.
+
+    Up to `config.concurrency` files are read at once, and batches keep the
+    order in which storage found the files. Only the files of the current
+    batch, and those being read ahead, are held in memory.
+    """
     files = list(
         storage.find(
             re.compile(config.file_pattern),
@@ -33,24 +62,57 @@ async def load_files(
         msg = f"No {config.file_type} files found in {config.storage.base_dir}"
         raise ValueError(msg)
 
-    files_loaded = []
+    num_loaded = 0
+    batch = []
+    async for data in _load_in_order(loader, files, config.concurrency):
+        if data is None:
+            continue
+        num_loaded += 1
+        batch.append(data)
+        if len(batch) >= batch_size:
+            yield pd.concat(batch)
+            batch = []
+    if batch:
+        yield pd.concat(batch)
+
+    logger.info(
+        "Found %d %s files, loading %d", len(files), config.file_type, num_loaded
+    )
+    if num_loaded == 0:
+        msg = f"None of the {config.file_type} files in {config.storage.base_dir} could be loaded"
+        raise ValueError(msg)
+
 
-    for file, group in files:
+async def _load_in_order(
+    loader: FileLoader,
+    files: Iterable[tuple[str, dict | None]],
+    concurrency: int,
+) -> AsyncIterator[pd.DataFrame | None]:
+    """Load files with up to `concurrency` reads at once, yielding them in order, or None for files that failed to load."""
+
+    async def load(file: str, group: dict | None) -> pd.DataFrame | None:
         try:
-            files_loaded.append(await loader(file, group))
+            return await loader(file, group)
         except Exception as e:  # noqa: BLE001 (catching Exception is fine here)
             logger.warning("Warning! Error loading file %s. Skipping...", file)
             logger.warning("Error: %s", e)
+            return None
 
-    logger.info(
-        "Found %d %s files, loading %d", len(files), config.file_type, len(files_loaded)
+    remaining = iter(files)
+    pending = deque(
+        asyncio.create_task(load(file, group))
+        for file, group in islice(remaining, max(concurrency, 1))
     )
-    result = pd.concat(files_loaded)
-    total_files_log = (
-        f"Total number of unfiltered {config.file_type} rows: {len(result)}"
-    )
-    logger.info(total_files_log)
-    return result
+    try:
+        while pending:
+            data = await pending.popleft()
+            next_file = next(remaining, None)
+            if next_file is not None:
+                pending.append(asyncio.create_task(load(*next_file)))
+            yield data
+    finally:
+        for task in pending:
+            task.cancel()
 
 
 def process_data_columns(
@@ -58,9 +120,7 @@ def process_data_columns(
 ) -> pd.DataFrame:
     """Process configured data columns of a DataFrame."""
     if "id" not in documents.columns:
-        documents["id"] = documents.apply(
-            lambda x: gen_sha512_hash(x, x.keys()), axis=1
-        )
+        documents["id"] = gen_sha512_hashes(documents, documents.columns)
     if config.text_column is not None and "text" not in documents.columns:
         if config.text_column not in documents.columns:
             logger.warning(
@@ -69,7 +129,7 @@ def process_data_columns(
                 path,
             )
         else:
-            documents["text"] = documents.apply(lambda x: x[config.text_column], axis=1)
+            documents["text"] = documents[config.text_column]
     if config.title_column is not None:
         if config.title_column not in documents.columns:
             logger.warning(
@@ -78,9 +138,7 @@ def process_data_columns(
                 path,
             )
         else:
-            documents["title"] = documents.apply(
-                lambda x: x[config.title_column], axis=1
-            )
+            documents["title"] = documents[config.title_column]
     else:
-        documents["title"] = documents.apply(lambda _: path, axis=1)
+        documents["title"] = path
     return documents
@@ -16,7 +16,8 @@ from graphrag.index.operations.build_noun_graph.np_extractors.base import (
 )
 from graphrag.index.utils.derive_from_rows import derive_from_rows
 from graphrag.index.utils.graphs import calculate_pmi_edge_weights
-from graphrag.index.utils.hashing import gen_sha512_hash
+from graphrag.index.utils.hashing import gen_sha512_hashes
+from graphrag.index.utils.process_pool import get_worker_state
 
 
 async def build_noun_graph(
@@ -56,23 +57,36 @@ async def _extract_nodes(
     cache = cache or NoopPipelineCache()
     cache = cache.child("extract_noun_phrases")
 
+    # the same keys as hashing {"text": text, "analyzer": str(text_analyzer)} per text
+    keys = gen_sha512_hashes(
+        pd.DataFrame({
+            "text": text_unit_df["text"].to_numpy(dtype=object),
+            "analyzer": str(text_analyzer),
+        }),
+        ["text", "analyzer"],
+    )
+
     async def extract(row):
         text = row["text"]
-        attrs = {"text": text, "analyzer": str(text_analyzer)}
-        key = gen_sha512_hash(attrs, attrs.keys())
+        key = row["cache_key"]
         result = await cache.get(key)
         if not result:
             result = text_analyzer.extract(text)
             await cache.set(key, result)
         return result
 
-    text_unit_df["noun_phrases"] = await derive_from_rows(
-        text_unit_df,
-        extract,
-        num_threads=num_threads,
-        async_type=async_mode,
-        progress_msg="extract noun phrases progress: ",
-    )
+    if async_mode == AsyncType.Process:
+        text_unit_df["noun_phrases"] = await _extract_in_processes(
+            text_unit_df, text_analyzer, cache, keys, num_threads
+        )
+    else:
+        text_unit_df["noun_phrases"] = await derive_from_rows(
+            text_unit_df.loc[:, ["text"]].assign(cache_key=keys),
+            extract,
+            num_threads=num_threads,
+            async_type=async_mode,
+            progress_msg="extract noun phrases progress: ",
+        )
 
     noun_node_df = text_unit_df.explode("noun_phrases")
     noun_node_df = noun_node_df.rename(
@@ -89,6 +103,42 @@ async def _extract_nodes(
     return grouped_node_df.loc[:, ["title", "frequency", "text_unit_ids"]]
 
 
+async def _extract_in_processes(
+    text_unit_df: pd.DataFrame,
+    text_analyzer: BaseNounPhraseExtractor,
+    cache: PipelineCache,
+    keys: list[str],
+    num_processes: int,
+) -> list[list[str]]:
+    """Extract noun phrases for the cache misses on a process pool, loading the analyzer once per process."""
+    results: list[list[str] | None] = [await cache.get(key) for key in keys]
+    misses = [index for index, result in enumerate(results) if not result]
+    extracted = await derive_from_rows(
+        text_unit_df.iloc[misses].loc[:, ["text"]],
+        _extract_noun_phrases,
+        num_threads=num_processes,
+        async_type=AsyncType.Process,
+        progress_msg="extract noun phrases progress: ",
+        initializer=_load_text_analyzer,
+        initargs=(text_analyzer,),
+    )
+    for index, result in zip(misses, extracted, strict=True):
+        results[index] = result
+        await cache.set(keys[index], result)
+    return [result or [] for result in results]
+
+
+def _load_text_analyzer(
+    text_analyzer: BaseNounPhraseExtractor,
+) -> BaseNounPhraseExtractor:
+    return text_analyzer
+
+
+def _extract_noun_phrases(row: pd.Series) -> list[str]:
+    text_analyzer: BaseNounPhraseExtractor = get_worker_state()
+    return text_analyzer.extract(str(row["text"]))
+
+
 def _extract_edges(
     nodes_df: pd.DataFrame,
     normalize_edge_weights: bool = True,
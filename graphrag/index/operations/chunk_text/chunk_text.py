@@ -3,18 +3,27 @@
 
 """A module containing _get_num_total, chunk, run_strategy and load_strategy methods definitions."""
 
+from collections.abc import Sequence
 from typing import Any, cast
 
 import pandas as pd
 
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
+from graphrag.config.enums import AsyncType
 from graphrag.config.models.chunking_config import ChunkingConfig, ChunkStrategyType
 from graphrag.index.operations.chunk_text.typing import (
     ChunkInput,
     ChunkStrategy,
 )
+from graphrag.index.utils.process_pool import (
+    get_num_processes,
+    get_worker_state,
+    map_in_processes,
+)
 from graphrag.logger.progress import ProgressTicker, progress_ticker
 
+ChunkOutput = list[str | tuple[list[str] | None, str, int]]
+
 
 def chunk_text(
     input: pd.DataFrame,
@@ -24,6 +33,8 @@ def chunk_text(
     encoding_model: str,
     strategy: ChunkStrategyType,
     callbacks: WorkflowCallbacks,
+    async_mode: AsyncType | None = None,
+    num_processes: int | None = None,
 ) -> pd.Series:
     """
     Chunk a piece of text into smaller pieces.
@@ -53,12 +64,29 @@ def chunk_text(
     ```yaml
     strategy: sentence
     ```
-    """
-    strategy_exec = load_strategy(strategy)
 
+    With `async_mode: process`, rows are chunked on a pool of worker processes,
+    one per available core unless `num_processes` is given.
+    """
     num_total = _get_num_total(input, column)
     tick = progress_ticker(callbacks.progress, num_total)
 
+    if async_mode == AsyncType.Process:
+        return pd.Series(
+            chunk_in_processes(
+                [(value, size) for value in input[column]],
+                overlap=overlap,
+                encoding_model=encoding_model,
+                strategy=strategy,
+                tick=tick,
+                num_processes=num_processes,
+            ),
+            index=input.index,
+            dtype="object",
+        )
+
+    strategy_exec = load_strategy(strategy)
+
     # collapse the config back to a single object to support "polymorphic" function call
     config = ChunkingConfig(size=size, overlap=overlap, encoding_model=encoding_model)
 
@@ -84,7 +112,7 @@ def run_strategy(
     input: ChunkInput,
     config: ChunkingConfig,
     tick: ProgressTicker,
-) -> list[str | tuple[list[str] | None, str, int]]:
+) -> ChunkOutput:
     """Run strategy method definition."""
     if isinstance(input, str):
         return [item.text_chunk for item in strategy_exec([input], config, tick)]
@@ -111,6 +139,55 @@ def run_strategy(
     return results
 
 
+def chunk_in_processes(
+    inputs: Sequence[tuple[ChunkInput, int]],
+    overlap: int,
+    encoding_model: str,
+    strategy: ChunkStrategyType,
+    tick: ProgressTicker,
+    num_processes: int | None = None,
+) -> list[ChunkOutput]:
+    """
+    Chunk (input, chunk size) pairs on a process pool, returning the chunks of each input in order.
+
+    Each worker process loads the strategy and its tokenizer once.
+    """
+    num_docs = iter([
+        1 if isinstance(value, str) else len(value) for value, _ in inputs
+    ])
+    return map_in_processes(
+        _run_strategy_in_process,
+        inputs,
+        num_processes=get_num_processes(num_processes),
+        initializer=_load_process_strategy,
+        initargs=(strategy, overlap, encoding_model),
+        on_result=lambda _: tick(next(num_docs)),
+    )
+
+
+def _load_process_strategy(
+    strategy: ChunkStrategyType, overlap: int, encoding_model: str
+) -> tuple[ChunkStrategy, ChunkingConfig]:
+    strategy_exec = load_strategy(strategy)
+    if strategy == ChunkStrategyType.tokens:
+        import tiktoken
+
+        # load the encoding once, later lookups hit tiktoken's cache
+        tiktoken.get_encoding(encoding_model)
+    return strategy_exec, ChunkingConfig(overlap=overlap, encoding_model=encoding_model)
+
+
+def _run_strategy_in_process(item: tuple[ChunkInput, int]) -> ChunkOutput:
+    strategy_exec, config = get_worker_state()
+    value, size = item
+    return run_strategy(
+        strategy_exec,
+        value,
+        config.model_copy(update={"size": size}),
+        progress_ticker(None, 0),
+    )
+
+
 def load_strategy(strategy: ChunkStrategyType) -> ChunkStrategy:
     """Load strategy method definition."""
     match strategy:
@@ -32,6 +32,21 @@ def get_encoding_fn(encoding_name):
     return encode, decode
 
 
+def get_batch_encoding_fn(encoding_name):
+    """Get functions encoding and decoding several texts at once with the encoding model."""
+    enc = tiktoken.get_encoding(encoding_name)
+
+    def encode_batch(texts: list[str]) -> list[list[int]]:
+        return enc.encode_batch([
+            text if isinstance(text, str) else f"{text}" for text in texts
+        ])
+
+    def decode_batch(batch: list[list[int]]) -> list[str]:
+        return enc.decode_batch(batch)
+
+    return encode_batch, decode_batch
+
+
 def run_tokens(
     input: list[str],
     config: ChunkingConfig,
@@ -43,6 +58,7 @@ def run_tokens(
     encoding_name = config.encoding_model
 
     encode, decode = get_encoding_fn(encoding_name)
+    encode_batch, decode_batch = get_batch_encoding_fn(encoding_name)
     return split_multiple_texts_on_tokens(
         input,
         TokenChunkerOptions(
@@ -50,6 +66,8 @@ def run_tokens(
             tokens_per_chunk=tokens_per_chunk,
             encode=encode,
             decode=decode,
+            encode_batch=encode_batch,
+            decode_batch=decode_batch,
         ),
         tick,
     )
@@ -180,6 +180,7 @@ async def _text_embed_with_vector_store(
         starting_index += len(documents)
         i += 1
 
+    vector_store.finalize_load()
     return all_results
 
 
@@ -3,7 +3,6 @@
 
 """A module containing the summarize_descriptions verb."""
 
-import asyncio
 import logging
 from typing import Any
 
@@ -15,7 +14,7 @@ from graphrag.index.operations.summarize_descriptions.typing import (
     SummarizationStrategy,
     SummarizeStrategyType,
 )
-from graphrag.logger.progress import ProgressTicker, progress_ticker
+from graphrag.index.utils.derive_from_rows import derive_from_rows
 
 logger = logging.getLogger(__name__)
 
@@ -36,76 +35,57 @@ async def summarize_descriptions(
     )
     strategy_config = {**strategy}
 
-    async def get_summarized(
-        nodes: pd.DataFrame, edges: pd.DataFrame, semaphore: asyncio.Semaphore
-    ):
-        ticker_length = len(nodes) + len(edges)
-
-        ticker = progress_ticker(
-            callbacks.progress,
-            ticker_length,
-            description="Summarize entity/relationship description progress: ",
+    async def summarize_node(row: pd.Series):
+        return await strategy_exec(
+            str(row["title"]), sorted(set(row["description"])), cache, strategy_config
         )
 
-        node_futures = [
-            do_summarize_descriptions(
-                str(row.title),  # type: ignore
-                sorted(set(row.description)),  # type: ignore
-                ticker,
-                semaphore,
-            )
-            for row in nodes.itertuples(index=False)
-        ]
-
-        node_results = await asyncio.gather(*node_futures)
-
-        node_descriptions = [
-            {
-                "title": result.id,
-                "description": result.description,
-            }
-            for result in node_results
-        ]
-
-        edge_futures = [
-            do_summarize_descriptions(
-                (str(row.source), str(row.target)),  # type: ignore
-                sorted(set(row.description)),  # type: ignore
-                ticker,
-                semaphore,
-            )
-            for row in edges.itertuples(index=False)
-        ]
-
-        edge_results = await asyncio.gather(*edge_futures)
-
-        edge_descriptions = [
-            {
-                "source": result.id[0],
-                "target": result.id[1],
-                "description": result.description,
-            }
-            for result in edge_results
-        ]
-
-        entity_descriptions = pd.DataFrame(node_descriptions)
-        relationship_descriptions = pd.DataFrame(edge_descriptions)
-        return entity_descriptions, relationship_descriptions
-
-    async def do_summarize_descriptions(
-        id: str | tuple[str, str],
-        descriptions: list[str],
-        ticker: ProgressTicker,
-        semaphore: asyncio.Semaphore,
-    ):
-        async with semaphore:
-            results = await strategy_exec(id, descriptions, cache, strategy_config)
-            ticker(1)
-        return results
-
-    semaphore = asyncio.Semaphore(num_threads)
+    async def summarize_edge(row: pd.Series):
+        return await strategy_exec(
+            (str(row["source"]), str(row["target"])),
+            sorted(set(row["description"])),
+            cache,
+            strategy_config,
+        )
 
-    return await get_summarized(entities_df, relationships_df, semaphore)
+    node_results = await derive_from_rows(
+        entities_df,
+        summarize_node,
+        callbacks,
+        num_threads=num_threads,
+        progress_msg="Summarize entity description progress: ",
+        fail_fast=True,
+    )
+    node_descriptions = [
+        {
+            "title": result.id,
+            "description": result.description,
+        }
+        for result in node_results
+        if result is not None
+    ]
+
+    edge_results = await derive_from_rows(
+        relationships_df,
+        summarize_edge,
+        callbacks,
+        num_threads=num_threads,
+        progress_msg="Summarize relationship description progress: ",
+        fail_fast=True,
+    )
+    edge_descriptions = [
+        {
+            "source": result.id[0],
+            "target": result.id[1],
+            "description": result.description,
+        }
+        for result in edge_results
+        if result is not None
+    ]
+
+    entity_descriptions = pd.DataFrame(node_descriptions)
+    relationship_descriptions = pd.DataFrame(edge_descriptions)
+    return entity_descriptions, relationship_descriptions
 
 
 def load_strategy(strategy_type: SummarizeStrategyType) -> SummarizationStrategy:
@@ -13,6 +13,7 @@ from typing import Any
 
 import pandas as pd
 
+from graphrag.cache.cache_stats import cache_stats
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
 from graphrag.config.models.graph_rag_config import GraphRagConfig
 from graphrag.index.run.utils import create_run_context
@@ -75,6 +76,7 @@ async def run_pipeline(
             cache=cache,
             callbacks=callbacks,
             state=state,
+            write_behind=True,
         )
 
     else:
@@ -91,6 +93,7 @@ async def run_pipeline(
             cache=cache,
             callbacks=callbacks,
             state=state,
+            write_behind=True,
         )
 
     async for table in _run_pipeline(
@@ -109,6 +112,7 @@ async def _run_pipeline(
     start_time = time.time()
 
     last_workflow = "<startup>"
+    cache_stats.reset()
 
     try:
         await _dump_json(context)
@@ -118,24 +122,40 @@ async def _run_pipeline(
             print(f"DEBUG: Processing workflow {name}") # Added debug
 
             last_workflow = name
+            if name not in pipeline.table_inputs:
+                # the workflow may read the output tables from storage
+                await context.output_tables.flush()
             context.callbacks.workflow_start(name, None)
             work_time = time.time()
             result = await workflow_function(config, context)
+            context.output_tables.check()
+            if name in pipeline.table_inputs:
+                context.output_tables.retain(pipeline.tables_read_after(name))
+            else:
+                # the workflow may have written tables to storage directly
+                context.output_tables.retain(())
             context.callbacks.workflow_end(name, result)
             yield PipelineRunResult(
                 workflow=name, result=result.result, state=context.state, errors=None
             )
             context.stats.workflows[name] = {"overall": time.time() - work_time}
+            context.stats.llm_cache = cache_stats.to_dict()
             if result.stop:
                 logger.info("Halting pipeline at workflow request")
                 break
 
+        await context.output_tables.flush()
         context.stats.total_runtime = time.time() - start_time
         logger.info("Indexing pipeline complete.")
         await _dump_json(context)
 
     except Exception as e:
         logger.exception("error running workflow %s", last_workflow)
+        try:
+            # write the tables of the workflows that completed, as they were before the error
+            await context.output_tables.flush()
+        except Exception:
+            logger.exception("error writing the output tables")
         yield PipelineRunResult(
             workflow=last_workflow, result=None, state=context.state, errors=[e]
         )
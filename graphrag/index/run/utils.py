@@ -12,6 +12,7 @@ from graphrag.config.models.graph_rag_config import GraphRagConfig
 from graphrag.index.typing.context import PipelineRunContext
 from graphrag.index.typing.state import PipelineState
 from graphrag.index.typing.stats import PipelineRunStats
+from graphrag.index.utils.table_cache import TableCache
 from graphrag.storage.memory_pipeline_storage import MemoryPipelineStorage
 from graphrag.storage.pipeline_storage import PipelineStorage
 from graphrag.utils.api import create_storage_from_config
@@ -25,11 +26,17 @@ def create_run_context(
     callbacks: WorkflowCallbacks | None = None,
     stats: PipelineRunStats | None = None,
     state: PipelineState | None = None,
+    write_behind: bool = False,
 ) -> PipelineRunContext:
-    """Create the run context for the pipeline."""
+    """Create the run context for the pipeline.
+
+    With `write_behind`, output tables are written to the output storage in the background.
+    """
+    output_storage = output_storage or MemoryPipelineStorage()
     return PipelineRunContext(
         input_storage=input_storage or MemoryPipelineStorage(),
-        output_storage=output_storage or MemoryPipelineStorage(),
+        output_storage=output_storage,
+        output_tables=TableCache(output_storage, write_behind=write_behind),
         previous_storage=previous_storage or MemoryPipelineStorage(),
         cache=cache or InMemoryCache(),
         callbacks=callbacks or NoopWorkflowCallbacks(),
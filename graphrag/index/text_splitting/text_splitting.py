@@ -9,6 +9,7 @@ from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 from typing import Any, cast
 
+import numpy as np
 import pandas as pd
 
 from graphrag.index.operations.chunk_text.typing import TextChunk
@@ -19,8 +20,13 @@ from graphrag.tokenizer.tokenizer import Tokenizer
 EncodedText = list[int]
 DecodeFn = Callable[[EncodedText], str]
 EncodeFn = Callable[[str], EncodedText]
+DecodeBatchFn = Callable[[list[EncodedText]], list[str]]
+EncodeBatchFn = Callable[[list[str]], list[EncodedText]]
 LengthFn = Callable[[str], int]
 
+TEXT_BATCH_SIZE = 256
+"""Number of texts encoded, or chunks decoded, per batch."""
+
 logger = logging.getLogger(__name__)
 
 
@@ -36,6 +42,10 @@ class TokenChunkerOptions:
     """ Function to decode a list of token ids to a string"""
     encode: EncodeFn
     """ Function to encode a string to a list of token ids"""
+    decode_batch: DecodeBatchFn | None = None
+    """Function to decode several lists of token ids at once, defaults to `decode` on each"""
+    encode_batch: EncodeBatchFn | None = None
+    """Function to encode several strings at once, defaults to `encode` on each"""
 
 
 class TextSplitter(ABC):
@@ -142,32 +152,88 @@ def split_single_text_on_tokens(text: str, tokenizer: TokenChunkerOptions) -> li
 def split_multiple_texts_on_tokens(
     texts: list[str], tokenizer: TokenChunkerOptions, tick: ProgressTicker
 ) -> list[TextChunk]:
-    """Split multiple texts and return chunks with metadata using the tokenizer."""
-    result = []
-    mapped_ids = []
-
-    for source_doc_idx, text in enumerate(texts):
-        encoded = tokenizer.encode(text)
-        if tick:
-            tick(1)  # Track progress if tick callback is provided
-        mapped_ids.append((source_doc_idx, encoded))
+    """Split multiple texts and return chunks with metadata using the tokenizer.
+
+    The texts are concatenated into a single token array, and windows of
+    `tokens_per_chunk` tokens overlapping by `chunk_overlap` are cut across
+    text boundaries. Each chunk lists the texts its tokens come from.
+
+    Tokens are held in one contiguous array with the offset at which each text
+    ends, so memory grows linearly with the number of tokens, and the texts
+    each chunk spans are found from the window bounds by binary search.
+    """
+    tokens, text_ends = _encode_texts(texts, tokenizer, tick)
+    window_starts = _window_starts(len(tokens), tokenizer)
+    window_stops = np.minimum(window_starts + tokenizer.tokens_per_chunk, len(tokens))
+
+    # texts without tokens are never part of a chunk
+    non_empty = np.flatnonzero(np.diff(text_ends, prepend=0))
+    non_empty_ends = text_ends[non_empty]
+    first_texts = np.searchsorted(non_empty_ends, window_starts, side="right")
+    last_texts = np.searchsorted(non_empty_ends, window_stops - 1, side="right")
 
-    input_ids = [
-        (source_doc_idx, id) for source_doc_idx, ids in mapped_ids for id in ids
-    ]
+    result = []
+    for batch_start in range(0, len(window_starts), TEXT_BATCH_SIZE):
+        batch = range(
+            batch_start, min(batch_start + TEXT_BATCH_SIZE, len(window_starts))
+        )
+        chunk_texts = _decode_batch(
+            [tokens[window_starts[i] : window_stops[i]].tolist() for i in batch],
+            tokenizer,
+        )
+        for i, chunk_text in zip(batch, chunk_texts, strict=True):
+            # listed in set order, as chunks always have been, so their ids are stable
+            doc_indices = list(
+                set(non_empty[first_texts[i] : last_texts[i] + 1].tolist())
+            )
+            result.append(
+                TextChunk(
+                    chunk_text,
+                    doc_indices,
+                    int(window_stops[i] - window_starts[i]),
+                )
+            )
 
-    start_idx = 0
-    cur_idx = min(start_idx + tokenizer.tokens_per_chunk, len(input_ids))
-    chunk_ids = input_ids[start_idx:cur_idx]
+    return result
 
-    while start_idx < len(input_ids):
-        chunk_text = tokenizer.decode([id for _, id in chunk_ids])
-        doc_indices = list({doc_idx for doc_idx, _ in chunk_ids})
-        result.append(TextChunk(chunk_text, doc_indices, len(chunk_ids)))
-        if cur_idx == len(input_ids):
-            break
-        start_idx += tokenizer.tokens_per_chunk - tokenizer.chunk_overlap
-        cur_idx = min(start_idx + tokenizer.tokens_per_chunk, len(input_ids))
-        chunk_ids = input_ids[start_idx:cur_idx]
 
-    return result
+def _encode_texts(
+    texts: list[str], tokenizer: TokenChunkerOptions, tick: ProgressTicker
+) -> tuple[np.ndarray, np.ndarray]:
+    """Encode texts in batches into one token array and the offset at which each text ends."""
+    encoded = []
+    for batch_start in range(0, len(texts), TEXT_BATCH_SIZE):
+        batch = texts[batch_start : batch_start + TEXT_BATCH_SIZE]
+        if tokenizer.encode_batch is not None:
+            batch_ids = tokenizer.encode_batch(batch)
+        else:
+            batch_ids = [tokenizer.encode(text) for text in batch]
+        for ids in batch_ids:
+            encoded.append(np.asarray(ids, dtype=np.uint32))
+            if tick:
+                tick(1)  # Track progress if tick callback is provided
+
+    text_ends = np.cumsum([len(ids) for ids in encoded], dtype=np.int64)
+    tokens = np.concatenate(encoded) if encoded else np.empty(0, dtype=np.uint32)
+    return tokens, text_ends
+
+
+def _window_starts(num_tokens: int, tokenizer: TokenChunkerOptions) -> np.ndarray:
+    """Get the start of each chunk window, the last one reaching the end of the tokens."""
+    if num_tokens <= tokenizer.tokens_per_chunk:
+        return np.arange(min(num_tokens, 1), dtype=np.int64)
+    step = tokenizer.tokens_per_chunk - tokenizer.chunk_overlap
+    if step <= 0:
+        msg = "Chunk overlap must be smaller than the number of tokens per chunk."
+        raise ValueError(msg)
+    starts = np.arange(0, num_tokens, step, dtype=np.int64)
+    last = np.searchsorted(starts + tokenizer.tokens_per_chunk, num_tokens)
+    return starts[: last + 1]
+
+
+def _decode_batch(
+    batch: list[EncodedText], tokenizer: TokenChunkerOptions
+) -> list[str]:
+    if tokenizer.decode_batch is not None:
+        return tokenizer.decode_batch(batch)
+    return [tokenizer.decode(ids) for ids in batch]
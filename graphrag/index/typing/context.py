@@ -10,6 +10,7 @@ from graphrag.cache.pipeline_cache import PipelineCache
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
 from graphrag.index.typing.state import PipelineState
 from graphrag.index.typing.stats import PipelineRunStats
+from graphrag.index.utils.table_cache import TableCache
 from graphrag.storage.pipeline_storage import PipelineStorage
 
 
@@ -22,6 +23,8 @@ class PipelineRunContext:
     "Storage for input documents."
     output_storage: PipelineStorage
     "Long-term storage for pipeline verbs to use. Items written here will be written to the storage provider."
+    output_tables: TableCache
+    "Tables of the output storage, handed to later workflows in memory and written through to the output storage."
     previous_storage: PipelineStorage
     "Storage for previous pipeline run when running in update mode."
     cache: PipelineCache
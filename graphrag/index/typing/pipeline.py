@@ -11,8 +11,14 @@ from graphrag.index.typing.workflow import Workflow
 class Pipeline:
     """Encapsulates running workflows."""
 
-    def __init__(self, workflows: list[Workflow]):
+    def __init__(
+        self,
+        workflows: list[Workflow],
+        table_inputs: dict[str, list[str]] | None = None,
+    ):
         self.workflows = workflows
+        # the output tables read by each workflow that declares them
+        self.table_inputs = table_inputs or {}
 
     def run(self) -> Generator[Workflow]:
         """Return a Generator over the pipeline workflows."""
@@ -22,6 +28,15 @@ class Pipeline:
         """Return the names of the workflows in the pipeline."""
         return [name for name, _ in self.workflows]
 
+    def tables_read_after(self, name: str) -> set[str]:
+        """Return the output tables read by the workflows after a workflow, of those that declare them."""
+        names = self.names()
+        return {
+            table
+            for later in names[names.index(name) + 1 :]
+            for table in self.table_inputs.get(later, [])
+        }
+
     def remove(self, name: str) -> None:
         """Remove a workflow from the pipeline by name."""
         self.workflows = [w for w in self.workflows if w[0] != name]
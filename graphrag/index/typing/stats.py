@@ -23,3 +23,6 @@ class PipelineRunStats:
 
     workflows: dict[str, dict[str, float]] = field(default_factory=dict)
     """A dictionary of workflows."""
+
+    llm_cache: dict[str, int] = field(default_factory=dict)
+    """The LLM cache hit, miss and coalesce counters."""
@@ -7,19 +7,31 @@ import asyncio
 import inspect
 import logging
 import traceback
-from collections.abc import Awaitable, Callable, Coroutine, Hashable
-from typing import Any, TypeVar, cast
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Hashable,
+    Iterable,
+    Sequence,
+)
+from typing import Any, TypeVar, cast, overload
 
 import pandas as pd
 
 from graphrag.callbacks.noop_workflow_callbacks import NoopWorkflowCallbacks
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
 from graphrag.config.enums import AsyncType
+from graphrag.index.utils.process_pool import astream_in_processes, get_num_processes
 from graphrag.logger.progress import progress_ticker
 
 logger = logging.getLogger(__name__)
 ItemType = TypeVar("ItemType")
 
+WINDOW_SIZE_PER_WORKER = 16
+"""Rows a worker may run ahead of the oldest unfinished row, bounding buffered results."""
+
 
 class ParallelizationError(ValueError):
     """Exception for invalid parallel processing."""
@@ -31,6 +43,7 @@ class ParallelizationError(ValueError):
         super().__init__(msg)
 
 
+@overload
 async def derive_from_rows(
     input: pd.DataFrame,
     transform: Callable[[pd.Series], Awaitable[ItemType]],
@@ -38,24 +51,171 @@ async def derive_from_rows(
     num_threads: int = 4,
     async_type: AsyncType = AsyncType.AsyncIO,
     progress_msg: str = "",
-) -> list[ItemType | None]:
+    fail_fast: bool = False,
+    initializer: Callable[..., Any] | None = None,
+    initargs: Sequence[Any] = (),
+) -> list[ItemType | None]: ...
+
+
+@overload
+async def derive_from_rows(
+    input: pd.DataFrame,
+    transform: Callable[[pd.Series], ItemType],
+    callbacks: WorkflowCallbacks | None = None,
+    num_threads: int = 4,
+    async_type: AsyncType = AsyncType.AsyncIO,
+    progress_msg: str = "",
+    fail_fast: bool = False,
+    initializer: Callable[..., Any] | None = None,
+    initargs: Sequence[Any] = (),
+) -> list[ItemType | None]: ...
+
+
+async def derive_from_rows(
+    input: pd.DataFrame,
+    transform: Callable[[pd.Series], Any],
+    callbacks: WorkflowCallbacks | None = None,
+    num_threads: int = 4,
+    async_type: AsyncType = AsyncType.AsyncIO,
+    progress_msg: str = "",
+    fail_fast: bool = False,
+    initializer: Callable[..., Any] | None = None,
+    initargs: Sequence[Any] = (),
+) -> list[Any]:
     """Apply a generic transform function to each row. Any errors will be reported and thrown."""
+    return [
+        result
+        async for result in stream_from_rows(
+            input,
+            transform,
+            callbacks,
+            num_threads=num_threads,
+            async_type=async_type,
+            progress_msg=progress_msg,
+            fail_fast=fail_fast,
+            initializer=initializer,
+            initargs=initargs,
+        )
+    ]
+
+
+@overload
+def stream_from_rows(
+    input: pd.DataFrame,
+    transform: Callable[[pd.Series], Awaitable[ItemType]],
+    callbacks: WorkflowCallbacks | None = None,
+    num_threads: int = 4,
+    async_type: AsyncType = AsyncType.AsyncIO,
+    progress_msg: str = "",
+    fail_fast: bool = False,
+    window_size: int | None = None,
+    initializer: Callable[..., Any] | None = None,
+    initargs: Sequence[Any] = (),
+) -> AsyncIterator[ItemType | None]: ...
+
+
+@overload
+def stream_from_rows(
+    input: pd.DataFrame,
+    transform: Callable[[pd.Series], ItemType],
+    callbacks: WorkflowCallbacks | None = None,
+    num_threads: int = 4,
+    async_type: AsyncType = AsyncType.AsyncIO,
+    progress_msg: str = "",
+    fail_fast: bool = False,
+    window_size: int | None = None,
+    initializer: Callable[..., Any] | None = None,
+    initargs: Sequence[Any] = (),
+) -> AsyncIterator[ItemType | None]: ...
+
+
+async def stream_from_rows(
+    input: pd.DataFrame,
+    transform: Callable[[pd.Series], Any],
+    callbacks: WorkflowCallbacks | None = None,
+    num_threads: int = 4,
+    async_type: AsyncType = AsyncType.AsyncIO,
+    progress_msg: str = "",
+    fail_fast: bool = False,
+    window_size: int | None = None,
+    initializer: Callable[..., Any] | None = None,
+    initargs: Sequence[Any] = (),
+) -> AsyncIterator[Any]:
+    """
+    Apply a generic transform function to each row, yielding the results in row order.
+
+    A fixed pool of `num_threads` workers pulls rows from a lazy row iterator.
+    Workers may run at most `window_size` rows ahead of the oldest unfinished
+    row, so the number of rows and results held in memory is bounded no matter
+    how large the input is.
+
+    Rows that fail yield None. Once every row is processed, the errors are
+    logged and a ParallelizationError is raised. With `fail_fast`, the first
+    error cancels the remaining rows and is raised right away.
+
+    With `AsyncType.Process`, the transform must be a picklable synchronous
+    function. Rows are shipped in batches to a pool of at most `num_threads`
+    processes, one per available core, each of which runs
+    `initializer(*initargs)` once at startup; the transform can read the
+    initializer's result with `get_worker_state`.
+    """
     callbacks = callbacks or NoopWorkflowCallbacks()
+    num_workers = max(1, num_threads or 4)
+    window_size = window_size or num_workers * WINDOW_SIZE_PER_WORKER
+    scheduled: AsyncGenerator[RowResult, None]
     match async_type:
         case AsyncType.AsyncIO:
-            return await derive_from_rows_asyncio(
-                input, transform, callbacks, num_threads, progress_msg
+            scheduled = _schedule(
+                input.iterrows(),
+                lambda row: _run_row_asyncio(transform, row),
+                num_workers,
+                window_size,
             )
         case AsyncType.Threaded:
-            return await derive_from_rows_asyncio_threads(
-                input, transform, callbacks, num_threads, progress_msg
+            scheduled = _schedule(
+                input.iterrows(),
+                lambda row: _run_row_threaded(transform, row),
+                num_workers,
+                window_size,
+            )
+        case AsyncType.Process:
+            if inspect.iscoroutinefunction(transform):
+                msg = "Process scheduling requires a synchronous, picklable transform function."
+                raise ValueError(msg)
+            scheduled = astream_in_processes(
+                transform,
+                (row for _, row in input.iterrows()),
+                num_processes=get_num_processes(num_workers),
+                num_items=len(input),
+                initializer=initializer,
+                initargs=initargs,
             )
         case _:
             msg = f"Unsupported scheduling type {async_type}"
             raise ValueError(msg)
 
+    tick = progress_ticker(
+        callbacks.progress, num_total=len(input), description=progress_msg
+    )
+    errors: list[tuple[BaseException, str]] = []
+    try:
+        async for error, result in scheduled:
+            tick(1)
+            if error is not None:
+                errors.append(error)
+                if fail_fast:
+                    tick.done()
+                    _log_errors(errors)
+                    raise ParallelizationError(1, error[1]) from error[0]
+            yield result
+    finally:
+        # stops the workers when the caller fails fast or stops iterating early
+        await scheduled.aclose()
+    tick.done()
 
-"""A module containing the derive_from_rows_async method."""
+    _log_errors(errors)
+    if len(errors) > 0:
+        raise ParallelizationError(len(errors), errors[0][1])
 
 
 async def derive_from_rows_asyncio_threads(
@@ -66,31 +226,20 @@ async def derive_from_rows_asyncio_threads(
     progress_msg: str = "",
 ) -> list[ItemType | None]:
     """
-    Derive from rows asynchronously.
+    Derive from rows asynchronously, calling the transform on worker threads.
 
     This is useful for IO bound operations.
     """
-    semaphore = asyncio.Semaphore(num_threads or 4)
-
-    async def gather(execute: ExecuteFn[ItemType]) -> list[ItemType | None]:
-        tasks = [asyncio.to_thread(execute, row) for row in input.iterrows()]
-
-        async def execute_task(task: Coroutine) -> ItemType | None:
-            async with semaphore:
-                # fire off the thread
-                thread = await task
-                return await thread
-
-        return await asyncio.gather(*[execute_task(task) for task in tasks])
-
-    return await _derive_from_rows_base(
-        input, transform, callbacks, gather, progress_msg
+    return await derive_from_rows(
+        input,
+        transform,
+        callbacks,
+        num_threads=num_threads or 4,
+        async_type=AsyncType.Threaded,
+        progress_msg=progress_msg,
     )
 
 
-"""A module containing the derive_from_rows_async method."""
-
-
 async def derive_from_rows_asyncio(
     input: pd.DataFrame,
     transform: Callable[[pd.Series], Awaitable[ItemType]],
@@ -103,71 +252,92 @@ async def derive_from_rows_asyncio(
 
     This is useful for IO bound operations.
     """
-    semaphore = asyncio.Semaphore(num_threads or 4)
-
-    async def gather(execute: ExecuteFn[ItemType]) -> list[ItemType | None]:
-        async def execute_row_protected(
-            row: tuple[Hashable, pd.Series],
-        ) -> ItemType | None:
-            async with semaphore:
-                return await execute(row)
-
-        tasks = [
-            asyncio.create_task(execute_row_protected(row)) for row in input.iterrows()
-        ]
-        return await asyncio.gather(*tasks)
-
-    return await _derive_from_rows_base(
-        input, transform, callbacks, gather, progress_msg
+    return await derive_from_rows(
+        input,
+        transform,
+        callbacks,
+        num_threads=num_threads,
+        async_type=AsyncType.AsyncIO,
+        progress_msg=progress_msg,
     )
 
 
-ItemType = TypeVar("ItemType")
-
-ExecuteFn = Callable[[tuple[Hashable, pd.Series]], Awaitable[ItemType | None]]
-GatherFn = Callable[[ExecuteFn], Awaitable[list[ItemType | None]]]
-
-
-async def _derive_from_rows_base(
-    input: pd.DataFrame,
-    transform: Callable[[pd.Series], Awaitable[ItemType]],
-    callbacks: WorkflowCallbacks,
-    gather: GatherFn[ItemType],
-    progress_msg: str = "",
-) -> list[ItemType | None]:
-    """
-    Derive from rows asynchronously.
-
-    This is useful for IO bound operations.
-    """
-    tick = progress_ticker(
-        callbacks.progress, num_total=len(input), description=progress_msg
-    )
-    errors: list[tuple[BaseException, str]] = []
-
-    async def execute(row: tuple[Any, pd.Series]) -> ItemType | None:
-        try:
-            result = transform(row[1])
-            if inspect.iscoroutine(result):
-                result = await result
-        except Exception as e:  # noqa: BLE001
-            errors.append((e, traceback.format_exc()))
-            return None
-        else:
-            return cast("ItemType", result)
-        finally:
-            tick(1)
-
-    result = await gather(execute)
-
-    tick.done()
-
+RowError = tuple[BaseException, str]
+RowResult = tuple[RowError | None, Any]
+
+
+async def _run_row_asyncio(
+    transform: Callable[[pd.Series], Awaitable[ItemType] | ItemType], row: pd.Series
+) -> ItemType:
+    result = transform(row)
+    if inspect.iscoroutine(result):
+        result = await result
+    return cast("ItemType", result)
+
+
+async def _run_row_threaded(
+    transform: Callable[[pd.Series], Awaitable[ItemType] | ItemType], row: pd.Series
+) -> ItemType:
+    # the transform is called on a worker thread, a returned coroutine is awaited on the loop
+    result = await asyncio.to_thread(transform, row)
+    if inspect.iscoroutine(result):
+        result = await result
+    return cast("ItemType", result)
+
+
+async def _schedule(
+    rows: Iterable[tuple[Hashable, pd.Series]],
+    run: Callable[[pd.Series], Awaitable[Any]],
+    num_workers: int,
+    window_size: int,
+) -> AsyncGenerator[RowResult, None]:
+    """Run rows on a fixed worker pool, yielding (error, result) pairs in row order."""
+    positions = enumerate(rows)
+    finished: dict[int, RowResult] = {}
+    # each slot is a row that may be started before the oldest unfinished row is yielded
+    slots = asyncio.Semaphore(max(window_size, num_workers))
+    changed = asyncio.Event()
+    exhausted = False
+    num_rows = 0
+
+    async def worker() -> None:
+        nonlocal exhausted, num_rows
+        while True:
+            await slots.acquire()
+            next_row = next(positions, None)
+            if next_row is None:
+                slots.release()
+                exhausted = True
+                changed.set()
+                return
+            num_rows += 1
+            position, (_, row) = next_row
+            try:
+                finished[position] = (None, await run(row))
+            except Exception as e:  # noqa: BLE001
+                finished[position] = ((e, traceback.format_exc()), None)
+            changed.set()
+
+    workers = [asyncio.create_task(worker()) for _ in range(num_workers)]
+    try:
+        position = 0
+        while True:
+            while position not in finished:
+                if exhausted and position >= num_rows:
+                    return
+                changed.clear()
+                await changed.wait()
+            yield finished.pop(position)
+            position += 1
+            slots.release()
+    finally:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+
+def _log_errors(errors: list[RowError]) -> None:
     for error, stack in errors:
         logger.error(
             "parallel transformation error", exc_info=error, extra={"stack": stack}
         )
-
-    if len(errors) > 0:
-        raise ParallelizationError(len(errors), errors[0][1])
-
-    return result
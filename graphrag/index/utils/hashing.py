@@ -4,11 +4,66 @@
 """Hashing utilities."""
 
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from hashlib import sha512
 from typing import Any
 
+import pandas as pd
+from pandas.api.extensions import ExtensionDtype
+
+HASH_BATCH_SIZE = 4_096
+"""The number of rows hashed by each task of `gen_sha512_hashes`."""
+
 
 def gen_sha512_hash(item: dict[str, Any], hashcode: Iterable[str]):
     """Generate a SHA512 hash."""
     hashed = "".join([str(item[column]) for column in hashcode])
     return f"{sha512(hashed.encode('utf-8'), usedforsecurity=False).hexdigest()}"
+
+
+def gen_sha512_hashes(
+    table: pd.DataFrame, hashcode: Iterable[str], num_threads: int | None = None
+) -> list[str]:
+    """Generate the SHA512 hash of every row of a table.
+
+    The hashes are the same as `gen_sha512_hash` on the rows of
+    `table.apply(..., axis=1)`: values are stringified as they appear in such
+    a row, whose dtype is the common dtype of all the table's columns. Rows
+    are hashed in batches on a thread pool. hashlib releases the GIL while
+    hashing large inputs, so long texts hash in parallel.
+    """
+    if len(table) == 0:
+        return []
+    hashcode = list(hashcode)
+    row_dtype = table.iloc[0].dtype
+    if isinstance(row_dtype, ExtensionDtype):
+        # rows of extension dtype tables hold the scalars of that dtype
+        rows = list(
+            zip(
+                *[table[column].astype(row_dtype).array for column in hashcode],
+                strict=True,
+            )
+        )
+    else:
+        values = table.to_numpy()
+        if values.dtype.kind in "mM":
+            # rows of datetime tables hold Timestamps and Timedeltas, not numpy scalars
+            values = table.astype(object).to_numpy()
+        rows = values[:, table.columns.get_indexer(hashcode)]
+
+    def hash_batch(start: int) -> list[str]:
+        return [
+            sha512(
+                "".join([str(value) for value in row]).encode("utf-8"),
+                usedforsecurity=False,
+            ).hexdigest()
+            for row in rows[start : start + HASH_BATCH_SIZE]
+        ]
+
+    starts = range(0, len(rows), HASH_BATCH_SIZE)
+    if len(starts) == 1 or num_threads == 1:
+        return [digest for start in starts for digest in hash_batch(start)]
+    with ThreadPoolExecutor(max_workers=num_threads) as executor:
+        return [
+            digest for batch in executor.map(hash_batch, starts) for digest in batch
+        ]
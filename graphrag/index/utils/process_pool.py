@@ -0,0 +1,160 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Run CPU-bound work on a pool of worker processes."""
+
+import asyncio
+import os
+import traceback
+from collections.abc import AsyncGenerator, Callable, Iterable, Iterator, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import Any, TypeVar
+
+ItemType = TypeVar("ItemType")
+ResultType = TypeVar("ResultType")
+
+BATCHES_PER_PROCESS = 4
+"""Batches submitted per worker process when no batch size is given, to balance uneven work."""
+
+MAX_BATCH_SIZE = 256
+"""Largest batch shipped to a worker process when no batch size is given."""
+
+_worker_state: Any = None
+
+
+def get_num_processes(max_processes: int | None = None) -> int:
+    """Get the number of worker processes to use, at most one per available core."""
+    cores = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else None
+    cores = cores or os.cpu_count() or 1
+    return max(1, min(cores, max_processes or cores))
+
+
+def get_worker_state() -> Any:
+    """Get the state created by the pool initializer of the current worker process."""
+    return _worker_state
+
+
+def _initialize_worker(
+    initializer: Callable[..., Any] | None, initargs: Sequence[Any]
+) -> None:
+    global _worker_state
+    _worker_state = initializer(*initargs) if initializer is not None else None
+
+
+def _run_batch(
+    fn: Callable[[Any], Any], batch: list[Any]
+) -> list[tuple[tuple[BaseException, str] | None, Any]]:
+    results: list[tuple[tuple[BaseException, str] | None, Any]] = []
+    for item in batch:
+        try:
+            results.append((None, fn(item)))
+        except Exception as e:  # noqa: BLE001
+            results.append(((e, traceback.format_exc()), None))
+    return results
+
+
+def _batches(items: Iterable[ItemType], batch_size: int) -> Iterator[list[ItemType]]:
+    iterator = iter(items)
+    while batch := list(islice(iterator, batch_size)):
+        yield batch
+
+
+def _batch_size(num_items: int | None, num_processes: int) -> int:
+    if num_items is None:
+        return MAX_BATCH_SIZE
+    return max(
+        1, min(MAX_BATCH_SIZE, num_items // (num_processes * BATCHES_PER_PROCESS))
+    )
+
+
+def create_process_pool(
+    num_processes: int,
+    initializer: Callable[..., Any] | None = None,
+    initargs: Sequence[Any] = (),
+) -> ProcessPoolExecutor:
+    """
+    Create a process pool whose workers run `initializer(*initargs)` once at startup.
+
+    The initializer's return value is available to work items through `get_worker_state`,
+    so that expensive resources such as NLP models or tokenizers are loaded once per
+    process rather than once per item.
+    """
+    return ProcessPoolExecutor(
+        max_workers=num_processes,
+        initializer=_initialize_worker,
+        initargs=(initializer, tuple(initargs)),
+    )
+
+
+async def astream_in_processes(
+    fn: Callable[[ItemType], ResultType],
+    items: Iterable[ItemType],
+    *,
+    num_processes: int,
+    num_items: int | None = None,
+    batch_size: int | None = None,
+    initializer: Callable[..., Any] | None = None,
+    initargs: Sequence[Any] = (),
+) -> AsyncGenerator[tuple[tuple[BaseException, str] | None, ResultType | None], None]:
+    """
+    Apply a picklable function to each item on a process pool, yielding (error, result) pairs in item order.
+
+    Items are shipped to the workers in batches and at most two batches per
+    worker are in flight at a time, so the input is consumed lazily.
+    """
+    batch_size = batch_size or _batch_size(num_items, num_processes)
+    loop = asyncio.get_running_loop()
+    pool = create_process_pool(num_processes, initializer, initargs)
+    pending: list[asyncio.Future] = []
+    try:
+        for batch in _batches(items, batch_size):
+            pending.append(
+                asyncio.wrap_future(pool.submit(_run_batch, fn, batch), loop=loop)
+            )
+            if len(pending) >= 2 * num_processes:
+                for result in await pending.pop(0):
+                    yield result
+        while pending:
+            for result in await pending.pop(0):
+                yield result
+    finally:
+        for future in pending:
+            future.cancel()
+        # do not block the event loop on batches that are still running
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def map_in_processes(
+    fn: Callable[[ItemType], ResultType],
+    items: Sequence[ItemType],
+    *,
+    num_processes: int,
+    batch_size: int | None = None,
+    initializer: Callable[..., Any] | None = None,
+    initargs: Sequence[Any] = (),
+    on_result: Callable[[ResultType], None] | None = None,
+) -> list[ResultType]:
+    """
+    Apply a picklable function to each item on a process pool, returning the results in item order.
+
+    The first error raised by `fn` is raised once the pool has shut down.
+    """
+    batch_size = batch_size or _batch_size(len(items), num_processes)
+    results: list[ResultType] = []
+    with create_process_pool(num_processes, initializer, initargs) as pool:
+        futures: list[Future] = [
+            pool.submit(_run_batch, fn, batch) for batch in _batches(items, batch_size)
+        ]
+        try:
+            for future in futures:
+                for error, result in future.result():
+                    if error is not None:
+                        raise error[0]
+                    results.append(result)
+                    if on_result is not None:
+                        on_result(result)
+        finally:
+            for future in futures:
+                future.cancel()
+    return results
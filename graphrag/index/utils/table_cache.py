@@ -0,0 +1,107 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Tables handed between the workflows of a pipeline run in memory."""
+
+import asyncio
+from collections.abc import Iterable
+
+import pandas as pd
+import pyarrow as pa
+
+from graphrag.storage.pipeline_storage import PipelineStorage
+from graphrag.utils.storage import (
+    load_table_from_storage,
+    storage_has_table,
+    write_arrow_table_to_storage,
+)
+
+
+class TableCache:
+    """The tables of a storage, kept in memory as Arrow tables for the workflows that read them next.
+
+    Writing a table keeps it in memory and writes it through to the storage.
+    With `write_behind`, the write runs in the background while the next
+    workflows run; `flush` waits for the pending writes and raises the error
+    of any that failed. Loading a table kept in memory converts it to a
+    DataFrame without decoding parquet, other tables are loaded from the
+    storage once their pending writes are done. Arrow tables are immutable, so
+    a workflow changing the DataFrame it loaded does not change what others
+    load or what is written.
+
+    `retain` evicts the tables no later workflow reads.
+    """
+
+    def __init__(self, storage: PipelineStorage, write_behind: bool = False):
+        self.storage = storage
+        self.write_behind = write_behind
+        self._tables: dict[str, pa.Table] = {}
+        self._writes: dict[str, asyncio.Task[None]] = {}
+
+    async def load(self, name: str, columns: list[str] | None = None) -> pd.DataFrame:
+        """Load a table, from memory if it is kept there.
+
+        If `columns` is given, only those of them that the table has are loaded.
+        """
+        table = self._tables.get(name)
+        if table is None:
+            await self._wait(name)
+            return await load_table_from_storage(name, self.storage, columns=columns)
+        if columns is not None:
+            table = table.select([
+                column for column in columns if column in table.column_names
+            ])
+        return await asyncio.to_thread(table.to_pandas)
+
+    async def has(self, name: str) -> bool:
+        """Check if a table is kept in memory, being written or in the storage."""
+        return (
+            name in self._tables
+            or name in self._writes
+            or await storage_has_table(name, self.storage)
+        )
+
+    async def write(self, table: pd.DataFrame, name: str) -> None:
+        """Keep a table in memory and write it to the storage, in the background with `write_behind`."""
+        self.check()
+        arrow_table = await asyncio.to_thread(pa.Table.from_pandas, table)
+        self._tables[name] = arrow_table
+        self._writes[name] = asyncio.create_task(
+            self._write(arrow_table, name, self._writes.get(name))
+        )
+        if not self.write_behind:
+            await self._wait(name)
+
+    async def _write(
+        self, table: pa.Table, name: str, previous: asyncio.Task[None] | None
+    ) -> None:
+        # a table written twice is written in order, failing if the first write failed
+        if previous is not None:
+            await previous
+        await write_arrow_table_to_storage(table, name, self.storage)
+
+    async def _wait(self, name: str) -> None:
+        task = self._writes.get(name)
+        if task is None:
+            return
+        await task
+        if self._writes.get(name) is task:
+            del self._writes[name]
+
+    def check(self) -> None:
+        """Raise the error of a background write that failed, if any."""
+        for task in self._writes.values():
+            if task.done() and (error := task.exception()) is not None:
+                raise error
+
+    async def flush(self) -> None:
+        """Wait for every pending write, raising the error of any that failed."""
+        for name in list(self._writes):
+            await self._wait(name)
+
+    def retain(self, names: Iterable[str]) -> None:
+        """Evict the tables kept in memory that are not in `names`, their pending writes still complete."""
+        names = set(names)
+        for name in list(self._tables):
+            if name not in names:
+                del self._tables[name]
@@ -98,3 +98,36 @@ PipelineFactory.register_all({
     "update_text_units": run_update_text_units,
     "update_clean_state": run_update_clean_state,
 })
+
+# the output tables read by the built-in workflows that read them through `context.output_tables`
+PipelineFactory.register_table_inputs({
+    "load_update_documents": [],
+    "create_base_text_units": ["documents"],
+    "create_final_documents": ["documents", "text_units"],
+    "extract_graph": ["text_units"],
+    "extract_graph_nlp": ["text_units"],
+    "prune_graph": ["entities", "relationships"],
+    "finalize_graph": ["entities", "relationships"],
+    "extract_covariates": ["text_units"],
+    "create_communities": ["entities", "relationships"],
+    "create_final_text_units": [
+        "text_units",
+        "entities",
+        "relationships",
+        "covariates",
+    ],
+    "create_community_reports": [
+        "relationships",
+        "entities",
+        "communities",
+        "covariates",
+    ],
+    "create_community_reports_text": ["entities", "communities", "text_units"],
+    "generate_text_embeddings": [
+        "documents",
+        "relationships",
+        "text_units",
+        "entities",
+        "community_reports",
+    ],
+})
@@ -10,14 +10,19 @@ from typing import Any, cast
 import pandas as pd
 
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
-from graphrag.config.models.chunking_config import ChunkStrategyType
+from graphrag.config.enums import AsyncType
+from graphrag.config.models.chunking_config import ChunkingConfig, ChunkStrategyType
 from graphrag.config.models.graph_rag_config import GraphRagConfig
-from graphrag.index.operations.chunk_text.chunk_text import chunk_text
+from graphrag.index.operations.chunk_text.chunk_text import (
+    chunk_in_processes,
+    load_strategy,
+    run_strategy,
+)
 from graphrag.index.operations.chunk_text.strategies import get_encoding_fn
 from graphrag.index.typing.context import PipelineRunContext
 from graphrag.index.typing.workflow import WorkflowFunctionOutput
-from graphrag.index.utils.hashing import gen_sha512_hash
-from graphrag.utils.storage import load_table_from_storage, write_table_to_storage
+from graphrag.index.utils.hashing import gen_sha512_hashes
+from graphrag.logger.progress import progress_ticker
 
 logger = logging.getLogger(__name__)
 
@@ -28,7 +33,7 @@ async def run_workflow(
 ) -> WorkflowFunctionOutput:
     """All the steps to transform base text_units."""
     logger.info("Workflow started: create_base_text_units")
-    documents = await load_table_from_storage("documents", context.output_storage)
+    documents = await context.output_tables.load("documents")
 
     chunks = config.chunks
 
@@ -42,9 +47,10 @@ async def run_workflow(
         strategy=chunks.strategy,
         prepend_metadata=chunks.prepend_metadata,
         chunk_size_includes_metadata=chunks.chunk_size_includes_metadata,
+        async_mode=chunks.async_mode,
     )
 
-    await write_table_to_storage(output, "text_units", context.output_storage)
+    await context.output_tables.write(output, "text_units")
 
     logger.info("Workflow completed: create_base_text_units")
     return WorkflowFunctionOutput(result=output)
@@ -60,6 +66,7 @@ def create_base_text_units(
     strategy: ChunkStrategyType,
     prepend_metadata: bool = False,
     chunk_size_includes_metadata: bool = False,
+    async_mode: AsyncType | None = None,
 ) -> pd.DataFrame:
     """All the steps to transform base text_units."""
     sort = documents.sort_values(by=["id"], ascending=[True])
@@ -83,7 +90,13 @@ def create_base_text_units(
     )
     aggregated.rename(columns={"text_with_ids": "texts"}, inplace=True)
 
-    def chunker(row: pd.Series) -> Any:
+    encode = (
+        get_encoding_fn(encoding_model)[0]
+        if prepend_metadata and chunk_size_includes_metadata
+        else None
+    )
+
+    def get_metadata(row: pd.Series) -> tuple[str, int]:
         line_delimiter = ".\n"
         metadata_str = ""
         metadata_tokens = 0
@@ -98,23 +111,15 @@ def create_base_text_units(
                     + line_delimiter
                 )
 
-            if chunk_size_includes_metadata:
-                encode, _ = get_encoding_fn(encoding_model)
+            if encode is not None:
                 metadata_tokens = len(encode(metadata_str))
                 if metadata_tokens >= size:
                     message = "Metadata tokens exceeds the maximum tokens per chunk. Please increase the tokens per chunk."
                     raise ValueError(message)
 
-        chunked = chunk_text(
-            pd.DataFrame([row]).reset_index(drop=True),
-            column="texts",
-            size=size - metadata_tokens,
-            overlap=overlap,
-            encoding_model=encoding_model,
-            strategy=strategy,
-            callbacks=callbacks,
-        )[0]
+        return metadata_str, metadata_tokens
 
+    def add_metadata(chunked: Any, metadata_str: str) -> Any:
         if prepend_metadata:
             for index, chunk in enumerate(chunked):
                 if isinstance(chunk, str):
@@ -123,24 +128,55 @@ def create_base_text_units(
                     chunked[index] = (
                         (chunk[0], metadata_str + chunk[1], chunk[2]) if chunk else None
                     )
-
-        row["chunks"] = chunked
-        return row
+        return chunked
 
     # Track progress of row-wise apply operation
     total_rows = len(aggregated)
     logger.info("Starting chunking process for %d documents", total_rows)
 
-    def chunker_with_logging(row: pd.Series, row_index: int) -> Any:
-        """Add logging to chunker execution."""
-        result = chunker(row)
-        logger.info("chunker progress:  %d/%d", row_index + 1, total_rows)
-        return result
-
-    aggregated = aggregated.apply(
-        lambda row: chunker_with_logging(row, row.name), axis=1
+    metadata = [get_metadata(row) for _, row in aggregated.iterrows()]
+    texts = aggregated["texts"].tolist()
+    tick = progress_ticker(
+        callbacks.progress, sum(len(row_texts) for row_texts in texts)
     )
 
+    if async_mode == AsyncType.Process:
+        chunked_rows = chunk_in_processes(
+            [
+                (row_texts, size - metadata_tokens)
+                for row_texts, (_, metadata_tokens) in zip(texts, metadata, strict=True)
+            ],
+            overlap=overlap,
+            encoding_model=encoding_model,
+            strategy=strategy,
+            tick=tick,
+        )
+        aggregated["chunks"] = [
+            add_metadata(chunked, metadata_str)
+            for chunked, (metadata_str, _) in zip(chunked_rows, metadata, strict=True)
+        ]
+        logger.info("chunker progress:  %d/%d", total_rows, total_rows)
+    else:
+        # load the strategy once rather than once per row
+        strategy_exec = load_strategy(strategy)
+        chunked_rows = []
+        for row_index, (row_texts, (metadata_str, metadata_tokens)) in enumerate(
+            zip(texts, metadata, strict=True)
+        ):
+            chunked = run_strategy(
+                strategy_exec,
+                row_texts,
+                ChunkingConfig(
+                    size=size - metadata_tokens,
+                    overlap=overlap,
+                    encoding_model=encoding_model,
+                ),
+                tick,
+            )
+            chunked_rows.append(add_metadata(chunked, metadata_str))
+            logger.info("chunker progress:  %d/%d", row_index + 1, total_rows)
+        aggregated["chunks"] = chunked_rows
+
     aggregated = cast("pd.DataFrame", aggregated[[*group_by_columns, "chunks"]])
     aggregated = aggregated.explode("chunks")
     aggregated.rename(
@@ -149,9 +185,7 @@ def create_base_text_units(
         },
         inplace=True,
     )
-    aggregated["id"] = aggregated.apply(
-        lambda row: gen_sha512_hash(row, ["chunk"]), axis=1
-    )
+    aggregated["id"] = gen_sha512_hashes(aggregated, ["chunk"])
     aggregated[["document_ids", "chunk", "n_tokens"]] = pd.DataFrame(
         aggregated["chunk"].tolist(), index=aggregated.index
     )
@@ -30,11 +30,6 @@ from graphrag.index.operations.summarize_communities.summarize_communities impor
 from graphrag.index.typing.context import PipelineRunContext
 from graphrag.index.typing.workflow import WorkflowFunctionOutput
 from graphrag.tokenizer.get_tokenizer import get_tokenizer
-from graphrag.utils.storage import (
-    load_table_from_storage,
-    storage_has_table,
-    write_table_to_storage,
-)
 
 logger = logging.getLogger(__name__)
 
@@ -45,14 +40,12 @@ async def run_workflow(
 ) -> WorkflowFunctionOutput:
     """All the steps to transform community reports."""
     logger.info("Workflow started: create_community_reports")
-    edges = await load_table_from_storage("relationships", context.output_storage)
-    entities = await load_table_from_storage("entities", context.output_storage)
-    communities = await load_table_from_storage("communities", context.output_storage)
+    edges = await context.output_tables.load("relationships")
+    entities = await context.output_tables.load("entities")
+    communities = await context.output_tables.load("communities")
     claims = None
-    if config.extract_claims.enabled and await storage_has_table(
-        "covariates", context.output_storage
-    ):
-        claims = await load_table_from_storage("covariates", context.output_storage)
+    if config.extract_claims.enabled and await context.output_tables.has("covariates"):
+        claims = await context.output_tables.load("covariates")
 
     community_reports_llm_settings = config.get_language_model_config(
         config.community_reports.model_id
@@ -75,7 +68,7 @@ async def run_workflow(
         num_threads=num_threads,
     )
 
-    await write_table_to_storage(output, "community_reports", context.output_storage)
+    await context.output_tables.write(output, "community_reports")
 
     logger.info("Workflow completed: create_community_reports")
     return WorkflowFunctionOutput(result=output)
@@ -29,7 +29,6 @@ from graphrag.index.operations.summarize_communities.text_unit_context.context_b
 from graphrag.index.typing.context import PipelineRunContext
 from graphrag.index.typing.workflow import WorkflowFunctionOutput
 from graphrag.tokenizer.get_tokenizer import get_tokenizer
-from graphrag.utils.storage import load_table_from_storage, write_table_to_storage
 
 logger = logging.getLogger(__name__)
 
@@ -40,10 +39,10 @@ async def run_workflow(
 ) -> WorkflowFunctionOutput:
     """All the steps to transform community reports."""
     logger.info("Workflow started: create_community_reports_text")
-    entities = await load_table_from_storage("entities", context.output_storage)
-    communities = await load_table_from_storage("communities", context.output_storage)
+    entities = await context.output_tables.load("entities")
+    communities = await context.output_tables.load("communities")
 
-    text_units = await load_table_from_storage("text_units", context.output_storage)
+    text_units = await context.output_tables.load("text_units")
 
     community_reports_llm_settings = config.get_language_model_config(
         config.community_reports.model_id
@@ -65,7 +64,7 @@ async def run_workflow(
         num_threads=num_threads,
     )
 
-    await write_table_to_storage(output, "community_reports", context.output_storage)
+    await context.output_tables.write(output, "community_reports")
 
     logger.info("Workflow completed: create_community_reports_text")
     return WorkflowFunctionOutput(result=output)
@@ -19,7 +19,6 @@ from graphrag.index.operations.extract_covariates.extract_covariates import (
 )
 from graphrag.index.typing.context import PipelineRunContext
 from graphrag.index.typing.workflow import WorkflowFunctionOutput
-from graphrag.utils.storage import load_table_from_storage, write_table_to_storage
 
 logger = logging.getLogger(__name__)
 
@@ -32,7 +31,7 @@ async def run_workflow(
     logger.info("Workflow started: extract_covariates")
     output = None
     if config.extract_claims.enabled:
-        text_units = await load_table_from_storage("text_units", context.output_storage)
+        text_units = await context.output_tables.load("text_units")
 
         extract_claims_llm_settings = config.get_language_model_config(
             config.extract_claims.model_id
@@ -55,7 +54,7 @@ async def run_workflow(
             num_threads=num_threads,
         )
 
-        await write_table_to_storage(output, "covariates", context.output_storage)
+        await context.output_tables.write(output, "covariates")
 
     logger.info("Workflow completed: extract_covariates")
     return WorkflowFunctionOutput(result=output)
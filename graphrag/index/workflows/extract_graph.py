@@ -20,7 +20,6 @@ from graphrag.index.operations.summarize_descriptions.summarize_descriptions imp
 )
 from graphrag.index.typing.context import PipelineRunContext
 from graphrag.index.typing.workflow import WorkflowFunctionOutput
-from graphrag.utils.storage import load_table_from_storage, write_table_to_storage
 
 logger = logging.getLogger(__name__)
 
@@ -31,7 +30,7 @@ async def run_workflow(
 ) -> WorkflowFunctionOutput:
     """All the steps to create the base entity graph."""
     logger.info("Workflow started: extract_graph")
-    text_units = await load_table_from_storage("text_units", context.output_storage)
+    text_units = await context.output_tables.load("text_units")
 
     extract_graph_llm_settings = config.get_language_model_config(
         config.extract_graph.model_id
@@ -59,16 +58,12 @@ async def run_workflow(
         summarization_num_threads=summarization_llm_settings.concurrent_requests,
     )
 
-    await write_table_to_storage(entities, "entities", context.output_storage)
-    await write_table_to_storage(relationships, "relationships", context.output_storage)
+    await context.output_tables.write(entities, "entities")
+    await context.output_tables.write(relationships, "relationships")
 
     if config.snapshots.raw_graph:
-        await write_table_to_storage(
-            raw_entities, "raw_entities", context.output_storage
-        )
-        await write_table_to_storage(
-            raw_relationships, "raw_relationships", context.output_storage
-        )
+        await context.output_tables.write(raw_entities, "raw_entities")
+        await context.output_tables.write(raw_relationships, "raw_relationships")
 
     logger.info("Workflow completed: extract_graph")
     return WorkflowFunctionOutput(
@@ -16,7 +16,6 @@ from graphrag.index.operations.build_noun_graph.np_extractors.factory import (
 )
 from graphrag.index.typing.context import PipelineRunContext
 from graphrag.index.typing.workflow import WorkflowFunctionOutput
-from graphrag.utils.storage import load_table_from_storage, write_table_to_storage
 
 logger = logging.getLogger(__name__)
 
@@ -27,7 +26,7 @@ async def run_workflow(
 ) -> WorkflowFunctionOutput:
     """All the steps to create the base entity graph."""
     logger.info("Workflow started: extract_graph_nlp")
-    text_units = await load_table_from_storage("text_units", context.output_storage)
+    text_units = await context.output_tables.load("text_units")
 
     entities, relationships = await extract_graph_nlp(
         text_units,
@@ -35,8 +34,8 @@ async def run_workflow(
         extraction_config=config.extract_graph_nlp,
     )
 
-    await write_table_to_storage(entities, "entities", context.output_storage)
-    await write_table_to_storage(relationships, "relationships", context.output_storage)
+    await context.output_tables.write(entities, "entities")
+    await context.output_tables.write(relationships, "relationships")
 
     logger.info("Workflow completed: extract_graph_nlp")
 
@@ -19,6 +19,7 @@ class PipelineFactory:
 
     workflows: ClassVar[dict[str, WorkflowFunction]] = {}
     pipelines: ClassVar[dict[str, list[str]]] = {}
+    table_inputs: ClassVar[dict[str, list[str]]] = {}
 
     @classmethod
     def register(cls, name: str, workflow: WorkflowFunction):
@@ -31,6 +32,14 @@ class PipelineFactory:
         for name, workflow in workflows.items():
             cls.register(name, workflow)
 
+    @classmethod
+    def register_table_inputs(cls, table_inputs: dict[str, list[str]]):
+        """Register the output tables read by workflows, so that the tables no later workflow reads are not kept in memory.
+
+        Workflows that declare their inputs must read them through `context.output_tables`.
+        """
+        cls.table_inputs.update(table_inputs)
+
     @classmethod
     def register_pipeline(cls, name: str, workflows: list[str]):
         """Register a new pipeline method as a list of workflow names."""
@@ -45,7 +54,14 @@ class PipelineFactory:
         """Create a pipeline generator."""
         workflows = config.workflows or cls.pipelines.get(method, [])
         logger.info("Creating pipeline with workflows: %s", workflows)
-        return Pipeline([(name, cls.workflows[name]) for name in workflows])
+        return Pipeline(
+            [(name, cls.workflows[name]) for name in workflows],
+            table_inputs={
+                name: cls.table_inputs[name]
+                for name in workflows
+                if name in cls.table_inputs
+            },
+        )
 
 
 # --- Register default implementations ---
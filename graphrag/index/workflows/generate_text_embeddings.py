@@ -24,10 +24,6 @@ from graphrag.config.models.graph_rag_config import GraphRagConfig
 from graphrag.index.operations.embed_text.embed_text import embed_text
 from graphrag.index.typing.context import PipelineRunContext
 from graphrag.index.typing.workflow import WorkflowFunctionOutput
-from graphrag.utils.storage import (
-    load_table_from_storage,
-    write_table_to_storage,
-)
 
 logger = logging.getLogger(__name__)
 
@@ -45,26 +41,33 @@ async def run_workflow(
     text_units = None
     entities = None
     community_reports = None
+    # only the columns that are embedded are read from the tables
     if document_text_embedding in embedded_fields:
-        documents = await load_table_from_storage("documents", context.output_storage)
+        documents = await context.output_tables.load(
+            "documents", columns=["id", "text"]
+        )
     if relationship_description_embedding in embedded_fields:
-        relationships = await load_table_from_storage(
-            "relationships", context.output_storage
+        relationships = await context.output_tables.load(
+            "relationships", columns=["id", "description"]
         )
     if text_unit_text_embedding in embedded_fields:
-        text_units = await load_table_from_storage("text_units", context.output_storage)
+        text_units = await context.output_tables.load(
+            "text_units", columns=["id", "text"]
+        )
     if (
         entity_title_embedding in embedded_fields
         or entity_description_embedding in embedded_fields
     ):
-        entities = await load_table_from_storage("entities", context.output_storage)
+        entities = await context.output_tables.load(
+            "entities", columns=["id", "title", "description"]
+        )
     if (
         community_title_embedding in embedded_fields
         or community_summary_embedding in embedded_fields
         or community_full_content_embedding in embedded_fields
     ):
-        community_reports = await load_table_from_storage(
-            "community_reports", context.output_storage
+        community_reports = await context.output_tables.load(
+            "community_reports", columns=["id", "title", "summary", "full_content"]
         )
 
     text_embed = get_embedding_settings(config)
@@ -83,11 +86,7 @@ async def run_workflow(
 
     if config.snapshots.embeddings:
         for name, table in output.items():
-            await write_table_to_storage(
-                table,
-                f"embeddings.{name}",
-                context.output_storage,
-            )
+            await context.output_tables.write(table, f"embeddings.{name}")
 
     logger.info("Workflow completed: generate_text_embeddings")
     return WorkflowFunctionOutput(result=output)
@@ -9,11 +9,11 @@ import pandas as pd
 
 from graphrag.config.models.graph_rag_config import GraphRagConfig
 from graphrag.config.models.input_config import InputConfig
-from graphrag.index.input.factory import create_input
+from graphrag.index.input.factory import create_input, stream_input
 from graphrag.index.typing.context import PipelineRunContext
 from graphrag.index.typing.workflow import WorkflowFunctionOutput
 from graphrag.storage.pipeline_storage import PipelineStorage
-from graphrag.utils.storage import write_table_to_storage
+from graphrag.utils.storage import write_table_batches_to_storage
 
 logger = logging.getLogger(__name__)
 
@@ -22,18 +22,20 @@ async def run_workflow(
     config: GraphRagConfig,
     context: PipelineRunContext,
 ) -> WorkflowFunctionOutput:
-    """Load and parse input documents into a standard format."""
-    output = await load_input_documents(
-        config.input,
-        context.input_storage,
+    """Load and parse input documents into a standard format.
+
+    Documents are streamed into storage in batches of files, so the input is never held in memory as a whole DataFrame.
+    """
+    num_documents = await write_table_batches_to_storage(
+        stream_input(config.input, context.input_storage),
+        "documents",
+        context.output_storage,
     )
 
-    logger.info("Final # of rows loaded: %s", len(output))
-    context.stats.num_documents = len(output)
-
-    await write_table_to_storage(output, "documents", context.output_storage)
+    logger.info("Final # of rows loaded: %s", num_documents)
+    context.stats.num_documents = num_documents
 
-    return WorkflowFunctionOutput(result=output)
+    return WorkflowFunctionOutput(result=None)
 
 
 async def load_input_documents(
@@ -14,7 +14,6 @@ from graphrag.index.operations.graph_to_dataframes import graph_to_dataframes
 from graphrag.index.operations.prune_graph import prune_graph as prune_graph_operation
 from graphrag.index.typing.context import PipelineRunContext
 from graphrag.index.typing.workflow import WorkflowFunctionOutput
-from graphrag.utils.storage import load_table_from_storage, write_table_to_storage
 
 logger = logging.getLogger(__name__)
 
@@ -25,10 +24,8 @@ async def run_workflow(
 ) -> WorkflowFunctionOutput:
     """All the steps to create the base entity graph."""
     logger.info("Workflow started: prune_graph")
-    entities = await load_table_from_storage("entities", context.output_storage)
-    relationships = await load_table_from_storage(
-        "relationships", context.output_storage
-    )
+    entities = await context.output_tables.load("entities")
+    relationships = await context.output_tables.load("relationships")
 
     pruned_entities, pruned_relationships = prune_graph(
         entities,
@@ -36,10 +33,8 @@ async def run_workflow(
         pruning_config=config.prune_graph,
     )
 
-    await write_table_to_storage(pruned_entities, "entities", context.output_storage)
-    await write_table_to_storage(
-        pruned_relationships, "relationships", context.output_storage
-    )
+    await context.output_tables.write(pruned_entities, "entities")
+    await context.output_tables.write(pruned_relationships, "relationships")
 
     logger.info("Workflow completed: prune_graph")
     return WorkflowFunctionOutput(
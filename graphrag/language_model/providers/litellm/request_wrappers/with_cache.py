@@ -4,10 +4,15 @@
 """LiteLLM completion/embedding cache wrapper."""
 
 import asyncio
+import threading
+from collections import OrderedDict
 from typing import TYPE_CHECKING, Any, Literal
 
 from litellm import EmbeddingResponse, ModelResponse  # type: ignore
 
+from graphrag.cache.cache_stats import cache_stats
+from graphrag.cache.noop_pipeline_cache import NoopPipelineCache
+from graphrag.cache.single_flight import SingleFlight
 from graphrag.language_model.providers.litellm.get_cache_key import get_cache_key
 from graphrag.language_model.providers.litellm.types import (
     AsyncLitellmRequestFunc,
@@ -18,6 +23,34 @@ if TYPE_CHECKING:
     from graphrag.cache.pipeline_cache import PipelineCache
     from graphrag.config.models.language_model_config import LanguageModelConfig
 
+DEFAULT_MEMORY_CACHE_SIZE = 1024
+"""Number of responses kept in the in-process memory tier of each cached model."""
+
+
+class _MemoryLRU:
+    """Thread-safe LRU map from cache keys to serialized responses."""
+
+    def __init__(self, max_size: int):
+        self._entries: OrderedDict[str, dict] = OrderedDict()
+        self._max_size = max_size
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> dict | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, value: dict) -> None:
+        if self._max_size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
 
 def with_cache(
     *,
@@ -27,10 +60,18 @@ def with_cache(
     cache: "PipelineCache",
     request_type: Literal["chat", "embedding"],
     cache_key_prefix: str,
+    memory_cache_size: int = DEFAULT_MEMORY_CACHE_SIZE,
 ) -> tuple[LitellmRequestFunc, AsyncLitellmRequestFunc]:
     """
     Wrap the synchronous and asynchronous request functions with caching.
 
+    Responses are looked up in an in-process LRU first and in the persistent
+    cache second. Concurrent async requests with the same cache key are
+    coalesced: the first one calls the model and writes the cache, the others
+    wait for its response. With a `NoopPipelineCache` (`cache.type: none`) the
+    functions are returned unwrapped: nothing is kept in memory and identical
+    requests are sent to the model separately.
+
     Args
     ----
         sync_fn: The synchronous chat/embedding request function to wrap.
@@ -39,21 +80,19 @@ def with_cache(
         cache: The cache to use for storing responses.
         request_type: The type of request being made, either "chat" or "embedding".
         cache_key_prefix: The prefix to use for cache keys.
+        memory_cache_size: The number of responses kept in memory, 0 to disable the memory tier.
 
     Returns
     -------
         A tuple containing the wrapped synchronous and asynchronous chat/embedding request functions.
     """
+    if isinstance(cache, NoopPipelineCache):
+        return (sync_fn, async_fn)
 
-    def _wrapped_with_cache(**kwargs: Any) -> Any:
-        is_streaming = kwargs.get("stream", False)
-        if is_streaming:
-            return sync_fn(**kwargs)
-        cache_key = get_cache_key(
-            model_config=model_config, prefix=cache_key_prefix, **kwargs
-        )
-        event_loop = asyncio.get_event_loop()
-        cached_response = event_loop.run_until_complete(cache.get(cache_key))
+    memory_cache = _MemoryLRU(memory_cache_size)
+    in_flight: SingleFlight[tuple[Any, dict]] = SingleFlight()
+
+    def _to_response(cached_response: Any) -> Any:
         if (
             cached_response is not None
             and isinstance(cached_response, dict)
@@ -69,12 +108,57 @@ def with_cache(
                 # Try to retrieve value from cache but if it fails, continue
                 # to make the request.
                 ...
-        response = sync_fn(**kwargs)
-        event_loop.run_until_complete(
-            cache.set(cache_key, {"response": response.model_dump()})
+        return None
+
+    def _from_memory(cache_key: str) -> Any:
+        response = _to_response(memory_cache.get(cache_key))
+        if response is not None:
+            cache_stats.increment("memory_hits")
+        return response
+
+    def _from_persistent(cache_key: str, cached_response: Any) -> Any:
+        response = _to_response(cached_response)
+        if response is not None:
+            cache_stats.increment("persistent_hits")
+            memory_cache.set(cache_key, cached_response)
+        return response
+
+    def _wrapped_with_cache(**kwargs: Any) -> Any:
+        is_streaming = kwargs.get("stream", False)
+        if is_streaming:
+            return sync_fn(**kwargs)
+        cache_key = get_cache_key(
+            model_config=model_config, prefix=cache_key_prefix, **kwargs
         )
+        response = _from_memory(cache_key)
+        if response is not None:
+            return response
+        event_loop = asyncio.get_event_loop()
+        response = _from_persistent(
+            cache_key, event_loop.run_until_complete(cache.get(cache_key))
+        )
+        if response is not None:
+            return response
+        cache_stats.increment("misses")
+        response = sync_fn(**kwargs)
+        cached_response = {"response": response.model_dump()}
+        event_loop.run_until_complete(cache.set(cache_key, cached_response))
+        memory_cache.set(cache_key, cached_response)
         return response
 
+    async def _fetch(cache_key: str, **kwargs: Any) -> tuple[Any, dict]:
+        """Resolve a response from the persistent cache or the model, returning it with its serialized form."""
+        cached_response = await cache.get(cache_key)
+        response = _from_persistent(cache_key, cached_response)
+        if response is not None:
+            return response, cached_response
+        cache_stats.increment("misses")
+        response = await async_fn(**kwargs)
+        cached_response = {"response": response.model_dump()}
+        await cache.set(cache_key, cached_response)
+        memory_cache.set(cache_key, cached_response)
+        return response, cached_response
+
     async def _wrapped_with_cache_async(
         **kwargs: Any,
     ) -> Any:
@@ -84,24 +168,27 @@ def with_cache(
         cache_key = get_cache_key(
             model_config=model_config, prefix=cache_key_prefix, **kwargs
         )
-        cached_response = await cache.get(cache_key)
-        if (
-            cached_response is not None
-            and isinstance(cached_response, dict)
-            and "response" in cached_response
-            and cached_response["response"] is not None
-            and isinstance(cached_response["response"], dict)
-        ):
-            try:
-                if request_type == "chat":
-                    return ModelResponse(**cached_response["response"])
-                return EmbeddingResponse(**cached_response["response"])
-            except Exception:  # noqa: BLE001
-                # Try to retrieve value from cache but if it fails, continue
-                # to make the request.
-                ...
-        response = await async_fn(**kwargs)
-        await cache.set(cache_key, {"response": response.model_dump()})
+        response = _from_memory(cache_key)
+        if response is not None:
+            return response
+
+        coalesced = False
+
+        def on_coalesced() -> None:
+            nonlocal coalesced
+            coalesced = True
+            cache_stats.increment("coalesced")
+
+        response, cached_response = await in_flight.run(
+            cache_key, lambda: _fetch(cache_key, **kwargs), on_coalesced
+        )
+        if not coalesced:
+            return response
+        # callers that shared a request get their own copy of the response
+        response = _to_response(cached_response)
+        if response is not None:
+            return response
+        response, _ = await _fetch(cache_key, **kwargs)
         return response
 
     return (_wrapped_with_cache, _wrapped_with_cache_async)
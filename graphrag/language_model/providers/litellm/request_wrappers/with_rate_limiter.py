@@ -3,6 +3,7 @@
 
 """LiteLLM completion/embedding rate limiter wrapper."""
 
+from collections.abc import Mapping
 from typing import TYPE_CHECKING, Any
 
 from litellm import token_counter  # type: ignore
@@ -17,6 +18,28 @@ from graphrag.language_model.providers.litellm.types import (
 
 if TYPE_CHECKING:
     from graphrag.config.models.language_model_config import LanguageModelConfig
+    from graphrag.language_model.providers.litellm.services.rate_limiter.rate_limiter import (
+        RateLimiter,
+    )
+
+
+def _response_headers(response: Any) -> Mapping[str, Any] | None:
+    """Get the provider headers of a litellm response or exception, if any."""
+    hidden_params = getattr(response, "_hidden_params", None)
+    if isinstance(hidden_params, dict):
+        headers = hidden_params.get("additional_headers")
+        if isinstance(headers, Mapping):
+            return headers
+    headers = getattr(response, "litellm_response_headers", None)
+    if headers is None:
+        headers = getattr(getattr(response, "response", None), "headers", None)
+    return headers if isinstance(headers, Mapping) else None
+
+
+def _observe(rate_limiter: "RateLimiter", response: Any) -> None:
+    headers = _response_headers(response)
+    if headers:
+        rate_limiter.observe(headers)
 
 
 def with_rate_limiter(
@@ -41,6 +64,9 @@ def with_rate_limiter(
 
     If `rpm` and `tpm` is set to 0 or None, rate limiting is disabled.
 
+    The rate limit headers of every response, and of failed requests, are
+    passed back to the rate limiter so that it can follow the provider's hints.
+
     Returns
     -------
         A tuple containing the wrapped synchronous and asynchronous chat/embedding request functions.
@@ -55,7 +81,10 @@ def with_rate_limiter(
         raise ValueError(msg)
 
     rate_limiter_service = rate_limiter_factory.create(
-        strategy=model_config.rate_limit_strategy, rpm=rpm, tpm=tpm
+        strategy=model_config.rate_limit_strategy,
+        rpm=rpm,
+        tpm=tpm,
+        coordinator_path=model_config.rate_limit_coordinator,
     )
 
     max_tokens = model_config.max_completion_tokens or model_config.max_tokens or 0
@@ -74,7 +103,13 @@ def with_rate_limiter(
             )
 
         with rate_limiter_service.acquire(token_count=token_count):
-            return sync_fn(**kwargs)
+            try:
+                response = sync_fn(**kwargs)
+            except Exception as e:
+                _observe(rate_limiter_service, e)
+                raise
+        _observe(rate_limiter_service, response)
+        return response
 
     async def _wrapped_with_rate_limiter_async(
         **kwargs: Any,
@@ -91,7 +126,13 @@ def with_rate_limiter(
                 text=kwargs["input"],
             )
 
-        with rate_limiter_service.acquire(token_count=token_count):
-            return await async_fn(**kwargs)
+        async with rate_limiter_service.aacquire(token_count=token_count):
+            try:
+                response = await async_fn(**kwargs)
+            except Exception as e:
+                _observe(rate_limiter_service, e)
+                raise
+        _observe(rate_limiter_service, response)
+        return response
 
     return (_wrapped_with_rate_limiter, _wrapped_with_rate_limiter_async)
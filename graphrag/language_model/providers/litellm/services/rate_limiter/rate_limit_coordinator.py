@@ -0,0 +1,117 @@
+# Copyright (c) 2025 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""LiteLLM Rate Limit Coordinators.
+
+A coordinator owns the state of a token bucket rate limiter, so that several
+limiters, possibly in different processes, can draw from the same budget.
+"""
+
+import os
+import struct
+import sys
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+_STATE_FORMAT = struct.Struct("<4d")
+
+
+@dataclass
+class BucketState:
+    """The shared state of the request and token buckets."""
+
+    requests: float
+    """Requests currently available, negative when reserved ahead."""
+    tokens: float
+    """Tokens currently available, negative when reserved ahead."""
+    updated: float
+    """Time of the last refill."""
+    blocked_until: float = 0.0
+    """Time before which no request may start, set from provider retry-after hints."""
+
+
+class RateLimitCoordinator(ABC):
+    """Abstract base class for rate limit coordinators."""
+
+    @abstractmethod
+    @contextmanager
+    def transaction(self, initial: BucketState) -> Iterator[BucketState]:
+        """
+        Lock the bucket state for a read-modify-write.
+
+        Args
+        ----
+            initial: The state to start from when no state exists yet.
+
+        Yields
+        ------
+            BucketState: The state, written back when the context exits.
+        """
+        msg = "RateLimitCoordinator subclasses must implement the transaction method."
+        raise NotImplementedError(msg)
+
+
+class LocalRateLimitCoordinator(RateLimitCoordinator):
+    """Keep the bucket state in memory, shared by the threads of one process."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._state: BucketState | None = None
+
+    @contextmanager
+    def transaction(self, initial: BucketState) -> Iterator[BucketState]:
+        """Lock the in-memory bucket state."""
+        with self._lock:
+            if self._state is None:
+                self._state = initial
+            yield self._state
+
+
+class FileRateLimitCoordinator(RateLimitCoordinator):
+    """Keep the bucket state in a small file, shared by every process that opens it.
+
+    Access is serialized with an exclusive `flock` on the file, so this
+    coordinator is only available on POSIX systems.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        if sys.platform == "win32":
+            msg = "The file rate limit coordinator is not supported on Windows."
+            raise ValueError(msg)
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def transaction(self, initial: BucketState) -> Iterator[BucketState]:
+        """Lock the bucket state file."""
+        import fcntl
+
+        with self._lock:
+            fd = os.open(self._path, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                data = os.pread(fd, _STATE_FORMAT.size, 0)
+                state = (
+                    BucketState(*_STATE_FORMAT.unpack(data))
+                    if len(data) == _STATE_FORMAT.size
+                    else initial
+                )
+                yield state
+                os.pwrite(
+                    fd,
+                    _STATE_FORMAT.pack(
+                        state.requests,
+                        state.tokens,
+                        state.updated,
+                        state.blocked_until,
+                    ),
+                    0,
+                )
+            finally:
+                # closing the descriptor releases the lock
+                os.close(fd)
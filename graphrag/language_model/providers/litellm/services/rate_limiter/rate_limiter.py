@@ -4,8 +4,8 @@
 """LiteLLM Rate Limiter."""
 
 from abc import ABC, abstractmethod
-from collections.abc import Iterator
-from contextlib import contextmanager
+from collections.abc import AsyncIterator, Iterator, Mapping
+from contextlib import asynccontextmanager, contextmanager
 from typing import Any
 
 
@@ -35,3 +35,31 @@ class RateLimiter(ABC):
         """
         msg = "RateLimiter subclasses must implement the acquire method."
         raise NotImplementedError(msg)
+
+    @asynccontextmanager
+    async def aacquire(self, *, token_count: int) -> AsyncIterator[None]:
+        """
+        Acquire Rate Limiter from a coroutine.
+
+        Rate limiters that can wait without blocking the event loop should override
+        this method, the default implementation delegates to `acquire`.
+
+        Args
+        ----
+            token_count: The estimated number of tokens for the current request.
+
+        Yields
+        ------
+            None: This context manager does not return any value.
+        """
+        with self.acquire(token_count=token_count):
+            yield
+
+    def observe(self, headers: Mapping[str, Any]) -> None:  # noqa: B027
+        """
+        Adapt the rate limiter to the headers of a provider response.
+
+        Args
+        ----
+            headers: The response headers, including rate limit hints such as `retry-after`.
+        """
@@ -0,0 +1,193 @@
+# Copyright (c) 2025 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""LiteLLM Token Bucket Rate Limiter."""
+
+import asyncio
+import logging
+import time
+from collections.abc import AsyncIterator, Iterator, Mapping
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any
+
+from graphrag.language_model.providers.litellm.services.rate_limiter.rate_limit_coordinator import (
+    BucketState,
+    FileRateLimitCoordinator,
+    LocalRateLimitCoordinator,
+    RateLimitCoordinator,
+)
+from graphrag.language_model.providers.litellm.services.rate_limiter.rate_limiter import (
+    RateLimiter,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _header_float(headers: Mapping[str, Any], *names: str) -> float | None:
+    for name in names:
+        value = headers.get(name)
+        if value is None:
+            continue
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            continue
+    return None
+
+
+class TokenBucketRateLimiter(RateLimiter):
+    """Token Bucket Rate Limiter implementation.
+
+    Requests and tokens are drawn from two buckets that refill continuously at
+    `rpm` and `tpm` per period. Each acquire reserves its share right away and
+    waits for the time it takes the buckets to cover the reservation, so the
+    accounting is O(1) and waiting never spins. The async path awaits instead
+    of sleeping, and provider rate limit headers pause or drain the buckets.
+    """
+
+    def __init__(
+        self,
+        *,
+        rpm: int | None = None,
+        tpm: int | None = None,
+        period_in_seconds: int = 60,
+        coordinator: RateLimitCoordinator | None = None,
+        coordinator_path: str | None = None,
+        **kwargs: Any,
+    ):
+        if rpm is None and tpm is None:
+            msg = "Both TPM and RPM cannot be None (disabled), one or both must be set to a positive integer."
+            raise ValueError(msg)
+        if (rpm is not None and rpm <= 0) or (tpm is not None and tpm <= 0):
+            msg = "RPM and TPM must be either None (disabled) or positive integers."
+            raise ValueError(msg)
+        if period_in_seconds <= 0:
+            msg = "Period in seconds must be a positive integer."
+            raise ValueError(msg)
+        self.rpm = rpm
+        self.tpm = tpm
+        self.period_in_seconds = period_in_seconds
+        if coordinator is None:
+            coordinator = (
+                FileRateLimitCoordinator(coordinator_path)
+                if coordinator_path
+                else LocalRateLimitCoordinator()
+            )
+        self._coordinator = coordinator
+
+    def _refill(self, state: BucketState, now: float) -> None:
+        elapsed = max(0.0, now - state.updated)
+        if self.rpm is not None:
+            state.requests = min(
+                float(self.rpm),
+                state.requests + elapsed * self.rpm / self.period_in_seconds,
+            )
+        if self.tpm is not None:
+            state.tokens = min(
+                float(self.tpm),
+                state.tokens + elapsed * self.tpm / self.period_in_seconds,
+            )
+        state.updated = max(state.updated, now)
+
+    def _full(self, now: float) -> BucketState:
+        return BucketState(
+            requests=float(self.rpm or 0), tokens=float(self.tpm or 0), updated=now
+        )
+
+    def _reserve(self, token_count: int) -> float:
+        """Reserve a request and its tokens, returning how long to wait before sending it."""
+        now = time.time()
+        with self._coordinator.transaction(self._full(now)) as state:
+            self._refill(state, now)
+            wait = max(0.0, state.blocked_until - now)
+            if self.rpm is not None:
+                state.requests -= 1
+                if state.requests < 0:
+                    wait = max(
+                        wait, -state.requests * self.period_in_seconds / self.rpm
+                    )
+            if self.tpm is not None:
+                # a request larger than the whole budget is let through once the bucket is full
+                state.tokens -= min(token_count, self.tpm)
+                if state.tokens < 0:
+                    wait = max(wait, -state.tokens * self.period_in_seconds / self.tpm)
+        return wait
+
+    @contextmanager
+    def acquire(self, *, token_count: int) -> Iterator[None]:
+        """
+        Acquire Rate Limiter.
+
+        Args
+        ----
+            token_count: The estimated number of tokens for the current request.
+
+        Yields
+        ------
+            None: This context manager does not return any value.
+        """
+        wait = self._reserve(token_count)
+        if wait > 0:
+            time.sleep(wait)
+        yield
+
+    @asynccontextmanager
+    async def aacquire(self, *, token_count: int) -> AsyncIterator[None]:
+        """
+        Acquire Rate Limiter without blocking the event loop.
+
+        Args
+        ----
+            token_count: The estimated number of tokens for the current request.
+
+        Yields
+        ------
+            None: This context manager does not return any value.
+        """
+        wait = self._reserve(token_count)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        yield
+
+    def observe(self, headers: Mapping[str, Any]) -> None:
+        """
+        Adapt the buckets to the rate limit headers of a provider response.
+
+        A `retry-after` (or `retry-after-ms`) header pauses every request until it
+        has elapsed. `x-ratelimit-remaining-requests` and `x-ratelimit-remaining-tokens`
+        lower the local buckets when the provider has less budget left than they do.
+
+        Args
+        ----
+            headers: The response headers, with or without litellm's `llm_provider-` prefix.
+        """
+        normalized = {
+            str(name).lower().removeprefix("llm_provider-"): value
+            for name, value in headers.items()
+        }
+        retry_after = _header_float(normalized, "retry-after")
+        retry_after_ms = _header_float(normalized, "retry-after-ms")
+        if retry_after_ms is not None:
+            retry_after = retry_after_ms / 1000
+        remaining_requests = _header_float(normalized, "x-ratelimit-remaining-requests")
+        remaining_tokens = _header_float(normalized, "x-ratelimit-remaining-tokens")
+        if (
+            retry_after is None
+            and remaining_requests is None
+            and remaining_tokens is None
+        ):
+            return
+
+        now = time.time()
+        with self._coordinator.transaction(self._full(now)) as state:
+            self._refill(state, now)
+            if retry_after is not None and retry_after > 0:
+                logger.warning(
+                    "Rate limited by the provider, pausing requests for %.1fs",
+                    retry_after,
+                )
+                state.blocked_until = max(state.blocked_until, now + retry_after)
+            if self.rpm is not None and remaining_requests is not None:
+                state.requests = min(state.requests, remaining_requests)
+            if self.tpm is not None and remaining_tokens is not None:
+                state.tokens = min(state.tokens, remaining_tokens)
@@ -10,11 +10,14 @@ from copy import deepcopy
 from time import time
 from typing import Any
 
+import numpy as np
+
 from graphrag.data_model.community import Community
 from graphrag.data_model.community_report import CommunityReport
-from graphrag.language_model.protocol.base import ChatModel
+from graphrag.language_model.protocol.base import ChatModel, EmbeddingModel
 from graphrag.query.context_builder.rate_prompt import RATE_QUERY
 from graphrag.query.context_builder.rate_relevancy import rate_relevancy
+from graphrag.query.query_cache import QueryCache
 from graphrag.tokenizer.tokenizer import Tokenizer
 
 logger = logging.getLogger(__name__)
@@ -24,6 +27,13 @@ class DynamicCommunitySelection:
     """Dynamic community selection to select community reports that are relevant to the query.
 
     Any community report with a rating EQUAL or ABOVE the rating_threshold is considered relevant.
+
+    The children of a relevant community are rated as soon as it is, without
+    waiting for the rest of its level. With a `text_embedder` and
+    `min_similarity`, communities whose report summary embedding is less
+    similar than `min_similarity` to the query are pruned, along with their
+    subtree, without being rated. Ratings are cached in `rating_cache`, if
+    given, by community and normalized query.
     """
 
     def __init__(
@@ -40,6 +50,9 @@ class DynamicCommunitySelection:
         max_level: int = 2,
         concurrent_coroutines: int = 8,
         model_params: dict[str, Any] | None = None,
+        text_embedder: EmbeddingModel | None = None,
+        min_similarity: float | None = None,
+        rating_cache: QueryCache | None = None,
     ):
         self.model = model
         self.tokenizer = tokenizer
@@ -51,6 +64,9 @@ class DynamicCommunitySelection:
         self.max_level = max_level
         self.semaphore = asyncio.Semaphore(concurrent_coroutines)
         self.model_params = model_params if model_params else {}
+        self.text_embedder = text_embedder
+        self.min_similarity = min_similarity
+        self.rating_cache = rating_cache
 
         self.reports = {report.community_id: report for report in community_reports}
         self.communities = {community.short_id: community for community in communities}
@@ -67,6 +83,88 @@ class DynamicCommunitySelection:
         # start from root communities (level 0)
         self.starting_communities = self.levels["0"]
 
+        # normalized report summary embeddings, computed as communities are first reached
+        self._report_embeddings: dict[str, np.ndarray] = {}
+
+    async def _embed(self, texts: list[str]) -> list[np.ndarray]:
+        """Embed texts into unit vectors."""
+        embeddings = np.array(
+            await self.text_embedder.aembed_batch(texts),  # type: ignore
+            dtype=np.float32,
+        )
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        return list(embeddings / np.where(norms == 0, 1, norms))
+
+    async def _prune(
+        self, query_embedding: np.ndarray | None, communities: list[str]
+    ) -> tuple[list[str], list[str]]:
+        """Split communities into those to rate, most similar to the query first, and those pruned."""
+        if query_embedding is None or self.min_similarity is None:
+            return communities, []
+        missing = [
+            community
+            for community in communities
+            if community not in self._report_embeddings
+        ]
+        if missing:
+            embeddings = await self._embed([
+                self.reports[community].summary or self.reports[community].full_content
+                for community in missing
+            ])
+            self._report_embeddings.update(zip(missing, embeddings, strict=True))
+        similarities = {
+            community: float(self._report_embeddings[community] @ query_embedding)
+            for community in communities
+        }
+        ranked = sorted(communities, key=lambda c: similarities[c], reverse=True)
+        return (
+            [c for c in ranked if similarities[c] >= self.min_similarity],
+            [c for c in ranked if similarities[c] < self.min_similarity],
+        )
+
+    async def _rate(self, query: str, community: str) -> dict[str, Any]:
+        """Rate a community, or get its cached rating without any LLM usage."""
+
+        async def rate() -> dict[str, Any]:
+            return await rate_relevancy(
+                query=query,
+                description=(
+                    self.reports[community].summary
+                    if self.use_summary
+                    else self.reports[community].full_content
+                ),
+                model=self.model,
+                tokenizer=self.tokenizer,
+                rate_query=self.rate_query,
+                num_repeats=self.num_repeats,
+                semaphore=self.semaphore,
+                **self.model_params,
+            )
+
+        if self.rating_cache is None:
+            return await rate()
+        rated = False
+
+        async def rate_once() -> dict[str, Any]:
+            nonlocal rated
+            rated = True
+            return await rate()
+
+        result = await self.rating_cache.get_or_create(
+            self.rating_cache.create_key(
+                " ".join(query.casefold().split()),
+                community,
+                self.use_summary,
+                self.rate_query,
+                self.num_repeats,
+                self.model_params,
+            ),
+            rate_once,
+        )
+        if rated:
+            return result
+        return {**result, "llm_calls": 0, "prompt_tokens": 0, "output_tokens": 0}
+
     async def select(self, query: str) -> tuple[list[CommunityReport], dict[str, Any]]:
         """
         Select relevant communities with respect to the query.
@@ -75,10 +173,10 @@ class DynamicCommunitySelection:
             query: the query to rate against
         """
         start = time()
-        queue = deepcopy(self.starting_communities)
         level = 0
 
         ratings = {}  # store the ratings for each community
+        pruned: list[str] = []  # communities skipped for their embedding similarity
         llm_info: dict[str, Any] = {
             "llm_calls": 0,
             "prompt_tokens": 0,
@@ -86,58 +184,54 @@ class DynamicCommunitySelection:
         }
         relevant_communities = set()
 
-        while queue:
-            gather_results = await asyncio.gather(*[
-                rate_relevancy(
-                    query=query,
-                    description=(
-                        self.reports[community].summary
-                        if self.use_summary
-                        else self.reports[community].full_content
-                    ),
-                    model=self.model,
-                    tokenizer=self.tokenizer,
-                    rate_query=self.rate_query,
-                    num_repeats=self.num_repeats,
-                    semaphore=self.semaphore,
-                    **self.model_params,
-                )
-                for community in queue
-            ])
+        query_embedding = None
+        if self.text_embedder is not None and self.min_similarity is not None:
+            query_embedding = (await self._embed([query]))[0]
 
+        async def expand(communities: list[str]) -> None:
+            to_rate, skipped = await self._prune(query_embedding, communities)
+            pruned.extend(skipped)
+            await asyncio.gather(*[visit(community) for community in to_rate])
+
+        async def visit(community: str) -> None:
+            result = await self._rate(query, community)
+            rating = result["rating"]
+            logger.debug(
+                "dynamic community selection: community %s rating %s",
+                community,
+                rating,
+            )
+            ratings[community] = rating
+            llm_info["llm_calls"] += result["llm_calls"]
+            llm_info["prompt_tokens"] += result["prompt_tokens"]
+            llm_info["output_tokens"] += result["output_tokens"]
+            if rating < self.threshold:
+                return
+            relevant_communities.add(community)
+            # find children nodes of the current node and rate them right away
+            # TODO check why some sub_communities are NOT in report_df
             communities_to_rate = []
-            for community, result in zip(queue, gather_results, strict=True):
-                rating = result["rating"]
-                logger.debug(
-                    "dynamic community selection: community %s rating %s",
-                    community,
-                    rating,
-                )
-                ratings[community] = rating
-                llm_info["llm_calls"] += result["llm_calls"]
-                llm_info["prompt_tokens"] += result["prompt_tokens"]
-                llm_info["output_tokens"] += result["output_tokens"]
-                if rating >= self.threshold:
-                    relevant_communities.add(community)
-                    # find children nodes of the current node and append them to the queue
-                    # TODO check why some sub_communities are NOT in report_df
-                    if community in self.communities:
-                        for child in self.communities[community].children:
-                            if child in self.reports:
-                                communities_to_rate.append(child)
-                            else:
-                                logger.debug(
-                                    "dynamic community selection: cannot find community %s in reports",
-                                    child,
-                                )
-                    # remove parent node if the current node is deemed relevant
-                    if not self.keep_parent and community in self.communities:
-                        relevant_communities.discard(self.communities[community].parent)
-            queue = communities_to_rate
+            if community in self.communities:
+                for child in self.communities[community].children:
+                    if child in self.reports:
+                        communities_to_rate.append(child)
+                    else:
+                        logger.debug(
+                            "dynamic community selection: cannot find community %s in reports",
+                            child,
+                        )
+            # remove parent node if the current node is deemed relevant
+            if not self.keep_parent and community in self.communities:
+                relevant_communities.discard(self.communities[community].parent)
+            await expand(communities_to_rate)
+
+        queue = deepcopy(self.starting_communities)
+        while queue:
+            await expand(queue)
             level += 1
+            queue = []
             if (
-                (len(queue) == 0)
-                and (len(relevant_communities) == 0)
+                (len(relevant_communities) == 0)
                 and (str(level) in self.levels)
                 and (level <= self.max_level)
             ):
@@ -146,7 +240,7 @@ class DynamicCommunitySelection:
                     "reports, adding all reports at level %s to rate.",
                     level,
                 )
-                # append all communities at the next level to queue
+                # rate all communities at the next level
                 queue = self.levels[str(level)]
 
         community_reports = [
@@ -158,14 +252,17 @@ class DynamicCommunitySelection:
             "dynamic community selection (took: %ss)\n"
             "\trating distribution %s\n"
             "\t%s out of %s community reports are relevant\n"
+            "\t%s community reports pruned by embedding similarity\n"
             "\tprompt tokens: %s, output tokens: %s",
             int(end - start),
             dict(sorted(Counter(ratings.values()).items())),
             len(relevant_communities),
             len(self.reports),
+            len(pruned),
             llm_info["prompt_tokens"],
             llm_info["output_tokens"],
         )
 
         llm_info["ratings"] = ratings
+        llm_info["pruned"] = pruned
         return community_reports, llm_info
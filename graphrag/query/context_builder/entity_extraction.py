@@ -13,7 +13,8 @@ from graphrag.query.input.retrieval.entities import (
     get_entity_by_key,
     get_entity_by_name,
 )
-from graphrag.vector_stores.base import BaseVectorStore
+from graphrag.query.input.retrieval.knowledge_index import KnowledgeIndex
+from graphrag.vector_stores.base import BaseVectorStore, VectorStoreSearchResult
 
 
 class EntityVectorStoreKey(str, Enum):
@@ -44,8 +45,16 @@ def map_query_to_entities(
     exclude_entity_names: list[str] | None = None,
     k: int = 10,
     oversample_scaler: int = 2,
+    search_results: list[VectorStoreSearchResult] | None = None,
+    knowledge_index: KnowledgeIndex | None = None,
 ) -> list[Entity]:
-    """Extract entities that match a given query using semantic similarity of text embeddings of query and entity descriptions."""
+    """Extract entities that match a given query using semantic similarity of text embeddings of query and entity descriptions.
+
+    `search_results` may carry the vector store matches for the query when they were already
+    resolved in a batch (see `asearch_query_entities`), in which case no embedding call is made.
+    For an empty query, the top ranked entities are taken from `knowledge_index` if given, rather
+    than sorting all entities.
+    """
     if include_entity_names is None:
         include_entity_names = []
     if exclude_entity_names is None:
@@ -55,11 +64,12 @@ def map_query_to_entities(
     if query != "":
         # get entities with highest semantic similarity to query
         # oversample to account for excluded entities
-        search_results = text_embedding_vectorstore.similarity_search_by_text(
-            text=query,
-            text_embedder=lambda t: text_embedder.embed(t),
-            k=k * oversample_scaler,
-        )
+        if search_results is None:
+            search_results = text_embedding_vectorstore.similarity_search_by_text(
+                text=query,
+                text_embedder=lambda t: text_embedder.embed(t),
+                k=k * oversample_scaler,
+            )
         for result in search_results:
             if embedding_vectorstore_key == EntityVectorStoreKey.ID and isinstance(
                 result.document.id, str
@@ -73,6 +83,8 @@ def map_query_to_entities(
                 )
             if matched:
                 matched_entities.append(matched)
+    elif knowledge_index is not None:
+        matched_entities = knowledge_index.entities_by_rank[:k]
     else:
         all_entities.sort(key=lambda x: x.rank if x.rank else 0, reverse=True)
         matched_entities = all_entities[:k]
@@ -119,3 +131,25 @@ def find_nearest_neighbors_by_entity_rank(
     if k:
         return top_relations[:k]
     return top_relations
+
+
+async def asearch_query_entities(
+    queries: list[str],
+    text_embedding_vectorstore: BaseVectorStore,
+    text_embedder: EmbeddingModel,
+    k: int = 10,
+    oversample_scaler: int = 2,
+) -> list[list[VectorStoreSearchResult] | None]:
+    """Embed several queries in one batch and resolve their entity matches in a single vector store call.
+
+    The result for an empty query is None, so that `map_query_to_entities` falls back to ranking entities.
+    """
+    non_empty = [query for query in queries if query != ""]
+    batched = iter(
+        await text_embedding_vectorstore.asimilarity_search_by_texts(
+            texts=non_empty,
+            text_embedder=text_embedder,
+            k=k * oversample_scaler,
+        )
+    )
+    return [next(batched) if query != "" else None for query in queries]
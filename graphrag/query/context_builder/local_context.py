@@ -4,6 +4,7 @@
 """Local Context Builder."""
 
 from collections import defaultdict
+from collections.abc import Mapping
 from typing import Any, cast
 
 import pandas as pd
@@ -97,15 +98,19 @@ def build_covariates_context(
     max_context_tokens: int = 8000,
     column_delimiter: str = "|",
     context_name: str = "Covariates",
+    covariates_by_subject: Mapping[str, list[Covariate]] | None = None,
 ) -> tuple[str, pd.DataFrame]:
-    """Prepare covariate data tables as context data for system prompt."""
+    """Prepare covariate data tables as context data for system prompt.
+
+    When `covariates_by_subject` is given, the covariates of each entity are
+    looked up in it instead of being scanned for in `covariates`.
+    """
     tokenizer = tokenizer or get_tokenizer()
     # create an empty list of covariates
     if len(selected_entities) == 0 or len(covariates) == 0:
         return "", pd.DataFrame()
 
     selected_covariates = list[Covariate]()
-    record_df = pd.DataFrame()
 
     # add context header
     current_context_text = f"-----{context_name}-----" + "\n"
@@ -120,9 +125,12 @@ def build_covariates_context(
 
     all_context_records = [header]
     for entity in selected_entities:
-        selected_covariates.extend([
-            cov for cov in covariates if cov.subject_id == entity.title
-        ])
+        if covariates_by_subject is not None:
+            selected_covariates.extend(covariates_by_subject.get(entity.title, []))
+        else:
+            selected_covariates.extend([
+                cov for cov in covariates if cov.subject_id == entity.title
+            ])
 
     for covariate in selected_covariates:
         new_context = [
@@ -145,12 +153,12 @@ def build_covariates_context(
         all_context_records.append(new_context)
         current_tokens += new_tokens
 
-        if len(all_context_records) > 1:
-            record_df = pd.DataFrame(
-                all_context_records[1:], columns=cast("Any", all_context_records[0])
-            )
-        else:
-            record_df = pd.DataFrame()
+    if len(all_context_records) > 1:
+        record_df = pd.DataFrame(
+            all_context_records[1:], columns=cast("Any", all_context_records[0])
+        )
+    else:
+        record_df = pd.DataFrame()
 
     return current_context_text, record_df
 
@@ -16,6 +16,7 @@ from graphrag.language_model.providers.fnllm.utils import (
     get_openai_model_parameters_from_config,
 )
 from graphrag.query.context_builder.entity_extraction import EntityVectorStoreKey
+from graphrag.query.query_cache import CachedEmbeddingModel, QueryCache
 from graphrag.query.structured_search.basic_search.basic_context import (
     BasicSearchContext,
 )
@@ -47,8 +48,15 @@ def get_local_search_engine(
     description_embedding_store: BaseVectorStore,
     system_prompt: str | None = None,
     callbacks: list[QueryCallbacks] | None = None,
+    context_builder: LocalSearchMixedContext | None = None,
+    embedding_cache: QueryCache | None = None,
+    result_cache: QueryCache | None = None,
 ) -> LocalSearch:
-    """Create a local search engine based on data + configuration."""
+    """Create a local search engine based on data + configuration.
+
+    A `context_builder` from a previous engine over the same data can be passed to reuse its indexes and caches.
+    Query embeddings are cached in `embedding_cache` and entity searches in `result_cache`, if given.
+    """
     model_settings = config.get_language_model_config(config.local_search.chat_model_id)
 
     chat_model = ModelManager().get_or_create_chat_model(
@@ -66,6 +74,8 @@ def get_local_search_engine(
         model_type=embedding_settings.type,
         config=embedding_settings,
     )
+    if embedding_cache is not None:
+        embedding_model = CachedEmbeddingModel(embedding_model, embedding_cache)
 
     tokenizer = get_tokenizer(model_config=model_settings)
 
@@ -76,7 +86,8 @@ def get_local_search_engine(
     return LocalSearch(
         model=chat_model,
         system_prompt=system_prompt,
-        context_builder=LocalSearchMixedContext(
+        context_builder=context_builder
+        or LocalSearchMixedContext(
             community_reports=reports,
             text_units=text_units,
             entities=entities,
@@ -86,6 +97,9 @@ def get_local_search_engine(
             embedding_vectorstore_key=EntityVectorStoreKey.ID,  # if the vectorstore uses entity title as ids, set this to EntityVectorStoreKey.TITLE
             text_embedder=embedding_model,
             tokenizer=tokenizer,
+            entity_search_cache=result_cache.child("entity_search")
+            if result_cache
+            else None,
         ),
         tokenizer=tokenizer,
         model_params=model_params,
@@ -119,8 +133,15 @@ def get_global_search_engine(
     reduce_system_prompt: str | None = None,
     general_knowledge_inclusion_prompt: str | None = None,
     callbacks: list[QueryCallbacks] | None = None,
+    context_builder: GlobalCommunityContext | None = None,
+    embedding_cache: QueryCache | None = None,
+    result_cache: QueryCache | None = None,
 ) -> GlobalSearch:
-    """Create a global search engine based on data + configuration."""
+    """Create a global search engine based on data + configuration.
+
+    A `context_builder` from a previous engine over the same data can be passed to reuse its caches.
+    Query embeddings are cached in `embedding_cache`, map responses and community ratings in `result_cache`, if given.
+    """
     model_settings = config.get_language_model_config(
         config.global_search.chat_model_id
     )
@@ -151,14 +172,31 @@ def get_global_search_engine(
             "threshold": gs_config.dynamic_search_threshold,
             "max_level": gs_config.dynamic_search_max_level,
             "model_params": {**model_params},
+            "min_similarity": gs_config.dynamic_search_min_similarity,
+            "rating_cache": result_cache.child("community_rating")
+            if result_cache
+            else None,
         })
+        if gs_config.dynamic_search_min_similarity is not None:
+            embedding_settings = config.get_language_model_config(
+                gs_config.embedding_model_id
+            )
+            embedding_model = ModelManager().get_or_create_embedding_model(
+                name="global_search_embedding",
+                model_type=embedding_settings.type,
+                config=embedding_settings,
+            )
+            if embedding_cache is not None:
+                embedding_model = CachedEmbeddingModel(embedding_model, embedding_cache)
+            dynamic_community_selection_kwargs["text_embedder"] = embedding_model
 
     return GlobalSearch(
         model=model,
         map_system_prompt=map_system_prompt,
         reduce_system_prompt=reduce_system_prompt,
         general_knowledge_inclusion_prompt=general_knowledge_inclusion_prompt,
-        context_builder=GlobalCommunityContext(
+        context_builder=context_builder
+        or GlobalCommunityContext(
             community_reports=reports,
             communities=communities,
             entities=entities,
@@ -172,6 +210,7 @@ def get_global_search_engine(
         reduce_llm_params={**model_params},
         map_max_length=gs_config.map_max_length,
         reduce_max_length=gs_config.reduce_max_length,
+        map_early_stop_score=gs_config.map_early_stop_score,
         allow_general_knowledge=False,
         json_mode=False,
         context_builder_params={
@@ -189,6 +228,7 @@ def get_global_search_engine(
         concurrent_coroutines=model_settings.concurrent_requests,
         response_type=response_type,
         callbacks=callbacks,
+        map_response_cache=result_cache.child("global_map") if result_cache else None,
     )
 
 
@@ -203,8 +243,18 @@ def get_drift_search_engine(
     local_system_prompt: str | None = None,
     reduce_system_prompt: str | None = None,
     callbacks: list[QueryCallbacks] | None = None,
+    context_builder: DRIFTSearchContextBuilder | None = None,
+    embedding_cache: QueryCache | None = None,
+    result_cache: QueryCache | None = None,
+    community_level: int | None = None,
+    dynamic_community_selection: bool = False,
 ) -> DRIFTSearch:
-    """Create a local search engine based on data + configuration."""
+    """Create a local search engine based on data + configuration.
+
+    A `context_builder` from a previous engine over the same data can be passed to reuse its indexes and caches.
+    Query embeddings are cached in `embedding_cache`, entity searches and local search contexts in `result_cache`, if given.
+    Local search contexts depend on the community level the reports and entities were read at, so they are cached per `community_level` and `dynamic_community_selection`.
+    """
     chat_model_settings = config.get_language_model_config(
         config.drift_search.chat_model_id
     )
@@ -224,12 +274,15 @@ def get_drift_search_engine(
         model_type=embedding_model_settings.type,
         config=embedding_model_settings,
     )
+    if embedding_cache is not None:
+        embedding_model = CachedEmbeddingModel(embedding_model, embedding_cache)
 
     tokenizer = get_tokenizer(model_config=chat_model_settings)
 
     return DRIFTSearch(
         model=chat_model,
-        context_builder=DRIFTSearchContextBuilder(
+        context_builder=context_builder
+        or DRIFTSearchContextBuilder(
             model=chat_model,
             text_embedder=embedding_model,
             entities=entities,
@@ -241,9 +294,17 @@ def get_drift_search_engine(
             reduce_system_prompt=reduce_system_prompt,
             config=config.drift_search,
             response_type=response_type,
+            entity_search_cache=result_cache.child("entity_search")
+            if result_cache
+            else None,
         ),
         tokenizer=tokenizer,
         callbacks=callbacks,
+        context_cache=result_cache.child(
+            f"local_context:{community_level}:{dynamic_community_selection}"
+        )
+        if result_cache
+        else None,
     )
 
 
@@ -254,8 +315,14 @@ def get_basic_search_engine(
     system_prompt: str | None = None,
     response_type: str = "multiple paragraphs",
     callbacks: list[QueryCallbacks] | None = None,
+    context_builder: BasicSearchContext | None = None,
+    embedding_cache: QueryCache | None = None,
 ) -> BasicSearch:
-    """Create a basic search engine based on data + configuration."""
+    """Create a basic search engine based on data + configuration.
+
+    A `context_builder` from a previous engine over the same data can be passed to reuse its caches.
+    Query embeddings are cached in `embedding_cache`, if given.
+    """
     chat_model_settings = config.get_language_model_config(
         config.basic_search.chat_model_id
     )
@@ -275,6 +342,8 @@ def get_basic_search_engine(
         model_type=embedding_model_settings.type,
         config=embedding_model_settings,
     )
+    if embedding_cache is not None:
+        embedding_model = CachedEmbeddingModel(embedding_model, embedding_cache)
 
     tokenizer = get_tokenizer(model_config=chat_model_settings)
 
@@ -286,7 +355,8 @@ def get_basic_search_engine(
         model=chat_model,
         system_prompt=system_prompt,
         response_type=response_type,
-        context_builder=BasicSearchContext(
+        context_builder=context_builder
+        or BasicSearchContext(
             text_embedder=embedding_model,
             text_unit_embeddings=text_unit_embeddings,
             text_units=text_units,
@@ -32,6 +32,72 @@ from graphrag.vector_stores.base import BaseVectorStore
 
 logger = logging.getLogger(__name__)
 
+QUERY_TABLE_COLUMNS: dict[str, list[str]] = {
+    "entities": [
+        "id",
+        "human_readable_id",
+        "title",
+        "type",
+        "description",
+        "description_embedding",
+        "text_unit_ids",
+        "degree",
+    ],
+    "communities": [
+        "id",
+        "community",
+        "level",
+        "parent",
+        "children",
+        "title",
+        "entity_ids",
+        "text_unit_ids",
+    ],
+    "community_reports": [
+        "id",
+        "community",
+        "level",
+        "title",
+        "summary",
+        "full_content",
+        "rank",
+        "full_content_embedding",
+    ],
+    "text_units": [
+        "id",
+        "text",
+        "entity_ids",
+        "relationship_ids",
+        "n_tokens",
+        "document_ids",
+    ],
+    "relationships": [
+        "id",
+        "human_readable_id",
+        "source",
+        "target",
+        "description",
+        "weight",
+        "combined_degree",
+        "text_unit_ids",
+    ],
+    "covariates": [
+        "id",
+        "human_readable_id",
+        "subject_id",
+        "type",
+        "object_id",
+        "status",
+        "start_date",
+        "end_date",
+        "description",
+    ],
+}
+"""The columns of each index output table that the read_indexer_* functions use.
+
+Loading only these keeps the columns that queries never read out of memory.
+"""
+
 
 def read_indexer_text_units(final_text_units: pd.DataFrame) -> list[TextUnit]:
     """Read in the Text Units from the raw indexing outputs."""
@@ -132,8 +198,11 @@ def read_indexer_report_embeddings(
     embeddings_store: BaseVectorStore,
 ):
     """Read in the Community Reports from the raw indexing outputs."""
-    for report in community_reports:
-        report.full_content_embedding = embeddings_store.search_by_id(report.id).vector
+    documents = embeddings_store.search_by_ids([
+        report.id for report in community_reports
+    ])
+    for report, document in zip(community_reports, documents, strict=True):
+        report.full_content_embedding = document.vector
 
 
 def read_indexer_entities(
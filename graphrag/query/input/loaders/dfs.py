@@ -1,7 +1,14 @@
 # Copyright (c) 2024 Microsoft Corporation.
 # Licensed under the MIT License
 
-"""Load data from dataframes into collections of data objects."""
+"""Load data from dataframes into collections of data objects.
+
+Each reader converts the columns it needs once, as whole columns, and then
+zips them into data objects. This avoids converting the DataFrame into one
+dict per row and looking every field up by name.
+"""
+
+from collections.abc import Sequence
 
 import pandas as pd
 
@@ -12,24 +19,25 @@ from graphrag.data_model.entity import Entity
 from graphrag.data_model.relationship import Relationship
 from graphrag.data_model.text_unit import TextUnit
 from graphrag.query.input.loaders.utils import (
-    to_list,
-    to_optional_dict,
-    to_optional_float,
-    to_optional_int,
-    to_optional_list,
-    to_optional_str,
-    to_str,
+    index_column,
+    to_attributes_column,
+    to_list_column,
+    to_optional_dict_column,
+    to_optional_float_column,
+    to_optional_int_column,
+    to_optional_list_column,
+    to_optional_str_column,
+    to_str_column,
 )
 
 
-def _prepare_records(df: pd.DataFrame) -> list[dict]:
-    """
-    Reset index and convert the DataFrame to a list of dictionaries.
-
-    We rename the reset index column to 'Index' for consistency.
-    """
-    df_reset = df.reset_index().rename(columns={"index": "Index"})
-    return df_reset.to_dict("records")
+def _short_id_column(
+    df: pd.DataFrame, short_id_col: str | None
+) -> Sequence[str | None]:
+    """Get the short ids from a column, or from the row index if no column is given."""
+    return (
+        to_optional_str_column(df, short_id_col) if short_id_col else index_column(df)
+    )
 
 
 def read_entities(
@@ -46,31 +54,47 @@ def read_entities(
     rank_col: str | None = "degree",
     attributes_cols: list[str] | None = None,
 ) -> list[Entity]:
-    """Read entities from a dataframe using pre-converted records."""
-    records = _prepare_records(df)
+    """Read entities from a dataframe."""
     return [
         Entity(
-            id=to_str(row, id_col),
-            short_id=to_optional_str(row, short_id_col)
-            if short_id_col
-            else str(row["Index"]),
-            title=to_str(row, title_col),
-            type=to_optional_str(row, type_col),
-            description=to_optional_str(row, description_col),
-            name_embedding=to_optional_list(row, name_embedding_col, item_type=float),
-            description_embedding=to_optional_list(
-                row, description_embedding_col, item_type=float
-            ),
-            community_ids=to_optional_list(row, community_col, item_type=str),
-            text_unit_ids=to_optional_list(row, text_unit_ids_col),
-            rank=to_optional_int(row, rank_col),
-            attributes=(
-                {col: row.get(col) for col in attributes_cols}
-                if attributes_cols
-                else None
-            ),
+            id=id,
+            short_id=short_id,
+            title=title,
+            type=entity_type,
+            description=description,
+            name_embedding=name_embedding,
+            description_embedding=description_embedding,
+            community_ids=community_ids,
+            text_unit_ids=text_unit_ids,
+            rank=rank,
+            attributes=attributes,
+        )
+        for (
+            id,
+            short_id,
+            title,
+            entity_type,
+            description,
+            name_embedding,
+            description_embedding,
+            community_ids,
+            text_unit_ids,
+            rank,
+            attributes,
+        ) in zip(
+            to_str_column(df, id_col),
+            _short_id_column(df, short_id_col),
+            to_str_column(df, title_col),
+            to_optional_str_column(df, type_col),
+            to_optional_str_column(df, description_col),
+            to_optional_list_column(df, name_embedding_col, item_type=float),
+            to_optional_list_column(df, description_embedding_col, item_type=float),
+            to_optional_list_column(df, community_col, item_type=str),
+            to_optional_list_column(df, text_unit_ids_col),
+            to_optional_int_column(df, rank_col),
+            to_attributes_column(df, attributes_cols),
+            strict=True,
         )
-        for row in records
     ]
 
 
@@ -87,30 +111,44 @@ def read_relationships(
     text_unit_ids_col: str | None = "text_unit_ids",
     attributes_cols: list[str] | None = None,
 ) -> list[Relationship]:
-    """Read relationships from a dataframe using pre-converted records."""
-    records = _prepare_records(df)
+    """Read relationships from a dataframe."""
     return [
         Relationship(
-            id=to_str(row, id_col),
-            short_id=to_optional_str(row, short_id_col)
-            if short_id_col
-            else str(row["Index"]),
-            source=to_str(row, source_col),
-            target=to_str(row, target_col),
-            description=to_optional_str(row, description_col),
-            description_embedding=to_optional_list(
-                row, description_embedding_col, item_type=float
-            ),
-            weight=to_optional_float(row, weight_col),
-            text_unit_ids=to_optional_list(row, text_unit_ids_col, item_type=str),
-            rank=to_optional_int(row, rank_col),
-            attributes=(
-                {col: row.get(col) for col in attributes_cols}
-                if attributes_cols
-                else None
-            ),
+            id=id,
+            short_id=short_id,
+            source=source,
+            target=target,
+            description=description,
+            description_embedding=description_embedding,
+            weight=weight,
+            text_unit_ids=text_unit_ids,
+            rank=rank,
+            attributes=attributes,
+        )
+        for (
+            id,
+            short_id,
+            source,
+            target,
+            description,
+            description_embedding,
+            weight,
+            text_unit_ids,
+            rank,
+            attributes,
+        ) in zip(
+            to_str_column(df, id_col),
+            _short_id_column(df, short_id_col),
+            to_str_column(df, source_col),
+            to_str_column(df, target_col),
+            to_optional_str_column(df, description_col),
+            to_optional_list_column(df, description_embedding_col, item_type=float),
+            to_optional_float_column(df, weight_col),
+            to_optional_list_column(df, text_unit_ids_col, item_type=str),
+            to_optional_int_column(df, rank_col),
+            to_attributes_column(df, attributes_cols),
+            strict=True,
         )
-        for row in records
     ]
 
 
@@ -123,26 +161,34 @@ def read_covariates(
     text_unit_ids_col: str | None = "text_unit_ids",
     attributes_cols: list[str] | None = None,
 ) -> list[Covariate]:
-    """Read covariates from a dataframe using pre-converted records."""
-    records = _prepare_records(df)
+    """Read covariates from a dataframe."""
     return [
         Covariate(
-            id=to_str(row, id_col),
-            short_id=to_optional_str(row, short_id_col)
-            if short_id_col
-            else str(row["Index"]),
-            subject_id=to_str(row, subject_col),
-            covariate_type=(
-                to_str(row, covariate_type_col) if covariate_type_col else "claim"
-            ),
-            text_unit_ids=to_optional_list(row, text_unit_ids_col, item_type=str),
-            attributes=(
-                {col: row.get(col) for col in attributes_cols}
-                if attributes_cols
-                else None
-            ),
+            id=id,
+            short_id=short_id,
+            subject_id=subject_id,
+            covariate_type=covariate_type,
+            text_unit_ids=text_unit_ids,
+            attributes=attributes,
+        )
+        for (
+            id,
+            short_id,
+            subject_id,
+            covariate_type,
+            text_unit_ids,
+            attributes,
+        ) in zip(
+            to_str_column(df, id_col),
+            _short_id_column(df, short_id_col),
+            to_str_column(df, subject_col),
+            to_str_column(df, covariate_type_col)
+            if covariate_type_col
+            else ["claim"] * len(df),
+            to_optional_list_column(df, text_unit_ids_col, item_type=str),
+            to_attributes_column(df, attributes_cols),
+            strict=True,
         )
-        for row in records
     ]
 
 
@@ -160,31 +206,47 @@ def read_communities(
     children_col: str | None = "children",
     attributes_cols: list[str] | None = None,
 ) -> list[Community]:
-    """Read communities from a dataframe using pre-converted records."""
-    records = _prepare_records(df)
+    """Read communities from a dataframe."""
     return [
         Community(
-            id=to_str(row, id_col),
-            short_id=to_optional_str(row, short_id_col)
-            if short_id_col
-            else str(row["Index"]),
-            title=to_str(row, title_col),
-            level=to_str(row, level_col),
-            entity_ids=to_optional_list(row, entities_col, item_type=str),
-            relationship_ids=to_optional_list(row, relationships_col, item_type=str),
-            text_unit_ids=to_optional_list(row, text_units_col, item_type=str),
-            covariate_ids=to_optional_dict(
-                row, covariates_col, key_type=str, value_type=str
-            ),
-            parent=to_str(row, parent_col),
-            children=to_list(row, children_col),
-            attributes=(
-                {col: row.get(col) for col in attributes_cols}
-                if attributes_cols
-                else None
-            ),
+            id=id,
+            short_id=short_id,
+            title=title,
+            level=level,
+            entity_ids=entity_ids,
+            relationship_ids=relationship_ids,
+            text_unit_ids=text_unit_ids,
+            covariate_ids=covariate_ids,
+            parent=parent,
+            children=children,
+            attributes=attributes,
+        )
+        for (
+            id,
+            short_id,
+            title,
+            level,
+            entity_ids,
+            relationship_ids,
+            text_unit_ids,
+            covariate_ids,
+            parent,
+            children,
+            attributes,
+        ) in zip(
+            to_str_column(df, id_col),
+            _short_id_column(df, short_id_col),
+            to_str_column(df, title_col),
+            to_str_column(df, level_col),
+            to_optional_list_column(df, entities_col, item_type=str),
+            to_optional_list_column(df, relationships_col, item_type=str),
+            to_optional_list_column(df, text_units_col, item_type=str),
+            to_optional_dict_column(df, covariates_col, key_type=str, value_type=str),
+            to_str_column(df, parent_col),
+            to_list_column(df, children_col),
+            to_attributes_column(df, attributes_cols),
+            strict=True,
         )
-        for row in records
     ]
 
 
@@ -200,29 +262,41 @@ def read_community_reports(
     content_embedding_col: str | None = "full_content_embedding",
     attributes_cols: list[str] | None = None,
 ) -> list[CommunityReport]:
-    """Read community reports from a dataframe using pre-converted records."""
-    records = _prepare_records(df)
+    """Read community reports from a dataframe."""
     return [
         CommunityReport(
-            id=to_str(row, id_col),
-            short_id=to_optional_str(row, short_id_col)
-            if short_id_col
-            else str(row["Index"]),
-            title=to_str(row, title_col),
-            community_id=to_str(row, community_col),
-            summary=to_str(row, summary_col),
-            full_content=to_str(row, content_col),
-            rank=to_optional_float(row, rank_col),
-            full_content_embedding=to_optional_list(
-                row, content_embedding_col, item_type=float
-            ),
-            attributes=(
-                {col: row.get(col) for col in attributes_cols}
-                if attributes_cols
-                else None
-            ),
+            id=id,
+            short_id=short_id,
+            title=title,
+            community_id=community_id,
+            summary=summary,
+            full_content=full_content,
+            rank=rank,
+            full_content_embedding=full_content_embedding,
+            attributes=attributes,
+        )
+        for (
+            id,
+            short_id,
+            title,
+            community_id,
+            summary,
+            full_content,
+            rank,
+            full_content_embedding,
+            attributes,
+        ) in zip(
+            to_str_column(df, id_col),
+            _short_id_column(df, short_id_col),
+            to_str_column(df, title_col),
+            to_str_column(df, community_col),
+            to_str_column(df, summary_col),
+            to_str_column(df, content_col),
+            to_optional_float_column(df, rank_col),
+            to_optional_list_column(df, content_embedding_col, item_type=float),
+            to_attributes_column(df, attributes_cols),
+            strict=True,
         )
-        for row in records
     ]
 
 
@@ -237,25 +311,39 @@ def read_text_units(
     document_ids_col: str | None = "document_ids",
     attributes_cols: list[str] | None = None,
 ) -> list[TextUnit]:
-    """Read text units from a dataframe using pre-converted records."""
-    records = _prepare_records(df)
+    """Read text units from a dataframe."""
     return [
         TextUnit(
-            id=to_str(row, id_col),
-            short_id=str(row["Index"]),
-            text=to_str(row, text_col),
-            entity_ids=to_optional_list(row, entities_col, item_type=str),
-            relationship_ids=to_optional_list(row, relationships_col, item_type=str),
-            covariate_ids=to_optional_dict(
-                row, covariates_col, key_type=str, value_type=str
-            ),
-            n_tokens=to_optional_int(row, tokens_col),
-            document_ids=to_optional_list(row, document_ids_col, item_type=str),
-            attributes=(
-                {col: row.get(col) for col in attributes_cols}
-                if attributes_cols
-                else None
-            ),
+            id=id,
+            short_id=short_id,
+            text=text,
+            entity_ids=entity_ids,
+            relationship_ids=relationship_ids,
+            covariate_ids=covariate_ids,
+            n_tokens=n_tokens,
+            document_ids=document_ids,
+            attributes=attributes,
+        )
+        for (
+            id,
+            short_id,
+            text,
+            entity_ids,
+            relationship_ids,
+            covariate_ids,
+            n_tokens,
+            document_ids,
+            attributes,
+        ) in zip(
+            to_str_column(df, id_col),
+            index_column(df),
+            to_str_column(df, text_col),
+            to_optional_list_column(df, entities_col, item_type=str),
+            to_optional_list_column(df, relationships_col, item_type=str),
+            to_optional_dict_column(df, covariates_col, key_type=str, value_type=str),
+            to_optional_int_column(df, tokens_col),
+            to_optional_list_column(df, document_ids_col, item_type=str),
+            to_attributes_column(df, attributes_cols),
+            strict=True,
         )
-        for row in records
     ]
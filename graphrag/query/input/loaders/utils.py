@@ -4,9 +4,10 @@
 """Data load utils."""
 
 from collections.abc import Mapping
-from typing import Any
+from typing import Any, cast
 
 import numpy as np
+import pandas as pd
 
 
 def _get_value(
@@ -46,13 +47,15 @@ def to_optional_str(data: Mapping[str, Any], column_name: str | None) -> str | N
     return None if value is None else str(value)
 
 
-def to_list(
-    data: Mapping[str, Any], column_name: str | None, item_type: type | None = None
-) -> list:
-    """Convert and validate a value to a list."""
-    value = _get_value(data, column_name, required=True)
+def _as_list(value: Any, item_type: type | None = None) -> list:
     if isinstance(value, np.ndarray):
+        # numeric arrays convert to python numbers of the matching type, so their items need no check
+        checked = (item_type is float and value.dtype.kind == "f") or (
+            item_type is int and value.dtype.kind in "iu"
+        )
         value = value.tolist()
+        if checked:
+            return value
     if not isinstance(value, list):
         msg = f"value is not a list: {value} ({type(value)})"
         raise TypeError(msg)
@@ -64,33 +67,15 @@ def to_list(
     return value
 
 
-def to_optional_list(
-    data: Mapping[str, Any], column_name: str | None, item_type: type | None = None
-) -> list | None:
-    """Convert and validate a value to an optional list."""
-    if column_name is None or column_name not in data:
-        return None
-    value = data[column_name]
+def _as_optional_list(value: Any, item_type: type | None = None) -> list | None:
     if value is None:
         return None
-    if isinstance(value, np.ndarray):
-        value = value.tolist()
     if isinstance(value, str):
         value = [value]
-    if not isinstance(value, list):
-        msg = f"value is not a list: {value} ({type(value)})"
-        raise TypeError(msg)
-    if item_type is not None:
-        for v in value:
-            if not isinstance(v, item_type):
-                msg = f"list item is not [{item_type}]: {v} ({type(v)})"
-                raise TypeError(msg)
-    return value
+    return _as_list(value, item_type)
 
 
-def to_int(data: Mapping[str, Any], column_name: str | None) -> int:
-    """Convert and validate a value to an int."""
-    value = _get_value(data, column_name, required=True)
+def _as_int(value: Any) -> int:
     if isinstance(value, float):
         value = int(value)
     if not isinstance(value, int):
@@ -99,6 +84,29 @@ def to_int(data: Mapping[str, Any], column_name: str | None) -> int:
     return int(value)
 
 
+def to_list(
+    data: Mapping[str, Any], column_name: str | None, item_type: type | None = None
+) -> list:
+    """Convert and validate a value to a list."""
+    value = _get_value(data, column_name, required=True)
+    return _as_list(value, item_type)
+
+
+def to_optional_list(
+    data: Mapping[str, Any], column_name: str | None, item_type: type | None = None
+) -> list | None:
+    """Convert and validate a value to an optional list."""
+    if column_name is None or column_name not in data:
+        return None
+    return _as_optional_list(data[column_name], item_type)
+
+
+def to_int(data: Mapping[str, Any], column_name: str | None) -> int:
+    """Convert and validate a value to an int."""
+    value = _get_value(data, column_name, required=True)
+    return _as_int(value)
+
+
 def to_optional_int(data: Mapping[str, Any], column_name: str | None) -> int | None:
     """Convert and validate a value to an optional int."""
     if column_name is None or column_name not in data:
@@ -106,12 +114,7 @@ def to_optional_int(data: Mapping[str, Any], column_name: str | None) -> int | N
     value = data[column_name]
     if value is None:
         return None
-    if isinstance(value, float):
-        value = int(value)
-    if not isinstance(value, int):
-        msg = f"value is not an int: {value} ({type(value)})"
-        raise TypeError(msg)
-    return int(value)
+    return _as_int(value)
 
 
 def to_float(data: Mapping[str, Any], column_name: str | None) -> float:
@@ -135,14 +138,9 @@ def to_optional_float(data: Mapping[str, Any], column_name: str | None) -> float
     return float(value)
 
 
-def to_dict(
-    data: Mapping[str, Any],
-    column_name: str | None,
-    key_type: type | None = None,
-    value_type: type | None = None,
+def _as_dict(
+    value: Any, key_type: type | None = None, value_type: type | None = None
 ) -> dict:
-    """Convert and validate a value to a dict."""
-    value = _get_value(data, column_name, required=True)
     if not isinstance(value, dict):
         msg = f"value is not a dict: {value} ({type(value)})"
         raise TypeError(msg)
@@ -159,6 +157,17 @@ def to_dict(
     return value
 
 
+def to_dict(
+    data: Mapping[str, Any],
+    column_name: str | None,
+    key_type: type | None = None,
+    value_type: type | None = None,
+) -> dict:
+    """Convert and validate a value to a dict."""
+    value = _get_value(data, column_name, required=True)
+    return _as_dict(value, key_type, value_type)
+
+
 def to_optional_dict(
     data: Mapping[str, Any],
     column_name: str | None,
@@ -171,17 +180,120 @@ def to_optional_dict(
     value = data[column_name]
     if value is None:
         return None
-    if not isinstance(value, dict):
-        msg = f"value is not a dict: {value} ({type(value)})"
-        raise TypeError(msg)
-    if key_type is not None:
-        for k in value:
-            if not isinstance(k, key_type):
-                msg = f"dict key is not [{key_type}]: {k} ({type(k)})"
-                raise TypeError(msg)
-    if value_type is not None:
-        for v in value.values():
-            if not isinstance(v, value_type):
-                msg = f"dict value is not [{value_type}]: {v} ({type(v)})"
-                raise TypeError(msg)
-    return value
+    return _as_dict(value, key_type, value_type)
+
+
+# Column-wise converters. Each converts a whole DataFrame column at once and
+# behaves like the matching row-wise converter above applied to every row.
+
+
+def _column(
+    df: pd.DataFrame, column_name: str | None, required: bool = True
+) -> list[Any] | None:
+    """Get the values of a column as python objects, None for a missing optional column."""
+    if column_name is None:
+        if required:
+            msg = "Column name is None"
+            raise ValueError(msg)
+        return None
+    if column_name in df.columns:
+        return df[column_name].tolist()
+    if required:
+        msg = f"Column [{column_name}] not found in data"
+        raise ValueError(msg)
+    return None
+
+
+def index_column(df: pd.DataFrame) -> list[str]:
+    """Convert the index of a DataFrame to strings."""
+    return [str(value) for value in df.index.tolist()]
+
+
+def to_str_column(df: pd.DataFrame, column_name: str | None) -> list[str]:
+    """Convert a column to strings."""
+    return [str(value) for value in cast("list", _column(df, column_name))]
+
+
+def to_optional_str_column(
+    df: pd.DataFrame, column_name: str | None
+) -> list[str | None]:
+    """Convert a column to optional strings."""
+    return [
+        None if value is None else str(value)
+        for value in cast("list", _column(df, column_name))
+    ]
+
+
+def to_list_column(
+    df: pd.DataFrame, column_name: str | None, item_type: type | None = None
+) -> list[list]:
+    """Convert and validate a column of lists."""
+    return [
+        _as_list(value, item_type) for value in cast("list", _column(df, column_name))
+    ]
+
+
+def to_optional_list_column(
+    df: pd.DataFrame, column_name: str | None, item_type: type | None = None
+) -> list[list | None]:
+    """Convert and validate a column of optional lists, all None if the column is missing."""
+    values = _column(df, column_name, required=False)
+    if values is None:
+        return [None] * len(df)
+    return [_as_optional_list(value, item_type) for value in values]
+
+
+def to_optional_int_column(
+    df: pd.DataFrame, column_name: str | None
+) -> list[int | None]:
+    """Convert and validate a column of optional ints, all None if the column is missing."""
+    values = _column(df, column_name, required=False)
+    if values is None:
+        return [None] * len(df)
+    if df[column_name].dtype.kind in "iu":
+        return values
+    return [None if value is None else _as_int(value) for value in values]
+
+
+def to_optional_float_column(
+    df: pd.DataFrame, column_name: str | None
+) -> list[float | None]:
+    """Convert a column to optional floats, all None if the column is missing."""
+    values = _column(df, column_name, required=False)
+    if values is None:
+        return [None] * len(df)
+    if df[column_name].dtype.kind == "f":
+        return values
+    return [None if value is None else float(value) for value in values]
+
+
+def to_optional_dict_column(
+    df: pd.DataFrame,
+    column_name: str | None,
+    key_type: type | None = None,
+    value_type: type | None = None,
+) -> list[dict | None]:
+    """Convert and validate a column of optional dicts, all None if the column is missing."""
+    values = _column(df, column_name, required=False)
+    if values is None:
+        return [None] * len(df)
+    return [
+        None if value is None else _as_dict(value, key_type, value_type)
+        for value in values
+    ]
+
+
+def to_attributes_column(
+    df: pd.DataFrame, attributes_cols: list[str] | None
+) -> list[dict[str, Any] | None]:
+    """Collect the given columns into one attribute dict per row, None for each row if no columns are given."""
+    if not attributes_cols:
+        return [None] * len(df)
+    columns = [
+        df[col].tolist() if col in df.columns else [None] * len(df)
+        for col in attributes_cols
+    ]
+    return [
+        dict(zip(attributes_cols, row, strict=True))
+        for row in zip(*columns, strict=True)
+    ]
@@ -0,0 +1,129 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""An in-memory index over the knowledge model for local retrieval."""
+
+from collections import defaultdict
+from collections.abc import Iterable
+from typing import TypeVar
+
+from graphrag.data_model.covariate import Covariate
+from graphrag.data_model.entity import Entity
+from graphrag.data_model.relationship import Relationship
+from graphrag.data_model.text_unit import TextUnit
+
+T = TypeVar("T")
+
+
+def _in_order(positioned: Iterable[tuple[int, T]]) -> list[T]:
+    """Deduplicate (position, item) pairs and return the items in position order."""
+    return [item for _, item in sorted(dict(positioned).items())]
+
+
+class KnowledgeIndex:
+    """Lookup tables over entities, relationships, text units and covariates.
+
+    Relationships are indexed by the title of both of their entities and
+    covariates by their subject, so that retrieving the neighborhood of a set of
+    entities costs time proportional to that neighborhood rather than to the
+    whole graph. Every lookup returns items in the order of the collections the
+    index was built from, so results match a scan over those collections.
+    """
+
+    def __init__(
+        self,
+        entities: Iterable[Entity],
+        relationships: Iterable[Relationship] | None = None,
+        text_units: Iterable[TextUnit] | None = None,
+        covariates: dict[str, list[Covariate]] | None = None,
+    ):
+        self.entities = list(entities)
+        self.relationships = list(relationships or [])
+        self.text_units = {unit.id: unit for unit in text_units or []}
+        self.covariates = covariates or {}
+
+        self._entities_by_title: dict[str, list[tuple[int, Entity]]] = defaultdict(list)
+        for position, entity in enumerate(self.entities):
+            self._entities_by_title[entity.title].append((position, entity))
+
+        self._relationships_by_title: dict[str, list[tuple[int, Relationship]]] = (
+            defaultdict(list)
+        )
+        for position, relationship in enumerate(self.relationships):
+            self._relationships_by_title[relationship.source].append((
+                position,
+                relationship,
+            ))
+            if relationship.target != relationship.source:
+                self._relationships_by_title[relationship.target].append((
+                    position,
+                    relationship,
+                ))
+
+        self._covariates_by_subject: dict[str, dict[str, list[Covariate]]] = {}
+        self._covariate_positions: dict[str, dict[str, list[int]]] = {}
+        for name, collection in self.covariates.items():
+            by_subject: dict[str, list[Covariate]] = defaultdict(list)
+            positions: dict[str, list[int]] = defaultdict(list)
+            for position, covariate in enumerate(collection):
+                by_subject[covariate.subject_id].append(covariate)
+                positions[covariate.subject_id].append(position)
+            self._covariates_by_subject[name] = dict(by_subject)
+            self._covariate_positions[name] = dict(positions)
+
+        self.entities_by_rank = sorted(
+            self.entities, key=lambda entity: entity.rank or 0, reverse=True
+        )
+        """Entities sorted by descending rank, ties in their original order."""
+
+    def get_entities(self, titles: Iterable[str]) -> list[Entity]:
+        """Get the entities with the given titles."""
+        return _in_order(
+            item
+            for title in set(titles)
+            for item in self._entities_by_title.get(title, [])
+        )
+
+    def get_relationships(self, entities: Iterable[Entity]) -> list[Relationship]:
+        """Get the relationships whose source or target is one of the given entities."""
+        return self.get_relationships_by_titles(entity.title for entity in entities)
+
+    def get_relationships_by_titles(self, titles: Iterable[str]) -> list[Relationship]:
+        """Get the relationships whose source or target has one of the given titles."""
+        return _in_order(
+            item
+            for title in set(titles)
+            for item in self._relationships_by_title.get(title, [])
+        )
+
+    def get_related_entities(self, entities: Iterable[Entity]) -> list[Entity]:
+        """Get the entities at either end of the relationships of the given entities."""
+        relationships = self.get_relationships(entities)
+        return self.get_entities(
+            {relationship.source for relationship in relationships}
+            | {relationship.target for relationship in relationships}
+        )
+
+    def get_covariates_by_subject(self, name: str) -> dict[str, list[Covariate]]:
+        """Get the covariates of the given type grouped by subject."""
+        return self._covariates_by_subject.get(name, {})
+
+    def get_covariates(self, name: str, entities: Iterable[Entity]) -> list[Covariate]:
+        """Get the covariates of the given type whose subject is one of the given entities."""
+        by_subject = self._covariates_by_subject.get(name, {})
+        positions = self._covariate_positions.get(name, {})
+        return _in_order(
+            (position, covariate)
+            for title in {entity.title for entity in entities}
+            for position, covariate in zip(
+                positions.get(title, []), by_subject.get(title, []), strict=True
+            )
+        )
+
+    def get_text_units(self, entity: Entity) -> list[TextUnit]:
+        """Get the text units an entity was extracted from."""
+        return [
+            self.text_units[text_unit_id]
+            for text_unit_id in entity.text_unit_ids or []
+            if text_unit_id in self.text_units
+        ]
@@ -0,0 +1,251 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""In-process caches for query embeddings and search results."""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from graphrag.cache.single_flight import SingleFlight
+from graphrag.language_model.protocol.base import EmbeddingModel
+
+if TYPE_CHECKING:
+    from graphrag.config.models.language_model_config import LanguageModelConfig
+
+T = TypeVar("T")
+
+DEFAULT_QUERY_CACHE_SIZE = 4096
+"""Number of entries kept by a query cache, shared by all of its children."""
+
+
+def create_cache_key(*parts: Any) -> str:
+    """Create a cache key from JSON-serializable parts."""
+    data = json.dumps(parts, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class QueryCacheStats:
+    """Hit, miss and coalesce counters of a query cache."""
+
+    hits: int = 0
+    """Lookups answered from the cache."""
+    misses: int = 0
+    """Lookups that had to compute their value."""
+    coalesced: int = 0
+    """Lookups that waited on an identical in-flight computation instead of computing their value."""
+
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    def increment(self, counter: str) -> None:
+        """Increment the given counter."""
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def to_dict(self) -> dict[str, int]:
+        """Return the counters as a dictionary."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "coalesced": self.coalesced,
+            }
+
+
+class _QueryCacheStore:
+    """Thread-safe LRU map shared by a query cache and its children."""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.entries: OrderedDict[str, Any] = OrderedDict()
+        self.in_flight: SingleFlight[Any] = SingleFlight()
+        self.lock = threading.Lock()
+        self.stats = QueryCacheStats()
+
+
+_MISSING = object()
+
+
+class QueryCache:
+    """A bounded, in-process LRU cache for values computed while answering queries.
+
+    Entries are kept in memory only and shared by a cache and all of its
+    children, which namespace their keys. Concurrent `get_or_create` calls with
+    the same key are coalesced, so identical questions asked at the same time
+    compute their value once.
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_QUERY_CACHE_SIZE,
+        namespace: str = "",
+        _store: _QueryCacheStore | None = None,
+    ):
+        self.namespace = namespace
+        self._store = _store or _QueryCacheStore(max_size)
+
+    @property
+    def stats(self) -> QueryCacheStats:
+        """The counters shared by this cache and its children."""
+        return self._store.stats
+
+    def child(self, name: str) -> "QueryCache":
+        """Create a child cache whose keys are namespaced by `name`."""
+        namespace = f"{self.namespace}:{name}" if self.namespace else name
+        return QueryCache(namespace=namespace, _store=self._store)
+
+    def create_key(self, *parts: Any) -> str:
+        """Create a key in the namespace of this cache from JSON-serializable parts."""
+        return create_cache_key(self.namespace, *parts)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a cached value, counting a hit or a miss."""
+        store = self._store
+        with store.lock:
+            value = store.entries.get(key, _MISSING)
+            if value is not _MISSING:
+                store.entries.move_to_end(key)
+        store.stats.increment("misses" if value is _MISSING else "hits")
+        return default if value is _MISSING else value
+
+    def set(self, key: str, value: Any) -> None:
+        """Cache a value, evicting the least recently used entries beyond the cache size."""
+        store = self._store
+        if store.max_size <= 0:
+            return
+        with store.lock:
+            store.entries[key] = value
+            store.entries.move_to_end(key)
+            while len(store.entries) > store.max_size:
+                store.entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries, including those of other namespaces."""
+        with self._store.lock:
+            self._store.entries.clear()
+
+    async def get_or_create(self, key: str, create: Callable[[], Awaitable[T]]) -> T:
+        """Get a cached value, or create and cache it.
+
+        If the same key is already being created, wait for that value instead.
+        Failures are not cached: when the shared creation fails, each waiter
+        creates the value itself.
+        """
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        async def create_and_set() -> T:
+            value = await create()
+            self.set(key, value)
+            return value
+
+        return await self._store.in_flight.run(
+            key,
+            create_and_set,
+            on_coalesced=lambda: self._store.stats.increment("coalesced"),
+        )
+
+
+def _model_key(config: "LanguageModelConfig") -> str:
+    return create_cache_key(
+        config.type,
+        config.model_provider,
+        config.model,
+        config.api_base,
+        config.api_version,
+        config.deployment_name,
+    )
+
+
+class CachedEmbeddingModel:
+    """An embedding model that caches query embeddings by model and text.
+
+    Batches only embed the texts that are not cached, in a single call to the
+    wrapped model.
+    """
+
+    def __init__(self, model: EmbeddingModel, cache: QueryCache):
+        self.model = model
+        self.config = model.config
+        self.cache = cache.child(_model_key(model.config))
+
+    def _lookup(
+        self, text_list: list[str], kwargs: dict[str, Any]
+    ) -> tuple[list[str], list[list[float] | None], list[str]]:
+        """Get the cache keys and cached embeddings of a batch, and the distinct texts that are not cached."""
+        keys = [self.cache.create_key(text, kwargs) for text in text_list]
+        embeddings = [self.cache.get(key) for key in keys]
+        missing = list(
+            dict.fromkeys(
+                text
+                for text, embedding in zip(text_list, embeddings, strict=True)
+                if embedding is None
+            )
+        )
+        return keys, embeddings, missing
+
+    def _fill(
+        self,
+        text_list: list[str],
+        keys: list[str],
+        embeddings: list[list[float] | None],
+        computed: dict[str, list[float]],
+    ) -> list[list[float]]:
+        """Fill in and cache the embeddings that were not cached."""
+        result = []
+        for text, key, embedding in zip(text_list, keys, embeddings, strict=True):
+            if embedding is None:
+                embedding = computed[text]
+                self.cache.set(key, embedding)
+            result.append(embedding)
+        return result
+
+    async def aembed(self, text: str, **kwargs: Any) -> list[float]:
+        """Embed a text, or get its cached embedding."""
+        return await self.cache.get_or_create(
+            self.cache.create_key(text, kwargs),
+            lambda: self.model.aembed(text, **kwargs),
+        )
+
+    async def aembed_batch(
+        self, text_list: list[str], **kwargs: Any
+    ) -> list[list[float]]:
+        """Embed a batch of texts, embedding only those that are not cached."""
+        keys, embeddings, missing = self._lookup(text_list, kwargs)
+        computed = {}
+        if missing:
+            computed = dict(
+                zip(
+                    missing,
+                    await self.model.aembed_batch(missing, **kwargs),
+                    strict=True,
+                )
+            )
+        return self._fill(text_list, keys, embeddings, computed)
+
+    def embed(self, text: str, **kwargs: Any) -> list[float]:
+        """Embed a text, or get its cached embedding."""
+        key = self.cache.create_key(text, kwargs)
+        embedding = self.cache.get(key)
+        if embedding is None:
+            embedding = self.model.embed(text, **kwargs)
+            self.cache.set(key, embedding)
+        return embedding
+
+    def embed_batch(self, text_list: list[str], **kwargs: Any) -> list[list[float]]:
+        """Embed a batch of texts, embedding only those that are not cached."""
+        keys, embeddings, missing = self._lookup(text_list, kwargs)
+        computed = {}
+        if missing:
+            computed = dict(
+                zip(missing, self.model.embed_batch(missing, **kwargs), strict=True)
+            )
+        return self._fill(text_list, keys, embeddings, computed)
@@ -0,0 +1,347 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Several indexes loaded once and served as one by a long-running query service."""
+
+import asyncio
+import logging
+from collections.abc import Callable
+from dataclasses import replace
+from typing import Any, TypeVar
+
+from graphrag.callbacks.query_callbacks import QueryCallbacks
+from graphrag.config.enums import SearchMethod
+from graphrag.config.models.graph_rag_config import GraphRagConfig
+from graphrag.data_model.community import Community
+from graphrag.data_model.community_report import CommunityReport
+from graphrag.data_model.covariate import Covariate
+from graphrag.data_model.entity import Entity
+from graphrag.data_model.relationship import Relationship
+from graphrag.data_model.text_unit import TextUnit
+from graphrag.query.factory import get_global_search_engine
+from graphrag.query.query_cache import QueryCache
+from graphrag.query.server.index_state import IndexState, load_index_state
+from graphrag.query.structured_search.base import BaseSearch
+from graphrag.query.structured_search.global_search.federated_context import (
+    FederatedGlobalContext,
+)
+from graphrag.utils.api import MultiVectorStore
+from graphrag.vector_stores.base import BaseVectorStore
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def _qualify(value: str, index_name: str) -> str:
+    return f"{value}-{index_name}"
+
+
+def _qualify_list(values: list[str] | None, index_name: str) -> list[str] | None:
+    return None if values is None else [_qualify(v, index_name) for v in values]
+
+
+def qualify_entity(entity: Entity, index_name: str) -> Entity:
+    """Suffix the ids, title and references of an entity with its index name."""
+    return replace(
+        entity,
+        id=_qualify(entity.id, index_name),
+        short_id=_qualify(entity.short_id, index_name) if entity.short_id else None,
+        title=_qualify(entity.title, index_name),
+        community_ids=_qualify_list(entity.community_ids, index_name),
+        text_unit_ids=_qualify_list(entity.text_unit_ids, index_name),
+    )
+
+
+def qualify_relationship(relationship: Relationship, index_name: str) -> Relationship:
+    """Suffix the ids and references of a relationship with its index name."""
+    return replace(
+        relationship,
+        id=_qualify(relationship.id, index_name),
+        short_id=_qualify(relationship.short_id, index_name)
+        if relationship.short_id
+        else None,
+        source=_qualify(relationship.source, index_name),
+        target=_qualify(relationship.target, index_name),
+        text_unit_ids=_qualify_list(relationship.text_unit_ids, index_name),
+    )
+
+
+def qualify_community(community: Community, index_name: str) -> Community:
+    """Suffix the ids and references of a community with its index name, roots keep their `-1` parent."""
+    return replace(
+        community,
+        id=_qualify(community.id, index_name),
+        short_id=_qualify(community.short_id, index_name)
+        if community.short_id
+        else None,
+        parent=community.parent
+        if community.parent == "-1"
+        else _qualify(community.parent, index_name),
+        children=_qualify_list(community.children, index_name) or [],
+        entity_ids=_qualify_list(community.entity_ids, index_name),
+        relationship_ids=_qualify_list(community.relationship_ids, index_name),
+        text_unit_ids=_qualify_list(community.text_unit_ids, index_name),
+    )
+
+
+def qualify_report(report: CommunityReport, index_name: str) -> CommunityReport:
+    """Suffix the ids of a community report with its index name."""
+    return replace(
+        report,
+        id=_qualify(report.id, index_name),
+        short_id=_qualify(report.short_id, index_name) if report.short_id else None,
+        community_id=_qualify(report.community_id, index_name),
+    )
+
+
+def qualify_text_unit(text_unit: TextUnit, index_name: str) -> TextUnit:
+    """Suffix the ids and references of a text unit with its index name."""
+    return replace(
+        text_unit,
+        id=_qualify(text_unit.id, index_name),
+        short_id=_qualify(text_unit.short_id, index_name)
+        if text_unit.short_id
+        else None,
+        entity_ids=_qualify_list(text_unit.entity_ids, index_name),
+        relationship_ids=_qualify_list(text_unit.relationship_ids, index_name),
+        covariate_ids={
+            key: _qualify_list(ids, index_name) or []
+            for key, ids in text_unit.covariate_ids.items()
+        }
+        if text_unit.covariate_ids is not None
+        else None,
+    )
+
+
+def qualify_covariate(covariate: Covariate, index_name: str) -> Covariate:
+    """Suffix the ids and references of a covariate with its index name."""
+    return replace(
+        covariate,
+        id=_qualify(covariate.id, index_name),
+        short_id=_qualify(covariate.short_id, index_name)
+        if covariate.short_id
+        else None,
+        subject_id=_qualify(covariate.subject_id, index_name),
+        text_unit_ids=_qualify_list(covariate.text_unit_ids, index_name),
+    )
+
+
+class FederatedIndexState(IndexState):
+    """Several indexes served as one, each keeping its own query-ready objects.
+
+    Global search builds the community report batches of every index
+    concurrently, each with the context builder of its index. The other search
+    methods run over the knowledge models of all indexes, whose ids, titles and
+    references are suffixed with their index name as `<id>-<index_name>`.
+    These are built once per state from the objects of each index, and their
+    embeddings are searched in the stores of every index concurrently, merging
+    results by score.
+    """
+
+    def __init__(
+        self,
+        config: GraphRagConfig,
+        states: dict[str, IndexState],
+        cache: QueryCache | None = None,
+    ):
+        super().__init__(
+            config,
+            tables={},
+            fingerprint=tuple(
+                (f"{index_name}/{table}", creation_date)
+                for index_name, state in states.items()
+                for table, creation_date in state.fingerprint
+            ),
+            cache=cache,
+        )
+        self.states = states
+        self._qualified: dict[tuple, list[Any]] = {}
+
+    def _qualified_objects(
+        self,
+        key: tuple,
+        get_objects: Callable[[IndexState], list[T]],
+        qualify: Callable[[T, str], T],
+    ) -> list[T]:
+        """Get the qualified objects of every index, computed on first use."""
+        if key not in self._qualified:
+            self._qualified[key] = [
+                qualify(item, index_name)
+                for index_name, state in self.states.items()
+                for item in get_objects(state)
+            ]
+        return self._qualified[key]
+
+    def require_tables(self, method: SearchMethod) -> None:
+        """Check that every index has the tables of a search method."""
+        for state in self.states.values():
+            state.require_tables(method)
+
+    def get_entities(self, community_level: int | None) -> list[Entity]:
+        """Get the entities of every index."""
+        return self._qualified_objects(
+            ("entities", community_level),
+            lambda state: state.get_entities(community_level),
+            qualify_entity,
+        )
+
+    def get_reports(
+        self,
+        method: SearchMethod,
+        community_level: int | None,
+        dynamic_community_selection: bool = False,
+    ) -> list[CommunityReport]:
+        """Get the community reports of every index."""
+        return self._qualified_objects(
+            ("reports", method, community_level, dynamic_community_selection),
+            lambda state: state.get_reports(
+                method, community_level, dynamic_community_selection
+            ),
+            qualify_report,
+        )
+
+    def get_communities(self) -> list[Community]:
+        """Get the communities of every index."""
+        return self._qualified_objects(
+            ("communities",), IndexState.get_communities, qualify_community
+        )
+
+    def get_text_units(self) -> list[TextUnit]:
+        """Get the text units of every index."""
+        return self._qualified_objects(
+            ("text_units",), IndexState.get_text_units, qualify_text_unit
+        )
+
+    def get_relationships(self) -> list[Relationship]:
+        """Get the relationships of every index."""
+        return self._qualified_objects(
+            ("relationships",), IndexState.get_relationships, qualify_relationship
+        )
+
+    def get_covariates(self) -> dict[str, list[Covariate]]:
+        """Get the covariates of every index by type."""
+        if self._covariates is None:
+            self._covariates = {
+                covariate_type: self._qualified_objects(
+                    ("covariates", covariate_type),
+                    lambda state, covariate_type=covariate_type: (
+                        state.get_covariates().get(covariate_type, [])
+                    ),
+                    qualify_covariate,
+                )
+                for covariate_type in {
+                    covariate_type
+                    for state in self.states.values()
+                    for covariate_type in state.get_covariates()
+                }
+            }
+        return self._covariates
+
+    def get_embedding_store(self, embedding_name: str) -> BaseVectorStore:
+        """Get a vector store searching the embeddings of every index."""
+        if embedding_name not in self._embedding_stores:
+            self._embedding_stores[embedding_name] = MultiVectorStore(
+                [
+                    state.get_embedding_store(embedding_name)
+                    for state in self.states.values()
+                ],
+                list(self.states),
+            )
+        return self._embedding_stores[embedding_name]
+
+    def get_search_engine(
+        self,
+        method: SearchMethod,
+        community_level: int | None = 2,
+        dynamic_community_selection: bool = False,
+        response_type: str = "Multiple Paragraphs",
+        callbacks: list[QueryCallbacks] | None = None,
+    ) -> BaseSearch:
+        """Create a search engine over every index, building the global search context per index."""
+        if method != SearchMethod.GLOBAL:
+            return super().get_search_engine(
+                method,
+                community_level=community_level,
+                dynamic_community_selection=dynamic_community_selection,
+                response_type=response_type,
+                callbacks=callbacks,
+            )
+
+        self.require_tables(method)
+        key = (method, community_level, dynamic_community_selection, response_type)
+        context_builder = self._context_builders.get(key)
+        if context_builder is None:
+            context_builder = FederatedGlobalContext({
+                index_name: get_global_search_engine(
+                    self.config,
+                    reports=[
+                        qualify_report(report, index_name)
+                        for report in state.get_reports(
+                            method, community_level, dynamic_community_selection
+                        )
+                    ],
+                    entities=[
+                        qualify_entity(entity, index_name)
+                        for entity in state.get_entities(community_level)
+                    ],
+                    communities=[
+                        qualify_community(community, index_name)
+                        for community in state.get_communities()
+                    ],
+                    response_type=response_type,
+                    dynamic_community_selection=dynamic_community_selection,
+                    embedding_cache=self.embedding_cache,
+                    result_cache=state.result_cache,
+                ).context_builder
+                for index_name, state in self.states.items()
+            })
+            self._context_builders[key] = context_builder
+        return get_global_search_engine(
+            self.config,
+            reports=[],
+            entities=[],
+            communities=[],
+            response_type=response_type,
+            dynamic_community_selection=dynamic_community_selection,
+            map_system_prompt=self.get_prompt(self.config.global_search.map_prompt),
+            reduce_system_prompt=self.get_prompt(
+                self.config.global_search.reduce_prompt
+            ),
+            general_knowledge_inclusion_prompt=self.get_prompt(
+                self.config.global_search.knowledge_prompt
+            ),
+            callbacks=callbacks,
+            context_builder=context_builder,  # type: ignore
+            embedding_cache=self.embedding_cache,
+            result_cache=self.result_cache,
+        )
+
+
+async def load_federated_index_state(
+    config: GraphRagConfig, cache: QueryCache | None = None
+) -> FederatedIndexState:
+    """Load the tables of every index configured in `config.outputs`, concurrently.
+
+    Each index is searched with the vector store configured under its name in `config.vector_store`.
+    """
+    outputs = config.outputs or {}
+    index_configs = {}
+    for index_name, output in outputs.items():
+        if index_name not in config.vector_store:
+            msg = f"No vector store is configured for index {index_name}, add one with the same name to `vector_store`."
+            raise ValueError(msg)
+        index_configs[index_name] = config.model_copy(
+            update={
+                "output": output,
+                "outputs": None,
+                "vector_store": {index_name: config.vector_store[index_name]},
+            }
+        )
+    states = await asyncio.gather(*[
+        load_index_state(index_config, cache) for index_config in index_configs.values()
+    ])
+    logger.info("Loaded indexes: %s", ", ".join(index_configs))
+    return FederatedIndexState(
+        config, dict(zip(index_configs, states, strict=True)), cache=cache
+    )
@@ -0,0 +1,249 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A minimal HTTP API for the query service, over TCP or a Unix socket.
+
+Routes
+------
+- GET /health: the loaded index tables, when they were written, and the
+  query cache counters.
+- POST /reload: reload the index now.
+- POST /search/{global,local,drift,basic}: run a query. The JSON body holds
+  `query` and optionally `community_level`, `dynamic_community_selection`,
+  `response_type` and `streaming`. Responses are `{"response", "context_data"}`,
+  or, when streaming, newline-delimited JSON objects with a `chunk` each and
+  the `context_data` last.
+"""
+
+import asyncio
+import json
+import logging
+from collections.abc import Callable, Coroutine
+from typing import Any
+
+import pandas as pd
+
+from graphrag.callbacks.noop_query_callbacks import NoopQueryCallbacks
+from graphrag.config.enums import SearchMethod
+from graphrag.query.server.query_service import QueryService
+
+logger = logging.getLogger(__name__)
+
+MAX_BODY_SIZE = 1024 * 1024
+"""Largest request body accepted, in bytes."""
+
+_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    500: "Internal Server Error",
+}
+
+
+class _HTTPError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+def _to_json(value: Any) -> Any:
+    """Convert search context data (DataFrames, possibly nested) to JSON-compatible values."""
+    if isinstance(value, pd.DataFrame):
+        return json.loads(value.to_json(orient="records") or "[]")
+    if isinstance(value, dict):
+        return {str(key): _to_json(item) for key, item in value.items()}
+    if isinstance(value, list | tuple):
+        return [_to_json(item) for item in value]
+    return value
+
+
+async def _read_request(
+    reader: asyncio.StreamReader,
+) -> tuple[str, str, dict[str, Any]]:
+    request_line = (await reader.readline()).decode("latin-1").strip()
+    parts = request_line.split()
+    if len(parts) != 3:
+        raise _HTTPError(400, "Malformed request line.")
+    verb, path, _ = parts
+    headers: dict[str, str] = {}
+    while line := (await reader.readline()).decode("latin-1").strip():
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip()
+    try:
+        length = int(headers.get("content-length", "0"))
+    except ValueError as e:
+        raise _HTTPError(400, "Invalid Content-Length header.") from e
+    if length > MAX_BODY_SIZE:
+        raise _HTTPError(413, "Request body too large.")
+    body: dict[str, Any] = {}
+    if length > 0:
+        try:
+            body = json.loads(await reader.readexactly(length))
+        except json.JSONDecodeError as e:
+            raise _HTTPError(400, "Request body must be JSON.") from e
+        if not isinstance(body, dict):
+            raise _HTTPError(400, "Request body must be a JSON object.")
+    return verb, path.split("?", 1)[0], body
+
+
+def _write_head(writer: asyncio.StreamWriter, status: int, content_type: str) -> None:
+    writer.write(
+        f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+        f"Content-Type: {content_type}\r\n"
+        "Connection: close\r\n\r\n".encode()
+    )
+
+
+async def _write_json(writer: asyncio.StreamWriter, status: int, data: Any) -> None:
+    _write_head(writer, status, "application/json")
+    writer.write(json.dumps(data).encode())
+    await writer.drain()
+
+
+def _search_options(body: dict[str, Any]) -> dict[str, Any]:
+    query = body.get("query")
+    if not isinstance(query, str) or query.strip() == "":
+        raise _HTTPError(400, "A non-empty `query` string is required.")
+    return {
+        "query": query,
+        "community_level": body.get("community_level", 2),
+        "dynamic_community_selection": bool(body.get("dynamic_community_selection")),
+        "response_type": body.get("response_type", "Multiple Paragraphs"),
+    }
+
+
+async def _search(
+    service: QueryService,
+    method: SearchMethod,
+    body: dict[str, Any],
+    writer: asyncio.StreamWriter,
+) -> None:
+    options = _search_options(body)
+    if not body.get("streaming"):
+        response, context_data = await service.search(method, **options)
+        await _write_json(
+            writer,
+            200,
+            {"response": response, "context_data": _to_json(context_data)},
+        )
+        return
+
+    context_data: Any = {}
+
+    def on_context(context: Any) -> None:
+        nonlocal context_data
+        context_data = context
+
+    callbacks = NoopQueryCallbacks()
+    callbacks.on_context = on_context
+    # engine creation errors surface before the response head is written
+    stream = service.stream_search(method, callbacks=[callbacks], **options)
+    _write_head(writer, 200, "application/x-ndjson")
+    try:
+        async for chunk in stream:
+            writer.write(json.dumps({"chunk": chunk}).encode() + b"\n")
+            await writer.drain()
+        last = {"context_data": _to_json(context_data)}
+    except ConnectionError:
+        raise
+    except Exception as e:
+        # the status line is already sent, so errors are reported in the stream
+        logger.exception("Error streaming query response")
+        last = {"error": str(e)}
+    writer.write(json.dumps(last).encode() + b"\n")
+    await writer.drain()
+
+
+async def _route(
+    service: QueryService,
+    verb: str,
+    path: str,
+    body: dict[str, Any],
+    writer: asyncio.StreamWriter,
+) -> None:
+    if path == "/health":
+        if verb != "GET":
+            raise _HTTPError(405, "Use GET.")
+        await _write_json(
+            writer,
+            200,
+            {
+                "status": "ok",
+                "tables": dict(service.state.fingerprint),
+                "cache": service.cache.stats.to_dict(),
+            },
+        )
+    elif path == "/reload":
+        if verb != "POST":
+            raise _HTTPError(405, "Use POST.")
+        await service.reload(force=True)
+        await _write_json(
+            writer, 200, {"status": "ok", "tables": dict(service.state.fingerprint)}
+        )
+    elif path.startswith("/search/"):
+        if verb != "POST":
+            raise _HTTPError(405, "Use POST.")
+        try:
+            method = SearchMethod(path.removeprefix("/search/"))
+        except ValueError as e:
+            raise _HTTPError(404, f"Unknown search method in {path}.") from e
+        await _search(service, method, body, writer)
+    else:
+        raise _HTTPError(404, f"No route for {path}.")
+
+
+def create_request_handler(
+    service: QueryService,
+) -> Callable[[asyncio.StreamReader, asyncio.StreamWriter], Coroutine[Any, Any, None]]:
+    """Create an asyncio stream handler that serves one HTTP request per connection."""
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            verb, path, body = await _read_request(reader)
+            await _route(service, verb, path, body, writer)
+        except _HTTPError as e:
+            await _write_json(writer, e.status, {"error": e.message})
+        except ValueError as e:
+            await _write_json(writer, 400, {"error": str(e)})
+        except (asyncio.IncompleteReadError, ConnectionError):
+            logger.debug("Client disconnected")
+        except Exception as e:
+            logger.exception("Error serving query request")
+            await _write_json(writer, 500, {"error": str(e)})
+        finally:
+            writer.close()
+
+    return handle
+
+
+async def start_server(
+    service: QueryService,
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    socket_path: str | None = None,
+) -> asyncio.Server:
+    """Start serving the query service on a TCP port, or on a Unix socket if `socket_path` is given."""
+    handler = create_request_handler(service)
+    if socket_path:
+        server = await asyncio.start_unix_server(handler, path=socket_path)
+        logger.info("Serving queries on unix socket %s", socket_path)
+    else:
+        server = await asyncio.start_server(handler, host=host, port=port)
+        logger.info("Serving queries on http://%s:%s", host, port)
+    return server
+
+
+async def serve(
+    service: QueryService,
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    socket_path: str | None = None,
+) -> None:
+    """Load the index and serve queries until cancelled."""
+    async with service.running():
+        server = await start_server(service, host, port, socket_path)
+        async with server:
+            await server.serve_forever()
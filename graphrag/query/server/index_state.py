@@ -0,0 +1,355 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Index outputs loaded once and shared by the queries of a long-running query service."""
+
+import logging
+from typing import Any
+
+import pandas as pd
+
+from graphrag.callbacks.query_callbacks import QueryCallbacks
+from graphrag.config.embeddings import (
+    community_full_content_embedding,
+    entity_description_embedding,
+    text_unit_text_embedding,
+)
+from graphrag.config.enums import SearchMethod
+from graphrag.config.models.graph_rag_config import GraphRagConfig
+from graphrag.data_model.community import Community
+from graphrag.data_model.community_report import CommunityReport
+from graphrag.data_model.covariate import Covariate
+from graphrag.data_model.entity import Entity
+from graphrag.data_model.relationship import Relationship
+from graphrag.data_model.text_unit import TextUnit
+from graphrag.query.factory import (
+    get_basic_search_engine,
+    get_drift_search_engine,
+    get_global_search_engine,
+    get_local_search_engine,
+)
+from graphrag.query.indexer_adapters import (
+    QUERY_TABLE_COLUMNS,
+    read_indexer_communities,
+    read_indexer_covariates,
+    read_indexer_entities,
+    read_indexer_relationships,
+    read_indexer_report_embeddings,
+    read_indexer_reports,
+    read_indexer_text_units,
+)
+from graphrag.query.query_cache import QueryCache, create_cache_key
+from graphrag.query.structured_search.base import BaseSearch
+from graphrag.storage.pipeline_storage import PipelineStorage
+from graphrag.utils.api import (
+    create_storage_from_config,
+    get_embedding_store,
+    load_search_prompt,
+)
+from graphrag.utils.storage import load_table_from_storage, storage_has_table
+from graphrag.vector_stores.base import BaseVectorStore
+
+logger = logging.getLogger(__name__)
+
+INDEX_TABLES = [
+    "entities",
+    "communities",
+    "community_reports",
+    "text_units",
+    "relationships",
+    "covariates",
+]
+"""The index output tables used by the search methods, loaded when present."""
+
+SEARCH_METHOD_TABLES = {
+    SearchMethod.GLOBAL: ["entities", "communities", "community_reports"],
+    SearchMethod.LOCAL: [
+        "entities",
+        "communities",
+        "community_reports",
+        "text_units",
+        "relationships",
+    ],
+    SearchMethod.DRIFT: [
+        "entities",
+        "communities",
+        "community_reports",
+        "text_units",
+        "relationships",
+    ],
+    SearchMethod.BASIC: ["text_units"],
+}
+"""The tables each search method requires."""
+
+IndexFingerprint = tuple[tuple[str, str], ...]
+
+
+async def get_index_fingerprint(storage: PipelineStorage) -> IndexFingerprint:
+    """Get the name and creation date of each index table in storage, which changes whenever the index is rewritten."""
+    fingerprint = [
+        (name, await storage.get_creation_date(f"{name}.parquet"))
+        for name in INDEX_TABLES
+        if await storage_has_table(name, storage)
+    ]
+    return tuple(fingerprint)
+
+
+class IndexState:
+    """The tables of one index and the query-ready objects derived from them.
+
+    Knowledge model objects, vector store connections, prompts and context
+    builders are created on first use and then shared by every query, so a
+    query only pays for retrieval and generation. The tables of an IndexState
+    never change: reloading the index creates a new one, and queries already
+    running keep the state they started with.
+
+    With a `cache`, query embeddings are cached in it by model and text, and
+    search results under the index fingerprint.
+    """
+
+    def __init__(
+        self,
+        config: GraphRagConfig,
+        tables: dict[str, pd.DataFrame],
+        fingerprint: IndexFingerprint = (),
+        cache: QueryCache | None = None,
+    ):
+        self.config = config
+        self.tables = tables
+        self.fingerprint = fingerprint
+        self.embedding_cache = cache.child("embeddings") if cache else None
+        self.result_cache = (
+            cache.child(f"index:{create_cache_key(fingerprint)}") if cache else None
+        )
+        self._entities: dict[int | None, list[Entity]] = {}
+        self._reports: dict[
+            tuple[SearchMethod, int | None, bool], list[CommunityReport]
+        ] = {}
+        self._communities: list[Community] | None = None
+        self._text_units: list[TextUnit] | None = None
+        self._relationships: list[Relationship] | None = None
+        self._covariates: dict[str, list[Covariate]] | None = None
+        self._embedding_stores: dict[str, BaseVectorStore] = {}
+        self._prompts: dict[str, str | None] = {}
+        self._context_builders: dict[tuple, Any] = {}
+
+    def _table(self, name: str) -> pd.DataFrame:
+        if name not in self.tables:
+            msg = f"Could not find {name}.parquet in the index output."
+            raise ValueError(msg)
+        return self.tables[name]
+
+    def require_tables(self, method: SearchMethod) -> None:
+        """Check that the index has the tables of a search method."""
+        for name in SEARCH_METHOD_TABLES[method]:
+            self._table(name)
+
+    def get_entities(self, community_level: int | None) -> list[Entity]:
+        """Get the entities, with their communities up to the given level."""
+        if community_level not in self._entities:
+            self._entities[community_level] = read_indexer_entities(
+                self._table("entities"),
+                self._table("communities"),
+                community_level=community_level,
+            )
+        return self._entities[community_level]
+
+    def get_reports(
+        self,
+        method: SearchMethod,
+        community_level: int | None,
+        dynamic_community_selection: bool = False,
+    ) -> list[CommunityReport]:
+        """Get the community reports at the given level.
+
+        Search methods annotate reports with weights and embeddings, so each method gets its own copy.
+        """
+        key = (method, community_level, dynamic_community_selection)
+        if key not in self._reports:
+            self._reports[key] = read_indexer_reports(
+                self._table("community_reports"),
+                self._table("communities"),
+                community_level=community_level,
+                dynamic_community_selection=dynamic_community_selection,
+            )
+        return self._reports[key]
+
+    def get_communities(self) -> list[Community]:
+        """Get the communities."""
+        if self._communities is None:
+            self._communities = read_indexer_communities(
+                self._table("communities"), self._table("community_reports")
+            )
+        return self._communities
+
+    def get_text_units(self) -> list[TextUnit]:
+        """Get the text units."""
+        if self._text_units is None:
+            self._text_units = read_indexer_text_units(self._table("text_units"))
+        return self._text_units
+
+    def get_relationships(self) -> list[Relationship]:
+        """Get the relationships."""
+        if self._relationships is None:
+            self._relationships = read_indexer_relationships(
+                self._table("relationships")
+            )
+        return self._relationships
+
+    def get_covariates(self) -> dict[str, list[Covariate]]:
+        """Get the covariates by type, empty if the index has none."""
+        if self._covariates is None:
+            covariates = self.tables.get("covariates")
+            self._covariates = {
+                "claims": read_indexer_covariates(covariates)
+                if covariates is not None
+                else []
+            }
+        return self._covariates
+
+    def get_embedding_store(self, embedding_name: str) -> BaseVectorStore:
+        """Get a connected vector store for the given embedding."""
+        if embedding_name not in self._embedding_stores:
+            self._embedding_stores[embedding_name] = get_embedding_store(
+                config_args={
+                    index: store.model_dump()
+                    for index, store in self.config.vector_store.items()
+                },
+                embedding_name=embedding_name,
+            )
+        return self._embedding_stores[embedding_name]
+
+    def get_prompt(self, prompt_config: str | None) -> str | None:
+        """Get a search prompt from disk, if configured."""
+        key = prompt_config or ""
+        if key not in self._prompts:
+            self._prompts[key] = load_search_prompt(self.config.root_dir, prompt_config)
+        return self._prompts[key]
+
+    def get_search_engine(
+        self,
+        method: SearchMethod,
+        community_level: int | None = 2,
+        dynamic_community_selection: bool = False,
+        response_type: str = "Multiple Paragraphs",
+        callbacks: list[QueryCallbacks] | None = None,
+    ) -> BaseSearch:
+        """
+        Create a search engine that reuses the context builder of earlier engines with the same settings.
+
+        Search engines keep per-query state such as callbacks, so a new one is
+        created for every query. Their context builders hold the expensive,
+        query-independent state and are shared.
+        """
+        self.require_tables(method)
+        key = (method, community_level, dynamic_community_selection, response_type)
+        context_builder = self._context_builders.get(key)
+        match method:
+            case SearchMethod.GLOBAL:
+                engine = get_global_search_engine(
+                    self.config,
+                    reports=self.get_reports(
+                        method, community_level, dynamic_community_selection
+                    ),
+                    entities=self.get_entities(community_level),
+                    communities=self.get_communities(),
+                    response_type=response_type,
+                    dynamic_community_selection=dynamic_community_selection,
+                    map_system_prompt=self.get_prompt(
+                        self.config.global_search.map_prompt
+                    ),
+                    reduce_system_prompt=self.get_prompt(
+                        self.config.global_search.reduce_prompt
+                    ),
+                    general_knowledge_inclusion_prompt=self.get_prompt(
+                        self.config.global_search.knowledge_prompt
+                    ),
+                    callbacks=callbacks,
+                    context_builder=context_builder,
+                    embedding_cache=self.embedding_cache,
+                    result_cache=self.result_cache,
+                )
+            case SearchMethod.LOCAL:
+                engine = get_local_search_engine(
+                    config=self.config,
+                    reports=self.get_reports(method, community_level),
+                    text_units=self.get_text_units(),
+                    entities=self.get_entities(community_level),
+                    relationships=self.get_relationships(),
+                    covariates=self.get_covariates(),
+                    description_embedding_store=self.get_embedding_store(
+                        entity_description_embedding
+                    ),
+                    response_type=response_type,
+                    system_prompt=self.get_prompt(self.config.local_search.prompt),
+                    callbacks=callbacks,
+                    context_builder=context_builder,
+                    embedding_cache=self.embedding_cache,
+                    result_cache=self.result_cache,
+                )
+            case SearchMethod.DRIFT:
+                reports = self.get_reports(method, community_level)
+                if context_builder is None:
+                    read_indexer_report_embeddings(
+                        reports,
+                        self.get_embedding_store(community_full_content_embedding),
+                    )
+                engine = get_drift_search_engine(
+                    config=self.config,
+                    reports=reports,
+                    text_units=self.get_text_units(),
+                    entities=self.get_entities(community_level),
+                    relationships=self.get_relationships(),
+                    description_embedding_store=self.get_embedding_store(
+                        entity_description_embedding
+                    ),
+                    local_system_prompt=self.get_prompt(
+                        self.config.drift_search.prompt
+                    ),
+                    reduce_system_prompt=self.get_prompt(
+                        self.config.drift_search.reduce_prompt
+                    ),
+                    response_type=response_type,
+                    callbacks=callbacks,
+                    context_builder=context_builder,
+                    embedding_cache=self.embedding_cache,
+                    result_cache=self.result_cache,
+                    community_level=community_level,
+                    dynamic_community_selection=dynamic_community_selection,
+                )
+            case SearchMethod.BASIC:
+                engine = get_basic_search_engine(
+                    config=self.config,
+                    text_units=self.get_text_units(),
+                    text_unit_embeddings=self.get_embedding_store(
+                        text_unit_text_embedding
+                    ),
+                    system_prompt=self.get_prompt(self.config.basic_search.prompt),
+                    callbacks=callbacks,
+                    context_builder=context_builder,
+                    embedding_cache=self.embedding_cache,
+                )
+            case _:
+                msg = f"Unsupported search method {method}"
+                raise ValueError(msg)
+        self._context_builders[key] = engine.context_builder
+        return engine
+
+
+async def load_index_state(
+    config: GraphRagConfig, cache: QueryCache | None = None
+) -> IndexState:
+    """Load the tables of the index configured in `config.output`."""
+    if config.outputs:
+        msg = "Multiple outputs are configured, load them with `load_federated_index_state` instead."
+        raise ValueError(msg)
+    storage = create_storage_from_config(config.output)
+    fingerprint = await get_index_fingerprint(storage)
+    tables = {
+        name: await load_table_from_storage(
+            name=name, storage=storage, columns=QUERY_TABLE_COLUMNS[name]
+        )
+        for name, _ in fingerprint
+    }
+    logger.info("Loaded index tables: %s", ", ".join(tables))
+    return IndexState(config, tables, fingerprint, cache=cache)
@@ -0,0 +1,190 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A query service that answers concurrent queries against warm, hot-reloaded indexes."""
+
+import asyncio
+import contextlib
+import logging
+from collections.abc import AsyncGenerator
+from typing import Any
+
+from graphrag.callbacks.noop_query_callbacks import NoopQueryCallbacks
+from graphrag.callbacks.query_callbacks import QueryCallbacks
+from graphrag.config.enums import SearchMethod
+from graphrag.config.models.graph_rag_config import GraphRagConfig
+from graphrag.query.query_cache import DEFAULT_QUERY_CACHE_SIZE, QueryCache
+from graphrag.query.server.federated_state import load_federated_index_state
+from graphrag.query.server.index_state import (
+    IndexFingerprint,
+    IndexState,
+    get_index_fingerprint,
+    load_index_state,
+)
+from graphrag.utils.api import create_storage_from_config
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RELOAD_INTERVAL = 5.0
+"""Seconds between checks of the index output for changes."""
+
+
+class QueryService:
+    """Serve global, local, DRIFT and basic search from an index kept in memory.
+
+    The index is loaded once by `start`. Every query then runs against the
+    current `IndexState`, sharing its knowledge model, vector store connections
+    and context builders with concurrent queries. `watch` polls the output
+    storage and swaps in a freshly loaded state once the index has been
+    rewritten, without interrupting queries that are already running.
+
+    Query embeddings are cached across reloads. Entity searches and global
+    search map responses are cached per index state, so a reload never serves
+    results of the previous index.
+
+    With `outputs` configured, every index is loaded and searched as one by a
+    `FederatedIndexState`, and rewriting any of them reloads them all.
+    """
+
+    def __init__(
+        self,
+        config: GraphRagConfig,
+        reload_interval: float = DEFAULT_RELOAD_INTERVAL,
+        cache_size: int = DEFAULT_QUERY_CACHE_SIZE,
+    ):
+        self.config = config
+        self.reload_interval = reload_interval
+        self.cache = QueryCache(max_size=cache_size)
+        self._storages = {
+            index_name: create_storage_from_config(output)
+            for index_name, output in (config.outputs or {"": config.output}).items()
+        }
+        self._state: IndexState | None = None
+        self._changed_fingerprint: IndexFingerprint | None = None
+        self._reload_lock = asyncio.Lock()
+
+    @property
+    def state(self) -> IndexState:
+        """The index state new queries run against."""
+        if self._state is None:
+            msg = "The query service has not been started."
+            raise ValueError(msg)
+        return self._state
+
+    async def start(self) -> None:
+        """Load the index."""
+        await self.reload(force=True)
+
+    async def reload(self, force: bool = False) -> bool:
+        """
+        Reload the index if it changed since it was loaded, returning whether it was reloaded.
+
+        Unless `force` is set, a change must be seen by two consecutive checks
+        before the index is reloaded, so an index that is still being written
+        is not loaded halfway.
+        """
+        async with self._reload_lock:
+            if not force:
+                fingerprint = await self._get_fingerprint()
+                if fingerprint == self.state.fingerprint:
+                    self._changed_fingerprint = None
+                    return False
+                if fingerprint != self._changed_fingerprint:
+                    self._changed_fingerprint = fingerprint
+                    return False
+            if self.config.outputs:
+                self._state = await load_federated_index_state(self.config, self.cache)
+            else:
+                self._state = await load_index_state(self.config, self.cache)
+            self._changed_fingerprint = None
+            logger.info("Loaded index from %s", ", ".join(self._output_dirs()))
+            return True
+
+    async def _get_fingerprint(self) -> IndexFingerprint:
+        """Get the fingerprint of the served indexes, qualifying tables by index name when there are several."""
+        if not self.config.outputs:
+            return await get_index_fingerprint(self._storages[""])
+        fingerprint = []
+        for index_name, storage in self._storages.items():
+            fingerprint.extend(
+                (f"{index_name}/{table}", creation_date)
+                for table, creation_date in await get_index_fingerprint(storage)
+            )
+        return tuple(fingerprint)
+
+    def _output_dirs(self) -> list[str]:
+        outputs = self.config.outputs or {"": self.config.output}
+        return [str(output.base_dir) for output in outputs.values()]
+
+    async def watch(self) -> None:
+        """Check the index for changes every `reload_interval` seconds, until cancelled."""
+        while True:
+            await asyncio.sleep(self.reload_interval)
+            try:
+                await self.reload()
+            except Exception:
+                logger.exception("Error reloading the index, keeping the loaded one")
+
+    def stream_search(
+        self,
+        method: SearchMethod,
+        query: str,
+        community_level: int | None = 2,
+        dynamic_community_selection: bool = False,
+        response_type: str = "Multiple Paragraphs",
+        callbacks: list[QueryCallbacks] | None = None,
+    ) -> AsyncGenerator[str, None]:
+        """Run a search against the current index, streaming the response."""
+        engine = self.state.get_search_engine(
+            method,
+            community_level=community_level,
+            dynamic_community_selection=dynamic_community_selection,
+            response_type=response_type,
+            callbacks=callbacks,
+        )
+        logger.debug("Executing %s search query: %s", method, query)
+        return engine.stream_search(query=query)  # type: ignore
+
+    async def search(
+        self,
+        method: SearchMethod,
+        query: str,
+        community_level: int | None = 2,
+        dynamic_community_selection: bool = False,
+        response_type: str = "Multiple Paragraphs",
+        callbacks: list[QueryCallbacks] | None = None,
+    ) -> tuple[str, Any]:
+        """Run a search against the current index, returning the response and its context data."""
+        context_data: Any = {}
+
+        def on_context(context: Any) -> None:
+            nonlocal context_data
+            context_data = context
+
+        local_callbacks = NoopQueryCallbacks()
+        local_callbacks.on_context = on_context
+
+        full_response = ""
+        stream = self.stream_search(
+            method,
+            query,
+            community_level=community_level,
+            dynamic_community_selection=dynamic_community_selection,
+            response_type=response_type,
+            callbacks=[*(callbacks or []), local_callbacks],
+        )
+        async for chunk in stream:
+            full_response += chunk
+        return full_response, context_data
+
+    @contextlib.asynccontextmanager
+    async def running(self) -> AsyncGenerator["QueryService", None]:
+        """Start the service and watch the index for changes for the duration of the context."""
+        await self.start()
+        watcher = asyncio.create_task(self.watch())
+        try:
+            yield self
+        finally:
+            watcher.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await watcher
@@ -15,6 +15,7 @@ from graphrag.query.context_builder.builders import (
     ContextBuilderResult,
 )
 from graphrag.query.context_builder.conversation_history import ConversationHistory
+from graphrag.tokenizer.cached_tokenizer import get_cached_tokenizer
 from graphrag.tokenizer.get_tokenizer import get_tokenizer
 from graphrag.tokenizer.tokenizer import Tokenizer
 from graphrag.vector_stores.base import BaseVectorStore
@@ -34,7 +35,7 @@ class BasicSearchContext(BasicContextBuilder):
         embedding_vectorstore_key: str = "id",
     ):
         self.text_embedder = text_embedder
-        self.tokenizer = tokenizer or get_tokenizer()
+        self.tokenizer = get_cached_tokenizer(tokenizer or get_tokenizer())
         self.text_units = text_units
         self.text_unit_embeddings = text_unit_embeddings
         self.embedding_vectorstore_key = embedding_vectorstore_key
@@ -76,12 +77,12 @@ class BasicSearchContext(BasicContextBuilder):
         # add these related text chunks into context until we fill up the context window
         current_tokens = 0
         text_ids = []
-        current_tokens = len(
-            self.tokenizer.encode(text_id_col + column_delimiter + text_col + "\n")
+        current_tokens = self.tokenizer.num_tokens(
+            text_id_col + column_delimiter + text_col + "\n"
         )
         for i, row in related_text_df.iterrows():
             text = row[text_id_col] + column_delimiter + row[text_col] + "\n"
-            tokens = len(self.tokenizer.encode(text))
+            tokens = self.tokenizer.num_tokens(text)
             if current_tokens + tokens > max_context_tokens:
                 msg = f"Reached token limit: {current_tokens + tokens}. Reverting to previous context state"
                 logger.warning(msg)
@@ -50,7 +50,13 @@ class DriftAction:
         """Check if the action is complete (i.e., an answer is available)."""
         return self.answer is not None
 
-    async def search(self, search_engine: Any, global_query: str, scorer: Any = None):
+    async def search(
+        self,
+        search_engine: Any,
+        global_query: str,
+        scorer: Any = None,
+        **kwargs: Any,
+    ):
         """
         Execute an asynchronous search using the search engine, and update the action with the results.
 
@@ -60,6 +66,7 @@ class DriftAction:
             search_engine (Any): The search engine to execute the query.
             global_query (str): The global query string.
             scorer (Any, optional): Scorer to compute scores for the action.
+            **kwargs: Extra context builder arguments, such as precomputed `entity_search_results`.
 
         Returns
         -------
@@ -71,7 +78,7 @@ class DriftAction:
             return self
 
         search_result = await search_engine.search(
-            drift_query=global_query, query=self.query
+            drift_query=global_query, query=self.query, **kwargs
         )
 
         # Do not launch exception as it will roll up with other steps
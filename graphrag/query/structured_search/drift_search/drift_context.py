@@ -22,11 +22,13 @@ from graphrag.prompts.query.drift_search_system_prompt import (
     DRIFT_REDUCE_PROMPT,
 )
 from graphrag.query.context_builder.entity_extraction import EntityVectorStoreKey
+from graphrag.query.query_cache import QueryCache
 from graphrag.query.structured_search.base import DRIFTContextBuilder
 from graphrag.query.structured_search.drift_search.primer import PrimerQueryProcessor
 from graphrag.query.structured_search.local_search.mixed_context import (
     LocalSearchMixedContext,
 )
+from graphrag.tokenizer.cached_tokenizer import get_cached_tokenizer
 from graphrag.tokenizer.get_tokenizer import get_tokenizer
 from graphrag.tokenizer.tokenizer import Tokenizer
 from graphrag.vector_stores.base import BaseVectorStore
@@ -54,12 +56,19 @@ class DRIFTSearchContextBuilder(DRIFTContextBuilder):
         local_mixed_context: LocalSearchMixedContext | None = None,
         reduce_system_prompt: str | None = None,
         response_type: str | None = None,
+        entity_search_cache: QueryCache | None = None,
     ):
-        """Initialize the DRIFT search context builder with necessary components."""
+        """Initialize the DRIFT search context builder with necessary components.
+
+        The community report embeddings are stacked into a normalized float32
+        matrix once, so that priming a query is a single matrix-vector product.
+        The entity matches of DRIFT's local queries are cached in
+        `entity_search_cache`, if given.
+        """
         self.config = config or DRIFTSearchConfig()
         self.model = model
         self.text_embedder = text_embedder
-        self.tokenizer = tokenizer or get_tokenizer()
+        self.tokenizer = get_cached_tokenizer(tokenizer or get_tokenizer())
         self.local_system_prompt = local_system_prompt or DRIFT_LOCAL_SYSTEM_PROMPT
         self.reduce_system_prompt = reduce_system_prompt or DRIFT_REDUCE_PROMPT
 
@@ -72,11 +81,22 @@ class DRIFTSearchContextBuilder(DRIFTContextBuilder):
         self.embedding_vectorstore_key = embedding_vectorstore_key
 
         self.response_type = response_type
+        self._report_embeddings: np.ndarray | None = None
+        self.entity_search_cache = entity_search_cache
 
         self.local_mixed_context = (
             local_mixed_context or self.init_local_context_builder()
         )
 
+        if self.reports:
+            try:
+                self._report_embeddings = self.get_report_embeddings()
+            except ValueError:
+                # incomplete reports are reported when a query is made
+                logger.warning(
+                    "Community report embeddings are unavailable, DRIFT queries will fail."
+                )
+
     def init_local_context_builder(self) -> LocalSearchMixedContext:
         """
         Initialize the local search mixed context builder.
@@ -95,6 +115,7 @@ class DRIFTSearchContextBuilder(DRIFTContextBuilder):
             embedding_vectorstore_key=self.embedding_vectorstore_key,
             text_embedder=self.text_embedder,
             tokenizer=self.tokenizer,
+            entity_search_cache=self.entity_search_cache,
         )
 
     @staticmethod
@@ -139,6 +160,30 @@ class DRIFTSearchContextBuilder(DRIFTContextBuilder):
             )
         return report_df
 
+    def get_report_embeddings(self) -> np.ndarray:
+        """
+        Get the normalized float32 matrix of community report embeddings, one row per report.
+
+        Returns
+        -------
+        np.ndarray: The report embeddings, each row scaled to unit length.
+
+        Raises
+        ------
+        ValueError: If some reports are missing full content or full content embeddings.
+        """
+        if self._report_embeddings is not None:
+            return self._report_embeddings
+        reports = self.reports or []
+        self.convert_reports_to_df(reports)
+        matrix = np.asarray(
+            [report.full_content_embedding for report in reports], dtype=np.float32
+        )
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        matrix /= np.where(norms == 0, 1, norms)
+        self._report_embeddings = matrix
+        return matrix
+
     @staticmethod
     def check_query_doc_encodings(query_embedding: Any, embedding: Any) -> bool:
         """
@@ -199,11 +244,9 @@ class DRIFTSearchContextBuilder(DRIFTContextBuilder):
 
         query_embedding, token_ct = await query_processor(query)
 
-        report_df = self.convert_reports_to_df(self.reports)
-
         # Check compatibility between query embedding and document embeddings
         if not self.check_query_doc_encodings(
-            query_embedding, report_df["full_content_embedding"].iloc[0]
+            query_embedding, self.reports[0].full_content_embedding
         ):
             error_message = (
                 "Query and document embeddings are not compatible. "
@@ -211,17 +254,37 @@ class DRIFTSearchContextBuilder(DRIFTContextBuilder):
             )
             raise ValueError(error_message)
 
-        # Vectorized cosine similarity computation
-        query_norm = np.linalg.norm(query_embedding)
-        document_norms = np.linalg.norm(
-            report_df["full_content_embedding"].to_list(), axis=1
-        )
-        dot_products = np.dot(
-            np.vstack(report_df["full_content_embedding"].to_list()), query_embedding
-        )
-        report_df["similarity"] = dot_products / (document_norms * query_norm)
+        return self.get_top_k_reports(query_embedding), token_ct
 
-        # Sort by similarity and select top-k
-        top_k = report_df.nlargest(self.config.drift_k_followups, "similarity")
+    def get_top_k_reports(self, query_embedding: list[float]) -> pd.DataFrame:
+        """
+        Get the community reports most similar to a query embedding.
 
-        return top_k.loc[:, ["short_id", "community_id", "full_content"]], token_ct
+        Args
+        ----
+        query_embedding : list[float]
+            Embedding of the query.
+
+        Returns
+        -------
+        pd.DataFrame: The `drift_k_followups` most similar reports, most similar first.
+        """
+        reports = self.reports or []
+        report_embeddings = self.get_report_embeddings()
+
+        # Cosine similarity against the pre-normalized report embeddings
+        query_vector = np.asarray(query_embedding, dtype=np.float32)
+        query_vector /= np.linalg.norm(query_vector) or 1
+        similarities = report_embeddings @ query_vector
+
+        # A stable sort keeps report order among equally similar reports
+        top_k = np.argsort(-similarities, kind="stable")[
+            : self.config.drift_k_followups
+        ]
+
+        top_reports = [reports[index] for index in top_k]
+        return pd.DataFrame({
+            "short_id": [report.short_id for report in top_reports],
+            "community_id": [report.community_id for report in top_reports],
+            "full_content": [report.full_content for report in top_reports],
+        })
@@ -95,7 +95,7 @@ class PrimerQueryProcessor:
         """
         hyde_query, token_ct = await self.expand_query(query)
         logger.debug("Expanded query: %s", hyde_query)
-        return self.text_embedder.embed(hyde_query), token_ct
+        return await self.text_embedder.aembed(hyde_query), token_ct
 
 
 class DRIFTPrimer:
@@ -3,11 +3,13 @@
 
 """DRIFT Search implementation."""
 
+import asyncio
 import logging
 import time
 from collections.abc import AsyncGenerator
 from typing import Any
 
+import numpy as np
 from tqdm.asyncio import tqdm_asyncio
 
 from graphrag.callbacks.query_callbacks import QueryCallbacks
@@ -17,16 +19,21 @@ from graphrag.language_model.providers.fnllm.utils import (
 )
 from graphrag.query.context_builder.conversation_history import ConversationHistory
 from graphrag.query.context_builder.entity_extraction import EntityVectorStoreKey
+from graphrag.query.query_cache import QueryCache
 from graphrag.query.structured_search.base import BaseSearch, SearchResult
 from graphrag.query.structured_search.drift_search.action import DriftAction
 from graphrag.query.structured_search.drift_search.drift_context import (
     DRIFTSearchContextBuilder,
 )
 from graphrag.query.structured_search.drift_search.primer import DRIFTPrimer
-from graphrag.query.structured_search.drift_search.state import QueryState
+from graphrag.query.structured_search.drift_search.state import DriftStep, QueryState
+from graphrag.query.structured_search.local_search.mixed_context import (
+    LocalSearchMixedContext,
+)
 from graphrag.query.structured_search.local_search.search import LocalSearch
 from graphrag.tokenizer.get_tokenizer import get_tokenizer
 from graphrag.tokenizer.tokenizer import Tokenizer
+from graphrag.vector_stores.base import VectorStoreSearchResult
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +48,7 @@ class DRIFTSearch(BaseSearch[DRIFTSearchContextBuilder]):
         tokenizer: Tokenizer | None = None,
         query_state: QueryState | None = None,
         callbacks: list[QueryCallbacks] | None = None,
+        context_cache: QueryCache | None = None,
     ):
         """
         Initialize the DRIFTSearch class.
@@ -51,6 +59,7 @@ class DRIFTSearch(BaseSearch[DRIFTSearchContextBuilder]):
             config (DRIFTSearchConfig, optional): Configuration settings for DRIFTSearch.
             tokenizer (Tokenizer, optional): Token encoder for managing tokens.
             query_state (QueryState, optional): State of the current search query.
+            context_cache (QueryCache, optional): Cache of the local search contexts, shared across queries. Each search uses its own otherwise.
         """
         super().__init__(model, context_builder, tokenizer)
 
@@ -64,6 +73,9 @@ class DRIFTSearch(BaseSearch[DRIFTSearchContextBuilder]):
         )
         self.callbacks = callbacks or []
         self.local_search = self.init_local_search()
+        self.context_cache = context_cache
+        # bounds the actions searched at once, acquired in priority order
+        self.semaphore = asyncio.Semaphore(self.context_builder.config.concurrency)
 
     def init_local_search(self) -> LocalSearch:
         """
@@ -155,24 +167,123 @@ class DRIFTSearch(BaseSearch[DRIFTSearchContextBuilder]):
         error_msg = "Response must be a list of dictionaries."
         raise ValueError(error_msg)
 
+    async def _search_entities(
+        self, search_engine: LocalSearch, actions: list[DriftAction]
+    ) -> list[list[VectorStoreSearchResult] | None]:
+        """Embed the queries of a step in one batch and map them all to entities with a single vector search."""
+        context_builder = search_engine.context_builder
+        if not isinstance(context_builder, LocalSearchMixedContext):
+            return [None] * len(actions)
+        return await context_builder.asearch_entities(
+            queries=[action.query for action in actions],
+            top_k_mapped_entities=search_engine.context_builder_params.get(
+                "top_k_mapped_entities", 10
+            ),
+        )
+
+    async def _embed_queries(
+        self, queries: list[str], embeddings: dict[str, np.ndarray]
+    ) -> None:
+        """Add the normalized embeddings of the queries that are not embedded yet."""
+        missing = list(dict.fromkeys(q for q in queries if q not in embeddings))
+        if not missing:
+            return
+        vectors = np.array(
+            await self.context_builder.text_embedder.aembed_batch(missing),
+            dtype=np.float32,
+        )
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        vectors = vectors / np.where(norms == 0, 1, norms)
+        embeddings.update(zip(missing, vectors, strict=True))
+
+    async def _select_actions(
+        self, embeddings: dict[str, np.ndarray]
+    ) -> tuple[list[DriftAction], int]:
+        """
+        Select the actions of the next step, following up the best answers first.
+
+        With a `follow_up_similarity_threshold`, follow-ups whose query is
+        near-identical to one already searched or selected are merged into it
+        instead of being searched.
+
+        Returns
+        -------
+        tuple[list[DriftAction], int]: The selected actions, by priority, and the number of merged follow-ups.
+        """
+        k = self.context_builder.config.drift_k_followups
+        threshold = self.context_builder.config.follow_up_similarity_threshold
+        actions = self.query_state.prioritize_incomplete_actions()
+        if threshold is None:
+            return actions[:k], 0
+
+        searched = [node for node in self.query_state.graph.nodes if node.is_complete]
+        await self._embed_queries(
+            [action.query for action in [*searched, *actions]], embeddings
+        )
+        selected: list[DriftAction] = []
+        merged = 0
+        for action in actions:
+            if len(selected) == k:
+                break
+            references = [*searched, *selected]
+            if references:
+                similarities = (
+                    np.stack([embeddings[reference.query] for reference in references])
+                    @ embeddings[action.query]
+                )
+                best = int(np.argmax(similarities))
+                if similarities[best] >= threshold:
+                    logger.debug(
+                        "Merging follow-up %r into %r",
+                        action.query,
+                        references[best].query,
+                    )
+                    self.query_state.merge_action(action, references[best])
+                    merged += 1
+                    continue
+            selected.append(action)
+        return selected, merged
+
     async def _search_step(
-        self, global_query: str, search_engine: LocalSearch, actions: list[DriftAction]
+        self,
+        global_query: str,
+        search_engine: LocalSearch,
+        actions: list[DriftAction],
+        context_cache: QueryCache | None = None,
     ) -> list[DriftAction]:
         """
         Perform an asynchronous search step by executing each DriftAction asynchronously.
 
+        Actions start in the given order, at most `concurrency` at a time.
+
         Args:
             global_query (str): The global query for the search.
             search_engine (LocalSearch): The local search engine instance.
             actions (list[DriftAction]): A list of actions to perform.
+            context_cache (QueryCache, optional): Cache of the local search contexts.
 
         Returns
         -------
         list[DriftAction]: The results from executing the search actions asynchronously.
         """
+        entity_search_results = await self._search_entities(search_engine, actions)
+
+        async def search_action(
+            action: DriftAction, search_results: list[VectorStoreSearchResult] | None
+        ) -> DriftAction:
+            async with self.semaphore:
+                return await action.search(
+                    search_engine=search_engine,
+                    global_query=global_query,
+                    entity_search_results=search_results,
+                    context_cache=context_cache,
+                )
+
         tasks = [
-            action.search(search_engine=search_engine, global_query=global_query)
-            for action in actions
+            search_action(action, search_results)
+            for action, search_results in zip(
+                actions, entity_search_results, strict=True
+            )
         ]
         return await tqdm_asyncio.gather(*tasks, leave=False)
 
@@ -229,25 +340,42 @@ class DRIFTSearch(BaseSearch[DRIFTSearchContextBuilder]):
 
         # Main loop
         epochs = 0
-        llm_call_offset = 0
+        # local search contexts are reused by actions that select the same entities
+        context_cache = self.context_cache or QueryCache()
+        query_embeddings: dict[str, np.ndarray] = {}
         while epochs < self.context_builder.config.n_depth:
-            actions = self.query_state.rank_incomplete_actions()
+            step_start = time.perf_counter()
+            actions, merged = await self._select_actions(query_embeddings)
             if len(actions) == 0:
                 logger.debug("No more actions to take. Exiting DRIFT loop.")
                 break
-            actions = actions[: self.context_builder.config.drift_k_followups]
-            llm_call_offset += (
-                len(actions) - self.context_builder.config.drift_k_followups
-            )
             # Process actions
             results = await self._search_step(
-                global_query=query, search_engine=self.local_search, actions=actions
+                global_query=query,
+                search_engine=self.local_search,
+                actions=actions,
+                context_cache=context_cache,
             )
 
             # Update query state
             for action in results:
                 self.query_state.add_action(action)
                 self.query_state.add_all_follow_ups(action, action.follow_ups)
+            step = DriftStep(
+                step=epochs,
+                actions=len(results),
+                merged=merged,
+                elapsed=time.perf_counter() - step_start,
+                llm_calls=sum(action.metadata["llm_calls"] for action in results),
+                prompt_tokens=sum(
+                    action.metadata["prompt_tokens"] for action in results
+                ),
+                output_tokens=sum(
+                    action.metadata["output_tokens"] for action in results
+                ),
+            )
+            self.query_state.steps.append(step)
+            logger.debug("DRIFT step: %s", step)
             epochs += 1
 
         t_elapsed = time.perf_counter() - start_time
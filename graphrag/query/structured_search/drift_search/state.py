@@ -6,6 +6,7 @@
 import logging
 import random
 from collections.abc import Callable
+from dataclasses import asdict, dataclass
 from typing import Any
 
 import networkx as nx
@@ -15,11 +16,29 @@ from graphrag.query.structured_search.drift_search.action import DriftAction
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class DriftStep:
+    """Timing and LLM usage of a DRIFT search step."""
+
+    step: int
+    """The index of the step, from 0."""
+    actions: int
+    """The number of actions searched."""
+    merged: int
+    """The number of follow-ups merged into near-identical ones instead of being searched."""
+    elapsed: float
+    """The duration of the step, in seconds."""
+    llm_calls: int
+    prompt_tokens: int
+    output_tokens: int
+
+
 class QueryState:
     """Manage the state of the query, including a graph of actions."""
 
     def __init__(self):
         self.graph = nx.MultiDiGraph()
+        self.steps: list[DriftStep] = []
 
     def add_action(self, action: DriftAction, metadata: dict[str, Any] | None = None):
         """Add an action to the graph with optional metadata."""
@@ -52,6 +71,13 @@ class QueryState:
             self.add_action(follow_up)
             self.relate_actions(action, follow_up, weight)
 
+    def merge_action(self, action: DriftAction, into: DriftAction):
+        """Replace an unanswered action by an equivalent one, relating its parents to it instead."""
+        for parent, _, edge_data in list(self.graph.in_edges(action, data=True)):
+            if parent != into:
+                self.relate_actions(parent, into, edge_data.get("weight", 1.0))
+        self.graph.remove_node(action)
+
     def find_incomplete_actions(self) -> list[DriftAction]:
         """Find all unanswered actions in the graph."""
         return [node for node in self.graph.nodes if not node.is_complete]
@@ -76,6 +102,22 @@ class QueryState:
         random.shuffle(unanswered)
         return list(unanswered)
 
+    def prioritize_incomplete_actions(self) -> list[DriftAction]:
+        """Rank all unanswered actions by the best score of the actions they follow up, in random order among equals."""
+        unanswered = self.find_incomplete_actions()
+        random.shuffle(unanswered)
+        return sorted(unanswered, key=self._priority, reverse=True)
+
+    def _priority(self, action: DriftAction) -> float:
+        return max(
+            (
+                parent.score
+                for parent in self.graph.predecessors(action)
+                if parent.score is not None
+            ),
+            default=float("-inf"),
+        )
+
     def serialize(
         self, include_context: bool = True
     ) -> dict[str, Any] | tuple[dict[str, Any], dict[str, Any], str]:
@@ -103,6 +145,8 @@ class QueryState:
             for u, v, edge_data in self.graph.edges(data=True)
         ]
 
+        steps = [asdict(step) for step in self.steps]
+
         if include_context:
             context_data = {
                 node["query"]: node["metadata"]["context_data"]
@@ -112,13 +156,18 @@ class QueryState:
 
             context_text = str(context_data)
 
-            return {"nodes": nodes, "edges": edges}, context_data, context_text
+            return (
+                {"nodes": nodes, "edges": edges, "steps": steps},
+                context_data,
+                context_text,
+            )
 
-        return {"nodes": nodes, "edges": edges}
+        return {"nodes": nodes, "edges": edges, "steps": steps}
 
     def deserialize(self, data: dict[str, Any]):
         """Deserialize the dictionary back to a graph."""
         self.graph.clear()
+        self.steps = [DriftStep(**step) for step in data.get("steps", [])]
         id_to_action = {}
 
         for node_data in data.get("nodes", []):
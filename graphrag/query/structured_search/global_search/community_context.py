@@ -19,6 +19,7 @@ from graphrag.query.context_builder.dynamic_community_selection import (
     DynamicCommunitySelection,
 )
 from graphrag.query.structured_search.base import GlobalContextBuilder
+from graphrag.tokenizer.cached_tokenizer import get_cached_tokenizer
 from graphrag.tokenizer.get_tokenizer import get_tokenizer
 from graphrag.tokenizer.tokenizer import Tokenizer
 
@@ -38,7 +39,7 @@ class GlobalCommunityContext(GlobalContextBuilder):
     ):
         self.community_reports = community_reports
         self.entities = entities
-        self.tokenizer = tokenizer or get_tokenizer()
+        self.tokenizer = get_cached_tokenizer(tokenizer or get_tokenizer())
         self.dynamic_community_selection = None
         if dynamic_community_selection and isinstance(
             dynamic_community_selection_kwargs, dict
@@ -0,0 +1,66 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Global search context over several indexes, built per index."""
+
+import asyncio
+from typing import Any
+
+import pandas as pd
+
+from graphrag.query.context_builder.builders import (
+    ContextBuilderResult,
+    GlobalContextBuilder,
+)
+from graphrag.query.context_builder.conversation_history import (
+    ConversationHistory,
+)
+
+
+class FederatedGlobalContext(GlobalContextBuilder):
+    """Global search context made of the community report batches of several indexes.
+
+    Each index builds its batches concurrently with its own context builder,
+    so the map step runs over the batches of every index without merging
+    their reports. Context records get an `index_name` column.
+    """
+
+    def __init__(self, context_builders: dict[str, GlobalContextBuilder]):
+        self.context_builders = context_builders
+
+    async def build_context(
+        self,
+        query: str,
+        conversation_history: ConversationHistory | None = None,
+        **kwargs: Any,
+    ) -> ContextBuilderResult:
+        """Build the context batches of every index."""
+        results = await asyncio.gather(*[
+            context_builder.build_context(
+                query=query, conversation_history=conversation_history, **kwargs
+            )
+            for context_builder in self.context_builders.values()
+        ])
+
+        context_chunks: list[str] = []
+        context_records: dict[str, list[pd.DataFrame]] = {}
+        for index_name, result in zip(self.context_builders, results, strict=True):
+            if isinstance(result.context_chunks, str):
+                context_chunks.append(result.context_chunks)
+            else:
+                context_chunks.extend(result.context_chunks)
+            for name, records in result.context_records.items():
+                context_records.setdefault(name, []).append(
+                    records.assign(index_name=index_name)
+                )
+
+        return ContextBuilderResult(
+            context_chunks=context_chunks,
+            context_records={
+                name: pd.concat(records, ignore_index=True)
+                for name, records in context_records.items()
+            },
+            llm_calls=sum(result.llm_calls for result in results),
+            prompt_tokens=sum(result.prompt_tokens for result in results),
+            output_tokens=sum(result.output_tokens for result in results),
+        )
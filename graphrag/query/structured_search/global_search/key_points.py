@@ -0,0 +1,103 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Selection of the global search map key points that make up the reduce context."""
+
+import heapq
+from dataclasses import dataclass, field
+from typing import Any
+
+from graphrag.tokenizer.tokenizer import Tokenizer
+
+
+@dataclass(order=True)
+class KeyPoint:
+    """A key point of a map response, ordered from the lowest to the highest ranked."""
+
+    sort_key: tuple[int, int, int] = field(repr=False)
+    analyst: int = field(compare=False)
+    answer: str = field(compare=False)
+    score: int = field(compare=False)
+    text: str = field(compare=False)
+    tokens: int = field(compare=False)
+
+
+class KeyPointSelection:
+    """The highest scoring map key points that fit the reduce token budget, updated as map responses arrive.
+
+    Points rank by descending score, then by analyst and position in the
+    analyst's response. The selection is the longest run of top ranked points
+    whose formatted text fits in `max_tokens`, whatever order the responses
+    are added in. This is the same selection as sorting all key points and
+    truncating them to the budget, without waiting for every response.
+    """
+
+    def __init__(self, tokenizer: Tokenizer, max_tokens: int):
+        self.tokenizer = tokenizer
+        self.max_tokens = max_tokens
+        self.total_tokens = 0
+        # number of points with a positive score, selected or not
+        self.candidates = 0
+        # min-heap of the selected points, its root is the lowest ranked
+        self._heap: list[KeyPoint] = []
+        # the highest ranked point dropped from the budget, lower ranked points never fit
+        self._cutoff: KeyPoint | None = None
+
+    @property
+    def is_full(self) -> bool:
+        """Whether points have been dropped because the budget is full."""
+        return self._cutoff is not None
+
+    @property
+    def min_score(self) -> int | None:
+        """The lowest score of the selected points, if any."""
+        return self._heap[0].score if self._heap else None
+
+    def add(self, analyst: int, response: Any) -> None:
+        """Add the key points of the map response of an analyst, dropping the lowest ranked points beyond the budget."""
+        if not isinstance(response, list):
+            return
+        for position, element in enumerate(response):
+            if not isinstance(element, dict):
+                continue
+            if "answer" not in element or "score" not in element:
+                continue
+            score = element["score"]
+            if score <= 0:
+                continue
+            self.candidates += 1
+            sort_key = (score, -analyst, -position)
+            if self._cutoff is not None and sort_key < self._cutoff.sort_key:
+                continue
+            text = "\n".join([
+                f"----Analyst {analyst + 1}----",
+                f"Importance Score: {score}",
+                element["answer"],
+            ])
+            point = KeyPoint(
+                sort_key=sort_key,
+                analyst=analyst,
+                answer=element["answer"],
+                score=score,
+                text=text,
+                tokens=len(self.tokenizer.encode(text)),
+            )
+            heapq.heappush(self._heap, point)
+            self.total_tokens += point.tokens
+            while self._heap and self.total_tokens > self.max_tokens:
+                dropped = heapq.heappop(self._heap)
+                self.total_tokens -= dropped.tokens
+                if self._cutoff is None or self._cutoff < dropped:
+                    self._cutoff = dropped
+
+    def __len__(self) -> int:
+        """Return the number of selected points."""
+        return len(self._heap)
+
+    def points(self) -> list[KeyPoint]:
+        """Get the selected points, from the highest to the lowest ranked."""
+        return sorted(self._heap, reverse=True)
+
+    def to_text(self) -> str:
+        """Format the selected points as the reduce context."""
+        return "\n\n".join(point.text for point in self.points())
@@ -30,7 +30,11 @@ from graphrag.query.context_builder.conversation_history import (
     ConversationHistory,
 )
 from graphrag.query.llm.text_utils import try_parse_json_object
+from graphrag.query.query_cache import QueryCache
 from graphrag.query.structured_search.base import BaseSearch, SearchResult
+from graphrag.query.structured_search.global_search.key_points import (
+    KeyPointSelection,
+)
 from graphrag.tokenizer.tokenizer import Tokenizer
 
 logger = logging.getLogger(__name__)
@@ -67,6 +71,8 @@ class GlobalSearch(BaseSearch[GlobalContextBuilder]):
         reduce_max_length: int = 2000,
         context_builder_params: dict[str, Any] | None = None,
         concurrent_coroutines: int = 32,
+        map_response_cache: QueryCache | None = None,
+        map_early_stop_score: int | None = None,
     ):
         super().__init__(
             model=model,
@@ -95,6 +101,10 @@ class GlobalSearch(BaseSearch[GlobalContextBuilder]):
         self.reduce_max_length = reduce_max_length
 
         self.semaphore = asyncio.Semaphore(concurrent_coroutines)
+        # map responses are cached by prompt, query and batch content when a cache is given
+        self.map_response_cache = map_response_cache
+        # stop the map step once the reduce budget is full of points scoring at least this much
+        self.map_early_stop_score = map_early_stop_score
 
     async def stream_search(
         self,
@@ -110,15 +120,10 @@ class GlobalSearch(BaseSearch[GlobalContextBuilder]):
         for callback in self.callbacks:
             callback.on_map_response_start(context_result.context_chunks)  # type: ignore
 
-        map_responses = await asyncio.gather(*[
-            self._map_response_single_batch(
-                context_data=data,
-                query=query,
-                max_length=self.map_max_length,
-                **self.map_llm_params,
-            )
-            for data in context_result.context_chunks
-        ])
+        map_responses = await self._map_responses(
+            query=query,
+            context_chunks=context_result.context_chunks,  # type: ignore
+        )
 
         for callback in self.callbacks:
             callback.on_map_response_end(map_responses)  # type: ignore
@@ -162,15 +167,10 @@ class GlobalSearch(BaseSearch[GlobalContextBuilder]):
         for callback in self.callbacks:
             callback.on_map_response_start(context_result.context_chunks)  # type: ignore
 
-        map_responses = await asyncio.gather(*[
-            self._map_response_single_batch(
-                context_data=data,
-                query=query,
-                max_length=self.map_max_length,
-                **self.map_llm_params,
-            )
-            for data in context_result.context_chunks
-        ])
+        map_responses = await self._map_responses(
+            query=query,
+            context_chunks=context_result.context_chunks,  # type: ignore
+        )
 
         for callback in self.callbacks:
             callback.on_map_response_end(map_responses)
@@ -206,6 +206,83 @@ class GlobalSearch(BaseSearch[GlobalContextBuilder]):
             output_tokens_categories=output_tokens,
         )
 
+    async def _map_responses(
+        self, query: str, context_chunks: list[str]
+    ) -> list[SearchResult]:
+        """Run the map step over every batch of community reports.
+
+        With `map_early_stop_score` set, responses are consumed as they
+        complete and their key points kept in a running selection for the
+        reduce budget. Once the budget is full of points scoring at least
+        `map_early_stop_score`, the remaining map calls are cancelled and their
+        batches get empty responses, so the reduce step can start.
+        """
+        tasks = [
+            asyncio.create_task(
+                self._map_response_single_batch(
+                    context_data=data,
+                    query=query,
+                    max_length=self.map_max_length,
+                    **self.map_llm_params,
+                )
+            )
+            for data in context_chunks
+        ]
+        if self.map_early_stop_score is None:
+            return list(await asyncio.gather(*tasks))
+
+        analysts = {task: index for index, task in enumerate(tasks)}
+        selection = KeyPointSelection(self.tokenizer, self.max_data_tokens)
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    selection.add(analysts[task], task.result().response)
+                min_score = selection.min_score
+                if (
+                    selection.is_full
+                    and min_score is not None
+                    and min_score >= self.map_early_stop_score
+                ):
+                    logger.debug(
+                        "Reduce budget filled, cancelling %d of %d map batches",
+                        len(pending),
+                        len(tasks),
+                    )
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.wait(pending)
+
+        return [
+            task.result()
+            if not task.cancelled()
+            else SearchResult(
+                response=[],
+                context_data=data,
+                context_text=data,
+                completion_time=0,
+                llm_calls=0,
+                prompt_tokens=0,
+                output_tokens=0,
+            )
+            for task, data in zip(tasks, context_chunks, strict=True)
+        ]
+
+    def _select_key_points(
+        self, map_responses: list[SearchResult]
+    ) -> KeyPointSelection:
+        """Select the highest scoring key points of the map responses that fit the reduce budget."""
+        selection = KeyPointSelection(self.tokenizer, self.max_data_tokens)
+        for index, response in enumerate(map_responses):
+            selection.add(index, response.response)
+        return selection
+
     async def _map_response_single_batch(
         self,
         context_data: str,
@@ -223,15 +300,30 @@ class GlobalSearch(BaseSearch[GlobalContextBuilder]):
             search_messages = [
                 {"role": "system", "content": search_prompt},
             ]
-            async with self.semaphore:
-                model_response = await self.model.achat(
-                    prompt=query,
-                    history=search_messages,
-                    model_parameters=llm_kwargs,
-                    json=True,
+            llm_calls = 0
+
+            async def map_batch() -> str:
+                nonlocal llm_calls
+                llm_calls = 1
+                async with self.semaphore:
+                    model_response = await self.model.achat(
+                        prompt=query,
+                        history=search_messages,
+                        model_parameters=llm_kwargs,
+                        json=True,
+                    )
+                return model_response.output.content
+
+            if self.map_response_cache is None:
+                search_response = await map_batch()
+            else:
+                search_response = await self.map_response_cache.get_or_create(
+                    self.map_response_cache.create_key(
+                        search_prompt, query, llm_kwargs
+                    ),
+                    map_batch,
                 )
-                search_response = model_response.output.content
-                logger.debug("Map response: %s", search_response)
+            logger.debug("Map response: %s", search_response)
             try:
                 # parse search response json
                 processed_response = self._parse_search_response(search_response)
@@ -246,9 +338,13 @@ class GlobalSearch(BaseSearch[GlobalContextBuilder]):
                 context_data=context_data,
                 context_text=context_data,
                 completion_time=time.time() - start_time,
-                llm_calls=1,
-                prompt_tokens=len(self.tokenizer.encode(search_prompt)),
-                output_tokens=len(self.tokenizer.encode(search_response)),
+                llm_calls=llm_calls,
+                prompt_tokens=len(self.tokenizer.encode(search_prompt))
+                if llm_calls
+                else 0,
+                output_tokens=len(self.tokenizer.encode(search_response))
+                if llm_calls
+                else 0,
             )
 
         except Exception:
@@ -304,30 +400,10 @@ class GlobalSearch(BaseSearch[GlobalContextBuilder]):
         search_prompt = ""
         start_time = time.time()
         try:
-            # collect all key points into a single list to prepare for sorting
-            key_points = []
-            for index, response in enumerate(map_responses):
-                if not isinstance(response.response, list):
-                    continue
-                for element in response.response:
-                    if not isinstance(element, dict):
-                        continue
-                    if "answer" not in element or "score" not in element:
-                        continue
-                    key_points.append({
-                        "analyst": index,
-                        "answer": element["answer"],
-                        "score": element["score"],
-                    })
-
-            # filter response with score = 0 and rank responses by descending order of score
-            filtered_key_points = [
-                point
-                for point in key_points
-                if point["score"] > 0  # type: ignore
-            ]
+            # rank key points with a positive score and keep those that fit the budget
+            selection = self._select_key_points(map_responses)
 
-            if len(filtered_key_points) == 0 and not self.allow_general_knowledge:
+            if selection.candidates == 0 and not self.allow_general_knowledge:
                 # return no data answer if no key points are found
                 logger.warning(
                     "Warning: All map responses have score 0 (i.e., no relevant information found from the dataset), returning a canned 'I do not know' answer. You can try enabling `allow_general_knowledge` to encourage the LLM to incorporate relevant general knowledge, at the risk of increasing hallucinations."
@@ -342,32 +418,7 @@ class GlobalSearch(BaseSearch[GlobalContextBuilder]):
                     output_tokens=0,
                 )
 
-            filtered_key_points = sorted(
-                filtered_key_points,
-                key=lambda x: x["score"],  # type: ignore
-                reverse=True,  # type: ignore
-            )
-
-            data = []
-            total_tokens = 0
-            for point in filtered_key_points:
-                formatted_response_data = []
-                formatted_response_data.append(
-                    f"----Analyst {point['analyst'] + 1}----"
-                )
-                formatted_response_data.append(
-                    f"Importance Score: {point['score']}"  # type: ignore
-                )
-                formatted_response_data.append(point["answer"])  # type: ignore
-                formatted_response_text = "\n".join(formatted_response_data)
-                if (
-                    total_tokens + len(self.tokenizer.encode(formatted_response_text))
-                    > self.max_data_tokens
-                ):
-                    break
-                data.append(formatted_response_text)
-                total_tokens += len(self.tokenizer.encode(formatted_response_text))
-            text_data = "\n\n".join(data)
+            text_data = selection.to_text()
 
             search_prompt = self.reduce_system_prompt.format(
                 report_data=text_data,
@@ -419,30 +470,10 @@ class GlobalSearch(BaseSearch[GlobalContextBuilder]):
         max_length: int,
         **llm_kwargs,
     ) -> AsyncGenerator[str, None]:
-        # collect all key points into a single list to prepare for sorting
-        key_points = []
-        for index, response in enumerate(map_responses):
-            if not isinstance(response.response, list):
-                continue
-            for element in response.response:
-                if not isinstance(element, dict):
-                    continue
-                if "answer" not in element or "score" not in element:
-                    continue
-                key_points.append({
-                    "analyst": index,
-                    "answer": element["answer"],
-                    "score": element["score"],
-                })
-
-        # filter response with score = 0 and rank responses by descending order of score
-        filtered_key_points = [
-            point
-            for point in key_points
-            if point["score"] > 0  # type: ignore
-        ]
+        # rank key points with a positive score and keep those that fit the budget
+        selection = self._select_key_points(map_responses)
 
-        if len(filtered_key_points) == 0 and not self.allow_general_knowledge:
+        if selection.candidates == 0 and not self.allow_general_knowledge:
             # return no data answer if no key points are found
             logger.warning(
                 "Warning: All map responses have score 0 (i.e., no relevant information found from the dataset), returning a canned 'I do not know' answer. You can try enabling `allow_general_knowledge` to encourage the LLM to incorporate relevant general knowledge, at the risk of increasing hallucinations."
@@ -450,29 +481,7 @@ class GlobalSearch(BaseSearch[GlobalContextBuilder]):
             yield NO_DATA_ANSWER
             return
 
-        filtered_key_points = sorted(
-            filtered_key_points,
-            key=lambda x: x["score"],  # type: ignore
-            reverse=True,  # type: ignore
-        )
-
-        data = []
-        total_tokens = 0
-        for point in filtered_key_points:
-            formatted_response_data = [
-                f"----Analyst {point['analyst'] + 1}----",
-                f"Importance Score: {point['score']}",
-                point["answer"],
-            ]
-            formatted_response_text = "\n".join(formatted_response_data)
-            if (
-                total_tokens + len(self.tokenizer.encode(formatted_response_text))
-                > self.max_data_tokens
-            ):
-                break
-            data.append(formatted_response_text)
-            total_tokens += len(self.tokenizer.encode(formatted_response_text))
-        text_data = "\n\n".join(data)
+        text_data = selection.to_text()
 
         search_prompt = self.reduce_system_prompt.format(
             report_data=text_data,
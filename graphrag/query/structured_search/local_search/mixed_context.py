@@ -23,6 +23,7 @@ from graphrag.query.context_builder.conversation_history import (
 )
 from graphrag.query.context_builder.entity_extraction import (
     EntityVectorStoreKey,
+    asearch_query_entities,
     map_query_to_entities,
 )
 from graphrag.query.context_builder.local_context import (
@@ -38,11 +39,14 @@ from graphrag.query.context_builder.source_context import (
 from graphrag.query.input.retrieval.community_reports import (
     get_candidate_communities,
 )
+from graphrag.query.input.retrieval.knowledge_index import KnowledgeIndex
 from graphrag.query.input.retrieval.text_units import get_candidate_text_units
+from graphrag.query.query_cache import QueryCache
 from graphrag.query.structured_search.base import LocalContextBuilder
+from graphrag.tokenizer.cached_tokenizer import get_cached_tokenizer
 from graphrag.tokenizer.get_tokenizer import get_tokenizer
 from graphrag.tokenizer.tokenizer import Tokenizer
-from graphrag.vector_stores.base import BaseVectorStore
+from graphrag.vector_stores.base import BaseVectorStore, VectorStoreSearchResult
 
 logger = logging.getLogger(__name__)
 
@@ -61,6 +65,8 @@ class LocalSearchMixedContext(LocalContextBuilder):
         covariates: dict[str, list[Covariate]] | None = None,
         tokenizer: Tokenizer | None = None,
         embedding_vectorstore_key: str = EntityVectorStoreKey.ID,
+        knowledge_index: KnowledgeIndex | None = None,
+        entity_search_cache: QueryCache | None = None,
     ):
         if community_reports is None:
             community_reports = []
@@ -81,13 +87,60 @@ class LocalSearchMixedContext(LocalContextBuilder):
         self.covariates = covariates
         self.entity_text_embeddings = entity_text_embeddings
         self.text_embedder = text_embedder
-        self.tokenizer = tokenizer or get_tokenizer()
+        self.tokenizer = get_cached_tokenizer(tokenizer or get_tokenizer())
         self.embedding_vectorstore_key = embedding_vectorstore_key
+        # relationships and covariates are looked up per entity instead of scanned per query
+        self.knowledge_index = knowledge_index or KnowledgeIndex(
+            entities=self.entities.values(),
+            relationships=self.relationships.values(),
+            text_units=self.text_units.values(),
+            covariates=self.covariates,
+        )
+        self.entity_search_cache = entity_search_cache
 
     def filter_by_entity_keys(self, entity_keys: list[int] | list[str]):
         """Filter entity text embeddings by entity keys."""
         self.entity_text_embeddings.filter_by_id(entity_keys)
 
+    async def asearch_entities(
+        self, queries: list[str], top_k_mapped_entities: int = 10
+    ) -> list[list[VectorStoreSearchResult] | None]:
+        """Resolve the entity matches of several queries in one batch, for use as `entity_search_results`.
+
+        With an `entity_search_cache`, only the queries whose matches are not cached are searched.
+        """
+        cache = self.entity_search_cache
+        if cache is None:
+            return await asearch_query_entities(
+                queries=queries,
+                text_embedding_vectorstore=self.entity_text_embeddings,
+                text_embedder=self.text_embedder,
+                k=top_k_mapped_entities,
+                oversample_scaler=2,
+            )
+
+        keys = {
+            query: cache.create_key(
+                query, top_k_mapped_entities, self.entity_text_embeddings.query_filter
+            )
+            for query in queries
+            if query != ""
+        }
+        results = {query: cache.get(key) for query, key in keys.items()}
+        missing = [query for query, result in results.items() if result is None]
+        if missing:
+            search_results = await asearch_query_entities(
+                queries=missing,
+                text_embedding_vectorstore=self.entity_text_embeddings,
+                text_embedder=self.text_embedder,
+                k=top_k_mapped_entities,
+                oversample_scaler=2,
+            )
+            for query, result in zip(missing, search_results, strict=True):
+                results[query] = result
+                cache.set(keys[query], result)
+        return [results.get(query) for query in queries]
+
     def build_context(
         self,
         query: str,
@@ -111,12 +164,15 @@ class LocalSearchMixedContext(LocalContextBuilder):
         min_community_rank: int = 0,
         community_context_name: str = "Reports",
         column_delimiter: str = "|",
+        entity_search_results: list[VectorStoreSearchResult] | None = None,
+        context_cache: QueryCache | None = None,
         **kwargs: dict[str, Any],
     ) -> ContextBuilderResult:
         """
         Build data context for local search prompt.
 
         Build a context by combining community reports and entity/relationship/covariate tables, and text units using a predefined ratio set by summary_prop.
+        Without conversation history, the context only depends on the selected entities, and is reused from `context_cache`, if given, for queries that select the same ones.
         """
         if include_entity_names is None:
             include_entity_names = []
@@ -146,8 +202,33 @@ class LocalSearchMixedContext(LocalContextBuilder):
             exclude_entity_names=exclude_entity_names,
             k=top_k_mapped_entities,
             oversample_scaler=2,
+            search_results=None if conversation_history else entity_search_results,
+            knowledge_index=self.knowledge_index,
         )
 
+        context_key = None
+        if context_cache is not None and not conversation_history:
+            context_key = context_cache.create_key(
+                [entity.id for entity in selected_entities],
+                max_context_tokens,
+                text_unit_prop,
+                community_prop,
+                top_k_relationships,
+                include_community_rank,
+                include_entity_rank,
+                rank_description,
+                include_relationship_weight,
+                relationship_ranking_attribute,
+                return_candidate_context,
+                use_community_summary,
+                min_community_rank,
+                community_context_name,
+                column_delimiter,
+            )
+            cached_result = context_cache.get(context_key)
+            if cached_result is not None:
+                return cached_result
+
         # build context
         final_context = list[str]()
         final_context_data = dict[str, pd.DataFrame]()
@@ -216,10 +297,13 @@ class LocalSearchMixedContext(LocalContextBuilder):
             final_context.append(text_unit_context)
             final_context_data = {**final_context_data, **text_unit_context_data}
 
-        return ContextBuilderResult(
+        result = ContextBuilderResult(
             context_chunks="\n\n".join(final_context),
             context_records=final_context_data,
         )
+        if context_cache is not None and context_key is not None:
+            context_cache.set(context_key, result)
+        return result
 
     def _build_community_context(
         self,
@@ -318,23 +402,18 @@ class LocalSearchMixedContext(LocalContextBuilder):
         text_unit_ids_set = set()
 
         unit_info_list = []
-        relationship_values = list(self.relationships.values())
 
         for index, entity in enumerate(selected_entities):
             # get matching relationships
-            entity_relationships = [
-                rel
-                for rel in relationship_values
-                if rel.source == entity.title or rel.target == entity.title
-            ]
-
-            for text_id in entity.text_unit_ids or []:
-                if text_id not in text_unit_ids_set and text_id in self.text_units:
-                    selected_unit = deepcopy(self.text_units[text_id])
+            entity_relationships = self.knowledge_index.get_relationships([entity])
+
+            for text_unit in self.knowledge_index.get_text_units(entity):
+                if text_unit.id not in text_unit_ids_set:
+                    selected_unit = deepcopy(text_unit)
                     num_relationships = count_relationships(
                         entity_relationships, selected_unit
                     )
-                    text_unit_ids_set.add(text_id)
+                    text_unit_ids_set.add(text_unit.id)
                     unit_info_list.append((selected_unit, index, num_relationships))
 
         # sort by entity_order and the number of relationships desc
@@ -397,7 +476,9 @@ class LocalSearchMixedContext(LocalContextBuilder):
             rank_description=rank_description,
             context_name="Entities",
         )
-        entity_tokens = len(self.tokenizer.encode(entity_context))
+        # whole contexts differ per query, count them without filling the row cache
+        num_tokens = self.tokenizer.tokenizer.num_tokens
+        entity_tokens = num_tokens(entity_context)
 
         # build relationship-covariate context
         added_entities = []
@@ -416,7 +497,7 @@ class LocalSearchMixedContext(LocalContextBuilder):
                 relationship_context_data,
             ) = build_relationship_context(
                 selected_entities=added_entities,
-                relationships=list(self.relationships.values()),
+                relationships=self.knowledge_index.get_relationships(added_entities),
                 tokenizer=self.tokenizer,
                 max_context_tokens=max_context_tokens,
                 column_delimiter=column_delimiter,
@@ -427,9 +508,7 @@ class LocalSearchMixedContext(LocalContextBuilder):
             )
             current_context.append(relationship_context)
             current_context_data["relationships"] = relationship_context_data
-            total_tokens = entity_tokens + len(
-                self.tokenizer.encode(relationship_context)
-            )
+            total_tokens = entity_tokens + num_tokens(relationship_context)
 
             # build covariate context
             for covariate in self.covariates:
@@ -440,8 +519,11 @@ class LocalSearchMixedContext(LocalContextBuilder):
                     max_context_tokens=max_context_tokens,
                     column_delimiter=column_delimiter,
                     context_name=covariate,
+                    covariates_by_subject=self.knowledge_index.get_covariates_by_subject(
+                        covariate
+                    ),
                 )
-                total_tokens += len(self.tokenizer.encode(covariate_context))
+                total_tokens += num_tokens(covariate_context)
                 current_context.append(covariate_context)
                 current_context_data[covariate.lower()] = covariate_context_data
 
@@ -463,9 +545,14 @@ class LocalSearchMixedContext(LocalContextBuilder):
             # and add a tag to indicate which records were included in the context window
             candidate_context_data = get_candidate_context(
                 selected_entities=selected_entities,
-                entities=list(self.entities.values()),
-                relationships=list(self.relationships.values()),
-                covariates=self.covariates,
+                entities=self.knowledge_index.get_related_entities(selected_entities),
+                relationships=self.knowledge_index.get_relationships(selected_entities),
+                covariates={
+                    covariate: self.knowledge_index.get_covariates(
+                        covariate, selected_entities
+                    )
+                    for covariate in self.covariates
+                },
                 include_entity_rank=include_entity_rank,
                 entity_rank_description=rank_description,
                 include_relationship_weight=include_relationship_weight,
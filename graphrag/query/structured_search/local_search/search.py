@@ -18,7 +18,11 @@ from graphrag.query.context_builder.conversation_history import (
     ConversationHistory,
 )
 from graphrag.query.structured_search.base import BaseSearch, SearchResult
+from graphrag.query.structured_search.local_search.mixed_context import (
+    LocalSearchMixedContext,
+)
 from graphrag.tokenizer.tokenizer import Tokenizer
+from graphrag.vector_stores.base import VectorStoreSearchResult
 
 logger = logging.getLogger(__name__)
 
@@ -48,6 +52,25 @@ class LocalSearch(BaseSearch[LocalContextBuilder]):
         self.callbacks = callbacks or []
         self.response_type = response_type
 
+    async def _search_entities(
+        self, query: str, conversation_history: ConversationHistory | None
+    ) -> list[VectorStoreSearchResult] | None:
+        """Map the query to entities with the async embedding API, so that building the context does not block on it.
+
+        Queries extended with conversation history are left to the context builder.
+        """
+        if conversation_history or not isinstance(
+            self.context_builder, LocalSearchMixedContext
+        ):
+            return None
+        search_results = await self.context_builder.asearch_entities(
+            queries=[query],
+            top_k_mapped_entities=self.context_builder_params.get(
+                "top_k_mapped_entities", 10
+            ),
+        )
+        return search_results[0]
+
     async def search(
         self,
         query: str,
@@ -58,6 +81,10 @@ class LocalSearch(BaseSearch[LocalContextBuilder]):
         start_time = time.time()
         search_prompt = ""
         llm_calls, prompt_tokens, output_tokens = {}, {}, {}
+        if "entity_search_results" not in kwargs:
+            kwargs["entity_search_results"] = await self._search_entities(
+                query, conversation_history
+            )
         context_result = self.context_builder.build_context(
             query=query,
             conversation_history=conversation_history,
@@ -140,6 +167,9 @@ class LocalSearch(BaseSearch[LocalContextBuilder]):
         context_result = self.context_builder.build_context(
             query=query,
             conversation_history=conversation_history,
+            entity_search_results=await self._search_entities(
+                query, conversation_history
+            ),
             **self.context_builder_params,
         )
         logger.debug("GENERATE ANSWER: %s. QUERY: %s", start_time, query)
@@ -3,14 +3,20 @@
 
 """Azure Blob Storage implementation of PipelineStorage."""
 
+import asyncio
+import io
 import logging
 import re
-from collections.abc import Iterator
+import uuid
+from collections.abc import AsyncGenerator, Iterator
+from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Any
 
+import pyarrow as pa
+from azure.core.exceptions import ResourceNotFoundError
 from azure.identity import DefaultAzureCredential
-from azure.storage.blob import BlobServiceClient
+from azure.storage.blob import BlobBlock, BlobClient, BlobServiceClient
 
 from graphrag.storage.pipeline_storage import (
     PipelineStorage,
@@ -19,6 +25,9 @@ from graphrag.storage.pipeline_storage import (
 
 logger = logging.getLogger(__name__)
 
+BLOCK_SIZE = 8 * 1024 * 1024
+"""The size of the blocks a blob is staged in by `BlobPipelineStorage.open_output`."""
+
 
 class BlobPipelineStorage(PipelineStorage):
     """The Blob-Storage implementation."""
@@ -178,14 +187,19 @@ class BlobPipelineStorage(PipelineStorage):
     async def get(
         self, key: str, as_bytes: bool | None = False, encoding: str | None = None
     ) -> Any:
-        """Get a value from the cache."""
+        """Get a value from the cache.
+
+        The download runs in a worker thread, so several blobs can be read concurrently.
+        """
         try:
             key = self._keyname(key)
             container_client = self._blob_service_client.get_container_client(
                 self._container_name
             )
             blob_client = container_client.get_blob_client(key)
-            blob_data = blob_client.download_blob().readall()
+            blob_data = await asyncio.to_thread(
+                lambda: blob_client.download_blob().readall()
+            )
             if not as_bytes:
                 coding = encoding or self._encoding
                 blob_data = blob_data.decode(coding)
@@ -249,6 +263,35 @@ class BlobPipelineStorage(PipelineStorage):
                 storage_options={"connection_string": self._connection_string},
             )
 
+    def _blob_client(self, key: str) -> BlobClient:
+        container_client = self._blob_service_client.get_container_client(
+            self._container_name
+        )
+        return container_client.get_blob_client(self._keyname(key))
+
+    @asynccontextmanager
+    async def open_input(self, key: str) -> AsyncGenerator[pa.NativeFile, None]:
+        """Open a blob for reading, downloading only the ranges that are read."""
+        blob_client = self._blob_client(key)
+        try:
+            properties = await asyncio.to_thread(blob_client.get_blob_properties)
+        except ResourceNotFoundError as e:
+            msg = f"Could not find {key} in storage!"
+            raise ValueError(msg) from e
+        with pa.PythonFile(
+            _BlobRangeReader(blob_client, properties.size), mode="r"
+        ) as source:
+            yield source
+
+    @asynccontextmanager
+    async def open_output(self, key: str) -> AsyncGenerator[pa.NativeFile, None]:
+        """Open a blob for writing, uploading it in blocks that are committed once it is written."""
+        blob_client = self._blob_client(key)
+        writer = _BlobBlockWriter(blob_client, BLOCK_SIZE)
+        with pa.PythonFile(writer, mode="w") as sink:
+            yield sink
+        await asyncio.to_thread(writer.commit)
+
     async def has(self, key: str) -> bool:
         """Check if a key exists in the cache."""
         key = self._keyname(key)
@@ -305,13 +348,86 @@ class BlobPipelineStorage(PipelineStorage):
                 self._container_name
             )
             blob_client = container_client.get_blob_client(key)
-            timestamp = blob_client.download_blob().properties.creation_time
+            properties = await asyncio.to_thread(blob_client.get_blob_properties)
+            timestamp = properties.creation_time
             return get_timestamp_formatted_with_local_tz(timestamp)
         except Exception:  # noqa: BLE001
             logger.warning("Error getting key %s", key)
             return ""
 
 
+class _BlobRangeReader(io.RawIOBase):
+    """A seekable file over a blob, each read downloading the range it reads."""
+
+    def __init__(self, blob_client: BlobClient, size: int):
+        self._blob_client = blob_client
+        self._size = size
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += self._size
+        self._position = offset
+        return offset
+
+    def read(self, size: int = -1) -> bytes:
+        end = self._size if size < 0 else min(self._size, self._position + size)
+        if end <= self._position:
+            return b""
+        data = self._blob_client.download_blob(
+            offset=self._position, length=end - self._position
+        ).readall()
+        self._position = end
+        return data
+
+
+class _BlobBlockWriter(io.RawIOBase):
+    """A file staging what is written to a blob as blocks, which `commit` makes the content of the blob."""
+
+    def __init__(self, blob_client: BlobClient, block_size: int):
+        self._blob_client = blob_client
+        self._block_size = block_size
+        self._blocks: list[BlobBlock] = []
+        self._buffer = bytearray()
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def write(self, data: Any) -> int:
+        self._buffer += data
+        self._position += len(data)
+        while len(self._buffer) >= self._block_size:
+            self._stage(bytes(self._buffer[: self._block_size]))
+            del self._buffer[: self._block_size]
+        return len(data)
+
+    def _stage(self, data: bytes) -> None:
+        block_id = uuid.uuid4().hex
+        self._blob_client.stage_block(block_id, data)
+        self._blocks.append(BlobBlock(block_id))
+
+    def commit(self) -> None:
+        if self._buffer or not self._blocks:
+            self._stage(bytes(self._buffer))
+            self._buffer.clear()
+        self._blob_client.commit_block_list(self._blocks)
+
+
 def validate_blob_container_name(container_name: str):
     """
     Check if the provided blob container name is valid based on Azure rules.
@@ -7,12 +7,14 @@ import logging
 import os
 import re
 import shutil
-from collections.abc import Iterator
+from collections.abc import AsyncGenerator, Iterator
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, cast
 
 import aiofiles
+import pyarrow as pa
 from aiofiles.os import remove
 from aiofiles.ospath import exists
 
@@ -128,6 +130,28 @@ class FilePipelineStorage(PipelineStorage):
         ) as f:
             await f.write(value)
 
+    @asynccontextmanager
+    async def open_input(self, key: str) -> AsyncGenerator[pa.NativeFile, None]:
+        """Memory-map a file, so that only the parts that are read are loaded."""
+        file_path = join_path(self._root_dir, key)
+        if not await exists(file_path):
+            msg = f"Could not find {key} in storage!"
+            raise ValueError(msg)
+        with pa.memory_map(str(file_path)) as source:
+            yield source
+
+    @asynccontextmanager
+    async def open_output(self, key: str) -> AsyncGenerator[pa.NativeFile, None]:
+        """Write a file in parts to a temporary file, which replaces the file once written."""
+        file_path = join_path(self._root_dir, key)
+        temp_path = file_path.with_name(f"{file_path.name}.tmp")
+        try:
+            with pa.OSFile(str(temp_path), "wb") as sink:
+                yield sink
+            temp_path.replace(file_path)
+        finally:
+            temp_path.unlink(missing_ok=True)
+
     async def has(self, key: str) -> bool:
         """Has method definition."""
         return await exists(join_path(self._root_dir, key))
@@ -3,12 +3,10 @@
 
 """A module containing 'InMemoryStorage' model."""
 
-from typing import TYPE_CHECKING, Any
+from typing import Any
 
 from graphrag.storage.file_pipeline_storage import FilePipelineStorage
-
-if TYPE_CHECKING:
-    from graphrag.storage.pipeline_storage import PipelineStorage
+from graphrag.storage.pipeline_storage import PipelineStorage
 
 
 class MemoryPipelineStorage(FilePipelineStorage):
@@ -69,6 +67,10 @@ class MemoryPipelineStorage(FilePipelineStorage):
         """Clear the storage."""
         self._storage.clear()
 
+    # values are read from and written to memory, not to files
+    open_input = PipelineStorage.open_input
+    open_output = PipelineStorage.open_output
+
     def child(self, name: str | None) -> "PipelineStorage":
         """Create a child storage instance."""
         return MemoryPipelineStorage()
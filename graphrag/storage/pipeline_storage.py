@@ -5,10 +5,13 @@
 
 import re
 from abc import ABCMeta, abstractmethod
-from collections.abc import Iterator
+from collections.abc import AsyncGenerator, Iterator
+from contextlib import asynccontextmanager
 from datetime import datetime
 from typing import Any
 
+import pyarrow as pa
+
 
 class PipelineStorage(metaclass=ABCMeta):
     """Provide a storage interface for the pipeline. This is where the pipeline will store its output data."""
@@ -91,6 +94,35 @@ class PipelineStorage(metaclass=ABCMeta):
             - output - The creation date for the given key.
         """
 
+    @asynccontextmanager
+    async def open_input(self, key: str) -> AsyncGenerator[pa.NativeFile, None]:
+        """Open the value for the given key as a random access file, to read parts of it such as parquet columns and row groups.
+
+        The default reads the whole value into memory, storages that can read ranges of a value override it.
+
+        Args:
+            - key - The key to open.
+        """
+        data = await self.get(key, as_bytes=True)
+        if data is None:
+            msg = f"Could not find {key} in storage!"
+            raise ValueError(msg)
+        with pa.BufferReader(data) as source:
+            yield source
+
+    @asynccontextmanager
+    async def open_output(self, key: str) -> AsyncGenerator[pa.NativeFile, None]:
+        """Open a file to write the value for the given key in parts, set once the file is written without errors.
+
+        The default buffers the value in memory and sets it on close, storages that can write parts of a value override it.
+
+        Args:
+            - key - The key to write.
+        """
+        sink = pa.BufferOutputStream()
+        yield sink
+        await self.set(key, sink.getvalue().to_pybytes())
+
 
 def get_timestamp_formatted_with_local_tz(timestamp: datetime) -> str:
     """Get the formatted timestamp with the local time zone."""
@@ -0,0 +1,78 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Cached Tokenizer."""
+
+from functools import lru_cache
+
+from graphrag.tokenizer.tokenizer import Tokenizer
+
+DEFAULT_CACHE_SIZE = 65_536
+"""Number of distinct texts whose token counts are kept."""
+
+
+class CachedTokenizer(Tokenizer):
+    """Tokenizer that remembers the token counts of the texts it has measured.
+
+    Context builders measure the same rows (entities, relationships, community
+    reports...) for every query, so caching `num_tokens` turns repeated context
+    assembly into dictionary lookups. Encoding and decoding are delegated to the
+    wrapped tokenizer unchanged.
+    """
+
+    def __init__(self, tokenizer: Tokenizer, cache_size: int = DEFAULT_CACHE_SIZE):
+        """Initialize the Cached Tokenizer.
+
+        Args
+        ----
+            tokenizer (Tokenizer): The tokenizer to delegate to.
+            cache_size (int): The maximum number of token counts to keep, least recently used first out.
+        """
+        self.tokenizer = tokenizer
+        self._num_tokens = lru_cache(maxsize=cache_size)(tokenizer.num_tokens)
+
+    def encode(self, text: str) -> list[int]:
+        """Encode the given text into a list of tokens.
+
+        Args
+        ----
+            text (str): The input text to encode.
+
+        Returns
+        -------
+            list[int]: A list of tokens representing the encoded text.
+        """
+        return self.tokenizer.encode(text)
+
+    def decode(self, tokens: list[int]) -> str:
+        """Decode a list of tokens back into a string.
+
+        Args
+        ----
+            tokens (list[int]): A list of tokens to decode.
+
+        Returns
+        -------
+            str: The decoded string from the list of tokens.
+        """
+        return self.tokenizer.decode(tokens)
+
+    def num_tokens(self, text: str) -> int:
+        """Return the number of tokens in the given text, measuring each distinct text once.
+
+        Args
+        ----
+            text (str): The input text to analyze.
+
+        Returns
+        -------
+            int: The number of tokens in the input text.
+        """
+        return self._num_tokens(text)
+
+
+def get_cached_tokenizer(tokenizer: Tokenizer) -> CachedTokenizer:
+    """Wrap a tokenizer with a token count cache, unless it already has one."""
+    if isinstance(tokenizer, CachedTokenizer):
+        return tokenizer
+    return CachedTokenizer(tokenizer)
@@ -3,6 +3,9 @@
 
 """API functions for the GraphRAG module."""
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
 from pathlib import Path
 from typing import Any
 
@@ -24,7 +27,12 @@ from graphrag.vector_stores.factory import VectorStoreFactory
 
 
 class MultiVectorStore(BaseVectorStore):
-    """Multi Vector Store wrapper implementation."""
+    """Multi Vector Store wrapper implementation.
+
+    Searches run against every store concurrently, and their results are
+    merged by score. Document ids are suffixed with the name of their index,
+    as `<id>-<index_name>`.
+    """
 
     def __init__(
         self,
@@ -33,6 +41,8 @@ class MultiVectorStore(BaseVectorStore):
     ):
         self.embedding_stores = embedding_stores
         self.index_names = index_names
+        # filter_by_id is not supported, so searches are never filtered
+        self.query_filter = None
 
     def load_documents(
         self, documents: list[VectorStoreDocument], overwrite: bool = True
@@ -51,36 +61,109 @@ class MultiVectorStore(BaseVectorStore):
         msg = "filter_by_id method not implemented"
         raise NotImplementedError(msg)
 
-    def search_by_id(self, id: str) -> VectorStoreDocument:
-        """Search for a document by id."""
-        search_index_id = id.split("-")[0]
-        search_index_name = id.split("-")[1]
+    def _get_store(self, id: str) -> tuple[BaseVectorStore, str]:
+        """Get the store of an index-suffixed document id and the id within that store."""
+        search_index_id, _, search_index_name = id.rpartition("-")
         for index_name, embedding_store in zip(
             self.index_names, self.embedding_stores, strict=False
         ):
             if index_name == search_index_name:
-                return embedding_store.search_by_id(search_index_id)
-        else:
-            message = f"Index {search_index_name} not found."
-            raise ValueError(message)
+                return embedding_store, search_index_id
+        message = f"Index {search_index_name} not found."
+        raise ValueError(message)
+
+    def search_by_id(self, id: str) -> VectorStoreDocument:
+        """Search for a document by id."""
+        embedding_store, search_index_id = self._get_store(id)
+        return embedding_store.search_by_id(search_index_id)
+
+    def search_by_ids(self, ids: list[str]) -> list[VectorStoreDocument]:
+        """Search for several documents by id, with one batch per index."""
+        batches: dict[str, tuple[BaseVectorStore, list[int], list[str]]] = {}
+        for position, document_id in enumerate(ids):
+            embedding_store, search_index_id = self._get_store(document_id)
+            _, positions, store_ids = batches.setdefault(
+                document_id.rpartition("-")[2], (embedding_store, [], [])
+            )
+            positions.append(position)
+            store_ids.append(search_index_id)
+        documents: list[VectorStoreDocument | None] = [None] * len(ids)
+        for embedding_store, positions, store_ids in batches.values():
+            for position, document in zip(
+                positions, embedding_store.search_by_ids(store_ids), strict=True
+            ):
+                documents[position] = document
+        return documents  # type: ignore
+
+    def _search_all(self, search: Any) -> list[Any]:
+        """Run a search against every store concurrently, returning the results in store order."""
+        if len(self.embedding_stores) == 1:
+            return [search(self.embedding_stores[0])]
+        with ThreadPoolExecutor(max_workers=len(self.embedding_stores)) as executor:
+            return list(executor.map(search, self.embedding_stores))
 
     def similarity_search_by_vector(
         self, query_embedding: list[float], k: int = 10, **kwargs: Any
     ) -> list[VectorStoreSearchResult]:
         """Perform a vector-based similarity search."""
-        all_results = []
-        for index_name, embedding_store in zip(
-            self.index_names, self.embedding_stores, strict=False
-        ):
-            results = embedding_store.similarity_search_by_vector(
-                query_embedding=query_embedding, k=k
+        batches = self._search_all(
+            lambda embedding_store: [
+                embedding_store.similarity_search_by_vector(
+                    query_embedding=query_embedding, k=k
+                )
+            ]
+        )
+        return self._merge_batches(batches, 1, k)[0]
+
+    def _merge_batches(
+        self,
+        batches: list[list[list[VectorStoreSearchResult]]],
+        num_queries: int,
+        k: int,
+    ) -> list[list[VectorStoreSearchResult]]:
+        """Merge the per-index result lists of a batched search, query by query."""
+        all_results: list[list[VectorStoreSearchResult]] = [
+            [] for _ in range(num_queries)
+        ]
+        for index_name, batch in zip(self.index_names, batches, strict=False):
+            for query_results, results in zip(all_results, batch, strict=True):
+                # results may share their documents with the store, so the ids are suffixed on copies
+                query_results += [
+                    replace(
+                        r,
+                        document=replace(
+                            r.document, id=f"{r.document.id}-{index_name}"
+                        ),
+                    )
+                    for r in results
+                ]
+        return [
+            sorted(results, key=lambda x: x.score, reverse=True)[:k]
+            for results in all_results
+        ]
+
+    def similarity_search_by_vectors(
+        self, query_embeddings: list[list[float]], k: int = 10, **kwargs: Any
+    ) -> list[list[VectorStoreSearchResult]]:
+        """Perform a batched vector-based similarity search across all indexes."""
+        batches = self._search_all(
+            lambda embedding_store: embedding_store.similarity_search_by_vectors(
+                query_embeddings=query_embeddings, k=k
+            )
+        )
+        return self._merge_batches(batches, len(query_embeddings), k)
+
+    async def asimilarity_search_by_vectors(
+        self, query_embeddings: list[list[float]], k: int = 10, **kwargs: Any
+    ) -> list[list[VectorStoreSearchResult]]:
+        """Perform a batched vector-based similarity search across all indexes concurrently."""
+        batches = await asyncio.gather(*[
+            embedding_store.asimilarity_search_by_vectors(
+                query_embeddings=query_embeddings, k=k
             )
-            mod_results = []
-            for r in results:
-                r.document.id = str(r.document.id) + f"-{index_name}"
-                mod_results += [r]
-            all_results += mod_results
-        return sorted(all_results, key=lambda x: x.score, reverse=True)[:k]
+            for embedding_store in self.embedding_stores
+        ])
+        return self._merge_batches(list(batches), len(query_embeddings), k)
 
     def similarity_search_by_text(
         self, text: str, text_embedder: TextEmbedder, k: int = 10, **kwargs: Any
@@ -3,35 +3,163 @@
 
 """Storage functions for the GraphRAG run module."""
 
+import asyncio
 import logging
-from io import BytesIO
+from collections import deque
+from collections.abc import AsyncIterable, AsyncIterator
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 from graphrag.storage.pipeline_storage import PipelineStorage
 
 logger = logging.getLogger(__name__)
 
+BATCH_SIZE = 65_536
+"""The number of rows of the batches read by `stream_table_from_storage`."""
 
-async def load_table_from_storage(name: str, storage: PipelineStorage) -> pd.DataFrame:
-    """Load a parquet from the storage instance."""
+
+async def load_table_from_storage(
+    name: str,
+    storage: PipelineStorage,
+    columns: list[str] | None = None,
+    row_groups: list[int] | None = None,
+) -> pd.DataFrame:
+    """Load a parquet from the storage instance.
+
+    If `columns` is given, only those of them that the table has are read. If
+    `row_groups` is given, only those row groups are read. Storages that can
+    read parts of a file only fetch these columns and row groups.
+    """
     filename = f"{name}.parquet"
     if not await storage.has(filename):
         msg = f"Could not find {filename} in storage!"
         raise ValueError(msg)
     try:
         logger.info("reading table from storage: %s", filename)
-        return pd.read_parquet(BytesIO(await storage.get(filename, as_bytes=True)))
+        async with storage.open_input(filename) as source:
+            return await asyncio.to_thread(_read_table, source, columns, row_groups)
     except Exception:
         logger.exception("error loading table from storage: %s", filename)
         raise
 
 
+def _read_table(
+    source: pa.NativeFile, columns: list[str] | None, row_groups: list[int] | None
+) -> pd.DataFrame:
+    parquet_file = pq.ParquetFile(source)
+    columns = _existing_columns(parquet_file, columns)
+    if row_groups is None:
+        table = parquet_file.read(columns=columns, use_pandas_metadata=True)
+    else:
+        table = parquet_file.read_row_groups(
+            row_groups, columns=columns, use_pandas_metadata=True
+        )
+    return table.to_pandas()
+
+
+def _existing_columns(
+    parquet_file: pq.ParquetFile, columns: list[str] | None
+) -> list[str] | None:
+    if columns is None:
+        return None
+    names = set(parquet_file.schema_arrow.names)
+    return [column for column in columns if column in names]
+
+
+async def load_table_metadata(name: str, storage: PipelineStorage) -> pq.FileMetaData:
+    """Load the parquet metadata of a table, such as its schema and row groups, without reading its rows."""
+    async with storage.open_input(f"{name}.parquet") as source:
+        return await asyncio.to_thread(lambda: pq.ParquetFile(source).metadata)
+
+
+async def stream_table_from_storage(
+    name: str,
+    storage: PipelineStorage,
+    columns: list[str] | None = None,
+    batch_size: int = BATCH_SIZE,
+) -> AsyncIterator[pd.DataFrame]:
+    """Read a table as record batches of up to `batch_size` rows, so that it is never held in memory as a whole.
+
+    If `columns` is given, only those of them that the table has are read.
+    The batches have a default index, starting at 0 for each.
+    """
+    async with storage.open_input(f"{name}.parquet") as source:
+        parquet_file = pq.ParquetFile(source)
+        batches = parquet_file.iter_batches(
+            batch_size=batch_size,
+            columns=_existing_columns(parquet_file, columns),
+            use_pandas_metadata=False,
+        )
+        while (batch := await asyncio.to_thread(next, batches, None)) is not None:
+            yield batch.to_pandas()
+
+
 async def write_table_to_storage(
     table: pd.DataFrame, name: str, storage: PipelineStorage
 ) -> None:
     """Write a table to storage."""
-    await storage.set(f"{name}.parquet", table.to_parquet())
+    async with storage.open_output(f"{name}.parquet") as sink:
+        await asyncio.to_thread(table.to_parquet, sink)
+
+
+async def write_arrow_table_to_storage(
+    table: pa.Table, name: str, storage: PipelineStorage
+) -> None:
+    """Write an Arrow table to storage, as `write_table_to_storage` writes the DataFrame it was converted from."""
+    async with storage.open_output(f"{name}.parquet") as sink:
+        await asyncio.to_thread(pq.write_table, table, sink)
+
+
+async def write_table_batches_to_storage(
+    batches: AsyncIterable[pd.DataFrame], name: str, storage: PipelineStorage
+) -> int:
+    """Write a table that arrives in batches to storage, one row group per batch, returning its number of rows.
+
+    Each batch is converted to Arrow as it arrives, so the table is never held
+    as DataFrames, nor as one concatenated DataFrame. Batches may have
+    different columns: they are written with the union of their columns,
+    types promoted to fit every batch, so they are held as Arrow until the
+    last one arrives. The row groups are then streamed to storage.
+    """
+    tables: deque[pa.Table] = deque()
+    async for batch in batches:
+        tables.append(
+            pa.Table.from_pandas(batch, preserve_index=False).replace_schema_metadata()
+        )
+    if not tables:
+        msg = f"No rows to write to {name}.parquet."
+        raise ValueError(msg)
+
+    schema = pa.unify_schemas(
+        [table.schema for table in tables], promote_options="permissive"
+    )
+
+    def write(sink: pa.NativeFile) -> int:
+        num_rows = 0
+        with pq.ParquetWriter(sink, schema) as writer:
+            while tables:
+                table = tables.popleft()
+                writer.write_table(_conform_table(table, schema))
+                num_rows += table.num_rows
+        return num_rows
+
+    async with storage.open_output(f"{name}.parquet") as sink:
+        return await asyncio.to_thread(write, sink)
+
+
+def _conform_table(table: pa.Table, schema: pa.Schema) -> pa.Table:
+    """Cast a table to a schema, with null columns for the fields it lacks."""
+    return pa.Table.from_arrays(
+        [
+            table.column(field.name).cast(field.type)
+            if field.name in table.column_names
+            else pa.nulls(table.num_rows, field.type)
+            for field in schema
+        ],
+        schema=schema,
+    )
 
 
 async def delete_table_from_storage(name: str, storage: PipelineStorage) -> None:
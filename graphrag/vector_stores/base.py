@@ -3,12 +3,23 @@
 
 """Base classes for vector stores."""
 
+from __future__ import annotations
+
+import asyncio
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from graphrag.config.models.vector_store_schema_config import (
+        VectorStoreSchemaConfig,
+    )
+    from graphrag.data_model.types import TextEmbedder
+    from graphrag.language_model.protocol.base import EmbeddingModel
 
-from graphrag.config.models.vector_store_schema_config import VectorStoreSchemaConfig
-from graphrag.data_model.types import TextEmbedder
+# maximum number of single-query searches run at once by the batched fallback
+DEFAULT_SEARCH_CONCURRENCY = 8
 
 
 @dataclass
@@ -69,12 +80,65 @@ class BaseVectorStore(ABC):
     ) -> None:
         """Load documents into the vector-store."""
 
+    def finalize_load(self) -> None:
+        """Finish a load made of several `load_documents` batches.
+
+        Stores that defer work such as index builds until all data is present
+        override this; by default it does nothing.
+        """
+        return
+
     @abstractmethod
     def similarity_search_by_vector(
         self, query_embedding: list[float], k: int = 10, **kwargs: Any
     ) -> list[VectorStoreSearchResult]:
         """Perform ANN search by vector."""
 
+    def similarity_search_by_vectors(
+        self, query_embeddings: list[list[float]], k: int = 10, **kwargs: Any
+    ) -> list[list[VectorStoreSearchResult]]:
+        """Perform ANN search for several query vectors, one result list per query.
+
+        The default implementation fans `similarity_search_by_vector` out over a
+        thread pool; stores with a native multi-query search override it.
+        """
+        if len(query_embeddings) == 0:
+            return []
+        if len(query_embeddings) == 1:
+            return [self.similarity_search_by_vector(query_embeddings[0], k, **kwargs)]
+        with ThreadPoolExecutor(
+            max_workers=min(len(query_embeddings), DEFAULT_SEARCH_CONCURRENCY)
+        ) as executor:
+            return list(
+                executor.map(
+                    lambda embedding: self.similarity_search_by_vector(
+                        embedding, k, **kwargs
+                    ),
+                    query_embeddings,
+                )
+            )
+
+    async def asimilarity_search_by_vectors(
+        self, query_embeddings: list[list[float]], k: int = 10, **kwargs: Any
+    ) -> list[list[VectorStoreSearchResult]]:
+        """Perform a batched ANN search without blocking the event loop."""
+        return await asyncio.to_thread(
+            self.similarity_search_by_vectors, query_embeddings, k, **kwargs
+        )
+
+    async def asimilarity_search_by_texts(
+        self,
+        texts: list[str],
+        text_embedder: EmbeddingModel,
+        k: int = 10,
+        **kwargs: Any,
+    ) -> list[list[VectorStoreSearchResult]]:
+        """Embed several texts in one batch and search for all of them at once."""
+        if len(texts) == 0:
+            return []
+        query_embeddings = await text_embedder.aembed_batch(texts)
+        return await self.asimilarity_search_by_vectors(query_embeddings, k, **kwargs)
+
     @abstractmethod
     def similarity_search_by_text(
         self, text: str, text_embedder: TextEmbedder, k: int = 10, **kwargs: Any
@@ -88,3 +152,10 @@ class BaseVectorStore(ABC):
     @abstractmethod
     def search_by_id(self, id: str) -> VectorStoreDocument:
         """Search for a document by id."""
+
+    def search_by_ids(self, ids: list[str]) -> list[VectorStoreDocument]:
+        """Search for several documents by id, in the order of `ids`.
+
+        Stores that can fetch many ids in a single query override this.
+        """
+        return [self.search_by_id(id) for id in ids]
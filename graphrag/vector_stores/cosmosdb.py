@@ -4,8 +4,10 @@
 """A package containing the CosmosDB vector store implementation."""
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
+import numpy as np
 from azure.cosmos import ContainerProxy, CosmosClient, DatabaseProxy
 from azure.cosmos.exceptions import CosmosHttpResponseError
 from azure.cosmos.partition_key import PartitionKey
@@ -14,6 +16,7 @@ from azure.identity import DefaultAzureCredential
 from graphrag.config.models.vector_store_schema_config import VectorStoreSchemaConfig
 from graphrag.data_model.types import TextEmbedder
 from graphrag.vector_stores.base import (
+    DEFAULT_SEARCH_CONCURRENCY,
     BaseVectorStore,
     VectorStoreDocument,
     VectorStoreSearchResult,
@@ -178,55 +181,56 @@ class CosmosDBVectorStore(BaseVectorStore):
                 print(doc_json)  # noqa: T201
                 self._container_client.upsert_item(doc_json)
 
-    def similarity_search_by_vector(
-        self, query_embedding: list[float], k: int = 10, **kwargs: Any
-    ) -> list[VectorStoreSearchResult]:
-        """Perform a vector-based similarity search."""
-        if self._container_client is None:
-            msg = "Container client is not initialized."
-            raise ValueError(msg)
-
-        try:
-            query = f"SELECT TOP {k} c.{self.id_field}, c.{self.text_field}, c.{self.vector_field}, c.{self.attributes_field}, VectorDistance(c.{self.vector_field}, @embedding) AS SimilarityScore FROM c ORDER BY VectorDistance(c.{self.vector_field}, @embedding)"  # noqa: S608
-            query_params = [{"name": "@embedding", "value": query_embedding}]
-            items = list(
-                self._container_client.query_items(
-                    query=query,
-                    parameters=query_params,
-                    enable_cross_partition_query=True,
-                )
+    def _vector_distance_items(
+        self, query_embedding: list[float], k: int
+    ) -> list[dict[str, Any]]:
+        """Rank items server-side with the VectorDistance function."""
+        query = f"SELECT TOP {k} c.{self.id_field}, c.{self.text_field}, c.{self.vector_field}, c.{self.attributes_field}, VectorDistance(c.{self.vector_field}, @embedding) AS SimilarityScore FROM c ORDER BY VectorDistance(c.{self.vector_field}, @embedding)"  # noqa: S608
+        query_params = [{"name": "@embedding", "value": query_embedding}]
+        return list(
+            self._container_client.query_items(
+                query=query,
+                parameters=query_params,
+                enable_cross_partition_query=True,
             )
-        except (CosmosHttpResponseError, ValueError):
-            # Currently, the CosmosDB emulator does not support the VectorDistance function.
-            # For emulator or test environments - fetch all items and calculate distance locally
-            query = f"SELECT c.{self.id_field}, c.{self.text_field}, c.{self.vector_field}, c.{self.attributes_field} FROM c"  # noqa: S608
-            items = list(
-                self._container_client.query_items(
-                    query=query,
-                    enable_cross_partition_query=True,
-                )
-            )
-
-            # Calculate cosine similarity locally (1 - cosine distance)
-            from numpy import dot
-            from numpy.linalg import norm
-
-            def cosine_similarity(a, b):
-                if norm(a) * norm(b) == 0:
-                    return 0.0
-                return dot(a, b) / (norm(a) * norm(b))
-
-            # Calculate scores for all items
-            for item in items:
-                item_vector = item.get(self.vector_field, [])
-                similarity = cosine_similarity(query_embedding, item_vector)
-                item["SimilarityScore"] = similarity
+        )
 
-            # Sort by similarity score (higher is better) and take top k
-            items = sorted(
-                items, key=lambda x: x.get("SimilarityScore", 0.0), reverse=True
-            )[:k]
+    def _local_ranked_items(
+        self, query_embeddings: list[list[float]], k: int
+    ) -> list[list[dict[str, Any]]]:
+        """Fetch all items once and rank them locally by cosine similarity for every query."""
+        query = f"SELECT c.{self.id_field}, c.{self.text_field}, c.{self.vector_field}, c.{self.attributes_field} FROM c"  # noqa: S608
+        items = list(
+            self._container_client.query_items(
+                query=query,
+                enable_cross_partition_query=True,
+            )
+        )
+        if len(items) == 0:
+            return [[] for _ in query_embeddings]
 
+        vectors = np.array(
+            [item.get(self.vector_field, []) for item in items], dtype=np.float64
+        )
+        queries = np.array(query_embeddings, dtype=np.float64)
+        norms = np.outer(
+            np.linalg.norm(queries, axis=1), np.linalg.norm(vectors, axis=1)
+        )
+        dots = queries @ vectors.T
+        scores = np.divide(dots, norms, out=np.zeros_like(dots), where=norms != 0)
+
+        ranked = []
+        for query_scores in scores:
+            # stable sort keeps insertion order between equal scores
+            top = np.argsort(-query_scores, kind="stable")[:k]
+            ranked.append([
+                {**items[i], "SimilarityScore": float(query_scores[i])} for i in top
+            ])
+        return ranked
+
+    def _to_search_results(
+        self, items: list[dict[str, Any]]
+    ) -> list[VectorStoreSearchResult]:
         return [
             VectorStoreSearchResult(
                 document=VectorStoreDocument(
@@ -240,6 +244,47 @@ class CosmosDBVectorStore(BaseVectorStore):
             for item in items
         ]
 
+    def similarity_search_by_vector(
+        self, query_embedding: list[float], k: int = 10, **kwargs: Any
+    ) -> list[VectorStoreSearchResult]:
+        """Perform a vector-based similarity search."""
+        if self._container_client is None:
+            msg = "Container client is not initialized."
+            raise ValueError(msg)
+
+        try:
+            items = self._vector_distance_items(query_embedding, k)
+        except (CosmosHttpResponseError, ValueError):
+            # Currently, the CosmosDB emulator does not support the VectorDistance function.
+            # For emulator or test environments - fetch all items and calculate distance locally
+            items = self._local_ranked_items([query_embedding], k)[0]
+        return self._to_search_results(items)
+
+    def similarity_search_by_vectors(
+        self, query_embeddings: list[list[float]], k: int = 10, **kwargs: Any
+    ) -> list[list[VectorStoreSearchResult]]:
+        """Perform a vector-based similarity search for many queries."""
+        if self._container_client is None:
+            msg = "Container client is not initialized."
+            raise ValueError(msg)
+        if len(query_embeddings) == 0:
+            return []
+
+        try:
+            with ThreadPoolExecutor(
+                max_workers=min(len(query_embeddings), DEFAULT_SEARCH_CONCURRENCY)
+            ) as executor:
+                batches = list(
+                    executor.map(
+                        lambda embedding: self._vector_distance_items(embedding, k),
+                        query_embeddings,
+                    )
+                )
+        except (CosmosHttpResponseError, ValueError):
+            # without VectorDistance, scan the container once for the whole batch
+            batches = self._local_ranked_items(query_embeddings, k)
+        return [self._to_search_results(items) for items in batches]
+
     def similarity_search_by_text(
         self, text: str, text_embedder: TextEmbedder, k: int = 10, **kwargs: Any
     ) -> list[VectorStoreSearchResult]:
@@ -11,6 +11,7 @@ from graphrag.config.enums import VectorStoreType
 from graphrag.vector_stores.azure_ai_search import AzureAISearchVectorStore
 from graphrag.vector_stores.cosmosdb import CosmosDBVectorStore
 from graphrag.vector_stores.lancedb import LanceDBVectorStore
+from graphrag.vector_stores.memmap import MemmapVectorStore
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -94,6 +95,7 @@ VectorStoreFactory.register(
     VectorStoreType.AzureAISearch.value, AzureAISearchVectorStore
 )
 VectorStoreFactory.register(VectorStoreType.CosmosDB.value, CosmosDBVectorStore)
+VectorStoreFactory.register(VectorStoreType.Memmap.value, MemmapVectorStore)
 from graphrag.vector_stores.postgres import PostgresVectorStore
 
 VectorStoreFactory.register("postgres", PostgresVectorStore)
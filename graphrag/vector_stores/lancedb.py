@@ -3,23 +3,42 @@
 
 """The LanceDB vector storage implementation package."""
 
-import json  # noqa: I001
+import json
+from collections.abc import Sequence
 from typing import Any
-import pyarrow as pa
+
+import lancedb
 import numpy as np
+import pyarrow as pa
+
 from graphrag.config.models.vector_store_schema_config import VectorStoreSchemaConfig
 from graphrag.data_model.types import TextEmbedder
-
 from graphrag.vector_stores.base import (
     BaseVectorStore,
     VectorStoreDocument,
     VectorStoreSearchResult,
 )
-import lancedb
+
+DISTANCE_COLUMN = "_distance"
+QUERY_INDEX_COLUMN = "query_index"
+
+
+def _sql_literal(value: str | int) -> str:
+    """Render an id as a SQL literal for a LanceDB filter."""
+    if isinstance(value, str):
+        escaped = value.replace("'", "''")
+        return f"'{escaped}'"
+    return str(value)
 
 
 class LanceDBVectorStore(BaseVectorStore):
-    """LanceDB vector storage implementation."""
+    """LanceDB vector storage implementation.
+
+    Attributes are stored as a JSON string column, so documents added later may
+    carry new keys or differently typed values. Searches run on Arrow tables,
+    projecting only the columns that are needed: result vectors are skipped
+    unless `include_vectors=True` is passed.
+    """
 
     def __init__(
         self, vector_store_schema_config: VectorStoreSchemaConfig, **kwargs: Any
@@ -55,6 +74,11 @@ class LanceDBVectorStore(BaseVectorStore):
                 vectors.append(np.array(document.vector, dtype=np.float32))
                 attributes.append(json.dumps(document.attributes))
 
+        if not overwrite:
+            self.document_collection = self.db_connection.open_table(
+                self.index_name if self.index_name else ""
+            )
+
         # Step 2: Handle empty case
         if len(ids) == 0:
             data = None
@@ -65,7 +89,6 @@ class LanceDBVectorStore(BaseVectorStore):
             vector_column = pa.FixedSizeListArray.from_arrays(
                 flat_array, self.vector_size
             )
-
             # Step 4: Create PyArrow table (let schema be inferred)
             data = pa.table({
                 self.id_field: pa.array(ids, type=pa.string()),
@@ -92,85 +115,145 @@ class LanceDBVectorStore(BaseVectorStore):
             self.document_collection.create_index(
                 vector_column_name=self.vector_field, index_type="IVF_FLAT"
             )
-        else:
+        elif data:
             # add data to existing table
-            self.document_collection = self.db_connection.open_table(
-                self.index_name if self.index_name else ""
-            )
-            if data:
-                self.document_collection.add(data)
+            self.document_collection.add(data)
 
     def filter_by_id(self, include_ids: list[str] | list[int]) -> Any:
         """Build a query filter to filter documents by id."""
         if len(include_ids) == 0:
             self.query_filter = None
         else:
-            if isinstance(include_ids[0], str):
-                id_filter = ", ".join([f"'{id}'" for id in include_ids])
-                self.query_filter = f"{self.id_field} in ({id_filter})"
-            else:
-                self.query_filter = (
-                    f"{self.id_field} in ({', '.join([str(id) for id in include_ids])})"
-                )
+            id_filter = ", ".join([_sql_literal(id) for id in include_ids])
+            self.query_filter = f"{self.id_field} in ({id_filter})"
         return self.query_filter
 
-    def similarity_search_by_vector(
-        self, query_embedding: list[float] | np.ndarray, k: int = 10, **kwargs: Any
-    ) -> list[VectorStoreSearchResult]:
-        """Perform a vector-based similarity search."""
-        if self.query_filter:
-            docs = (
-                self.document_collection.search(
-                    query=query_embedding, vector_column_name=self.vector_field
-                )
-                .where(self.query_filter, prefilter=True)
-                .limit(k)
-                .to_list()
-            )
-        else:
-            query_embedding = np.array(query_embedding, dtype=np.float32)
+    def _columns(self, include_vectors: bool) -> list[str]:
+        columns = [self.id_field, self.text_field, self.attributes_field]
+        if include_vectors:
+            columns.append(self.vector_field)
+        return columns
 
-            docs = (
-                self.document_collection.search(
-                    query=query_embedding, vector_column_name=self.vector_field
-                )
-                .limit(k)
-                .to_list()
+    def _decode_attributes(self, column: pa.ChunkedArray) -> list[dict[str, Any]]:
+        return [json.loads(value) if value else {} for value in column.to_pylist()]
+
+    def _to_documents(self, table: pa.Table) -> list[VectorStoreDocument]:
+        """Convert an Arrow result table column by column into documents."""
+        ids = table.column(self.id_field).to_pylist()
+        texts = table.column(self.text_field).to_pylist()
+        attributes = self._decode_attributes(table.column(self.attributes_field))
+        if self.vector_field in table.column_names:
+            vectors = table.column(self.vector_field).to_pylist()
+        else:
+            vectors = [None] * table.num_rows
+        return [
+            VectorStoreDocument(id=id, text=text, vector=vector, attributes=attrs)
+            for id, text, vector, attrs in zip(
+                ids, texts, vectors, attributes, strict=True
             )
+        ]
+
+    def similarity_search_arrow(
+        self,
+        query_embeddings: Sequence[list[float] | np.ndarray] | np.ndarray,
+        k: int = 10,
+        include_vectors: bool = False,
+    ) -> pa.Table:
+        """Search for one or more query vectors and return the raw Arrow result table.
+
+        The table holds the id, text and attributes columns (plus the vector column
+        when `include_vectors` is set), the `_distance` column and, for several
+        queries, a `query_index` column pointing back into `query_embeddings`.
+        """
+        queries = [np.asarray(q, dtype=np.float32) for q in query_embeddings]
+        query = self.document_collection.search(
+            query=queries[0] if len(queries) == 1 else queries,
+            vector_column_name=self.vector_field,
+        )
+        if self.query_filter:
+            query = query.where(self.query_filter, prefilter=True)
+        return query.select(self._columns(include_vectors)).limit(k).to_arrow()
+
+    def _to_search_results(self, table: pa.Table) -> list[VectorStoreSearchResult]:
+        distances = np.abs(table.column(DISTANCE_COLUMN).to_numpy())
         return [
-            VectorStoreSearchResult(
-                document=VectorStoreDocument(
-                    id=doc[self.id_field],
-                    text=doc[self.text_field],
-                    vector=doc[self.vector_field],
-                    attributes=json.loads(doc[self.attributes_field]),
-                ),
-                score=1 - abs(float(doc["_distance"])),
+            VectorStoreSearchResult(document=document, score=1 - float(distance))
+            for document, distance in zip(
+                self._to_documents(table), distances, strict=True
             )
-            for doc in docs
         ]
 
+    def similarity_search_by_vector(
+        self,
+        query_embedding: list[float] | np.ndarray,
+        k: int = 10,
+        include_vectors: bool = False,
+        **kwargs: Any,
+    ) -> list[VectorStoreSearchResult]:
+        """Perform a vector-based similarity search."""
+        table = self.similarity_search_arrow([query_embedding], k, include_vectors)
+        return self._to_search_results(table)
+
+    def similarity_search_by_vectors(
+        self,
+        query_embeddings: list[list[float]] | np.ndarray,
+        k: int = 10,
+        include_vectors: bool = False,
+        **kwargs: Any,
+    ) -> list[list[VectorStoreSearchResult]]:
+        """Perform a vector-based similarity search for many queries in one scan."""
+        if len(query_embeddings) == 0:
+            return []
+        if len(query_embeddings) == 1:
+            # lancedb only adds the query_index column for multi-vector queries
+            return [
+                self.similarity_search_by_vector(
+                    query_embeddings[0], k, include_vectors
+                )
+            ]
+
+        table = self.similarity_search_arrow(query_embeddings, k, include_vectors)
+        table = table.sort_by([
+            (QUERY_INDEX_COLUMN, "ascending"),
+            (DISTANCE_COLUMN, "ascending"),
+        ])
+        results: list[list[VectorStoreSearchResult]] = [[] for _ in query_embeddings]
+        query_indexes = table.column(QUERY_INDEX_COLUMN).to_numpy()
+        for query_index, result in zip(
+            query_indexes, self._to_search_results(table), strict=True
+        ):
+            results[query_index].append(result)
+        return results
+
     def similarity_search_by_text(
         self, text: str, text_embedder: TextEmbedder, k: int = 10, **kwargs: Any
     ) -> list[VectorStoreSearchResult]:
         """Perform a similarity search using a given input text."""
         query_embedding = text_embedder(text)
         if query_embedding:
-            return self.similarity_search_by_vector(query_embedding, k)
+            return self.similarity_search_by_vector(query_embedding, k, **kwargs)
         return []
 
     def search_by_id(self, id: str) -> VectorStoreDocument:
         """Search for a document by id."""
-        doc = (
+        return self.search_by_ids([id])[0]
+
+    def search_by_ids(
+        self, ids: list[str], include_vectors: bool = True
+    ) -> list[VectorStoreDocument]:
+        """Search for several documents by id with a single `IN` query."""
+        if len(ids) == 0:
+            return []
+        id_filter = ", ".join([_sql_literal(id) for id in set(ids)])
+        table = (
             self.document_collection.search()
-            .where(f"{self.id_field} == '{id}'", prefilter=True)
-            .to_list()
+            .where(f"{self.id_field} IN ({id_filter})", prefilter=True)
+            .select(self._columns(include_vectors))
+            .limit(None)
+            .to_arrow()
         )
-        if doc:
-            return VectorStoreDocument(
-                id=doc[0][self.id_field],
-                text=doc[0][self.text_field],
-                vector=doc[0][self.vector_field],
-                attributes=json.loads(doc[0][self.attributes_field]),
-            )
-        return VectorStoreDocument(id=id, text=None, vector=None)
+        found = {document.id: document for document in self._to_documents(table)}
+        return [
+            found.get(id, VectorStoreDocument(id=id, text=None, vector=None))
+            for id in ids
+        ]
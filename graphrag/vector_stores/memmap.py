@@ -0,0 +1,430 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""The memory-mapped NumPy vector storage implementation package."""
+
+import json
+import logging
+import shutil
+from functools import cached_property
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pyarrow as pa
+
+from graphrag.config.defaults import vector_store_defaults
+from graphrag.config.models.vector_store_schema_config import VectorStoreSchemaConfig
+from graphrag.data_model.types import TextEmbedder
+from graphrag.vector_stores.base import (
+    BaseVectorStore,
+    VectorStoreDocument,
+    VectorStoreSearchResult,
+)
+
+logger = logging.getLogger(__name__)
+
+# number of rows scored per block when assigning rows to IVF lists
+_ASSIGN_BLOCK_SIZE = 65_536
+_KMEANS_ITERATIONS = 10
+_KMEANS_SAMPLES_PER_LIST = 256
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.where(norms == 0, 1, norms)
+
+
+def _save(path: Path, array: np.ndarray) -> None:
+    """Write an .npy file atomically so readers never map a partial file."""
+    tmp_path = path.with_suffix(".tmp")
+    with tmp_path.open("wb") as file:
+        np.save(file, array)
+    tmp_path.replace(path)
+
+
+def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Return the positions of the k highest scores, best first."""
+    if k <= 0 or len(scores) == 0:
+        return np.empty(0, dtype=np.int64)
+    if len(scores) > k:
+        candidates = np.argpartition(-scores, k - 1)[:k]
+    else:
+        candidates = np.arange(len(scores))
+    return candidates[np.argsort(-scores[candidates], kind="stable")]
+
+
+class _IVFIndex:
+    """Inverted file lists over a segment: rows grouped by nearest centroid."""
+
+    def __init__(self, centroids: np.ndarray, offsets: np.ndarray, rows: np.ndarray):
+        self.centroids = centroids
+        self.offsets = offsets
+        self.rows = rows
+
+    @classmethod
+    def train(cls, vectors: np.ndarray, num_lists: int, seed: int = 42) -> "_IVFIndex":
+        """Train a spherical k-means coarse quantizer and assign every row."""
+        rng = np.random.default_rng(seed)
+        num_rows = len(vectors)
+        num_lists = max(1, min(num_lists, num_rows))
+        sample_size = min(num_rows, num_lists * _KMEANS_SAMPLES_PER_LIST)
+        sample_rows = np.sort(rng.choice(num_rows, size=sample_size, replace=False))
+        sample = _normalize(np.asarray(vectors[sample_rows], dtype=np.float32))
+        centroids = sample[rng.choice(sample_size, size=num_lists, replace=False)]
+
+        for _ in range(_KMEANS_ITERATIONS):
+            assignments = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assignments, sample)
+            counts = np.bincount(assignments, minlength=num_lists)
+            # keep the previous centroid for lists that lost all their members
+            sums[counts == 0] = centroids[counts == 0]
+            centroids = _normalize(sums)
+
+        assignments = np.empty(num_rows, dtype=np.int32)
+        for start in range(0, num_rows, _ASSIGN_BLOCK_SIZE):
+            block = vectors[start : start + _ASSIGN_BLOCK_SIZE]
+            assignments[start : start + len(block)] = np.argmax(
+                block @ centroids.T, axis=1
+            )
+        rows = np.argsort(assignments, kind="stable")
+        offsets = np.searchsorted(assignments[rows], np.arange(num_lists + 1))
+        return cls(centroids.astype(np.float32), offsets, rows)
+
+    def candidates(self, query: np.ndarray, probes: int) -> np.ndarray:
+        """Return the rows stored in the lists closest to the query."""
+        probed = _top_k(self.centroids @ query, probes)
+        return np.concatenate([
+            self.rows[self.offsets[list_id] : self.offsets[list_id + 1]]
+            for list_id in probed
+        ])
+
+
+class _Segment:
+    """A memory-mapped block of vectors with its id/text/attribute sidecar."""
+
+    def __init__(self, path: Path, name: str):
+        self.name = name
+        self.vectors: np.ndarray = np.load(path / f"{name}.vectors.npy", mmap_mode="r")
+        self.norms: np.ndarray = np.load(path / f"{name}.norms.npy", mmap_mode="r")
+        with pa.memory_map(str(path / f"{name}.documents.arrow")) as source:
+            self.documents: pa.Table = pa.ipc.open_file(source).read_all()
+        self.ivf: _IVFIndex | None = None
+        if (path / f"{name}.ivf_centroids.npy").exists():
+            self.ivf = _IVFIndex(
+                np.load(path / f"{name}.ivf_centroids.npy", mmap_mode="r"),
+                np.load(path / f"{name}.ivf_offsets.npy", mmap_mode="r"),
+                np.load(path / f"{name}.ivf_rows.npy", mmap_mode="r"),
+            )
+
+    def __len__(self) -> int:
+        return len(self.vectors)
+
+    @cached_property
+    def ids(self) -> list[str]:
+        return self.documents.column(0).to_pylist()
+
+
+class MemmapVectorStore(BaseVectorStore):
+    """In-process vector storage backed by memory-mapped NumPy matrices.
+
+    Each index is a directory of segments, one per `load_documents` call: a float32
+    `.npy` vector matrix, its row norms and an Arrow IPC sidecar with ids, texts and
+    JSON attributes. `finalize_load` compacts the segments into one and, when
+    `ivf_lists` is set, trains an IVF coarse quantizer over it. Searches are exact
+    matrix products with an `argpartition` top-k, restricted to the probed IVF lists
+    when an index is present. All files are opened with `mmap_mode="r"`, so query
+    processes share the same pages instead of copying the index.
+    """
+
+    def __init__(
+        self, vector_store_schema_config: VectorStoreSchemaConfig, **kwargs: Any
+    ) -> None:
+        super().__init__(
+            vector_store_schema_config=vector_store_schema_config, **kwargs
+        )
+        self._segments: list[_Segment] = []
+        self._id_lookup: dict[str, tuple[int, int]] | None = None
+        self._filter_rows: list[np.ndarray] | None = None
+
+    def connect(self, **kwargs: Any) -> Any:
+        """Connect to the vector storage."""
+        self.db_connection = Path(kwargs["db_uri"])
+        self.document_collection = self.db_connection / (self.index_name or "")
+        self.ivf_lists = int(kwargs.get("ivf_lists") or vector_store_defaults.ivf_lists)
+        self.ivf_probes = int(
+            kwargs.get("ivf_probes") or vector_store_defaults.ivf_probes
+        )
+        self._open()
+
+    def _open(self) -> None:
+        """Memory-map every committed segment of the index."""
+        self._segments = []
+        self._reset_lookups()
+        if not self.document_collection.exists():
+            return
+        names = sorted(
+            path.name.removesuffix(".documents.arrow")
+            for path in self.document_collection.glob("*.documents.arrow")
+        )
+        self._segments = [_Segment(self.document_collection, name) for name in names]
+        if self._segments:
+            self.vector_size = self._segments[0].vectors.shape[1]
+
+    def _reset_lookups(self) -> None:
+        self._id_lookup = None
+        self._filter_rows = None
+
+    def _next_segment_name(self) -> str:
+        last = int(self._segments[-1].name) if self._segments else -1
+        return f"{last + 1:06d}"
+
+    def _write_segment(
+        self,
+        vectors: np.ndarray,
+        ids: list[str],
+        texts: list[str | None],
+        attributes: list[str],
+    ) -> _Segment:
+        """Write a segment; the Arrow sidecar is written last and marks it committed."""
+        path = self.document_collection
+        name = self._next_segment_name()
+        _save(path / f"{name}.vectors.npy", vectors)
+        _save(
+            path / f"{name}.norms.npy",
+            np.linalg.norm(vectors, axis=1).astype(np.float32),
+        )
+        self._write_documents(
+            path / f"{name}.documents.arrow",
+            pa.table({
+                self.id_field: pa.array(ids, type=pa.string()),
+                self.text_field: pa.array(texts, type=pa.string()),
+                self.attributes_field: pa.array(attributes, type=pa.string()),
+            }),
+        )
+        return _Segment(path, name)
+
+    @staticmethod
+    def _write_documents(path: Path, table: pa.Table) -> None:
+        tmp_path = path.with_suffix(".tmp")
+        with (
+            pa.OSFile(str(tmp_path), "wb") as sink,
+            pa.ipc.new_file(sink, table.schema) as writer,
+        ):
+            writer.write_table(table)
+        tmp_path.replace(path)
+
+    def _remove_segment(self, segment: _Segment) -> None:
+        for path in self.document_collection.glob(f"{segment.name}.*"):
+            path.unlink()
+
+    def load_documents(
+        self, documents: list[VectorStoreDocument], overwrite: bool = True
+    ) -> None:
+        """Load documents into vector storage."""
+        if overwrite:
+            shutil.rmtree(self.document_collection, ignore_errors=True)
+            self._segments = []
+        self.document_collection.mkdir(parents=True, exist_ok=True)
+        self._reset_lookups()
+
+        for document in documents:
+            if document.vector is not None:
+                self.vector_size = len(document.vector)
+                break
+        loaded = [
+            document
+            for document in documents
+            if document.vector is not None and len(document.vector) == self.vector_size
+        ]
+        if not loaded:
+            return
+
+        vectors = np.asarray([doc.vector for doc in loaded], dtype=np.float32)
+        self._segments.append(
+            self._write_segment(
+                vectors,
+                [str(doc.id) for doc in loaded],
+                [doc.text for doc in loaded],
+                [json.dumps(doc.attributes) for doc in loaded],
+            )
+        )
+
+    def finalize_load(self) -> None:
+        """Compact the loaded segments into one and build the IVF index."""
+        if not self._segments:
+            return
+        if len(self._segments) > 1:
+            self._compact()
+        segment = self._segments[0]
+        if self.ivf_lists and segment.ivf is None:
+            ivf = _IVFIndex.train(segment.vectors, self.ivf_lists)
+            path = self.document_collection
+            # the centroids file marks the index as complete, so it goes last
+            _save(path / f"{segment.name}.ivf_rows.npy", ivf.rows)
+            _save(path / f"{segment.name}.ivf_offsets.npy", ivf.offsets)
+            _save(path / f"{segment.name}.ivf_centroids.npy", ivf.centroids)
+            segment.ivf = ivf
+            logger.info(
+                "built IVF index with %d lists over %d rows for %s",
+                len(ivf.centroids),
+                len(segment),
+                self.index_name,
+            )
+
+    def _compact(self) -> None:
+        """Merge all segments into a single memory-mapped matrix."""
+        old_segments = self._segments
+        num_rows = sum(len(segment) for segment in old_segments)
+        name = self._next_segment_name()
+        vectors = np.lib.format.open_memmap(
+            self.document_collection / f"{name}.vectors.npy",
+            mode="w+",
+            dtype=np.float32,
+            shape=(num_rows, self.vector_size),
+        )
+        start = 0
+        for segment in old_segments:
+            vectors[start : start + len(segment)] = segment.vectors
+            start += len(segment)
+        vectors.flush()
+        del vectors
+        _save(
+            self.document_collection / f"{name}.norms.npy",
+            np.concatenate([segment.norms for segment in old_segments]),
+        )
+        self._write_documents(
+            self.document_collection / f"{name}.documents.arrow",
+            pa.concat_tables([segment.documents for segment in old_segments]),
+        )
+        for segment in old_segments:
+            self._remove_segment(segment)
+        self._segments = [_Segment(self.document_collection, name)]
+        self._reset_lookups()
+
+    def _lookup(self) -> dict[str, tuple[int, int]]:
+        """Map every id to its (segment, row) position."""
+        if self._id_lookup is None:
+            self._id_lookup = {
+                id: (segment_index, row)
+                for segment_index, segment in enumerate(self._segments)
+                for row, id in enumerate(segment.ids)
+            }
+        return self._id_lookup
+
+    def filter_by_id(self, include_ids: list[str] | list[int]) -> Any:
+        """Build a query filter to filter documents by id."""
+        self._filter_rows = None
+        if include_ids is None or len(include_ids) == 0:
+            self.query_filter = None
+        else:
+            self.query_filter = [str(id) for id in include_ids]
+        return self.query_filter
+
+    def _filter_masks(self) -> list[np.ndarray]:
+        """Return, per segment, the rows allowed by the current id filter."""
+        if self._filter_rows is None:
+            lookup = self._lookup()
+            masks = [np.zeros(len(segment), dtype=bool) for segment in self._segments]
+            for id in self.query_filter or []:
+                position = lookup.get(id)
+                if position is not None:
+                    masks[position[0]][position[1]] = True
+            self._filter_rows = [np.flatnonzero(mask) for mask in masks]
+        return self._filter_rows
+
+    def _search(
+        self, queries: np.ndarray, k: int
+    ) -> list[list[VectorStoreSearchResult]]:
+        """Score normalized queries against every segment and merge the top k."""
+        hits: list[list[tuple[float, int, int]]] = [[] for _ in queries]
+        for segment_index, segment in enumerate(self._segments):
+            norms = np.where(segment.norms == 0, 1, segment.norms)
+            if self.query_filter or segment.ivf is None:
+                # the same rows are scored for every query: one matrix product
+                rows = (
+                    self._filter_masks()[segment_index] if self.query_filter else None
+                )
+                vectors = segment.vectors if rows is None else segment.vectors[rows]
+                if rows is not None:
+                    norms = norms[rows]
+                scores = (queries @ vectors.T) / norms
+                per_query = [(rows, query_scores) for query_scores in scores]
+            else:
+                per_query = []
+                for query in queries:
+                    rows = segment.ivf.candidates(query, self.ivf_probes)
+                    per_query.append((
+                        rows,
+                        (segment.vectors[rows] @ query) / norms[rows],
+                    ))
+            for query_index, (rows, scores) in enumerate(per_query):
+                for position in _top_k(scores, k):
+                    row = int(position if rows is None else rows[position])
+                    hits[query_index].append((
+                        float(scores[position]),
+                        segment_index,
+                        row,
+                    ))
+        return [
+            [
+                self._to_result(segment_index, row, score)
+                for score, segment_index, row in sorted(
+                    query_hits, key=lambda hit: hit[0], reverse=True
+                )[:k]
+            ]
+            for query_hits in hits
+        ]
+
+    def _to_document(self, segment_index: int, row: int) -> VectorStoreDocument:
+        segment = self._segments[segment_index]
+        return VectorStoreDocument(
+            id=segment.ids[row],
+            text=segment.documents.column(1)[row].as_py(),
+            vector=segment.vectors[row].tolist(),
+            attributes=json.loads(segment.documents.column(2)[row].as_py() or "{}"),
+        )
+
+    def _to_result(
+        self, segment_index: int, row: int, score: float
+    ) -> VectorStoreSearchResult:
+        return VectorStoreSearchResult(
+            document=self._to_document(segment_index, row), score=score
+        )
+
+    def similarity_search_by_vector(
+        self, query_embedding: list[float] | np.ndarray, k: int = 10, **kwargs: Any
+    ) -> list[VectorStoreSearchResult]:
+        """Perform a vector-based similarity search."""
+        return self.similarity_search_by_vectors(
+            np.asarray([query_embedding], dtype=np.float32), k
+        )[0]
+
+    def similarity_search_by_vectors(
+        self,
+        query_embeddings: list[list[float]] | np.ndarray,
+        k: int = 10,
+        **kwargs: Any,
+    ) -> list[list[VectorStoreSearchResult]]:
+        """Perform a vector-based similarity search for many queries at once."""
+        if len(query_embeddings) == 0:
+            return []
+        queries = _normalize(np.asarray(query_embeddings, dtype=np.float32))
+        return self._search(queries, k)
+
+    def similarity_search_by_text(
+        self, text: str, text_embedder: TextEmbedder, k: int = 10, **kwargs: Any
+    ) -> list[VectorStoreSearchResult]:
+        """Perform a similarity search using a given input text."""
+        query_embedding = text_embedder(text)
+        if query_embedding:
+            return self.similarity_search_by_vector(query_embedding, k)
+        return []
+
+    def search_by_id(self, id: str) -> VectorStoreDocument:
+        """Search for a document by id."""
+        position = self._lookup().get(str(id))
+        if position is None:
+            return VectorStoreDocument(id=id, text=None, vector=None)
+        return self._to_document(*position)
@@ -1,13 +1,18 @@
 # Copyright (c) 2024 Microsoft Corporation.
 # Licensed under the MIT License
 
-"""Postgres vector storage implementation."""
+"""Postgres (pgvector) vector storage implementation."""
 
+import asyncio
 import json
+import logging
 import os
-from typing import Any
+import time
+from enum import Enum
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
+
 from graphrag.config.models.vector_store_schema_config import VectorStoreSchemaConfig
 from graphrag.data_model.types import TextEmbedder
 from graphrag.vector_stores.base import (
@@ -16,9 +21,52 @@ from graphrag.vector_stores.base import (
     VectorStoreSearchResult,
 )
 
+if TYPE_CHECKING:
+    from psycopg import sql
+    from psycopg_pool import AsyncConnectionPool, ConnectionPool
+
+logger = logging.getLogger(__name__)
+
+
+class PostgresIndexType(str, Enum):
+    """The approximate nearest neighbor index types supported by pgvector."""
+
+    HNSW = "hnsw"
+    IVFFlat = "ivfflat"
+    NoIndex = "none"
+
+
+# pgvector defaults, see https://github.com/pgvector/pgvector#index-options
+DEFAULT_HNSW_M = 16
+DEFAULT_HNSW_EF_CONSTRUCTION = 64
+DEFAULT_HNSW_EF_SEARCH = 40
+DEFAULT_IVFFLAT_PROBES = 1
+DEFAULT_POOL_MIN_SIZE = 1
+DEFAULT_POOL_MAX_SIZE = 10
+
+
+def _setting(kwargs: dict[str, Any], name: str, default: Any = None) -> Any:
+    """Resolve a setting from the store kwargs, falling back to a DB_* env var."""
+    value = kwargs.get(name)
+    if value is None:
+        value = os.getenv(f"DB_{name.upper()}")
+    return default if value is None else value
+
+
+def _to_vector_literal(vector: list[float] | np.ndarray) -> str:
+    """Format a vector using the pgvector text representation."""
+    values = np.asarray(vector, dtype=np.float32).tolist()
+    return "[" + ",".join(str(value) for value in values) + "]"
+
 
 class PostgresVectorStore(BaseVectorStore):
-    """Postgres vector storage implementation."""
+    """Postgres vector storage implementation.
+
+    Connections are drawn from a pool so concurrent searches no longer share a
+    single cursor. Documents are bulk loaded with COPY, after which the vector
+    column is indexed with HNSW (default) or IVFFlat; the index search
+    parameters are applied per transaction.
+    """
 
     def __init__(
         self, vector_store_schema_config: VectorStoreSchemaConfig, **kwargs: Any
@@ -26,104 +74,444 @@ class PostgresVectorStore(BaseVectorStore):
         super().__init__(
             vector_store_schema_config=vector_store_schema_config, **kwargs
         )
-        self.db_connection = None
-        self.cursor = None
+        self.db_connection: ConnectionPool | None = None
+        self._async_pool: AsyncConnectionPool | None = None
+        self._async_pool_lock = asyncio.Lock()
+        self._loaded_rows = 0
+        self._load_seconds = 0.0
+        self._configure(kwargs)
+
+    def _configure(self, kwargs: dict[str, Any]) -> None:
+        """Read the pool and index settings."""
+        self._pool_min_size = int(
+            _setting(kwargs, "pool_min_size", DEFAULT_POOL_MIN_SIZE)
+        )
+        self._pool_max_size = int(
+            _setting(kwargs, "pool_max_size", DEFAULT_POOL_MAX_SIZE)
+        )
+        self.index_type = PostgresIndexType(
+            str(_setting(kwargs, "index_type", PostgresIndexType.HNSW.value)).lower()
+        )
+        self.hnsw_m = int(_setting(kwargs, "hnsw_m", DEFAULT_HNSW_M))
+        self.hnsw_ef_construction = int(
+            _setting(kwargs, "hnsw_ef_construction", DEFAULT_HNSW_EF_CONSTRUCTION)
+        )
+        self.hnsw_ef_search = int(
+            _setting(kwargs, "hnsw_ef_search", DEFAULT_HNSW_EF_SEARCH)
+        )
+        ivfflat_lists = _setting(kwargs, "ivfflat_lists")
+        self.ivfflat_lists = int(ivfflat_lists) if ivfflat_lists else None
+        self.ivfflat_probes = int(
+            _setting(kwargs, "ivfflat_probes", DEFAULT_IVFFLAT_PROBES)
+        )
+        self.maintenance_work_mem = _setting(kwargs, "maintenance_work_mem")
 
     def connect(self, **kwargs: Any) -> Any:
         """Connect to the vector storage."""
-        import psycopg2
+        from psycopg_pool import ConnectionPool
+
+        kwargs = {**self.kwargs, **kwargs}
+        self._configure(kwargs)
+        self._conninfo = self._build_conninfo(kwargs)
+        self.db_connection = ConnectionPool(
+            self._conninfo,
+            min_size=self._pool_min_size,
+            max_size=self._pool_max_size,
+            open=True,
+        )
+        with self.db_connection.connection() as conn:
+            conn.execute("CREATE EXTENSION IF NOT EXISTS vector")
+
+    @staticmethod
+    def _build_conninfo(kwargs: dict[str, Any]) -> str:
+        """Build a libpq connection string from the store url or DB_* env vars."""
+        from psycopg.conninfo import make_conninfo
 
-        self.db_connection = psycopg2.connect(
+        url = kwargs.get("url") or os.getenv("DB_URL")
+        if url:
+            return url
+        return make_conninfo(
             dbname=os.getenv("DB_NAME", "agno_play"),
             user=os.getenv("DB_USER", "ai"),
             password=os.getenv("DB_PASSWORD", "ai"),
             host=os.getenv("DB_HOST", "localhost"),
             port=os.getenv("DB_PORT", "5433"),
         )
-        self.cursor = self.db_connection.cursor()
-        # Enable vector extension
-        self.cursor.execute("CREATE EXTENSION IF NOT EXISTS vector;")
-        self.db_connection.commit()
+
+    def close(self) -> None:
+        """Close the connection pools."""
+        if self.db_connection is not None:
+            self.db_connection.close()
+            self.db_connection = None
+
+    async def aclose(self) -> None:
+        """Close the connection pools, including the async pool."""
+        if self._async_pool is not None:
+            await self._async_pool.close()
+            self._async_pool = None
+        self.close()
+
+    def _get_pool(self) -> "ConnectionPool":
+        if self.db_connection is None:
+            msg = "Vector store is not connected. Call connect() first."
+            raise ValueError(msg)
+        return self.db_connection
+
+    async def _aget_pool(self) -> "AsyncConnectionPool":
+        if self._async_pool is not None:
+            return self._async_pool
+        # concurrent first searches must not each open a pool
+        async with self._async_pool_lock:
+            if self._async_pool is None:
+                from psycopg_pool import AsyncConnectionPool
+
+                self._get_pool()
+                pool: AsyncConnectionPool = AsyncConnectionPool(
+                    self._conninfo,
+                    min_size=self._pool_min_size,
+                    max_size=self._pool_max_size,
+                    open=False,
+                )
+                await pool.open()
+                self._async_pool = pool
+            return self._async_pool
+
+    def _table(self) -> "sql.Identifier":
+        from psycopg import sql
+
+        return sql.Identifier(self.index_name or "")
+
+    def _index_statement(self, row_count: int) -> "sql.Composed | None":
+        """Build the CREATE INDEX statement for the configured index type."""
+        from psycopg import sql
+
+        if self.index_type == PostgresIndexType.NoIndex:
+            return None
+
+        index_name = sql.Identifier(
+            f"{self.index_name}_{self.vector_field}_{self.index_type.value}_idx"
+        )
+        if self.index_type == PostgresIndexType.HNSW:
+            options = sql.SQL("m = {}, ef_construction = {}").format(
+                sql.Literal(self.hnsw_m), sql.Literal(self.hnsw_ef_construction)
+            )
+        else:
+            # pgvector recommends rows / 1000 lists for up to 1M rows
+            lists = self.ivfflat_lists or max(1, row_count // 1000)
+            options = sql.SQL("lists = {}").format(sql.Literal(lists))
+
+        return sql.SQL(
+            "CREATE INDEX IF NOT EXISTS {index} ON {table} "
+            "USING {method} ({vector} vector_cosine_ops) WITH ({options})"
+        ).format(
+            index=index_name,
+            table=self._table(),
+            method=sql.SQL(self.index_type.value),
+            vector=sql.Identifier(self.vector_field),
+            options=options,
+        )
+
+    def _search_settings(self, k: int) -> list["sql.Composed"]:
+        """Build the SET LOCAL statements that tune the index scan for a query."""
+        from psycopg import sql
+
+        if self.index_type == PostgresIndexType.HNSW:
+            # HNSW can return at most ef_search rows per scan
+            return [
+                sql.SQL("SET LOCAL hnsw.ef_search = {}").format(
+                    sql.Literal(max(self.hnsw_ef_search, k))
+                )
+            ]
+        if self.index_type == PostgresIndexType.IVFFlat:
+            return [
+                sql.SQL("SET LOCAL ivfflat.probes = {}").format(
+                    sql.Literal(self.ivfflat_probes)
+                )
+            ]
+        return []
+
+    def _source(self) -> tuple["sql.Composable", "sql.Composable"]:
+        """Return the (CTE prefix, relation) pair to search over.
+
+        When an id filter is active the candidates are materialized first so the
+        filter is applied before ranking instead of after an ANN scan.
+        """
+        from psycopg import sql
+
+        if not self.query_filter:
+            return sql.SQL(""), self._table()
+        return (
+            sql.SQL(
+                "WITH candidates AS MATERIALIZED "
+                "(SELECT * FROM {table} WHERE {id} = ANY(%(ids)s)) "
+            ).format(table=self._table(), id=sql.Identifier(self.id_field)),
+            sql.Identifier("candidates"),
+        )
+
+    def _search_statement(self) -> "sql.Composed":
+        from psycopg import sql
+
+        prefix, source = self._source()
+        return sql.SQL(
+            "{prefix}SELECT {id}, {text}, {attributes}, "
+            "{vector} <=> %(embedding)s::vector AS distance "
+            "FROM {source} ORDER BY distance LIMIT %(k)s"
+        ).format(
+            prefix=prefix,
+            id=sql.Identifier(self.id_field),
+            text=sql.Identifier(self.text_field),
+            attributes=sql.Identifier(self.attributes_field),
+            vector=sql.Identifier(self.vector_field),
+            source=source,
+        )
+
+    def _batch_search_statement(self) -> "sql.Composed":
+        from psycopg import sql
+
+        prefix, source = self._source()
+        return sql.SQL(
+            "{prefix}SELECT q.ord, d.* "
+            "FROM unnest(%(embeddings)s::text[]) WITH ORDINALITY AS q(embedding, ord) "
+            "CROSS JOIN LATERAL ("
+            "SELECT {id}, {text}, {attributes}, "
+            "{vector} <=> q.embedding::vector AS distance "
+            "FROM {source} ORDER BY distance LIMIT %(k)s"
+            ") AS d ORDER BY q.ord, d.distance"
+        ).format(
+            prefix=prefix,
+            id=sql.Identifier(self.id_field),
+            text=sql.Identifier(self.text_field),
+            attributes=sql.Identifier(self.attributes_field),
+            vector=sql.Identifier(self.vector_field),
+            source=source,
+        )
+
+    def _search_params(self, k: int, **params: Any) -> dict[str, Any]:
+        params["k"] = k
+        if self.query_filter:
+            params["ids"] = [str(id) for id in self.query_filter]
+        return params
+
+    @staticmethod
+    def _to_search_result(
+        id: str, text: str | None, attributes: Any, distance: float
+    ) -> VectorStoreSearchResult:
+        return VectorStoreSearchResult(
+            document=VectorStoreDocument(
+                id=id,
+                text=text,
+                vector=None,  # Optimization: don't return vector
+                attributes=attributes
+                if isinstance(attributes, dict)
+                else json.loads(attributes or "{}"),
+            ),
+            score=1 - float(distance),
+        )
+
+    def _group_batch_results(
+        self, rows: list[tuple], num_queries: int
+    ) -> list[list[VectorStoreSearchResult]]:
+        results: list[list[VectorStoreSearchResult]] = [[] for _ in range(num_queries)]
+        for query_index, id, text, attributes, distance in rows:
+            results[query_index - 1].append(
+                self._to_search_result(id, text, attributes, distance)
+            )
+        return results
 
     def load_documents(
         self, documents: list[VectorStoreDocument], overwrite: bool = True
     ) -> None:
-        """Load documents into vector storage."""
-        if not documents:
+        """Load documents into vector storage.
+
+        Rows are streamed with a binary COPY into a temporary staging table and
+        merged into the target table with one set-based upsert. The ANN index is
+        not touched here; it is built once by `finalize_load` after the last batch.
+        """
+        from psycopg import sql
+
+        vector_size = next(
+            (len(doc.vector) for doc in documents if doc.vector is not None), None
+        )
+        if vector_size is None:
             return
+        self.vector_size = vector_size
 
-        table_name = self.index_name
-        # Assuming vector size is consistent
-        dim = len(documents[0].vector) if documents[0].vector else 1536
-
-        # Drop table if overwrite
-        if overwrite:
-            self.cursor.execute(f"DROP TABLE IF EXISTS {table_name}")
-
-        # Create table
-        self.cursor.execute(f"""
-            CREATE TABLE IF NOT EXISTS {table_name} (
-                id TEXT PRIMARY KEY,
-                text TEXT,
-                attributes JSONB,
-                vector vector({dim})
+        table = self._table()
+        staging = sql.Identifier(f"{self.index_name}_staging")
+        fields = {
+            "id": sql.Identifier(self.id_field),
+            "text": sql.Identifier(self.text_field),
+            "attributes": sql.Identifier(self.attributes_field),
+            "vector": sql.Identifier(self.vector_field),
+        }
+        start_time = time.perf_counter()
+        rows = 0
+        with self._get_pool().connection() as conn, conn.cursor() as cursor:
+            if overwrite:
+                cursor.execute(
+                    sql.SQL("DROP TABLE IF EXISTS {table}").format(table=table)
+                )
+            cursor.execute(
+                sql.SQL(
+                    "CREATE TABLE IF NOT EXISTS {table} ("
+                    "{id} TEXT PRIMARY KEY, {text} TEXT, {attributes} JSONB, "
+                    "{vector} vector({dim}))"
+                ).format(table=table, dim=sql.Literal(self.vector_size), **fields)
+            )
+            cursor.execute(
+                sql.SQL(
+                    "CREATE TEMP TABLE {staging} "
+                    "(id TEXT, text TEXT, attributes JSONB, vector REAL[]) "
+                    "ON COMMIT DROP"
+                ).format(staging=staging)
+            )
+            with cursor.copy(
+                sql.SQL(
+                    "COPY {staging} (id, text, attributes, vector) "
+                    "FROM STDIN (FORMAT BINARY)"
+                ).format(staging=staging)
+            ) as copy:
+                copy.set_types(["text", "text", "jsonb", "float4[]"])
+                for doc in documents:
+                    if doc.vector is None:
+                        continue
+                    values = (
+                        doc.vector.tolist()
+                        if isinstance(doc.vector, np.ndarray)
+                        else doc.vector
+                    )
+                    copy.write_row((str(doc.id), doc.text, doc.attributes, values))
+                    rows += 1
+            cursor.execute(
+                sql.SQL(
+                    "INSERT INTO {table} ({id}, {text}, {attributes}, {vector}) "
+                    "SELECT DISTINCT ON (id) id, text, attributes, vector::vector "
+                    "FROM {staging} ORDER BY id "
+                    "ON CONFLICT ({id}) DO UPDATE SET "
+                    "{text} = EXCLUDED.{text}, "
+                    "{attributes} = EXCLUDED.{attributes}, "
+                    "{vector} = EXCLUDED.{vector}"
+                ).format(table=table, staging=staging, **fields)
             )
-        """)
-
-        # Upsert
-        from psycopg2.extras import execute_values
-
-        data = []
-        for doc in documents:
-            if doc.vector:
-                data.append((doc.id, doc.text, json.dumps(doc.attributes), doc.vector))
-
-        insert_query = f"""
-            INSERT INTO {table_name} (id, text, attributes, vector)
-            VALUES %s
-            ON CONFLICT (id) DO UPDATE SET
-                text = EXCLUDED.text,
-                attributes = EXCLUDED.attributes,
-                vector = EXCLUDED.vector
-        """
-        execute_values(self.cursor, insert_query, data)
-        self.db_connection.commit()
+
+        elapsed = time.perf_counter() - start_time
+        self._loaded_rows += rows
+        self._load_seconds += elapsed
+        logger.info(
+            "loaded %d rows into %s in %.2fs (%.0f rows/s)",
+            rows,
+            self.index_name,
+            elapsed,
+            rows / elapsed if elapsed > 0 else rows,
+        )
+
+    def finalize_load(self) -> None:
+        """Build the ANN index once all batches have been loaded."""
+        from psycopg import sql
+
+        if self._loaded_rows:
+            logger.info(
+                "loaded %d rows into %s at %.0f rows/s",
+                self._loaded_rows,
+                self.index_name,
+                self._loaded_rows / self._load_seconds
+                if self._load_seconds > 0
+                else self._loaded_rows,
+            )
+        self._loaded_rows = 0
+        self._load_seconds = 0.0
+
+        table = self._table()
+        with self._get_pool().connection() as conn, conn.cursor() as cursor:
+            cursor.execute(sql.SQL("SELECT count(*) FROM {table}").format(table=table))
+            row = cursor.fetchone()
+            index_statement = self._index_statement(row[0] if row else 0)
+            if index_statement is None:
+                return
+            if self.maintenance_work_mem:
+                cursor.execute(
+                    sql.SQL("SET LOCAL maintenance_work_mem = {}").format(
+                        sql.Literal(self.maintenance_work_mem)
+                    )
+                )
+            start_time = time.perf_counter()
+            cursor.execute(index_statement)
+        logger.info(
+            "built %s index on %s in %.2fs",
+            self.index_type.value,
+            self.index_name,
+            time.perf_counter() - start_time,
+        )
 
     def filter_by_id(self, include_ids: list[str] | list[int]) -> Any:
         """Build a query filter to filter documents by id."""
-        return include_ids
+        if include_ids is None or len(include_ids) == 0:
+            self.query_filter = None
+        else:
+            self.query_filter = list(include_ids)
+        return self.query_filter
 
     def similarity_search_by_vector(
         self, query_embedding: list[float] | np.ndarray, k: int = 10, **kwargs: Any
     ) -> list[VectorStoreSearchResult]:
         """Perform a vector-based similarity search."""
-        table_name = self.index_name
-        self.cursor.execute(
-            f"""
-            SELECT id, text, attributes, vector <=> %s::vector as distance 
-            FROM {table_name} 
-            ORDER BY distance ASC 
-            LIMIT %s
-        """,
-            (query_embedding, k),
-        )
-
-        results = []
-        for id, text, attributes, distance in self.cursor.fetchall():
-            results.append(
-                VectorStoreSearchResult(
-                    document=VectorStoreDocument(
-                        id=id,
-                        text=text,
-                        vector=None,  # Optimization: don't return vector
-                        attributes=attributes
-                        if isinstance(attributes, dict)
-                        else json.loads(attributes),
-                    ),
-                    score=1 - distance,
-                )
-            )
-        return results
+        params = self._search_params(k, embedding=_to_vector_literal(query_embedding))
+        with self._get_pool().connection() as conn, conn.cursor() as cursor:
+            for statement in self._search_settings(k):
+                cursor.execute(statement)
+            cursor.execute(self._search_statement(), params)
+            rows = cursor.fetchall()
+        return [self._to_search_result(*row) for row in rows]
+
+    def similarity_search_by_vectors(
+        self,
+        query_embeddings: list[list[float]] | np.ndarray,
+        k: int = 10,
+        **kwargs: Any,
+    ) -> list[list[VectorStoreSearchResult]]:
+        """Perform a vector-based similarity search for many queries in one round trip."""
+        embeddings = [_to_vector_literal(embedding) for embedding in query_embeddings]
+        if not embeddings:
+            return []
+        params = self._search_params(k, embeddings=embeddings)
+        with self._get_pool().connection() as conn, conn.cursor() as cursor:
+            for statement in self._search_settings(k):
+                cursor.execute(statement)
+            cursor.execute(self._batch_search_statement(), params)
+            rows = cursor.fetchall()
+        return self._group_batch_results(rows, len(embeddings))
+
+    async def asimilarity_search_by_vector(
+        self, query_embedding: list[float] | np.ndarray, k: int = 10
+    ) -> list[VectorStoreSearchResult]:
+        """Perform a vector-based similarity search without blocking the event loop."""
+        params = self._search_params(k, embedding=_to_vector_literal(query_embedding))
+        pool = await self._aget_pool()
+        async with pool.connection() as conn, conn.cursor() as cursor:
+            for statement in self._search_settings(k):
+                await cursor.execute(statement)
+            await cursor.execute(self._search_statement(), params)
+            rows = await cursor.fetchall()
+        return [self._to_search_result(*row) for row in rows]
+
+    async def asimilarity_search_by_vectors(
+        self,
+        query_embeddings: list[list[float]] | np.ndarray,
+        k: int = 10,
+        **kwargs: Any,
+    ) -> list[list[VectorStoreSearchResult]]:
+        """Perform a batched vector-based similarity search without blocking the event loop."""
+        embeddings = [_to_vector_literal(embedding) for embedding in query_embeddings]
+        if not embeddings:
+            return []
+        params = self._search_params(k, embeddings=embeddings)
+        pool = await self._aget_pool()
+        async with pool.connection() as conn, conn.cursor() as cursor:
+            for statement in self._search_settings(k):
+                await cursor.execute(statement)
+            await cursor.execute(self._batch_search_statement(), params)
+            rows = await cursor.fetchall()
+        return self._group_batch_results(rows, len(embeddings))
 
     def similarity_search_by_text(
         self, text: str, text_embedder: TextEmbedder, k: int = 10, **kwargs: Any
@@ -136,16 +524,25 @@ class PostgresVectorStore(BaseVectorStore):
 
     def search_by_id(self, id: str) -> VectorStoreDocument:
         """Search for a document by id."""
-        table_name = self.index_name
-        self.cursor.execute(
-            f"SELECT id, text, attributes FROM {table_name} WHERE id = %s", (id,)
+        from psycopg import sql
+
+        statement = sql.SQL(
+            "SELECT {id}, {text}, {attributes}, {vector}::real[] "
+            "FROM {table} WHERE {id} = %s"
+        ).format(
+            id=sql.Identifier(self.id_field),
+            text=sql.Identifier(self.text_field),
+            attributes=sql.Identifier(self.attributes_field),
+            vector=sql.Identifier(self.vector_field),
+            table=self._table(),
         )
-        row = self.cursor.fetchone()
+        with self._get_pool().connection() as conn:
+            row = conn.execute(statement, (str(id),)).fetchone()
         if row:
             return VectorStoreDocument(
                 id=row[0],
                 text=row[1],
-                vector=None,
+                vector=row[3],
                 attributes=row[2] if isinstance(row[2], dict) else json.loads(row[2]),
             )
         return VectorStoreDocument(id=id, text=None, vector=None)
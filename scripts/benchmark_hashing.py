@@ -0,0 +1,80 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+# ruff: noqa: INP001, T201
+
+"""Benchmark hashing table rows in batches against the row-wise apply it replaced.
+
+Hashes synthetic documents and text unit chunks both ways, reporting wall time
+and checking that both produce the same ids.
+
+    python scripts/benchmark_hashing.py --rows 200000 --text-length 4000
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+
+import numpy as np
+import pandas as pd
+
+from graphrag.index.utils.hashing import gen_sha512_hash, gen_sha512_hashes
+
+
+def _tables(rows: int, text_length: int) -> dict[str, tuple[pd.DataFrame, list[str]]]:
+    rng = np.random.default_rng(0)
+    words = np.array(["graph", "entity", "community", "report", "text", "unit"])
+    texts = [
+        " ".join(rng.choice(words, text_length // 6)) + f" {i}" for i in range(rows)
+    ]
+    documents = pd.DataFrame({
+        "text": texts,
+        "title": [f"document {i}.txt" for i in range(rows)],
+        "creation_date": "2024-01-01 00:00:00 +0000",
+    })
+    chunks = pd.DataFrame({
+        "document_ids": [f"d{i // 10}" for i in range(rows)],
+        "chunk": [
+            ([f"d{i // 10}"], text, len(text) // 4) for i, text in enumerate(texts)
+        ],
+    })
+    return {
+        "documents": (documents, list(documents.columns)),
+        "text units": (chunks, ["chunk"]),
+    }
+
+
+def _time(hash_table: Callable[[], list[str]]) -> tuple[list[str], float]:
+    start = time.perf_counter()
+    hashes = hash_table()
+    return hashes, time.perf_counter() - start
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--text-length", type=int, default=1_200)
+    parser.add_argument("--threads", type=int)
+    args = parser.parse_args()
+
+    for name, (table, hashcode) in _tables(args.rows, args.text_length).items():
+        row_wise, row_wise_elapsed = _time(
+            lambda table=table, hashcode=hashcode: table.apply(
+                lambda row: gen_sha512_hash(row, hashcode), axis=1
+            ).tolist()
+        )
+        batched, batched_elapsed = _time(
+            lambda table=table, hashcode=hashcode: gen_sha512_hashes(
+                table, hashcode, num_threads=args.threads
+            )
+        )
+        if batched != row_wise:
+            msg = f"Batched hashes of {name} differ from row-wise hashes"
+            raise AssertionError(msg)
+        print(
+            f"{name:>10}: {len(table)} rows, row-wise {row_wise_elapsed:.2f}s, batched {batched_elapsed:.2f}s, ids identical"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+# ruff: noqa: INP001, S404, T201
+
+"""Benchmark loading relationships for query against the record-based loader it replaced.
+
+Writes a synthetic relationships table and loads it into data model objects
+once per mode, each in a fresh process, reporting wall time and peak RSS.
+
+    python scripts/benchmark_query_loaders.py --rows 1000000
+"""
+
+import argparse
+import asyncio
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from graphrag.data_model.relationship import Relationship
+from graphrag.query.indexer_adapters import (
+    QUERY_TABLE_COLUMNS,
+    read_indexer_relationships,
+)
+from graphrag.storage.file_pipeline_storage import FilePipelineStorage
+from graphrag.utils.storage import load_table_from_storage
+
+
+def _write_relationships(path: Path, rows: int) -> None:
+    rng = np.random.default_rng(0)
+    ids = np.arange(rows)
+    pd.DataFrame({
+        "id": [f"r{i}" for i in ids],
+        "human_readable_id": ids,
+        "source": [f"entity {i}" for i in rng.integers(0, rows // 4 + 1, rows)],
+        "target": [f"entity {i}" for i in rng.integers(0, rows // 4 + 1, rows)],
+        "description": [f"relationship {i} between two entities" for i in ids],
+        "weight": rng.random(rows),
+        "combined_degree": rng.integers(1, 100, rows),
+        "text_unit_ids": [np.array([f"t{i % 1000}"]) for i in ids],
+        # written by the index but never read by queries
+        "source_degree": rng.integers(1, 50, rows),
+        "target_degree": rng.integers(1, 50, rows),
+    }).to_parquet(path / "relationships.parquet")
+
+
+def _load_records(path: Path) -> list[Relationship]:
+    """Load relationships the way the query readers did before they were columnar."""
+    df = pd.read_parquet(path / "relationships.parquet")
+    df = df.reset_index(drop=True).assign(Index=df.index)
+    relationships = []
+    for row in df.to_dict("records"):
+        text_unit_ids = row.get("text_unit_ids")
+        if isinstance(text_unit_ids, np.ndarray):
+            text_unit_ids = text_unit_ids.tolist()
+        relationships.append(
+            Relationship(
+                id=str(row.get("id")),
+                short_id=str(row.get("human_readable_id")),
+                source=str(row.get("source")),
+                target=str(row.get("target")),
+                description=str(row.get("description")),
+                weight=float(row.get("weight")),  # type: ignore
+                text_unit_ids=text_unit_ids,
+                rank=int(row.get("combined_degree")),  # type: ignore
+            )
+        )
+    return relationships
+
+
+def _load_columnar(path: Path) -> list[Relationship]:
+    df = asyncio.run(
+        load_table_from_storage(
+            "relationships",
+            FilePipelineStorage(base_dir=str(path)),
+            columns=QUERY_TABLE_COLUMNS["relationships"],
+        )
+    )
+    return read_indexer_relationships(df)
+
+
+def _run(mode: str, path: Path) -> None:
+    load = _load_records if mode == "records" else _load_columnar
+    start = time.perf_counter()
+    relationships = load(path)
+    elapsed = time.perf_counter() - start
+    # ru_maxrss is in kilobytes on Linux
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(
+        f"{mode:>9}: {len(relationships)} relationships in {elapsed:.2f}s, peak RSS {peak_mb:.0f} MB"
+    )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=500_000)
+    parser.add_argument("--mode", choices=["records", "columnar"])
+    parser.add_argument("--path", type=Path)
+    args = parser.parse_args()
+
+    if args.mode:
+        _run(args.mode, args.path)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        _write_relationships(Path(tmp), args.rows)
+        for mode in ["records", "columnar"]:
+            subprocess.run(  # noqa: S603
+                [sys.executable, __file__, "--mode", mode, "--path", tmp],
+                check=True,
+            )
+
+
+if __name__ == "__main__":
+    main()
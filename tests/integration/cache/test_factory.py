@@ -14,6 +14,7 @@ from graphrag.cache.json_pipeline_cache import JsonPipelineCache
 from graphrag.cache.memory_pipeline_cache import InMemoryCache
 from graphrag.cache.noop_pipeline_cache import NoopPipelineCache
 from graphrag.cache.pipeline_cache import PipelineCache
+from graphrag.cache.sharded_pipeline_cache import ShardedPipelineCache
 from graphrag.config.enums import CacheType
 
 # cspell:disable-next-line well-known-key
@@ -40,6 +41,13 @@ def test_create_file_cache():
     assert isinstance(cache, JsonPipelineCache)
 
 
+def test_create_sharded_cache(tmp_path):
+    kwargs = {"root_dir": str(tmp_path), "base_dir": "testcache", "shards": 2}
+    cache = CacheFactory.create_cache(CacheType.sharded.value, kwargs)
+    assert isinstance(cache, ShardedPipelineCache)
+    assert len(list((tmp_path / "testcache").glob("shard-*.sqlite"))) == 2
+
+
 def test_create_blob_cache():
     kwargs = {
         "connection_string": WELL_KNOWN_BLOB_STORAGE_KEY,
@@ -96,6 +104,7 @@ def test_get_cache_types():
     assert CacheType.file.value in cache_types
     assert CacheType.blob.value in cache_types
     assert CacheType.cosmosdb.value in cache_types
+    assert CacheType.sharded.value in cache_types
 
 
 def test_create_unknown_cache():
@@ -110,6 +119,7 @@ def test_is_supported_type():
     assert CacheFactory.is_supported_type(CacheType.file.value)
     assert CacheFactory.is_supported_type(CacheType.blob.value)
     assert CacheFactory.is_supported_type(CacheType.cosmosdb.value)
+    assert CacheFactory.is_supported_type(CacheType.sharded.value)
 
     # Test unknown type
     assert not CacheFactory.is_supported_type("unknown")
@@ -0,0 +1,127 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+"""Sharded pipeline cache tests."""
+
+import asyncio
+import time
+
+import pytest
+
+from graphrag.cache.sharded_pipeline_cache import ShardedPipelineCache
+
+
+async def test_get_set_delete(tmp_path):
+    cache = ShardedPipelineCache(tmp_path, shards=4)
+    try:
+        assert await cache.get("missing") is None
+        assert not await cache.has("missing")
+
+        await cache.set("key", {"answer": "ü" * 100}, {"input": "prompt"})
+        assert await cache.has("key")
+        assert await cache.get("key") == {"answer": "ü" * 100}
+
+        # None is never cached
+        await cache.set("none", None)
+        assert not await cache.has("none")
+
+        await cache.delete("key")
+        assert await cache.get("key") is None
+    finally:
+        cache.close()
+
+    assert len(list(tmp_path.glob("shard-*.sqlite"))) == 4
+
+
+async def test_persistence_across_compression(tmp_path):
+    cache = ShardedPipelineCache(tmp_path, shards=2, compression="zlib")
+    await cache.set("key", "value")
+    cache.close()
+
+    reopened = ShardedPipelineCache(tmp_path, shards=2, compression="none")
+    try:
+        assert await reopened.get("key") == "value"
+    finally:
+        reopened.close()
+
+
+async def test_children_are_isolated(tmp_path):
+    cache = ShardedPipelineCache(tmp_path, shards=2)
+    try:
+        first = cache.child("first")
+        second = cache.child("second")
+        await first.set("key", "first")
+        await second.set("key", "second")
+        await first.child("nested").set("key", "nested")
+
+        assert await first.get("key") == "first"
+        assert await second.get("key") == "second"
+
+        await first.clear()
+        assert await first.get("key") is None
+        assert await first.child("nested").get("key") is None
+        assert await second.get("key") == "second"
+
+        await cache.clear()
+        assert await second.get("key") is None
+
+        # a namespace ending where the key continues does not share entries
+        await cache.child("a").set("b/c", "a")
+        await cache.child("a/b").set("c", "a/b")
+        assert await cache.child("a").get("b/c") == "a"
+        assert await cache.child("a/b").get("c") == "a/b"
+    finally:
+        cache.close()
+
+
+async def test_concurrent_access(tmp_path):
+    cache = ShardedPipelineCache(tmp_path, shards=2)
+    try:
+        keys = [f"key-{i}" for i in range(50)]
+        await asyncio.gather(*[cache.set(key, key) for key in keys])
+        assert await asyncio.gather(*[cache.get(key) for key in keys]) == keys
+        assert all(await asyncio.gather(*[cache.has(key) for key in keys]))
+    finally:
+        cache.close()
+
+
+async def test_size_eviction_is_lru(tmp_path):
+    cache = ShardedPipelineCache(
+        tmp_path, shards=1, compression="none", max_size_bytes=1000
+    )
+    try:
+        for i in range(4):
+            await cache.set(f"key{i}", "x" * 150)
+        # touch the oldest entry so that it becomes the most recently used
+        assert await cache.get("key0") is not None
+        for i in range(4, 8):
+            await cache.set(f"key{i}", "x" * 150)
+
+        assert await cache.has("key0")
+        assert not await cache.has("key1")
+        assert await cache.has("key7")
+    finally:
+        cache.close()
+
+
+async def test_age_eviction(tmp_path):
+    cache = ShardedPipelineCache(tmp_path, shards=1, max_age_seconds=60)
+    try:
+        await cache.set("key", "value")
+        assert await cache.get("key") == "value"
+
+        # age the entry past the limit
+        shard = cache._shards.shards[0]  # noqa: SLF001
+        shard.connection.execute("UPDATE entries SET created = ?", (time.time() - 120,))
+        assert not await cache.has("key")
+        assert await cache.get("key") is None
+
+        await cache.set("other", "value")
+        await cache.compact()
+        assert await cache.get("other") == "value"
+    finally:
+        cache.close()
+
+
+def test_unknown_compression(tmp_path):
+    with pytest.raises(ValueError, match="Unknown cache compression"):
+        ShardedPipelineCache(tmp_path, compression="lz4")
@@ -4,8 +4,12 @@
 
 import re
 from datetime import datetime
+from unittest.mock import patch
+
+import pandas as pd
 
 from graphrag.storage.blob_pipeline_storage import BlobPipelineStorage
+from graphrag.utils.storage import load_table_from_storage, write_table_to_storage
 
 # cspell:disable-next-line well-known-key
 WELL_KNOWN_BLOB_STORAGE_KEY = "DefaultEndpointsProtocol=http;AccountName=devstoreaccount1;AccountKey=Eby8vdM02xNOcqFlqUwJPLlmEtlCDXJ1OUzFT50uSRZ6IFsuFq2UVErCz4I6tq/K1SZFPTOtr/KBHBeksoGMGw==;BlobEndpoint=http://127.0.0.1:10000/devstoreaccount1;"
@@ -113,3 +117,25 @@ async def test_child():
             assert not has_test
     finally:
         parent._delete_container()  # noqa: SLF001
+
+
+async def test_tables_in_blocks_and_ranges():
+    storage = BlobPipelineStorage(
+        connection_string=WELL_KNOWN_BLOB_STORAGE_KEY,
+        container_name="testtables",
+    )
+    table = pd.DataFrame({
+        "id": range(1000),
+        "text": [f"text {i}" for i in range(1000)],
+    })
+    try:
+        with patch("graphrag.storage.blob_pipeline_storage.BLOCK_SIZE", 1024):
+            await write_table_to_storage(table, "text_units", storage)
+
+        assert await storage.get("text_units.parquet", as_bytes=True) == (
+            table.to_parquet()
+        )
+        loaded = await load_table_from_storage("text_units", storage, columns=["text"])
+        pd.testing.assert_frame_equal(loaded, table.loc[:, ["text"]])
+    finally:
+        storage._delete_container()  # noqa: SLF001
@@ -262,3 +262,116 @@ class TestLanceDBVectorStore:
             assert non_existent.vector is None
         finally:
             shutil.rmtree(temp_dir)
+
+    def test_batched_search(self, sample_documents_categories):
+        """Test that a batched search matches one search per query."""
+        temp_dir = tempfile.mkdtemp()
+        try:
+            vector_store = LanceDBVectorStore(
+                vector_store_schema_config=VectorStoreSchemaConfig(
+                    index_name="batch_collection", vector_size=5
+                )
+            )
+            vector_store.connect(db_uri=temp_dir)
+            vector_store.load_documents(sample_documents_categories)
+
+            queries = [[0.1, 0.2, 0.3, 0.4, 0.5], [0.3, 0.4, 0.5, 0.6, 0.7]]
+            for include_ids in [[], ["1", "2"]]:
+                vector_store.filter_by_id(include_ids)
+                batched = vector_store.similarity_search_by_vectors(queries, k=2)
+                assert len(batched) == len(queries)
+                for query, results in zip(queries, batched, strict=True):
+                    expected = vector_store.similarity_search_by_vector(query, k=2)
+                    assert [r.document.id for r in results] == [
+                        r.document.id for r in expected
+                    ]
+                    assert [r.score for r in results] == pytest.approx([
+                        r.score for r in expected
+                    ])
+            assert vector_store.similarity_search_by_vectors([], k=2) == []
+        finally:
+            shutil.rmtree(temp_dir)
+
+    def test_arrow_results(self, sample_documents):
+        """Test column projection and attribute decoding."""
+        temp_dir = tempfile.mkdtemp()
+        try:
+            vector_store = LanceDBVectorStore(
+                vector_store_schema_config=VectorStoreSchemaConfig(
+                    index_name="arrow_collection", vector_size=5
+                )
+            )
+            vector_store.connect(db_uri=temp_dir)
+            vector_store.load_documents(sample_documents[:2])
+            vector_store.load_documents(
+                [
+                    VectorStoreDocument(
+                        id="it's",
+                        text="Quoted id",
+                        vector=[0.3, 0.4, 0.5, 0.6, 0.7],
+                        attributes={"title": "Quoted"},
+                    )
+                ],
+                overwrite=False,
+            )
+
+            table = vector_store.similarity_search_arrow(
+                [[0.1, 0.2, 0.3, 0.4, 0.5]], k=2
+            )
+            assert "vector" not in table.column_names
+            assert table.column("id").to_pylist() == ["1", "2"]
+
+            results = vector_store.similarity_search_by_vector(
+                [0.1, 0.2, 0.3, 0.4, 0.5], k=3
+            )
+            assert results[0].document.vector is None
+            assert results[0].document.attributes == {
+                "title": "Doc 1",
+                "category": "test",
+            }
+            results = vector_store.similarity_search_by_vector(
+                [0.1, 0.2, 0.3, 0.4, 0.5], k=1, include_vectors=True
+            )
+            assert results[0].document.vector is not None
+            assert np.allclose(results[0].document.vector, [0.1, 0.2, 0.3, 0.4, 0.5])
+
+            docs = vector_store.search_by_ids(["2", "missing", "it's", "1"])
+            assert [doc.text for doc in docs] == [
+                "This is document 2",
+                None,
+                "Quoted id",
+                "This is document 1",
+            ]
+            assert docs[2].attributes == {"title": "Quoted"}
+            assert docs[0].vector is not None
+        finally:
+            shutil.rmtree(temp_dir)
+
+    def test_append_changed_attributes(self, sample_documents):
+        """Test appending documents with new or differently typed attributes."""
+        temp_dir = tempfile.mkdtemp()
+        try:
+            vector_store = LanceDBVectorStore(
+                vector_store_schema_config=VectorStoreSchemaConfig(
+                    index_name="evolving_collection", vector_size=5
+                )
+            )
+            vector_store.connect(db_uri=temp_dir)
+            vector_store.load_documents(sample_documents[:1])
+            vector_store.load_documents(
+                [
+                    VectorStoreDocument(
+                        id="2",
+                        text="This is document 2",
+                        vector=[0.2, 0.3, 0.4, 0.5, 0.6],
+                        attributes={"title": 2, "extra": ["a", "b"]},
+                    )
+                ],
+                overwrite=False,
+            )
+
+            docs = vector_store.search_by_ids(["1", "2"])
+            assert docs[0].attributes == {"title": "Doc 1", "category": "test"}
+            assert docs[1].attributes == {"title": 2, "extra": ["a", "b"]}
+        finally:
+            shutil.rmtree(temp_dir)
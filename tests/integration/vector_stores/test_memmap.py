@@ -0,0 +1,140 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Integration tests for the memory-mapped NumPy vector store implementation."""
+
+import numpy as np
+import pytest
+
+from graphrag.config.models.vector_store_schema_config import VectorStoreSchemaConfig
+from graphrag.vector_stores.base import VectorStoreDocument
+from graphrag.vector_stores.memmap import MemmapVectorStore
+
+
+@pytest.fixture
+def sample_documents():
+    return [
+        VectorStoreDocument(
+            id="1",
+            text="This is document 1",
+            vector=[0.1, 0.2, 0.3, 0.4, 0.5],
+            attributes={"title": "Doc 1", "category": "test"},
+        ),
+        VectorStoreDocument(
+            id="2",
+            text="This is document 2",
+            vector=[0.2, 0.3, 0.4, 0.5, 0.6],
+            attributes={"title": "Doc 2", "category": "test"},
+        ),
+        VectorStoreDocument(
+            id="3",
+            text="This is document 3",
+            vector=[0.9, 0.1, 0.0, 0.1, 0.0],
+            attributes={"title": "Doc 3", "category": "test"},
+        ),
+    ]
+
+
+def _create_store(db_uri, **kwargs) -> MemmapVectorStore:
+    vector_store = MemmapVectorStore(
+        vector_store_schema_config=VectorStoreSchemaConfig(
+            index_name="test_collection", vector_size=5
+        )
+    )
+    vector_store.connect(db_uri=str(db_uri), **kwargs)
+    return vector_store
+
+
+def test_vector_store_operations(tmp_path, sample_documents):
+    vector_store = _create_store(tmp_path)
+    vector_store.load_documents(sample_documents[:2])
+
+    doc = vector_store.search_by_id("1")
+    assert doc.id == "1"
+    assert doc.text == "This is document 1"
+    assert doc.vector is not None
+    assert np.allclose(doc.vector, [0.1, 0.2, 0.3, 0.4, 0.5])
+    assert doc.attributes["title"] == "Doc 1"
+
+    results = vector_store.similarity_search_by_vector([0.1, 0.2, 0.3, 0.4, 0.5], k=2)
+    assert [r.document.id for r in results] == ["1", "2"]
+    assert results[0].score == pytest.approx(1.0)
+
+    # append mode adds a new segment that is searched alongside the first one
+    vector_store.load_documents([sample_documents[2]], overwrite=False)
+    results = vector_store.similarity_search_by_vector([0.9, 0.1, 0.0, 0.1, 0.0], k=1)
+    assert results[0].document.id == "3"
+
+    text_results = vector_store.similarity_search_by_text(
+        "test query", lambda _: [0.1, 0.2, 0.3, 0.4, 0.5], k=2
+    )
+    assert len(text_results) == 2
+
+    non_existent = vector_store.search_by_id("nonexistent")
+    assert non_existent.text is None
+    assert non_existent.vector is None
+
+
+def test_filter_search(tmp_path, sample_documents):
+    vector_store = _create_store(tmp_path)
+    vector_store.load_documents(sample_documents)
+
+    assert vector_store.filter_by_id(["1", "2"]) == ["1", "2"]
+    results = vector_store.similarity_search_by_vector([0.9, 0.1, 0.0, 0.1, 0.0], k=3)
+    assert {r.document.id for r in results} == {"1", "2"}
+
+    vector_store.filter_by_id([])
+    results = vector_store.similarity_search_by_vector([0.9, 0.1, 0.0, 0.1, 0.0], k=3)
+    assert len(results) == 3
+
+
+def test_finalize_compacts_segments(tmp_path, sample_documents):
+    vector_store = _create_store(tmp_path)
+    for i, document in enumerate(sample_documents):
+        vector_store.load_documents([document], overwrite=i == 0)
+    vector_store.finalize_load()
+
+    assert len(list((tmp_path / "test_collection").glob("*.vectors.npy"))) == 1
+    assert [vector_store.search_by_id(id).text for id in ["1", "2", "3"]] == [
+        "This is document 1",
+        "This is document 2",
+        "This is document 3",
+    ]
+
+
+def test_readers_share_memory_mapped_index(tmp_path, sample_documents):
+    writer = _create_store(tmp_path)
+    writer.load_documents(sample_documents)
+    writer.finalize_load()
+
+    reader = _create_store(tmp_path)
+    assert isinstance(reader._segments[0].vectors, np.memmap)  # noqa: SLF001
+    results = reader.similarity_search_by_vector([0.9, 0.1, 0.0, 0.1, 0.0], k=1)
+    assert results[0].document.id == "3"
+
+
+def test_ivf_search_matches_flat_search(tmp_path):
+    rng = np.random.default_rng(0)
+    centers = rng.normal(size=(8, 16))
+    vectors = np.concatenate([
+        center + 0.05 * rng.normal(size=(50, 16)) for center in centers
+    ])
+    documents = [
+        VectorStoreDocument(id=str(i), text=None, vector=vector.tolist())
+        for i, vector in enumerate(vectors)
+    ]
+
+    flat = _create_store(tmp_path / "flat")
+    flat.load_documents(documents)
+    flat.finalize_load()
+
+    ivf = _create_store(tmp_path / "ivf", ivf_lists=8, ivf_probes=2)
+    ivf.load_documents(documents)
+    ivf.finalize_load()
+    assert ivf._segments[0].ivf is not None  # noqa: SLF001
+
+    queries = centers + 0.05 * rng.normal(size=centers.shape)
+    flat_results = flat.similarity_search_by_vectors(queries, k=5)
+    ivf_results = ivf.similarity_search_by_vectors(queries, k=5)
+    for expected, actual in zip(flat_results, ivf_results, strict=True):
+        assert [r.document.id for r in actual] == [r.document.id for r in expected]
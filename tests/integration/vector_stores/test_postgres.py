@@ -0,0 +1,190 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Integration tests for Postgres (pgvector) vector store implementation."""
+
+import asyncio
+import os
+
+import numpy as np
+import pytest
+
+from graphrag.config.models.vector_store_schema_config import VectorStoreSchemaConfig
+from graphrag.vector_stores.base import VectorStoreDocument
+from graphrag.vector_stores.postgres import (
+    PostgresIndexType,
+    PostgresVectorStore,
+    _to_vector_literal,
+)
+
+pytest.importorskip("psycopg")
+psycopg_pool = pytest.importorskip("psycopg_pool")
+
+POSTGRES_TEST_URL = os.getenv("GRAPHRAG_POSTGRES_TEST_URL")
+
+requires_postgres = pytest.mark.skipif(
+    not POSTGRES_TEST_URL,
+    reason="requires a pgvector database in GRAPHRAG_POSTGRES_TEST_URL",
+)
+
+
+@pytest.fixture
+def sample_documents():
+    return [
+        VectorStoreDocument(
+            id="1",
+            text="This is document 1",
+            vector=[0.1, 0.2, 0.3, 0.4, 0.5],
+            attributes={"title": "Doc 1", "category": "test"},
+        ),
+        VectorStoreDocument(
+            id="2",
+            text="This is document 2",
+            vector=[0.2, 0.3, 0.4, 0.5, 0.6],
+            attributes={"title": "Doc 2", "category": "test"},
+        ),
+        VectorStoreDocument(
+            id="3",
+            text="This is document 3",
+            vector=[0.9, 0.1, 0.0, 0.1, 0.0],
+            attributes={"title": "Doc 3", "category": "test"},
+        ),
+    ]
+
+
+def test_vector_literal():
+    assert _to_vector_literal([1, 0.5]) == "[1.0,0.5]"
+    assert _to_vector_literal(np.array([0.25], dtype=np.float64)) == "[0.25]"
+
+
+def test_index_settings(monkeypatch):
+    monkeypatch.setenv("DB_INDEX_TYPE", "ivfflat")
+    monkeypatch.setenv("DB_IVFFLAT_PROBES", "7")
+    vector_store = PostgresVectorStore(
+        vector_store_schema_config=VectorStoreSchemaConfig(index_name="settings"),
+        hnsw_m=32,
+    )
+    assert vector_store.index_type == PostgresIndexType.IVFFlat
+    assert vector_store.ivfflat_probes == 7
+    assert vector_store.hnsw_m == 32
+
+    statement = vector_store._index_statement(row_count=50_000)  # noqa: SLF001
+    assert statement is not None
+    rendered = statement.as_string(None)
+    assert "USING ivfflat" in rendered
+    assert "lists = 50" in rendered
+
+    settings = [s.as_string(None) for s in vector_store._search_settings(k=10)]  # noqa: SLF001
+    assert settings == ["SET LOCAL ivfflat.probes = 7"]
+
+
+def test_hnsw_ef_search_covers_k():
+    vector_store = PostgresVectorStore(
+        vector_store_schema_config=VectorStoreSchemaConfig(index_name="settings"),
+        index_type="hnsw",
+        hnsw_ef_search=40,
+    )
+    settings = [s.as_string(None) for s in vector_store._search_settings(k=100)]  # noqa: SLF001
+    assert settings == ["SET LOCAL hnsw.ef_search = 100"]
+
+
+def test_filter_by_id_prefilters():
+    vector_store = PostgresVectorStore(
+        vector_store_schema_config=VectorStoreSchemaConfig(index_name="filtered"),
+    )
+    assert vector_store.filter_by_id([]) is None
+    assert "candidates" not in vector_store._search_statement().as_string(None)  # noqa: SLF001
+
+    assert vector_store.filter_by_id(["1", "2"]) == ["1", "2"]
+    rendered = vector_store._batch_search_statement().as_string(None)  # noqa: SLF001
+    assert rendered.startswith("WITH candidates AS MATERIALIZED")
+    assert vector_store._search_params(5)["ids"] == ["1", "2"]  # noqa: SLF001
+
+
+async def test_async_pool_is_opened_once(monkeypatch):
+    opened = []
+
+    class FakeAsyncConnectionPool:
+        def __init__(self, conninfo: str, **kwargs):
+            self.conninfo = conninfo
+
+        async def open(self) -> None:
+            await asyncio.sleep(0)
+            opened.append(self)
+
+    monkeypatch.setattr(psycopg_pool, "AsyncConnectionPool", FakeAsyncConnectionPool)
+    vector_store = PostgresVectorStore(
+        vector_store_schema_config=VectorStoreSchemaConfig(index_name="pooled"),
+    )
+    vector_store.db_connection = object()  # type: ignore
+    vector_store._conninfo = "postgresql://pooled"  # noqa: SLF001
+
+    pools = await asyncio.gather(*[vector_store._aget_pool() for _ in range(5)])  # noqa: SLF001
+
+    assert len(opened) == 1
+    assert all(pool is opened[0] for pool in pools)
+
+
+@requires_postgres
+@pytest.mark.parametrize("index_type", ["hnsw", "ivfflat", "none"])
+def test_vector_store_operations(sample_documents, index_type):
+    vector_store = PostgresVectorStore(
+        vector_store_schema_config=VectorStoreSchemaConfig(
+            index_name=f"graphrag_test_{index_type}", vector_size=5
+        ),
+    )
+    vector_store.connect(url=POSTGRES_TEST_URL, index_type=index_type)
+    try:
+        # load in two batches, the second one upserting over the first
+        vector_store.load_documents(sample_documents[:2])
+        vector_store.load_documents(sample_documents[1:], overwrite=False)
+        vector_store.finalize_load()
+
+        doc = vector_store.search_by_id("1")
+        assert doc.text == "This is document 1"
+        assert doc.vector is not None
+        assert np.allclose(doc.vector, [0.1, 0.2, 0.3, 0.4, 0.5])
+        assert doc.attributes["title"] == "Doc 1"
+
+        results = vector_store.similarity_search_by_vector(
+            [0.9, 0.1, 0.0, 0.1, 0.0], k=2
+        )
+        assert results[0].document.id == "3"
+
+        vector_store.filter_by_id(["1", "2"])
+        results = vector_store.similarity_search_by_vector(
+            [0.9, 0.1, 0.0, 0.1, 0.0], k=3
+        )
+        assert {r.document.id for r in results} == {"1", "2"}
+        vector_store.filter_by_id([])
+
+        batched = vector_store.similarity_search_by_vectors(
+            [[0.9, 0.1, 0.0, 0.1, 0.0], [0.1, 0.2, 0.3, 0.4, 0.5]], k=1
+        )
+        assert [r[0].document.id for r in batched] == ["3", "1"]
+    finally:
+        vector_store.close()
+
+
+@requires_postgres
+async def test_async_search(sample_documents):
+    vector_store = PostgresVectorStore(
+        vector_store_schema_config=VectorStoreSchemaConfig(
+            index_name="graphrag_test_async", vector_size=5
+        ),
+    )
+    vector_store.connect(url=POSTGRES_TEST_URL)
+    try:
+        vector_store.load_documents(sample_documents)
+        vector_store.finalize_load()
+        results = await vector_store.asimilarity_search_by_vector(
+            [0.9, 0.1, 0.0, 0.1, 0.0], k=1
+        )
+        assert results[0].document.id == "3"
+
+        batched = await vector_store.asimilarity_search_by_vectors(
+            [[0.9, 0.1, 0.0, 0.1, 0.0], [0.1, 0.2, 0.3, 0.4, 0.5]], k=1
+        )
+        assert [r[0].document.id for r in batched] == ["3", "1"]
+    finally:
+        await vector_store.aclose()
@@ -0,0 +1,18 @@
+# Copyright (c) 2025 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A module containing a mock tokenizer definition."""
+
+from graphrag.tokenizer.tokenizer import Tokenizer
+
+
+class CharacterTokenizer(Tokenizer):
+    """A tokenizer that encodes every character as one token, so token counts equal text lengths."""
+
+    def encode(self, text: str) -> list[int]:
+        """Encode the given text into a list of tokens."""
+        return [ord(character) for character in text]
+
+    def decode(self, tokens: list[int]) -> str:
+        """Decode a list of tokens back into a string."""
+        return "".join(chr(token) for token in tokens)
@@ -90,6 +90,8 @@ def assert_language_model_configs(
     assert actual.model_supports_json == expected.model_supports_json
     assert actual.tokens_per_minute == expected.tokens_per_minute
     assert actual.requests_per_minute == expected.requests_per_minute
+    assert actual.rate_limit_strategy == expected.rate_limit_strategy
+    assert actual.rate_limit_coordinator == expected.rate_limit_coordinator
     assert actual.retry_strategy == expected.retry_strategy
     assert actual.max_retries == expected.max_retries
     assert actual.max_retry_wait == expected.max_retry_wait
@@ -124,6 +126,8 @@ def assert_vector_store_configs(
         assert store_a.container_name == store_e.container_name
         assert store_a.overwrite == store_e.overwrite
         assert store_a.database_name == store_e.database_name
+        assert store_a.ivf_lists == store_e.ivf_lists
+        assert store_a.ivf_probes == store_e.ivf_probes
 
 
 def assert_reporting_configs(
@@ -163,6 +167,10 @@ def assert_cache_configs(actual: CacheConfig, expected: CacheConfig) -> None:
     assert actual.container_name == expected.container_name
     assert actual.storage_account_blob_url == expected.storage_account_blob_url
     assert actual.cosmosdb_account_url == expected.cosmosdb_account_url
+    assert actual.shards == expected.shards
+    assert actual.compression == expected.compression
+    assert actual.max_size_mb == expected.max_size_mb
+    assert actual.max_age_days == expected.max_age_days
 
 
 def assert_input_configs(actual: InputConfig, expected: InputConfig) -> None:
@@ -181,6 +189,7 @@ def assert_input_configs(actual: InputConfig, expected: InputConfig) -> None:
     assert actual.text_column == expected.text_column
     assert actual.title_column == expected.title_column
     assert actual.metadata == expected.metadata
+    assert actual.concurrency == expected.concurrency
 
 
 def assert_embed_graph_configs(
@@ -215,6 +224,7 @@ def assert_chunking_configs(actual: ChunkingConfig, expected: ChunkingConfig) ->
     assert actual.encoding_model == expected.encoding_model
     assert actual.prepend_metadata == expected.prepend_metadata
     assert actual.chunk_size_includes_metadata == expected.chunk_size_includes_metadata
+    assert actual.async_mode == expected.async_mode
 
 
 def assert_snapshots_configs(
@@ -336,11 +346,16 @@ def assert_global_search_configs(
     assert actual.data_max_tokens == expected.data_max_tokens
     assert actual.map_max_length == expected.map_max_length
     assert actual.reduce_max_length == expected.reduce_max_length
+    assert actual.map_early_stop_score == expected.map_early_stop_score
     assert actual.dynamic_search_threshold == expected.dynamic_search_threshold
     assert actual.dynamic_search_keep_parent == expected.dynamic_search_keep_parent
     assert actual.dynamic_search_num_repeats == expected.dynamic_search_num_repeats
     assert actual.dynamic_search_use_summary == expected.dynamic_search_use_summary
     assert actual.dynamic_search_max_level == expected.dynamic_search_max_level
+    assert (
+        actual.dynamic_search_min_similarity == expected.dynamic_search_min_similarity
+    )
+    assert actual.embedding_model_id == expected.embedding_model_id
 
 
 def assert_drift_search_configs(
@@ -356,6 +371,9 @@ def assert_drift_search_configs(
     assert actual.primer_folds == expected.primer_folds
     assert actual.primer_llm_max_tokens == expected.primer_llm_max_tokens
     assert actual.n_depth == expected.n_depth
+    assert (
+        actual.follow_up_similarity_threshold == expected.follow_up_similarity_threshold
+    )
     assert actual.local_search_text_unit_prop == expected.local_search_text_unit_prop
     assert actual.local_search_community_prop == expected.local_search_community_prop
     assert (
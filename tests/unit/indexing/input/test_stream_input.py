@@ -0,0 +1,111 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import asyncio
+import re
+from io import BytesIO
+from pathlib import Path
+
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+
+from graphrag.config.enums import InputFileType
+from graphrag.config.models.input_config import InputConfig
+from graphrag.config.models.storage_config import StorageConfig
+from graphrag.index.input.factory import create_input, stream_input
+from graphrag.index.input.util import stream_files
+from graphrag.storage.file_pipeline_storage import FilePipelineStorage
+from graphrag.storage.memory_pipeline_storage import MemoryPipelineStorage
+from graphrag.utils.api import create_storage_from_config
+from graphrag.utils.storage import (
+    load_table_from_storage,
+    write_table_batches_to_storage,
+)
+
+
+async def test_stream_input_matches_create_input():
+    config = InputConfig(
+        storage=StorageConfig(
+            base_dir="tests/unit/indexing/input/data/multiple-csvs",
+        ),
+        file_type=InputFileType.csv,
+        file_pattern=".*\\.csv$",
+        metadata=["title"],
+    )
+    storage = create_storage_from_config(config.storage)
+
+    batches = [batch async for batch in stream_input(config, storage, batch_size=2)]
+    documents = await create_input(config=config, storage=storage)
+
+    assert len(batches) == 2
+    pd.testing.assert_frame_equal(pd.concat(batches), documents)
+
+
+async def test_stream_files_reads_concurrently_in_order(tmp_path: Path):
+    storage = FilePipelineStorage(base_dir=str(tmp_path))
+    for index in range(10):
+        await storage.set(f"{index}.txt", str(index))
+    config = InputConfig(file_pattern=".*\\.txt$", concurrency=4)
+    found = [int(Path(path).stem) for path, _ in storage.find(re.compile(r"\.txt$"))]
+    reading = 0
+    max_reading = 0
+
+    async def load_file(path: str, group: dict | None) -> pd.DataFrame:
+        nonlocal reading, max_reading
+        reading += 1
+        max_reading = max(max_reading, reading)
+        index = int(await storage.get(path))
+        # files found earlier take longer, so they finish out of order
+        await asyncio.sleep(0.001 * (10 - found.index(index)))
+        reading -= 1
+        if index == found[3]:
+            msg = "unreadable"
+            raise ValueError(msg)
+        return pd.DataFrame({"index": [index]})
+
+    batches = [
+        batch async for batch in stream_files(load_file, config, storage, batch_size=4)
+    ]
+
+    assert [batch["index"].tolist() for batch in batches] == [
+        [found[0], found[1], found[2], found[4]],
+        found[5:9],
+        found[9:],
+    ]
+    assert max_reading == 4
+
+
+async def test_write_table_batches_unifies_columns():
+    storage = MemoryPipelineStorage()
+
+    async def batches():
+        await asyncio.sleep(0)
+        yield pd.DataFrame({"id": ["a", "b"], "text": ["one", None]})
+        yield pd.DataFrame({"id": ["c"], "text": [None], "title": ["third"]})
+
+    num_rows = await write_table_batches_to_storage(batches(), "documents", storage)
+
+    assert num_rows == 3
+    table = await load_table_from_storage("documents", storage)
+    assert table.to_dict("records") == [
+        {"id": "a", "text": "one", "title": None},
+        {"id": "b", "text": None, "title": None},
+        {"id": "c", "text": None, "title": "third"},
+    ]
+    metadata = pq.ParquetFile(
+        BytesIO(await storage.get("documents.parquet", as_bytes=True))
+    ).metadata
+    assert metadata.num_row_groups == 2
+
+
+async def test_write_table_batches_requires_rows():
+    async def batches():
+        await asyncio.sleep(0)
+        for batch in []:
+            yield batch
+
+    with pytest.raises(ValueError, match="documents"):
+        await write_table_batches_to_storage(
+            batches(), "documents", MemoryPipelineStorage()
+        )
@@ -54,6 +54,12 @@ class TestRunTokens:
         mock_encoder = Mock()
         mock_encoder.encode.side_effect = lambda x: list(x.encode())
         mock_encoder.decode.side_effect = lambda x: bytes(x).decode()
+        mock_encoder.encode_batch.side_effect = lambda xs: [
+            list(x.encode()) for x in xs
+        ]
+        mock_encoder.decode_batch.side_effect = lambda xs: [
+            bytes(x).decode() for x in xs
+        ]
         mock_get_encoding.return_value = mock_encoder
 
         # Input and config
@@ -77,6 +83,12 @@ class TestRunTokens:
         mock_encoder = Mock()
         mock_encoder.encode.side_effect = lambda x: list(str(x).encode())
         mock_encoder.decode.side_effect = lambda x: bytes(x).decode()
+        mock_encoder.encode_batch.side_effect = lambda xs: [
+            list(str(x).encode()) for x in xs
+        ]
+        mock_encoder.decode_batch.side_effect = lambda xs: [
+            bytes(x).decode() for x in xs
+        ]
         mock_get_encoding.return_value = mock_encoder
 
         input = [123]  # Non-string input
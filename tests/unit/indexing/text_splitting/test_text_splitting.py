@@ -1,12 +1,14 @@
 # Copyright (c) 2024 Microsoft Corporation.
 # Licensed under the MIT License
 
+import random
 from unittest import mock
 from unittest.mock import MagicMock
 
 import pytest
 import tiktoken
 
+from graphrag.index.operations.chunk_text.typing import TextChunk
 from graphrag.index.text_splitting.text_splitting import (
     NoopTextSplitter,
     TokenChunkerOptions,
@@ -129,6 +131,82 @@ def test_split_multiple_texts_on_tokens():
     mock_tick.assert_called()
 
 
+def _split_on_token_tuples(
+    texts: list[str], tokenizer: TokenChunkerOptions
+) -> list[TextChunk]:
+    """Split texts by windowing over a list of (text index, token) tuples."""
+    input_ids = [
+        (doc_idx, id)
+        for doc_idx, text in enumerate(texts)
+        for id in tokenizer.encode(text)
+    ]
+    result = []
+    start_idx = 0
+    while start_idx < len(input_ids):
+        cur_idx = min(start_idx + tokenizer.tokens_per_chunk, len(input_ids))
+        chunk_ids = input_ids[start_idx:cur_idx]
+        result.append(
+            TextChunk(
+                tokenizer.decode([id for _, id in chunk_ids]),
+                list({doc_idx for doc_idx, _ in chunk_ids}),
+                len(chunk_ids),
+            )
+        )
+        if cur_idx == len(input_ids):
+            break
+        start_idx += tokenizer.tokens_per_chunk - tokenizer.chunk_overlap
+    return result
+
+
+def test_split_multiple_texts_on_tokens_matches_token_tuples():
+    rng = random.Random(0)
+    mocked_tokenizer = MockTokenizer()
+    for _ in range(200):
+        texts = [
+            "".join(rng.choice("abc ") for _ in range(rng.randint(0, 30)))
+            for _ in range(rng.randint(0, 12))
+        ]
+        tokens_per_chunk = rng.randint(1, 20)
+        tokenizer = TokenChunkerOptions(
+            chunk_overlap=rng.randint(0, tokens_per_chunk - 1),
+            tokens_per_chunk=tokens_per_chunk,
+            decode=mocked_tokenizer.decode,
+            encode=mocked_tokenizer.encode,
+        )
+
+        result = split_multiple_texts_on_tokens(texts, tokenizer, tick=MagicMock())
+
+        assert result == _split_on_token_tuples(texts, tokenizer)
+
+
+def test_split_multiple_texts_on_tokens_in_batches():
+    texts = [f"text {index}" for index in range(600)]
+    mocked_tokenizer = MockTokenizer()
+    encode_batch = MagicMock(
+        side_effect=lambda batch: [mocked_tokenizer.encode(text) for text in batch]
+    )
+    decode_batch = MagicMock(
+        side_effect=lambda batch: [mocked_tokenizer.decode(ids) for ids in batch]
+    )
+    tokenizer = TokenChunkerOptions(
+        chunk_overlap=0,
+        tokens_per_chunk=10,
+        decode=mocked_tokenizer.decode,
+        encode=mocked_tokenizer.encode,
+        decode_batch=decode_batch,
+        encode_batch=encode_batch,
+    )
+    tick = MagicMock()
+
+    result = split_multiple_texts_on_tokens(texts, tokenizer, tick=tick)
+
+    assert "".join(chunk.text_chunk for chunk in result) == "".join(texts)
+    assert result[0].source_doc_indices == [0, 1]
+    assert encode_batch.call_count == 3
+    assert decode_batch.call_count == 2
+    assert tick.call_count == 600
+
+
 def test_split_single_text_on_tokens_no_overlap():
     text = "This is a test text, meaning to be taken seriously by this test only."
     enc = tiktoken.get_encoding("cl100k_base")
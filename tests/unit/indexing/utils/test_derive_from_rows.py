@@ -0,0 +1,143 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import asyncio
+
+import pandas as pd
+import pytest
+
+from graphrag.config.enums import AsyncType
+from graphrag.index.utils.derive_from_rows import (
+    ParallelizationError,
+    derive_from_rows,
+    stream_from_rows,
+)
+from graphrag.index.utils.process_pool import get_worker_state
+
+
+@pytest.mark.parametrize("async_type", [AsyncType.AsyncIO, AsyncType.Threaded])
+async def test_results_in_row_order(async_type: AsyncType):
+    input = pd.DataFrame({"value": range(50)})
+
+    async def transform(row: pd.Series) -> int:
+        value = int(row["value"])
+        await asyncio.sleep(value * 7 % 5 / 1000)
+        return value * 2
+
+    results = await derive_from_rows(
+        input, transform, num_threads=8, async_type=async_type
+    )
+    assert results == [value * 2 for value in range(50)]
+
+
+async def test_bounded_concurrency_and_window():
+    input = pd.DataFrame({"value": range(100)})
+    running = 0
+    max_running = 0
+    started: list[int] = []
+
+    async def transform(row: pd.Series) -> int:
+        nonlocal running, max_running
+        value = int(row["value"])
+        started.append(value)
+        running += 1
+        max_running = max(max_running, running)
+        # the first row is slow, the window stops the others from running far ahead
+        await asyncio.sleep(0.1 if value == 0 else 0)
+        running -= 1
+        return value
+
+    stream = stream_from_rows(input, transform, num_threads=4, window_size=10)
+    assert await anext(stream) == 0
+    assert max_running <= 4
+    assert len(started) <= 10
+    assert [result async for result in stream] == list(range(1, 100))
+
+
+async def test_errors_are_raised_after_all_rows():
+    input = pd.DataFrame({"value": range(10)})
+    processed: list[int] = []
+
+    async def transform(row: pd.Series) -> int:
+        value = int(row["value"])
+        processed.append(value)
+        await asyncio.sleep(0)
+        if value % 5 == 0:
+            msg = "bad row"
+            raise ValueError(msg)
+        return value
+
+    with pytest.raises(ParallelizationError, match="2 Errors"):
+        await derive_from_rows(input, transform)
+    assert sorted(processed) == list(range(10))
+
+
+async def test_fail_fast_stops_scheduling():
+    input = pd.DataFrame({"value": range(1000)})
+    processed: list[int] = []
+
+    async def transform(row: pd.Series) -> int:
+        value = int(row["value"])
+        processed.append(value)
+        await asyncio.sleep(0)
+        if value == 3:
+            msg = "bad row"
+            raise ValueError(msg)
+        return value
+
+    with pytest.raises(ParallelizationError, match="1 Errors"):
+        await derive_from_rows(input, transform, num_threads=2, fail_fast=True)
+    assert len(processed) < 1000
+
+
+def _load_multiplier(multiplier: int) -> int:
+    return multiplier
+
+
+def _multiply(row: pd.Series) -> int:
+    return int(row["value"]) * get_worker_state()
+
+
+def _fail_on_odd(row: pd.Series) -> int:
+    value = int(row["value"])
+    if value % 2:
+        msg = "odd row"
+        raise ValueError(msg)
+    return value
+
+
+async def test_process_pool():
+    input = pd.DataFrame({"value": range(100)})
+
+    results = await derive_from_rows(
+        input,
+        _multiply,
+        num_threads=2,
+        async_type=AsyncType.Process,
+        initializer=_load_multiplier,
+        initargs=(3,),
+    )
+    assert results == [value * 3 for value in range(100)]
+
+
+async def test_process_pool_errors():
+    input = pd.DataFrame({"value": range(10)})
+
+    with pytest.raises(ParallelizationError, match="5 Errors"):
+        await derive_from_rows(
+            input,
+            _fail_on_odd,
+            num_threads=2,
+            async_type=AsyncType.Process,
+        )
+
+
+async def test_process_pool_requires_sync_transform():
+    async def transform(row: pd.Series) -> int:
+        await asyncio.sleep(0)
+        return int(row["value"])
+
+    with pytest.raises(ValueError, match="synchronous"):
+        await derive_from_rows(
+            pd.DataFrame({"value": [1]}), transform, async_type=AsyncType.Process
+        )
@@ -0,0 +1,55 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from graphrag.index.utils import hashing
+from graphrag.index.utils.hashing import gen_sha512_hash, gen_sha512_hashes
+
+TABLES = {
+    "documents": pd.DataFrame({
+        "text": ["first", None],
+        "title": ["a.txt", "b.txt"],
+        "creation_date": ["2024-01-01", "2024-01-02"],
+    }),
+    "numbers": pd.DataFrame({"count": [1, 2], "score": [0.1, np.nan]}),
+    "mixed": pd.DataFrame({"count": [1, 2], "flag": [True, False], "name": ["a", "b"]}),
+    "chunks": pd.DataFrame({
+        "document_ids": ["d", "d"],
+        "chunk": [(["d"], "text", 3), None],
+    }),
+    "datetimes": pd.DataFrame({
+        "date": pd.to_datetime(["2024-01-01", "2024-01-02"]),
+        "count": [1, 2],
+    }),
+    "extension": pd.DataFrame({
+        "count": pd.array([1, None], dtype="Int64"),
+        "score": pd.array([0.5, 1.0], dtype="Float64"),
+    }),
+}
+
+
+@pytest.mark.parametrize("name", TABLES)
+def test_hashes_match_row_wise_hashing(name: str):
+    table = TABLES[name]
+
+    for hashcode in [list(table.columns), list(table.columns)[-1:]]:
+        expected = table.apply(
+            lambda row, hashcode=hashcode: gen_sha512_hash(row, hashcode), axis=1
+        )
+        assert gen_sha512_hashes(table, hashcode) == expected.tolist()
+
+
+def test_hashes_in_batches_on_threads(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(hashing, "HASH_BATCH_SIZE", 3)
+    table = pd.DataFrame({"text": [f"text {i}" for i in range(10)]})
+    expected = [gen_sha512_hash(row, ["text"]) for row in table.to_dict("records")]
+
+    assert gen_sha512_hashes(table, ["text"], num_threads=4) == expected
+    assert gen_sha512_hashes(table, ["text"], num_threads=1) == expected
+
+
+def test_hashes_empty_table():
+    assert gen_sha512_hashes(pd.DataFrame({"text": []}), ["text"]) == []
@@ -0,0 +1,175 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import asyncio
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from graphrag.config.models.graph_rag_config import GraphRagConfig
+from graphrag.index.run.run_pipeline import _run_pipeline
+from graphrag.index.run.utils import create_run_context
+from graphrag.index.typing.context import PipelineRunContext
+from graphrag.index.typing.pipeline import Pipeline
+from graphrag.index.typing.workflow import WorkflowFunctionOutput
+from graphrag.index.utils.table_cache import TableCache
+from graphrag.storage.memory_pipeline_storage import MemoryPipelineStorage
+from graphrag.utils.storage import (
+    load_table_from_storage,
+    storage_has_table,
+    write_table_to_storage,
+)
+from tests.unit.config.utils import get_default_graphrag_config
+
+ENTITIES = pd.DataFrame({
+    "id": ["e0", "e1"],
+    "title": ["ALICE", "BOB"],
+    "degree": [1, 2],
+    "text_unit_ids": [np.array(["t0"]), np.array(["t0", "t1"])],
+    "x": [0.5, None],
+})
+
+
+class FailingStorage(MemoryPipelineStorage):
+    @asynccontextmanager
+    async def open_output(self, key: str):
+        await asyncio.sleep(0)
+        msg = f"cannot write {key}"
+        raise OSError(msg)
+        yield
+
+
+async def test_loads_tables_from_memory_as_written():
+    storage = MemoryPipelineStorage()
+    tables = TableCache(storage, write_behind=True)
+
+    await tables.write(ENTITIES, "entities")
+    loaded = await tables.load("entities")
+    loaded["degree"] = 0
+    await tables.flush()
+
+    stored = await load_table_from_storage("entities", storage)
+    pd.testing.assert_frame_equal(stored, await tables.load("entities"))
+    assert await storage.get("entities.parquet") == ENTITIES.to_parquet()
+    pd.testing.assert_frame_equal(
+        await tables.load("entities", columns=["id", "missing"]), stored[["id"]]
+    )
+
+
+async def test_evicted_tables_load_from_storage():
+    storage = MemoryPipelineStorage()
+    tables = TableCache(storage, write_behind=True)
+
+    await tables.write(ENTITIES, "entities")
+    await tables.write(ENTITIES.iloc[:1], "relationships")
+    tables.retain(["relationships"])
+
+    assert await tables.has("entities")
+    pd.testing.assert_frame_equal(
+        await tables.load("entities"),
+        await load_table_from_storage("entities", storage),
+    )
+
+
+async def test_failed_writes_are_raised():
+    tables = TableCache(FailingStorage(), write_behind=True)
+
+    await tables.write(ENTITIES, "entities")
+    await asyncio.sleep(0.01)
+
+    with pytest.raises(OSError, match=r"entities\.parquet"):
+        tables.check()
+    with pytest.raises(OSError, match=r"entities\.parquet"):
+        await tables.flush()
+
+
+def test_tables_read_after():
+    async def workflow(config, context):
+        await asyncio.sleep(0)
+        return WorkflowFunctionOutput(result=None)
+
+    pipeline = Pipeline(
+        [("first", workflow), ("second", workflow), ("third", workflow)],
+        table_inputs={"second": ["entities"], "third": ["communities"]},
+    )
+
+    assert pipeline.tables_read_after("first") == {"entities", "communities"}
+    assert pipeline.tables_read_after("second") == {"communities"}
+    assert pipeline.tables_read_after("third") == set()
+
+
+async def test_pipeline_writes_tables_before_workflows_reading_storage(
+    tmp_path: Path,
+):
+    async def write_entities(
+        config: GraphRagConfig, context: PipelineRunContext
+    ) -> WorkflowFunctionOutput:
+        await context.output_tables.write(ENTITIES, "entities")
+        return WorkflowFunctionOutput(result=None)
+
+    async def read_storage(
+        config: GraphRagConfig, context: PipelineRunContext
+    ) -> WorkflowFunctionOutput:
+        return WorkflowFunctionOutput(
+            result=await storage_has_table("entities", context.output_storage)
+        )
+
+    context = create_run_context(write_behind=True)
+    pipeline = Pipeline(
+        [("write_entities", write_entities), ("read_storage", read_storage)],
+        table_inputs={"write_entities": []},
+    )
+
+    results = [
+        result
+        async for result in _run_pipeline(
+            pipeline, get_default_graphrag_config(str(tmp_path)), context
+        )
+    ]
+
+    assert [result.result for result in results] == [None, True]
+    assert context.output_tables._tables == {}  # noqa: SLF001
+
+
+async def test_pipeline_loads_tables_rewritten_to_storage(tmp_path: Path):
+    async def write_entities(
+        config: GraphRagConfig, context: PipelineRunContext
+    ) -> WorkflowFunctionOutput:
+        await context.output_tables.write(ENTITIES, "entities")
+        return WorkflowFunctionOutput(result=None)
+
+    async def rewrite_storage(
+        config: GraphRagConfig, context: PipelineRunContext
+    ) -> WorkflowFunctionOutput:
+        await write_table_to_storage(
+            ENTITIES.iloc[:1], "entities", context.output_storage
+        )
+        return WorkflowFunctionOutput(result=None)
+
+    async def read_entities(
+        config: GraphRagConfig, context: PipelineRunContext
+    ) -> WorkflowFunctionOutput:
+        entities = await context.output_tables.load("entities")
+        return WorkflowFunctionOutput(result=entities["id"].tolist())
+
+    context = create_run_context(write_behind=True)
+    pipeline = Pipeline(
+        [
+            ("write_entities", write_entities),
+            ("rewrite_storage", rewrite_storage),
+            ("read_entities", read_entities),
+        ],
+        table_inputs={"write_entities": [], "read_entities": ["entities"]},
+    )
+
+    results = [
+        result
+        async for result in _run_pipeline(
+            pipeline, get_default_graphrag_config(str(tmp_path)), context
+        )
+    ]
+
+    assert [result.result for result in results] == [None, None, ["e0"]]
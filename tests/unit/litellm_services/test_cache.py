@@ -0,0 +1,157 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Test LiteLLM layered cache."""
+
+import asyncio
+from typing import Any
+
+from litellm import ModelResponse  # type: ignore
+
+from graphrag.cache.cache_stats import cache_stats
+from graphrag.cache.memory_pipeline_cache import InMemoryCache
+from graphrag.cache.noop_pipeline_cache import NoopPipelineCache
+from graphrag.cache.pipeline_cache import PipelineCache
+from graphrag.config.models.language_model_config import LanguageModelConfig
+from graphrag.language_model.providers.litellm.request_wrappers.with_cache import (
+    with_cache,
+)
+
+model_config = LanguageModelConfig(
+    type="chat", model_provider="openai", model="gpt-4o", api_key="NOT_A_KEY"
+)
+
+
+def _create_completions(cache: PipelineCache, calls: list[str], fail: bool = False):
+    def completion(**kwargs: Any) -> ModelResponse:
+        calls.append(kwargs["messages"])
+        return ModelResponse(id="sync")
+
+    async def acompletion(**kwargs: Any) -> ModelResponse:
+        calls.append(kwargs["messages"])
+        await asyncio.sleep(0.05)
+        if fail:
+            msg = "model unavailable"
+            raise RuntimeError(msg)
+        return ModelResponse(id="async")
+
+    return with_cache(
+        sync_fn=completion,
+        async_fn=acompletion,
+        model_config=model_config,
+        cache=cache,
+        request_type="chat",
+        cache_key_prefix="chat",
+    )
+
+
+async def test_concurrent_requests_are_coalesced():
+    cache_stats.reset()
+    calls: list[str] = []
+    _, acompletion = _create_completions(InMemoryCache(), calls)
+
+    responses = await asyncio.gather(*[
+        acompletion(messages="same prompt") for _ in range(5)
+    ])
+
+    assert calls == ["same prompt"]
+    assert {response.id for response in responses} == {"async"}
+    assert cache_stats.to_dict() == {
+        "memory_hits": 0,
+        "persistent_hits": 0,
+        "misses": 1,
+        "coalesced": 4,
+    }
+
+
+async def test_memory_tier_in_front_of_persistent_cache():
+    cache_stats.reset()
+    cache = InMemoryCache()
+    calls: list[str] = []
+    _, acompletion = _create_completions(cache, calls)
+
+    await acompletion(messages="prompt")
+    await acompletion(messages="prompt")
+    assert calls == ["prompt"]
+    assert cache_stats.memory_hits == 1
+
+    # a fresh wrapper has an empty memory tier and reads the persistent cache
+    _, acompletion = _create_completions(cache, calls)
+    response = await acompletion(messages="prompt")
+    assert response.id == "async"
+    assert calls == ["prompt"]
+    assert cache_stats.persistent_hits == 1
+
+
+async def test_failed_request_is_not_shared():
+    cache_stats.reset()
+    calls: list[str] = []
+    _, acompletion = _create_completions(InMemoryCache(), calls, fail=True)
+
+    results = await asyncio.gather(
+        acompletion(messages="prompt"),
+        acompletion(messages="prompt"),
+        return_exceptions=True,
+    )
+
+    # the waiting request retries on its own after the shared one failed
+    assert calls == ["prompt", "prompt"]
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+def test_sync_requests_use_memory_tier():
+    cache_stats.reset()
+    calls: list[str] = []
+    completion, _ = _create_completions(InMemoryCache(), calls)
+
+    # the sync wrapper drives the async cache on the current event loop
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        assert completion(messages="prompt").id == "sync"
+        assert completion(messages="prompt").id == "sync"
+    finally:
+        asyncio.set_event_loop(None)
+        loop.close()
+    assert calls == ["prompt"]
+    assert cache_stats.misses == 1
+    assert cache_stats.memory_hits == 1
+
+
+async def test_memory_tier_can_be_disabled():
+    cache_stats.reset()
+    calls: list[str] = []
+
+    async def acompletion(**kwargs: Any) -> ModelResponse:
+        calls.append(kwargs["messages"])
+        await asyncio.sleep(0)
+        return ModelResponse(id="async")
+
+    _, cached = with_cache(
+        sync_fn=lambda **_: ModelResponse(),
+        async_fn=acompletion,
+        model_config=model_config,
+        cache=InMemoryCache(),
+        request_type="chat",
+        cache_key_prefix="chat",
+        memory_cache_size=0,
+    )
+    await cached(messages="prompt")
+    await cached(messages="prompt")
+    assert calls == ["prompt"]
+    assert cache_stats.memory_hits == 0
+    assert cache_stats.persistent_hits == 1
+
+
+async def test_no_memory_tier_or_coalescing_without_cache():
+    cache_stats.reset()
+    calls: list[str] = []
+    _, acompletion = _create_completions(NoopPipelineCache(), calls)
+
+    await asyncio.gather(*[acompletion(messages="prompt") for _ in range(3)])
+    await acompletion(messages="prompt")
+
+    # cache.type none: every request reaches the model
+    assert calls == ["prompt"] * 4
+    assert cache_stats.memory_hits == 0
+    assert cache_stats.coalesced == 0
@@ -0,0 +1,128 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Test LiteLLM Token Bucket Rate Limiter."""
+
+import asyncio
+import time
+from pathlib import Path
+
+import pytest
+
+from graphrag.language_model.providers.litellm.services.rate_limiter.rate_limiter_factory import (
+    RateLimiterFactory,
+)
+
+rate_limiter_factory = RateLimiterFactory()
+
+_period_in_seconds = 1
+_rpm = 4
+_tpm = 100
+_num_requests = 8
+
+
+def test_token_bucket_validation():
+    """Test that the token bucket rate limiter validates its settings."""
+    with pytest.raises(ValueError, match="Both TPM and RPM cannot be None"):
+        rate_limiter_factory.create(strategy="token_bucket")
+    with pytest.raises(ValueError, match="must be either None"):
+        rate_limiter_factory.create(strategy="token_bucket", rpm=-1)
+    with pytest.raises(ValueError, match="Period in seconds"):
+        rate_limiter_factory.create(
+            strategy="token_bucket", rpm=10, period_in_seconds=0
+        )
+
+
+def test_rpm():
+    """Test that requests burst up to the bucket size and then follow the refill rate."""
+    rate_limiter = rate_limiter_factory.create(
+        strategy="token_bucket", rpm=_rpm, period_in_seconds=_period_in_seconds
+    )
+
+    time_values: list[float] = []
+    start_time = time.time()
+    for _ in range(_num_requests):
+        with rate_limiter.acquire(token_count=1):
+            time_values.append(time.time() - start_time)
+
+    interval = _period_in_seconds / _rpm
+    assert time_values[_rpm - 1] < interval
+    for i in range(_rpm, _num_requests):
+        assert time_values[i] >= (i - _rpm + 1) * interval - 0.01
+
+
+async def test_async_acquire_does_not_block_the_event_loop():
+    """Test that waiting for the bucket leaves the event loop free."""
+    rate_limiter = rate_limiter_factory.create(
+        strategy="token_bucket", tpm=_tpm, period_in_seconds=_period_in_seconds
+    )
+    ticks = 0
+    done = False
+
+    async def ticker():
+        nonlocal ticks
+        while not done:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    async def request() -> float:
+        async with rate_limiter.aacquire(token_count=50):
+            return time.time()
+
+    start_time = time.time()
+    ticker_task = asyncio.create_task(ticker())
+    finish_times = await asyncio.gather(*[request() for _ in range(4)])
+    done = True
+    await ticker_task
+
+    # 100 tokens are available at once, the other 100 refill over one period
+    assert max(finish_times) - start_time >= 0.95 * _period_in_seconds
+    assert ticks >= 20
+
+
+def test_retry_after_pauses_requests():
+    """Test that a retry-after header pauses the next request."""
+    rate_limiter = rate_limiter_factory.create(
+        strategy="token_bucket", rpm=1000, period_in_seconds=_period_in_seconds
+    )
+    rate_limiter.observe({"llm_provider-retry-after-ms": "300"})
+
+    start_time = time.time()
+    with rate_limiter.acquire(token_count=1):
+        assert time.time() - start_time >= 0.29
+
+
+def test_remaining_tokens_header_drains_bucket():
+    """Test that the provider's remaining budget lowers the local bucket."""
+    rate_limiter = rate_limiter_factory.create(
+        strategy="token_bucket", tpm=_tpm, period_in_seconds=_period_in_seconds
+    )
+    rate_limiter.observe({"X-RateLimit-Remaining-Tokens": "0"})
+
+    start_time = time.time()
+    with rate_limiter.acquire(token_count=20):
+        assert time.time() - start_time >= 0.19
+
+
+def test_file_coordinator_shares_budget(tmp_path: Path):
+    """Test that limiters using the same coordinator file share one budget."""
+    coordinator_path = str(tmp_path / "rate_limit.bin")
+    first, second = (
+        rate_limiter_factory.create(
+            strategy="token_bucket",
+            rpm=_rpm,
+            period_in_seconds=_period_in_seconds,
+            coordinator_path=coordinator_path,
+        )
+        for _ in range(2)
+    )
+
+    start_time = time.time()
+    for _ in range(_rpm // 2):
+        with first.acquire(token_count=1), second.acquire(token_count=1):
+            pass
+    assert time.time() - start_time < 0.2
+
+    # the shared bucket is empty, so the next request waits for a refill
+    with second.acquire(token_count=1):
+        assert time.time() - start_time >= 0.2
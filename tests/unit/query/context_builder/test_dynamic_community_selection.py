@@ -0,0 +1,122 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import json
+from typing import Any
+
+from graphrag.data_model.community import Community
+from graphrag.data_model.community_report import CommunityReport
+from graphrag.query.context_builder.dynamic_community_selection import (
+    DynamicCommunitySelection,
+)
+from graphrag.query.query_cache import QueryCache
+from tests.mock_provider import MockChatLLM, MockEmbeddingLLM
+from tests.mock_tokenizer import CharacterTokenizer
+
+# level, parent, children and summary of each community
+HIERARCHY = {
+    "0": ("0", "-1", ["1", "2"], "relevant root"),
+    "1": ("1", "0", ["3"], "relevant topic"),
+    "2": ("1", "0", ["4"], "unrelated topic"),
+    "3": ("2", "1", [], "relevant detail"),
+    "4": ("2", "2", [], "relevant detail of an unrelated topic"),
+}
+
+
+class RatingChatLLM(MockChatLLM):
+    """Rates reports mentioning a relevant topic 5, and any other report 0."""
+
+    def __init__(self):
+        super().__init__()
+        self.rated: list[str] = []
+
+    async def achat(self, prompt: str, history: list | None = None, **kwargs):
+        content = (history or [])[0]["content"]
+        summary = next(
+            summary for *_, summary in HIERARCHY.values() if summary in content
+        )
+        self.rated.append(summary)
+        self.responses = [
+            json.dumps({
+                "reason": "",
+                "rating": 0 if "unrelated" in summary else 5,
+            })
+        ]
+        return await super().achat(prompt, history, **kwargs)
+
+
+class TopicEmbeddingLLM(MockEmbeddingLLM):
+    """Embeds unrelated topics orthogonally to everything else."""
+
+    async def aembed_batch(
+        self, text_list: list[str], **kwargs: Any
+    ) -> list[list[float]]:
+        return [[0.0, 1.0] if "unrelated" in text else [1.0, 0.0] for text in text_list]
+
+
+def _selection(**kwargs: Any) -> DynamicCommunitySelection:
+    return DynamicCommunitySelection(
+        community_reports=[
+            CommunityReport(
+                id=f"report {community}",
+                short_id=community,
+                title=community,
+                community_id=community,
+                summary=summary,
+                full_content=summary,
+            )
+            for community, (*_, summary) in HIERARCHY.items()
+        ],
+        communities=[
+            Community(
+                id=community,
+                short_id=community,
+                title=community,
+                level=level,
+                parent=parent,
+                children=children,
+            )
+            for community, (level, parent, children, _) in HIERARCHY.items()
+        ],
+        model=RatingChatLLM(),
+        tokenizer=CharacterTokenizer(),
+        use_summary=True,
+        **kwargs,
+    )
+
+
+async def test_select_expands_relevant_communities():
+    selection = _selection()
+
+    reports, info = await selection.select("query")
+
+    assert [report.community_id for report in reports] == ["3"]
+    assert info["ratings"] == {"0": 5, "1": 5, "2": 0, "3": 5}
+    assert info["llm_calls"] == 4
+    assert info["pruned"] == []
+
+
+async def test_select_prunes_dissimilar_subtrees():
+    selection = _selection(text_embedder=TopicEmbeddingLLM(), min_similarity=0.5)
+
+    reports, info = await selection.select("query")
+
+    assert [report.community_id for report in reports] == ["3"]
+    assert "unrelated topic" not in selection.model.rated  # type: ignore
+    assert info["llm_calls"] == 3
+    assert info["pruned"] == ["2"]
+
+
+async def test_select_reuses_cached_ratings():
+    cache = QueryCache()
+    first = _selection(rating_cache=cache)
+    second = _selection(rating_cache=cache)
+
+    first_reports, first_info = await first.select("What are the  topics?")
+    second_reports, second_info = await second.select("what are the topics?")
+
+    assert first_reports == second_reports
+    assert first_info["ratings"] == second_info["ratings"]
+    assert first_info["llm_calls"] == 4
+    assert second_info["llm_calls"] == 0
+    assert second.model.rated == []  # type: ignore
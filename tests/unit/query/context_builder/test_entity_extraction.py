@@ -9,6 +9,7 @@ from graphrag.data_model.types import TextEmbedder
 from graphrag.language_model.manager import ModelManager
 from graphrag.query.context_builder.entity_extraction import (
     EntityVectorStoreKey,
+    asearch_query_entities,
     map_query_to_entities,
 )
 from graphrag.vector_stores.base import (
@@ -188,3 +189,45 @@ def test_map_query_to_entities():
             rank=3,
         ),
     ]
+
+
+async def test_map_query_to_entities_with_batched_search_results():
+    entities = [
+        Entity(id="e1", short_id="sid1", title="t1", rank=2),
+        Entity(id="e2", short_id="sid2", title="t22", rank=4),
+        Entity(id="e3", short_id="sid3", title="t333", rank=1),
+    ]
+    vectorstore = MockBaseVectorStore([
+        VectorStoreDocument(id=entity.id, text=entity.title, vector=None)
+        for entity in entities
+    ])
+    text_embedder = ModelManager().get_or_create_embedding_model(
+        model_type="mock_embedding", name="mock"
+    )
+
+    search_results = await asearch_query_entities(
+        queries=["q1", "", "q2"],
+        text_embedding_vectorstore=vectorstore,
+        text_embedder=text_embedder,
+        k=1,
+        oversample_scaler=2,
+    )
+    assert search_results[1] is None
+    assert [[r.document.id for r in results or []] for results in search_results] == [
+        ["e1", "e2"],
+        [],
+        ["e1", "e2"],
+    ]
+
+    # precomputed matches are used as-is, without embedding the query again
+    assert (
+        map_query_to_entities(
+            query="t333",
+            text_embedding_vectorstore=vectorstore,
+            text_embedder=text_embedder,
+            all_entities_dict={entity.id: entity for entity in entities},
+            k=2,
+            search_results=search_results[0],
+        )
+        == entities[:2]
+    )
@@ -0,0 +1,156 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+from graphrag.data_model.covariate import Covariate
+from graphrag.data_model.entity import Entity
+from graphrag.language_model.manager import ModelManager
+from graphrag.query.context_builder.local_context import (
+    build_covariates_context,
+    build_entity_context,
+)
+from graphrag.query.query_cache import QueryCache
+from graphrag.query.structured_search.local_search.mixed_context import (
+    LocalSearchMixedContext,
+)
+from graphrag.tokenizer.cached_tokenizer import get_cached_tokenizer
+from graphrag.tokenizer.tokenizer import Tokenizer
+from graphrag.vector_stores.base import VectorStoreDocument, VectorStoreSearchResult
+from tests.unit.query.context_builder.test_entity_extraction import (
+    MockBaseVectorStore,
+)
+
+
+class CountingTokenizer(Tokenizer):
+    def __init__(self):
+        self.measured: list[str] = []
+
+    def encode(self, text: str) -> list[int]:
+        self.measured.append(text)
+        return [ord(character) for character in text]
+
+    def decode(self, tokens: list[int]) -> str:
+        return "".join(chr(token) for token in tokens)
+
+
+entities = [
+    Entity(
+        id=str(i),
+        short_id=str(i),
+        title=f"entity {i}",
+        description="x" * (10 * i),
+        rank=i,
+    )
+    for i in range(5)
+]
+
+
+def test_entity_context_rows_are_measured_once_across_queries():
+    tokenizer = CountingTokenizer()
+    cached = get_cached_tokenizer(tokenizer)
+    assert get_cached_tokenizer(cached) is cached
+
+    first = build_entity_context(entities, tokenizer=cached, max_context_tokens=90)
+    num_measured = len(tokenizer.measured)
+    second = build_entity_context(entities, tokenizer=cached, max_context_tokens=90)
+
+    assert len(tokenizer.measured) == num_measured
+    assert len(set(tokenizer.measured)) == num_measured
+    uncached = build_entity_context(
+        entities, tokenizer=CountingTokenizer(), max_context_tokens=90
+    )
+    for context in [first, second]:
+        assert context[0] == uncached[0]
+        assert context[1].equals(uncached[1])
+
+
+def test_covariates_context_respects_budget():
+    covariates = [
+        Covariate(
+            id=str(i),
+            short_id=str(i),
+            subject_id=f"entity {i % 2}",
+            attributes={"description": "y" * 10},
+        )
+        for i in range(6)
+    ]
+    header = "-----Claims-----\nid|entity|description\n"
+    row_tokens = len("0|entity 0|yyyyyyyyyy\n")
+
+    text, records = build_covariates_context(
+        entities[:2],
+        covariates,
+        tokenizer=get_cached_tokenizer(CountingTokenizer()),
+        max_context_tokens=len(header) + 4 * row_tokens,
+        context_name="Claims",
+    )
+
+    assert records["id"].tolist() == ["0", "2", "4", "1"]
+    assert text == header + "".join(
+        f"{i}|entity {i % 2}|yyyyyyyyyy\n" for i in [0, 2, 4, 1]
+    )
+
+
+def test_mixed_context_is_reused_for_the_same_entities():
+    context_builder = LocalSearchMixedContext(
+        entities=entities,
+        entity_text_embeddings=MockBaseVectorStore([]),
+        text_embedder=ModelManager().get_or_create_embedding_model(
+            model_type="mock_embedding", name="mock_local_context_embedding"
+        ),
+        tokenizer=CountingTokenizer(),
+    )
+    search_results = [
+        VectorStoreSearchResult(
+            document=VectorStoreDocument(id=id, text=None, vector=None), score=1
+        )
+        for id in ["1", "3"]
+    ]
+    cache = QueryCache()
+
+    first = context_builder.build_context(
+        "first query", entity_search_results=search_results, context_cache=cache
+    )
+    second = context_builder.build_context(
+        "second query", entity_search_results=search_results, context_cache=cache
+    )
+    other = context_builder.build_context(
+        "first query", entity_search_results=search_results[:1], context_cache=cache
+    )
+
+    assert second is first
+    assert other is not first
+    assert "entity 3" in first.context_chunks
+    assert "entity 3" not in other.context_chunks
+    assert first.context_chunks == (
+        context_builder.build_context(
+            "third query", entity_search_results=search_results
+        ).context_chunks
+    )
+
+
+def test_whole_contexts_are_not_cached():
+    tokenizer = CountingTokenizer()
+    context_builder = LocalSearchMixedContext(
+        entities=entities,
+        entity_text_embeddings=MockBaseVectorStore([]),
+        text_embedder=ModelManager().get_or_create_embedding_model(
+            model_type="mock_embedding", name="mock_local_context_embedding"
+        ),
+        tokenizer=tokenizer,
+    )
+    search_results = [
+        VectorStoreSearchResult(
+            document=VectorStoreDocument(id=id, text=None, vector=None), score=1
+        )
+        for id in ["1", "3"]
+    ]
+
+    for query in ["first query", "second query"]:
+        context_builder.build_context(query, entity_search_results=search_results)
+
+    # rows come from the cache the second time, whole tables are measured again
+    repeated = {
+        text for text in tokenizer.measured if tokenizer.measured.count(text) > 1
+    }
+    assert any(text.startswith("-----Entities-----") for text in repeated)
+    assert all(text == "" or text.startswith("-----") for text in repeated)
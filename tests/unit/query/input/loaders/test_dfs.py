@@ -0,0 +1,186 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from graphrag.data_model.entity import Entity
+from graphrag.data_model.relationship import Relationship
+from graphrag.query.indexer_adapters import (
+    QUERY_TABLE_COLUMNS,
+    read_indexer_communities,
+)
+from graphrag.query.input.loaders.dfs import (
+    read_communities,
+    read_entities,
+    read_relationships,
+)
+from graphrag.query.input.loaders.utils import (
+    to_int,
+    to_list,
+    to_optional_float,
+    to_optional_list,
+    to_optional_str,
+    to_str,
+)
+from graphrag.storage.memory_pipeline_storage import MemoryPipelineStorage
+from graphrag.utils.storage import load_table_from_storage, write_table_to_storage
+
+
+def _entities_df() -> pd.DataFrame:
+    return pd.DataFrame({
+        "id": ["e0", "e1", "e2"],
+        "human_readable_id": [0, 1, 2],
+        "title": ["A", "B", "C"],
+        "type": ["person", None, "place"],
+        "description": ["a", "b", None],
+        "description_embedding": [np.array([0.1, 0.2]), None, np.array([0.3, 0.4])],
+        "text_unit_ids": [np.array(["t0"]), np.array(["t0", "t1"]), None],
+        "degree": [2, 1, 1],
+        "frequency": [3, 4, 5],
+    })
+
+
+def test_read_entities_matches_row_wise_conversion():
+    df = _entities_df()
+    expected = [
+        Entity(
+            id=to_str(row, "id"),
+            short_id=to_optional_str(row, "human_readable_id"),
+            title=to_str(row, "title"),
+            type=to_optional_str(row, "type"),
+            description=to_optional_str(row, "description"),
+            description_embedding=to_optional_list(
+                row, "description_embedding", item_type=float
+            ),
+            text_unit_ids=to_optional_list(row, "text_unit_ids"),
+            rank=to_int(row, "degree"),
+            attributes={"frequency": row["frequency"]},
+        )
+        for row in df.to_dict("records")
+    ]
+
+    entities = read_entities(df, name_embedding_col=None, attributes_cols=["frequency"])
+
+    assert entities == expected
+    assert entities[0].description_embedding == [0.1, 0.2]
+    assert entities[1].type is None
+
+
+def test_read_relationships_matches_row_wise_conversion():
+    df = pd.DataFrame({
+        "id": ["r0", "r1"],
+        "source": ["A", "B"],
+        "target": ["B", "C"],
+        "description": ["ab", "bc"],
+        "weight": pd.Series([1.0, None], dtype=object),
+        "combined_degree": [3, 2],
+    })
+    expected = [
+        Relationship(
+            id=to_str(row, "id"),
+            short_id=str(index),
+            source=to_str(row, "source"),
+            target=to_str(row, "target"),
+            description=to_optional_str(row, "description"),
+            weight=to_optional_float(row, "weight"),
+            rank=to_int(row, "combined_degree"),
+        )
+        for index, row in zip(df.index, df.to_dict("records"), strict=True)
+    ]
+
+    relationships = read_relationships(
+        df,
+        short_id_col=None,
+        description_embedding_col=None,
+        text_unit_ids_col=None,
+    )
+
+    assert relationships == expected
+    assert relationships[1].weight is None
+
+
+def test_read_communities_converts_hierarchy():
+    df = pd.DataFrame({
+        "id": ["c0", "c1"],
+        "community": [0, 1],
+        "title": ["Community 0", "Community 1"],
+        "level": [0, 1],
+        "parent": [-1, 0],
+        "children": [np.array([1]), np.array([], dtype=int)],
+    })
+
+    communities = read_communities(
+        df,
+        entities_col=None,
+        relationships_col=None,
+        text_units_col=None,
+        covariates_col=None,
+    )
+
+    assert [(c.short_id, c.level, c.parent) for c in communities] == [
+        ("0", "0", "-1"),
+        ("1", "1", "0"),
+    ]
+    assert [c.children for c in communities] == [
+        to_list({"children": np.array([1])}, "children"),
+        [],
+    ]
+
+
+def test_read_entities_errors():
+    df = _entities_df()
+    with pytest.raises(ValueError, match=r"Column \[name\] not found"):
+        read_entities(df, title_col="name")
+
+    df["description_embedding"] = [np.array([1, 2]), None, None]
+    with pytest.raises(TypeError, match="list item is not"):
+        read_entities(df)
+
+    df["description_embedding"] = [{"x": 1.0}, None, None]
+    with pytest.raises(TypeError, match="value is not a list"):
+        read_entities(df)
+
+
+async def test_load_table_from_storage_projects_columns():
+    storage = MemoryPipelineStorage()
+    await write_table_to_storage(_entities_df(), "entities", storage)
+
+    table = await load_table_from_storage(
+        "entities", storage, columns=[*QUERY_TABLE_COLUMNS["entities"], "missing"]
+    )
+
+    assert list(table.columns) == QUERY_TABLE_COLUMNS["entities"]
+    assert "frequency" in (await load_table_from_storage("entities", storage)).columns
+
+
+async def test_projected_communities_keep_text_units():
+    storage = MemoryPipelineStorage()
+    await write_table_to_storage(
+        pd.DataFrame({
+            "id": ["c0"],
+            "human_readable_id": [0],
+            "community": [0],
+            "level": [0],
+            "parent": [-1],
+            "children": [np.array([], dtype=int)],
+            "title": ["Community 0"],
+            "entity_ids": [np.array(["e0"])],
+            "relationship_ids": [np.array(["r0"])],
+            "text_unit_ids": [np.array(["t0", "t1"])],
+            "period": ["2024-01-01"],
+            "size": [1],
+        }),
+        "communities",
+        storage,
+    )
+
+    communities = read_indexer_communities(
+        await load_table_from_storage(
+            "communities", storage, columns=QUERY_TABLE_COLUMNS["communities"]
+        ),
+        pd.DataFrame({"community": [0]}),
+    )
+
+    assert communities[0].text_unit_ids == ["t0", "t1"]
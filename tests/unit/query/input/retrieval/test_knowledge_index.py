@@ -0,0 +1,131 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+from graphrag.data_model.covariate import Covariate
+from graphrag.data_model.entity import Entity
+from graphrag.data_model.relationship import Relationship
+from graphrag.data_model.text_unit import TextUnit
+from graphrag.language_model.manager import ModelManager
+from graphrag.query.context_builder.entity_extraction import map_query_to_entities
+from graphrag.query.input.retrieval.covariates import get_candidate_covariates
+from graphrag.query.input.retrieval.knowledge_index import KnowledgeIndex
+from graphrag.query.input.retrieval.relationships import (
+    get_candidate_relationships,
+    get_entities_from_relationships,
+)
+from tests.unit.query.context_builder.test_entity_extraction import (
+    MockBaseVectorStore,
+)
+
+entities = [
+    Entity(id=str(i), short_id=str(i), title=title, rank=rank, text_unit_ids=units)
+    for i, (title, rank, units) in enumerate([
+        ("A", 3, ["t1"]),
+        ("B", 5, ["t2", "missing"]),
+        ("C", 5, None),
+        ("D", 1, ["t1"]),
+        ("E", 2, []),
+    ])
+]
+
+relationships = [
+    Relationship(id=str(i), short_id=str(i), source=source, target=target)
+    for i, (source, target) in enumerate([
+        ("C", "A"),
+        ("A", "B"),
+        ("B", "D"),
+        ("A", "A"),
+        ("D", "E"),
+        ("E", "C"),
+    ])
+]
+
+covariates = {
+    "claims": [
+        Covariate(id=str(i), short_id=str(i), subject_id=subject)
+        for i, subject in enumerate(["B", "A", "E", "B", "A"])
+    ]
+}
+
+text_units = [
+    TextUnit(id="t1", short_id="t1", text="one"),
+    TextUnit(id="t2", short_id="t2", text="two"),
+]
+
+index = KnowledgeIndex(
+    entities=entities,
+    relationships=relationships,
+    text_units=text_units,
+    covariates=covariates,
+)
+
+
+def test_get_relationships_matches_scan():
+    for selected in [entities[:1], entities[1:3], entities[::2], entities, []]:
+        assert index.get_relationships(selected) == get_candidate_relationships(
+            selected, relationships
+        )
+
+
+def test_self_loop_is_returned_once():
+    assert [rel.id for rel in index.get_relationships_by_titles(["A"])] == [
+        "0",
+        "1",
+        "3",
+    ]
+
+
+def test_get_related_entities_matches_scan():
+    for selected in [entities[:1], entities[3:], entities]:
+        assert index.get_related_entities(selected) == get_entities_from_relationships(
+            get_candidate_relationships(selected, relationships), entities
+        )
+
+
+def test_get_covariates_matches_scan():
+    for selected in [entities[:1], entities[:2], entities[2:], []]:
+        assert index.get_covariates("claims", selected) == get_candidate_covariates(
+            selected, covariates["claims"]
+        )
+    assert index.get_covariates("unknown", entities) == []
+    assert [
+        covariate.id for covariate in index.get_covariates_by_subject("claims")["B"]
+    ] == ["0", "3"]
+
+
+def test_get_text_units():
+    assert [unit.id for unit in index.get_text_units(entities[1])] == ["t2"]
+    assert index.get_text_units(entities[2]) == []
+
+
+def test_entities_by_rank_keeps_ties_in_order():
+    assert [entity.title for entity in index.entities_by_rank] == [
+        "B",
+        "C",
+        "A",
+        "E",
+        "D",
+    ]
+
+
+def test_top_ranked_entities_match_sort():
+    entities_dict = {entity.id: entity for entity in entities}
+    for k in [2, 10]:
+        assert map_query_to_entities(
+            "",
+            MockBaseVectorStore([]),
+            ModelManager().get_or_create_embedding_model(
+                model_type="mock_embedding", name="mock_rank_embedding"
+            ),
+            entities_dict,
+            k=k,
+            knowledge_index=index,
+        ) == map_query_to_entities(
+            "",
+            MockBaseVectorStore([]),
+            ModelManager().get_or_create_embedding_model(
+                model_type="mock_embedding", name="mock_rank_embedding"
+            ),
+            entities_dict,
+            k=k,
+        )
@@ -0,0 +1,243 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+import pytest
+
+from graphrag.config.embeddings import entity_description_embedding
+from graphrag.config.enums import ModelType, SearchMethod
+from graphrag.config.models.graph_rag_config import GraphRagConfig
+from graphrag.config.models.storage_config import StorageConfig
+from graphrag.config.models.vector_store_schema_config import VectorStoreSchemaConfig
+from graphrag.data_model.entity import Entity
+from graphrag.query.context_builder.builders import (
+    ContextBuilderResult,
+    GlobalContextBuilder,
+)
+from graphrag.query.server.federated_state import (
+    load_federated_index_state,
+    qualify_entity,
+)
+from graphrag.query.server.query_service import QueryService
+from graphrag.query.structured_search.global_search.federated_context import (
+    FederatedGlobalContext,
+)
+from graphrag.utils.api import MultiVectorStore, get_embedding_store
+from graphrag.vector_stores.base import (
+    BaseVectorStore,
+    VectorStoreDocument,
+    VectorStoreSearchResult,
+)
+from tests.unit.config.utils import get_default_graphrag_config
+
+
+class ScoredVectorStore(BaseVectorStore):
+    """Returns its documents with fixed scores for every query."""
+
+    def __init__(self, scores: dict[str, float]) -> None:
+        super().__init__(
+            vector_store_schema_config=VectorStoreSchemaConfig(index_name="scored")
+        )
+        self.documents = {
+            document_id: VectorStoreDocument(id=document_id, text=None, vector=None)
+            for document_id in scores
+        }
+        self.scores = scores
+
+    def connect(self, **kwargs: Any) -> None:
+        raise NotImplementedError
+
+    def load_documents(
+        self, documents: list[VectorStoreDocument], overwrite: bool = True
+    ) -> None:
+        raise NotImplementedError
+
+    def similarity_search_by_vector(
+        self, query_embedding: list[float], k: int = 10, **kwargs: Any
+    ) -> list[VectorStoreSearchResult]:
+        return sorted(
+            [
+                VectorStoreSearchResult(document=self.documents[id], score=score)
+                for id, score in self.scores.items()
+            ],
+            key=lambda x: x.score,
+            reverse=True,
+        )[:k]
+
+    def similarity_search_by_text(
+        self, text: str, text_embedder: Any, k: int = 10, **kwargs: Any
+    ) -> list[VectorStoreSearchResult]:
+        raise NotImplementedError
+
+    def filter_by_id(self, include_ids: list[str] | list[int]) -> Any:
+        raise NotImplementedError
+
+    def search_by_id(self, id: str) -> VectorStoreDocument:
+        return self.documents[id]
+
+
+class RecordsContext(GlobalContextBuilder):
+    def __init__(self, name: str):
+        self.name = name
+
+    async def build_context(self, query, conversation_history=None, **kwargs):
+        return ContextBuilderResult(
+            context_chunks=[f"{self.name} batch 0", f"{self.name} batch 1"],
+            context_records={"reports": pd.DataFrame({"id": [self.name]})},
+            llm_calls=1,
+        )
+
+
+def _federated_config(tmp_path: Path, index_names: list[str]) -> GraphRagConfig:
+    config = get_default_graphrag_config(str(tmp_path))
+    vector_store = next(iter(config.vector_store.values()))
+    config.outputs = {}
+    config.vector_store = {}
+    for index_name in index_names:
+        output_dir = tmp_path / index_name
+        output_dir.mkdir()
+        pd.DataFrame({"id": ["1"], "text": [f"{index_name} text"]}).to_parquet(
+            output_dir / "text_units.parquet"
+        )
+        config.outputs[index_name] = StorageConfig(base_dir=str(output_dir))
+        config.vector_store[index_name] = vector_store
+    return config
+
+
+def test_multi_vector_store_merges_results_by_score():
+    first = ScoredVectorStore({"a-1": 0.9, "a-2": 0.2})
+    second = ScoredVectorStore({"b-1": 0.5})
+    store = MultiVectorStore([first, second], ["first", "second"])
+
+    results = store.similarity_search_by_vector([1.0], k=2)
+
+    assert [result.document.id for result in results] == [
+        "a-1-first",
+        "b-1-second",
+    ]
+    # the documents of the stores keep their ids
+    assert first.documents["a-1"].id == "a-1"
+    assert store.search_by_id("a-2-first").id == "a-2"
+    assert [
+        document.id for document in store.search_by_ids(["b-1-second", "a-1-first"])
+    ] == [
+        "b-1",
+        "a-1",
+    ]
+    with pytest.raises(ValueError, match="third"):
+        store.search_by_id("a-1-third")
+
+
+async def test_federated_global_context_combines_batches():
+    context = FederatedGlobalContext({
+        "first": RecordsContext("first"),
+        "second": RecordsContext("second"),
+    })
+
+    result = await context.build_context("query")
+
+    assert result.context_chunks == [
+        "first batch 0",
+        "first batch 1",
+        "second batch 0",
+        "second batch 1",
+    ]
+    assert result.context_records["reports"].to_dict("records") == [
+        {"id": "first", "index_name": "first"},
+        {"id": "second", "index_name": "second"},
+    ]
+    assert result.llm_calls == 2
+
+
+def test_qualify_entity_keeps_the_original():
+    entity = Entity(id="1", short_id="0", title="ALICE", text_unit_ids=["t"])
+
+    qualified = qualify_entity(entity, "books")
+
+    assert (qualified.id, qualified.short_id, qualified.title) == (
+        "1-books",
+        "0-books",
+        "ALICE-books",
+    )
+    assert qualified.text_unit_ids == ["t-books"]
+    assert (entity.id, entity.title) == ("1", "ALICE")
+
+
+async def test_federated_state_loads_every_index(tmp_path: Path):
+    config = _federated_config(tmp_path, ["first", "second"])
+
+    state = await load_federated_index_state(config)
+
+    assert [text_unit.id for text_unit in state.get_text_units()] == [
+        "1-first",
+        "1-second",
+    ]
+    assert [name for name, _ in state.fingerprint] == [
+        "first/text_units",
+        "second/text_units",
+    ]
+    with pytest.raises(ValueError, match=r"entities\.parquet"):
+        state.require_tables(SearchMethod.GLOBAL)
+
+
+async def test_federated_state_requires_a_vector_store_per_index(tmp_path: Path):
+    config = _federated_config(tmp_path, ["first", "second"])
+    del config.vector_store["second"]
+
+    with pytest.raises(ValueError, match="second"):
+        await load_federated_index_state(config)
+
+
+async def test_query_service_reloads_federated_indexes(tmp_path: Path):
+    service = QueryService(_federated_config(tmp_path, ["first", "second"]))
+    await service.start()
+    state = service.state
+
+    pd.DataFrame({"id": ["1"], "title": ["ALICE"]}).to_parquet(
+        tmp_path / "second" / "entities.parquet"
+    )
+    assert not await service.reload()
+    assert await service.reload()
+    assert service.state is not state
+    assert "second/entities" in dict(service.state.fingerprint)
+
+
+async def test_query_service_runs_federated_local_search(tmp_path: Path):
+    config = _federated_config(tmp_path, ["first", "second"])
+    for index_name in config.outputs or {}:
+        for table in [
+            "entities",
+            "communities",
+            "community_reports",
+            "text_units",
+            "relationships",
+        ]:
+            pd.read_parquet(f"tests/verbs/data/{table}.parquet").to_parquet(
+                tmp_path / index_name / f"{table}.parquet"
+            )
+    config.models[config.local_search.chat_model_id].type = ModelType.MockChat
+    config.models[config.local_search.chat_model_id].responses = ["local answer"]
+    config.models[config.local_search.embedding_model_id].type = ModelType.MockEmbedding
+    # both indexes share one store, searched once per index
+    entity_store = get_embedding_store(
+        {"first": config.vector_store["first"].model_dump()},
+        entity_description_embedding,
+    )
+    entity_store.load_documents([
+        VectorStoreDocument(id=id, text=None, vector=[1.0, 1.0, 1.0])
+        for id in pd.read_parquet("tests/verbs/data/entities.parquet")["id"]
+    ])
+
+    service = QueryService(config)
+    await service.start()
+    for _ in range(2):
+        response, context_data = await service.search(SearchMethod.LOCAL, "query")
+        assert response == "local answer"
+        assert (
+            context_data["entities"]["entity"].str.endswith(("-first", "-second")).all()
+        )
+    # the second query is answered from the cache
+    assert service.cache.stats.hits > 0
@@ -0,0 +1,75 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+from pathlib import Path
+
+import pandas as pd
+
+from graphrag.config.embeddings import (
+    community_full_content_embedding,
+    entity_description_embedding,
+)
+from graphrag.config.enums import ModelType, SearchMethod
+from graphrag.query.query_cache import QueryCache
+from graphrag.query.server.index_state import IndexState
+from graphrag.query.structured_search.drift_search.search import DRIFTSearch
+from graphrag.utils.api import get_embedding_store
+from graphrag.vector_stores.base import VectorStoreDocument, VectorStoreSearchResult
+from tests.unit.config.utils import get_default_graphrag_config
+
+
+async def test_drift_local_contexts_are_cached_per_community_level(tmp_path: Path):
+    config = get_default_graphrag_config(str(tmp_path))
+    config.models[config.drift_search.chat_model_id].type = ModelType.MockChat
+    config.models[config.drift_search.chat_model_id].responses = ["local answer"]
+    config.models[config.drift_search.embedding_model_id].type = ModelType.MockEmbedding
+    config.drift_search.local_search_community_prop = 0.5
+    config.drift_search.local_search_text_unit_prop = 0.0
+    config.drift_search.local_search_max_data_tokens = 100_000
+    tables = {
+        table: pd.read_parquet(f"tests/verbs/data/{table}.parquet")
+        for table in [
+            "entities",
+            "communities",
+            "community_reports",
+            "text_units",
+            "relationships",
+        ]
+    }
+    vector_store_args = {
+        index: store.model_dump() for index, store in config.vector_store.items()
+    }
+    for embedding_name, table in [
+        (entity_description_embedding, "entities"),
+        (community_full_content_embedding, "community_reports"),
+    ]:
+        get_embedding_store(vector_store_args, embedding_name).load_documents([
+            VectorStoreDocument(id=id, text=None, vector=[1.0, 1.0, 1.0])
+            for id in tables[table]["id"]
+        ])
+    # the entities of community 10, at level 1 under community 0
+    communities = tables["communities"].set_index("community")
+    entity_ids = communities.loc[10, "entity_ids"]
+    entity_search_results = [
+        VectorStoreSearchResult(
+            document=VectorStoreDocument(id=id, text=None, vector=None), score=1.0
+        )
+        for id in entity_ids
+    ]
+
+    state = IndexState(config, tables, cache=QueryCache())
+    reports = {}
+    for community_level in [0, 1]:
+        engine = state.get_search_engine(SearchMethod.DRIFT, community_level)
+        assert isinstance(engine, DRIFTSearch)
+        result = await engine.local_search.search(
+            "query",
+            drift_query="query",
+            entity_search_results=entity_search_results,
+            context_cache=engine.context_cache,
+        )
+        assert isinstance(result.context_data, dict)
+        reports[community_level] = set(result.context_data["reports"]["id"])
+
+    # each level gets its own context, not the one cached by the other
+    assert reports == {0: {"0"}, 1: {"0", "10"}}
@@ -0,0 +1,135 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import asyncio
+import json
+from collections.abc import AsyncGenerator
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+import pytest
+
+from graphrag.callbacks.query_callbacks import QueryCallbacks
+from graphrag.config.enums import SearchMethod
+from graphrag.config.models.graph_rag_config import GraphRagConfig
+from graphrag.query.server.http_server import start_server
+from graphrag.query.server.query_service import QueryService
+from tests.unit.config.utils import get_default_graphrag_config
+
+
+def _write_table(output_dir: Path, name: str) -> None:
+    pd.DataFrame({"id": ["1", "2"], "text": ["one", "two"]}).to_parquet(
+        output_dir / f"{name}.parquet"
+    )
+
+
+def _config(tmp_path: Path) -> GraphRagConfig:
+    config = get_default_graphrag_config(str(tmp_path))
+    config.output.base_dir = str(tmp_path / "output")
+    (tmp_path / "output").mkdir()
+    _write_table(tmp_path / "output", "text_units")
+    return config
+
+
+class EchoQueryService(QueryService):
+    """Answers every query with its own words, instead of running a search engine."""
+
+    def stream_search(
+        self,
+        method: SearchMethod,
+        query: str,
+        community_level: int | None = 2,
+        dynamic_community_selection: bool = False,
+        response_type: str = "Multiple Paragraphs",
+        callbacks: list[QueryCallbacks] | None = None,
+    ) -> AsyncGenerator[str, None]:
+        async def stream():
+            for callback in callbacks or []:
+                callback.on_context({"sources": pd.DataFrame({"id": [method.value]})})
+            for word in query.split():
+                await asyncio.sleep(0)
+                yield word
+
+        return stream()
+
+
+async def _request(
+    socket_path: str, verb: str, path: str, body: dict[str, Any] | None = None
+) -> tuple[int, bytes]:
+    reader, writer = await asyncio.open_unix_connection(socket_path)
+    payload = json.dumps(body).encode() if body is not None else b""
+    writer.write(
+        f"{verb} {path} HTTP/1.1\r\nContent-Length: {len(payload)}\r\n\r\n".encode()
+        + payload
+    )
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, content = response.partition(b"\r\n\r\n")
+    return int(head.split()[1]), content
+
+
+async def test_reload_waits_for_the_index_to_settle(tmp_path: Path):
+    service = QueryService(_config(tmp_path))
+    await service.start()
+    state = service.state
+    assert list(state.tables) == ["text_units"]
+    assert not await service.reload()
+
+    _write_table(tmp_path / "output", "relationships")
+    # the first check only notices the change, the next one reloads if nothing else changed
+    assert not await service.reload()
+    assert service.state is state
+    assert await service.reload()
+    assert list(service.state.tables) == ["text_units", "relationships"]
+    # queries that started earlier keep the state they hold
+    assert list(state.tables) == ["text_units"]
+
+
+async def test_missing_tables_are_reported(tmp_path: Path):
+    service = QueryService(_config(tmp_path))
+    await service.start()
+    with pytest.raises(ValueError, match=r"entities\.parquet"):
+        service.stream_search(SearchMethod.GLOBAL, "query")
+
+
+async def test_http_api(tmp_path: Path):
+    service = EchoQueryService(_config(tmp_path))
+    await service.start()
+    socket_path = str(tmp_path / "query.sock")
+    server = await start_server(service, socket_path=socket_path)
+    async with server:
+        status, content = await _request(socket_path, "GET", "/health")
+        assert status == 200
+        assert list(json.loads(content)["tables"]) == ["text_units"]
+
+        status, content = await _request(
+            socket_path, "POST", "/search/local", {"query": "hello warm index"}
+        )
+        assert status == 200
+        assert json.loads(content) == {
+            "response": "hellowarmindex",
+            "context_data": {"sources": [{"id": "local"}]},
+        }
+
+        status, content = await _request(
+            socket_path,
+            "POST",
+            "/search/basic",
+            {"query": "hello warm index", "streaming": True},
+        )
+        assert status == 200
+        assert [json.loads(line) for line in content.splitlines()] == [
+            {"chunk": "hello"},
+            {"chunk": "warm"},
+            {"chunk": "index"},
+            {"context_data": {"sources": [{"id": "basic"}]}},
+        ]
+
+        status, _ = await _request(socket_path, "POST", "/search/unknown", {})
+        assert status == 404
+        status, _ = await _request(socket_path, "POST", "/search/global", {})
+        assert status == 400
+        status, _ = await _request(socket_path, "GET", "/search/global")
+        assert status == 405
@@ -0,0 +1,81 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import numpy as np
+import pytest
+
+from graphrag.config.models.drift_search_config import DRIFTSearchConfig
+from graphrag.data_model.community_report import CommunityReport
+from graphrag.language_model.manager import ModelManager
+from graphrag.query.structured_search.drift_search.drift_context import (
+    DRIFTSearchContextBuilder,
+)
+from tests.mock_tokenizer import CharacterTokenizer
+from tests.unit.query.context_builder.test_entity_extraction import (
+    MockBaseVectorStore,
+)
+
+
+def _reports(embeddings: list[list[float] | None]) -> list[CommunityReport]:
+    return [
+        CommunityReport(
+            id=f"report-{index}",
+            short_id=str(index),
+            title=f"Report {index}",
+            community_id=str(index),
+            summary="",
+            full_content=f"content {index}",
+            full_content_embedding=embedding,
+        )
+        for index, embedding in enumerate(embeddings)
+    ]
+
+
+def _builder(reports: list[CommunityReport], k: int = 2) -> DRIFTSearchContextBuilder:
+    return DRIFTSearchContextBuilder(
+        model=ModelManager().get_or_create_chat_model(
+            model_type="mock_chat", name="mock_drift_chat"
+        ),
+        text_embedder=ModelManager().get_or_create_embedding_model(
+            model_type="mock_embedding", name="mock_drift_embedding"
+        ),
+        entities=[],
+        entity_text_embeddings=MockBaseVectorStore([]),
+        reports=reports,
+        tokenizer=CharacterTokenizer(),
+        config=DRIFTSearchConfig(drift_k_followups=k),
+    )
+
+
+def test_report_embeddings_are_normalized_once():
+    builder = _builder(_reports([[3.0, 4.0], [0.0, 2.0], [0.0, 0.0]]))
+
+    embeddings = builder.get_report_embeddings()
+    assert embeddings.dtype == np.float32
+    np.testing.assert_allclose(embeddings, [[0.6, 0.8], [0.0, 1.0], [0.0, 0.0]])
+    assert builder.get_report_embeddings() is embeddings
+
+
+def test_top_k_reports():
+    builder = _builder(_reports([[1.0, 0.0], [0.0, 1.0], [1.0, 1.0], [0.0, 1.0]]))
+
+    top_k = builder.get_top_k_reports([0.0, 5.0])
+    # equally similar reports keep their original order
+    assert top_k["short_id"].tolist() == ["1", "3"]
+    assert top_k.columns.tolist() == ["short_id", "community_id", "full_content"]
+
+
+def test_top_k_reports_ties_keep_report_order():
+    embeddings: list[list[float] | None] = [[0.0, 1.0]] * 100
+    embeddings[50] = [1.0, 0.0]
+    builder = _builder(_reports(embeddings), k=5)
+
+    top_k = builder.get_top_k_reports([1.0, 0.0])
+    assert top_k["short_id"].tolist() == ["50", "0", "1", "2", "3"]
+
+
+def test_missing_report_embeddings():
+    builder = _builder(_reports([[1.0, 0.0], None]))
+
+    with pytest.raises(ValueError, match="missing full content embeddings"):
+        builder.get_report_embeddings()
@@ -0,0 +1,76 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+from graphrag.query.structured_search.drift_search.action import DriftAction
+from graphrag.query.structured_search.drift_search.state import DriftStep, QueryState
+
+
+def _answered(query: str, score: float) -> DriftAction:
+    action = DriftAction(query, answer=f"answer to {query}")
+    action.score = score
+    return action
+
+
+def _state() -> tuple[QueryState, DriftAction, DriftAction]:
+    state = QueryState()
+    primer = _answered("primer", 1.0)
+    best = _answered("best", 5.0)
+    state.add_action(primer)
+    state.add_action(best)
+    state.add_all_follow_ups(primer, [DriftAction("a"), DriftAction("b"), best])
+    state.add_all_follow_ups(best, ["c"])
+    return state, primer, best
+
+
+def test_follow_ups_of_best_answers_come_first():
+    state, _, _ = _state()
+
+    ranked = [action.query for action in state.prioritize_incomplete_actions()]
+
+    assert ranked[0] == "c"
+    assert sorted(ranked[1:]) == ["a", "b"]
+
+
+def test_merged_action_relates_its_parents_to_the_equivalent_action():
+    state, primer, best = _state()
+    c = DriftAction("c")
+
+    state.merge_action(DriftAction("a"), into=c)
+
+    assert DriftAction("a") not in state.graph
+    assert set(state.graph.predecessors(c)) == {primer, best}
+    assert [action.query for action in state.prioritize_incomplete_actions()] == [
+        "c",
+        "b",
+    ]
+
+
+def test_steps_are_serialized():
+    state, _, _ = _state()
+    step = DriftStep(
+        step=0,
+        actions=2,
+        merged=1,
+        elapsed=0.5,
+        llm_calls=2,
+        prompt_tokens=100,
+        output_tokens=10,
+    )
+    state.steps.append(step)
+
+    serialized = state.serialize(include_context=False)
+    restored = QueryState()
+    restored.deserialize(serialized)  # type: ignore
+
+    assert serialized["steps"] == [  # type: ignore
+        {
+            "step": 0,
+            "actions": 2,
+            "merged": 1,
+            "elapsed": 0.5,
+            "llm_calls": 2,
+            "prompt_tokens": 100,
+            "output_tokens": 10,
+        }
+    ]
+    assert restored.steps == [step]
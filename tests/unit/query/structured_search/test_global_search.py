@@ -0,0 +1,141 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import asyncio
+import json
+import random
+
+from graphrag.query.context_builder.builders import (
+    ContextBuilderResult,
+    GlobalContextBuilder,
+)
+from graphrag.query.structured_search.global_search.key_points import (
+    KeyPointSelection,
+)
+from graphrag.query.structured_search.global_search.search import GlobalSearch
+from graphrag.tokenizer.tokenizer import Tokenizer
+from tests.mock_provider import MockChatLLM
+from tests.mock_tokenizer import CharacterTokenizer
+
+SLOW_BATCH = "<slow batch>"
+
+
+class BatchesContext(GlobalContextBuilder):
+    def __init__(self, context_chunks: list[str]):
+        self.context_chunks = context_chunks
+
+    async def build_context(self, query, conversation_history=None, **kwargs):
+        await asyncio.sleep(0)
+        return ContextBuilderResult(
+            context_chunks=self.context_chunks, context_records={}
+        )
+
+
+class SlowBatchChatLLM(MockChatLLM):
+    """Answers every batch with top scored points, taking forever on slow batches."""
+
+    def __init__(self):
+        super().__init__(
+            responses=[
+                json.dumps({
+                    "points": [
+                        {"description": "first point", "score": 100},
+                        {"description": "second point", "score": 100},
+                    ]
+                })
+            ]
+        )
+        self.cancelled = 0
+
+    async def achat(self, prompt: str, history: list | None = None, **kwargs):
+        if SLOW_BATCH in json.dumps(history):
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                self.cancelled += 1
+                raise
+        return await super().achat(prompt, history, **kwargs)
+
+
+def _sort_and_truncate(
+    map_responses: list, tokenizer: Tokenizer, max_tokens: int
+) -> str:
+    """Select key points by sorting all of them and truncating to the budget."""
+    key_points = [
+        {"analyst": index, "answer": element["answer"], "score": element["score"]}
+        for index, response in enumerate(map_responses)
+        for element in response
+        if element["score"] > 0
+    ]
+    key_points = sorted(key_points, key=lambda x: x["score"], reverse=True)
+    data, total_tokens = [], 0
+    for point in key_points:
+        formatted = "\n".join([
+            f"----Analyst {point['analyst'] + 1}----",
+            f"Importance Score: {point['score']}",
+            point["answer"],
+        ])
+        formatted_tokens = len(tokenizer.encode(formatted))
+        if total_tokens + formatted_tokens > max_tokens:
+            break
+        data.append(formatted)
+        total_tokens += formatted_tokens
+    return "\n\n".join(data)
+
+
+def test_key_point_selection_matches_sort_and_truncate():
+    rng = random.Random(0)
+    tokenizer = CharacterTokenizer()
+    for _ in range(200):
+        map_responses = [
+            [
+                {"answer": "x" * rng.randint(1, 40), "score": rng.randint(0, 5)}
+                for _ in range(rng.randint(0, 4))
+            ]
+            for _ in range(rng.randint(1, 6))
+        ]
+        max_tokens = rng.randint(0, 300)
+
+        selection = KeyPointSelection(tokenizer, max_tokens)
+        for index in rng.sample(range(len(map_responses)), len(map_responses)):
+            selection.add(index, map_responses[index])
+
+        assert selection.to_text() == _sort_and_truncate(
+            map_responses, tokenizer, max_tokens
+        )
+        assert selection.candidates == sum(
+            element["score"] > 0 for response in map_responses for element in response
+        )
+        assert selection.total_tokens <= max_tokens
+
+
+async def test_map_step_stops_once_reduce_budget_is_full():
+    model = SlowBatchChatLLM()
+    search = GlobalSearch(
+        model=model,
+        context_builder=BatchesContext([
+            "batch 0",
+            f"batch 1 {SLOW_BATCH}",
+            "batch 2",
+            f"batch 3 {SLOW_BATCH}",
+        ]),
+        tokenizer=CharacterTokenizer(),
+        # room for a single key point
+        max_data_tokens=60,
+        map_early_stop_score=100,
+    )
+
+    result = await asyncio.wait_for(search.search("query"), timeout=10)
+
+    assert model.cancelled == 2
+    assert [response.response != [] for response in result.map_responses] == [
+        True,
+        False,
+        True,
+        False,
+    ]
+    assert result.llm_calls == 3
+    assert (
+        result.reduce_context_text
+        == "----Analyst 1----\nImportance Score: 100\nfirst point"
+    )
@@ -0,0 +1,125 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from graphrag.query.context_builder.builders import (
+    ContextBuilderResult,
+    GlobalContextBuilder,
+)
+from graphrag.query.query_cache import CachedEmbeddingModel, QueryCache
+from graphrag.query.structured_search.global_search.search import GlobalSearch
+from tests.mock_provider import MockChatLLM, MockEmbeddingLLM
+from tests.mock_tokenizer import CharacterTokenizer
+
+
+class CountingEmbeddingLLM(MockEmbeddingLLM):
+    def __init__(self):
+        super().__init__()
+        self.embedded: list[list[str]] = []
+
+    async def aembed(self, text: str, **kwargs: Any) -> list[float]:
+        self.embedded.append([text])
+        await asyncio.sleep(0)
+        return [float(len(text))]
+
+    async def aembed_batch(
+        self, text_list: list[str], **kwargs: Any
+    ) -> list[list[float]]:
+        self.embedded.append(text_list)
+        return [[float(len(text))] for text in text_list]
+
+
+class CountingChatLLM(MockChatLLM):
+    calls = 0
+
+    def chat(self, prompt: str, history: list | None = None, **kwargs):
+        self.calls += 1
+        return super().chat(prompt, history, **kwargs)
+
+
+class ReportsContext(GlobalContextBuilder):
+    async def build_context(self, query, conversation_history=None, **kwargs):
+        await asyncio.sleep(0)
+        return ContextBuilderResult(context_chunks=["reports"], context_records={})
+
+
+async def test_concurrent_requests_are_coalesced_and_failures_not_cached():
+    cache = QueryCache(max_size=2)
+    calls = 0
+
+    async def create() -> str:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0)
+        return "value"
+
+    key = cache.create_key("query")
+    assert (
+        await asyncio.gather(*[cache.get_or_create(key, create) for _ in range(3)])
+        == ["value"] * 3
+    )
+    assert await cache.get_or_create(key, create) == "value"
+    assert calls == 1
+    assert cache.stats.coalesced == 2
+
+    async def fail() -> str:
+        await asyncio.sleep(0)
+        msg = "model unavailable"
+        raise ValueError(msg)
+
+    other = cache.create_key("other")
+    with pytest.raises(ValueError, match="unavailable"):
+        await cache.get_or_create(other, fail)
+    assert await cache.get_or_create(other, create) == "value"
+
+    # children share the entries but not the keys, the oldest entry is evicted
+    child = cache.child("child")
+    assert child.create_key("query") != key
+    child.set(child.create_key("query"), "child value")
+    assert cache.get(key) is None
+    assert child.get(child.create_key("query")) == "child value"
+
+
+async def test_cached_embedding_model_only_embeds_new_texts():
+    model = CountingEmbeddingLLM()
+    cached = CachedEmbeddingModel(model, QueryCache())
+
+    assert await cached.aembed("abc") == [3.0]
+    assert await cached.aembed_batch(["abc", "de", "de", "f"]) == [
+        [3.0],
+        [2.0],
+        [2.0],
+        [1.0],
+    ]
+    assert cached.embed("f") == [1.0]
+    assert model.embedded == [["abc"], ["de", "f"]]
+
+
+async def test_global_map_responses_are_cached():
+    model = CountingChatLLM(
+        responses=['{"points": [{"description": "a", "score": 1}]}']
+    )
+    cache = QueryCache()
+
+    def search() -> GlobalSearch:
+        return GlobalSearch(
+            model=model,
+            context_builder=ReportsContext(),
+            tokenizer=CharacterTokenizer(),
+            map_response_cache=cache.child("global_map"),
+        )
+
+    first = await search().search("query")
+    second = await search().search("query")
+    other = await search().search("other")
+
+    assert model.calls == 2
+    assert first.map_responses[0].response == second.map_responses[0].response
+    assert [
+        (result.llm_calls_categories or {})["map"] for result in [first, second, other]
+    ] == [1, 0, 1]
+    assert (second.prompt_tokens_categories or {})["map"] == 0
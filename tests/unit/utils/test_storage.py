@@ -0,0 +1,96 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from graphrag.storage.file_pipeline_storage import FilePipelineStorage
+from graphrag.storage.memory_pipeline_storage import MemoryPipelineStorage
+from graphrag.storage.pipeline_storage import PipelineStorage
+from graphrag.utils.storage import (
+    load_table_from_storage,
+    load_table_metadata,
+    stream_table_from_storage,
+    write_table_to_storage,
+)
+
+TABLE = pd.DataFrame({
+    "id": [f"e{i}" for i in range(10)],
+    "title": [f"entity {i}" for i in range(10)],
+    "degree": range(10),
+})
+
+
+def _storages(tmp_path: Path) -> list[PipelineStorage]:
+    return [FilePipelineStorage(base_dir=str(tmp_path)), MemoryPipelineStorage()]
+
+
+async def _write_row_groups(storage: PipelineStorage) -> None:
+    async with storage.open_output("entities.parquet") as sink:
+        TABLE.to_parquet(sink, row_group_size=4)
+
+
+async def test_write_table_matches_to_parquet(tmp_path: Path):
+    for storage in _storages(tmp_path):
+        await write_table_to_storage(TABLE, "entities", storage)
+
+        assert await storage.get("entities.parquet", as_bytes=True) == (
+            TABLE.to_parquet()
+        )
+
+
+async def test_load_table_columns_and_row_groups(tmp_path: Path):
+    for storage in _storages(tmp_path):
+        await _write_row_groups(storage)
+
+        metadata = await load_table_metadata("entities", storage)
+        table = await load_table_from_storage(
+            "entities", storage, columns=["id", "degree", "missing"], row_groups=[1, 2]
+        )
+
+        assert metadata.num_row_groups == 3
+        pd.testing.assert_frame_equal(
+            table, TABLE.loc[4:, ["id", "degree"]].reset_index(drop=True)
+        )
+
+
+async def test_stream_table_in_batches(tmp_path: Path):
+    for storage in _storages(tmp_path):
+        await _write_row_groups(storage)
+
+        batches = [
+            batch
+            async for batch in stream_table_from_storage(
+                "entities", storage, columns=["title"], batch_size=3
+            )
+        ]
+
+        assert [len(batch) for batch in batches] == [3, 3, 3, 1]
+        assert pd.concat(batches)["title"].tolist() == TABLE["title"].tolist()
+
+
+async def test_failed_write_keeps_the_table(tmp_path: Path):
+    storage = FilePipelineStorage(base_dir=str(tmp_path))
+    await write_table_to_storage(TABLE, "entities", storage)
+
+    async def write_partial_table():
+        async with storage.open_output("entities.parquet") as sink:
+            sink.write(b"partial")
+            raise RuntimeError
+
+    with pytest.raises(RuntimeError):
+        await write_partial_table()
+
+    pd.testing.assert_frame_equal(
+        await load_table_from_storage("entities", storage), TABLE
+    )
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["entities.parquet"]
+
+
+async def test_open_input_requires_the_key(tmp_path: Path):
+    for storage in _storages(tmp_path):
+        with pytest.raises(ValueError, match=r"entities\.parquet"):
+            async with storage.open_input("entities.parquet"):
+                pass